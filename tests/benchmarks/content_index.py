@@ -0,0 +1,135 @@
+import tempfile
+import shutil
+import timeit
+import random
+import os
+
+from vex_manager.core.content_index import ContentIndex
+from vex_manager.core.library_index import LibraryIndex
+from vex_manager.core.library_index import FILE_EXTENSION
+from vex_manager.core.library_diff import ChangeSet
+
+
+NUMBER_OF_FILES = 50_000
+NUMBER_OF_MODIFIED_FILES = 10
+REPEAT = 5
+
+VEX_LINES = (
+    "@P.y += noise(@P * {0}) * chf('amplitude');",
+    "v@Cd = chramp('color_{0}', @P.x);",
+    "int handle = pcopen(0, 'P', @P, {0}.0, 10);",
+    "float mask_{0} = fit01(@P.y, 0, 1);",
+    "vector offset_{0} = curlnoise(@P + @Time);",
+    "i@group_{0} = nearpoint(1, @P) >= 0;",
+    "// comment {0}",
+)
+
+SEARCH_TEXTS = ("@Cd", "noise", "curl", "pcop", "chramp color_7", "mask_4242", "@P")
+
+
+def create_vex_library(folder_path: str) -> None:
+    rng = random.Random(0)
+
+    for i in range(NUMBER_OF_FILES):
+        lines = [rng.choice(VEX_LINES).format(rng.randrange(10_000)) for _ in range(8)]
+        vex_file_path = os.path.join(folder_path, f"VEX{i:06}{FILE_EXTENSION}")
+
+        with open(vex_file_path, "w") as file_for_write:
+            file_for_write.write("\n".join(lines))
+
+
+def grep_search(file_paths: list[str], text: str) -> set[str]:
+    matches = set()
+
+    for file_path in file_paths:
+        with open(file_path, "r") as file_for_read:
+            if text.lower() in file_for_read.read().lower():
+                matches.add(file_path)
+
+    return matches
+
+
+def best_time(statement, repeat: int = REPEAT) -> float:
+    return min(timeit.repeat(statement, number=1, repeat=repeat)) * 1000
+
+
+def benchmark() -> None:
+    folder_path = tempfile.mkdtemp(prefix="vex-manager-benchmark-")
+    cache_path = tempfile.mkdtemp(prefix="vex-manager-benchmark-cache-")
+
+    try:
+        create_vex_library(folder_path)
+
+        # Age the directory mtime so the index trusts it on coarse filesystems.
+        os.utime(folder_path, (0, 1_000_000_000))
+
+        library_index = LibraryIndex(folder_path, cache_path=cache_path)
+        library_index.revalidate()
+        records = library_index.get_records()
+
+        content_index = ContentIndex(folder_path, cache_path=cache_path)
+
+        def cold_build() -> None:
+            if os.path.exists(content_index.cache_file_path):
+                os.remove(content_index.cache_file_path)
+
+            content_index.build(records)
+
+        cold_time = best_time(cold_build, repeat=1)
+        cached_time = best_time(lambda: content_index.build(records))
+
+        modified_paths = [record.path for record in records[:NUMBER_OF_MODIFIED_FILES]]
+
+        for file_path in modified_paths:
+            with open(file_path, "a") as file_for_write:
+                file_for_write.write("\nfloat edited = 1;")
+
+        update_time = best_time(
+            lambda: content_index.update(ChangeSet(modified=modified_paths))
+        )
+
+        assert content_index.search("edited") == set(modified_paths)
+
+        def save_cache() -> None:
+            content_index._is_dirty = True
+            content_index.save_cache()
+
+        save_time = best_time(save_cache)
+
+        grep_time = best_time(
+            lambda: grep_search([record.path for record in records], "curlnoise"),
+            repeat=1,
+        )
+
+        print(f"{NUMBER_OF_FILES} files")
+        print(f"    grep every file      {grep_time:10.3f} ms")
+        print(f"    index cold build     {cold_time:10.3f} ms")
+        print(f"    index from cache     {cached_time:10.3f} ms")
+        print(
+            f"    index update         {update_time:10.3f} ms "
+            f"({NUMBER_OF_MODIFIED_FILES} files)"
+        )
+        print(f"    index save cache     {save_time:10.3f} ms")
+
+        for text in SEARCH_TEXTS:
+            # The first search after a new token sorts the vocabulary.
+            content_index._sorted_tokens = None
+            first_time = best_time(lambda: content_index.search(text), repeat=1)
+            search_time = best_time(lambda: content_index.search(text))
+            number_of_matches = len(content_index.search(text) or ())
+
+            print(
+                f"    search {text!r:<18}{search_time:8.3f} ms "
+                f"(first {first_time:.3f} ms, {number_of_matches} files)"
+            )
+    finally:
+        shutil.rmtree(folder_path, ignore_errors=True)
+        shutil.rmtree(cache_path, ignore_errors=True)
+
+
+def main() -> None:
+    benchmark()
+
+
+if __name__ == "__main__":
+    main()
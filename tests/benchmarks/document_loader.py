@@ -0,0 +1,108 @@
+from PySide2 import QtWidgets
+
+import tempfile
+import time
+import sys
+import os
+
+from vex_manager.gui.vex_plain_text_edit import VEXPlainTextEdit
+from vex_manager.gui.document_loader import DocumentLoader
+
+
+NUMBER_OF_LINES = 100_000
+
+VEX_LINES = (
+    "v@Cd = set(fit01(@P.y, 0, 1), 0.5, 1.0); // color",
+    "float amplitude = chf('amplitude') * 2.5;",
+    "/* block",
+    "comment */ int i = 0;",
+)
+
+
+def measure(file_path: str, streamed: bool) -> tuple[float, float, str]:
+    text_edit = VEXPlainTextEdit()
+    text_edit.resize(800, 600)
+    text_edit.show()
+    QtWidgets.QApplication.processEvents()
+
+    document_loader = DocumentLoader(text_edit)
+
+    start_time = time.perf_counter()
+
+    if streamed:
+        document_loader.start(file_path)
+    else:
+        with open(file_path, "r") as file_for_read:
+            text_edit.setPlainText(file_for_read.read())
+
+    longest_stall = time.perf_counter() - start_time
+
+    # The longest event loop turn is what the user feels.
+    while document_loader.is_loading():
+        turn_time = time.perf_counter()
+        QtWidgets.QApplication.processEvents()
+        longest_stall = max(longest_stall, time.perf_counter() - turn_time)
+
+    loaded_time = time.perf_counter() - start_time
+
+    text_edit.symbols_thread_pool.waitForDone()
+    text = text_edit.toPlainText()
+    text_edit.deleteLater()
+
+    return longest_stall, loaded_time, text
+
+
+def cancel(file_path: str) -> None:
+    text_edit = VEXPlainTextEdit()
+    document_loader = DocumentLoader(text_edit)
+    document_loader.start(file_path)
+
+    for _ in range(5):
+        QtWidgets.QApplication.processEvents()
+
+    document_loader.cancel()
+    text_edit.setPlainText("int i = 0;")
+
+    assert not document_loader.is_loading()
+    assert not text_edit.streaming
+
+    print(f"Cancelled with {text_edit.document().blockCount()} block left.")
+
+    text_edit.deleteLater()
+
+
+def main() -> None:
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QtWidgets.QApplication(sys.argv)
+
+    code = "\n".join(VEX_LINES[i % len(VEX_LINES)] for i in range(NUMBER_OF_LINES))
+
+    with tempfile.TemporaryDirectory() as folder_path:
+        file_path = os.path.join(folder_path, "large.vfl")
+
+        with open(file_path, "w") as file_for_write:
+            file_for_write.write(code)
+
+        print(
+            f"{os.path.getsize(file_path) / 1e6:.1f} MB "
+            f"{'longest stall':>15} {'loaded':>11}"
+        )
+
+        for label, streamed in (("read", False), ("streamed", True)):
+            longest_stall, loaded_time, text = measure(file_path, streamed)
+
+            assert text == code
+
+            print(
+                f"{label:>8} "
+                f"{longest_stall * 1e3:>12.1f} ms "
+                f"{loaded_time * 1e3:>8.1f} ms"
+            )
+
+        cancel(file_path)
+
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
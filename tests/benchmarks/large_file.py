@@ -0,0 +1,69 @@
+from PySide2 import QtWidgets
+
+import time
+import sys
+import os
+
+from vex_manager.gui.vex_plain_text_edit import VEXPlainTextEdit
+
+
+NUMBER_OF_LINES = 30_000
+
+VEX_LINES = (
+    "v@Cd = set(fit01(@P.y, 0, 1), 0.5, 1.0); // color",
+    "float amplitude = chf('amplitude') * 2.5;",
+    "/* block",
+    "comment */ int i = 0;",
+)
+
+
+def measure(deferred: bool) -> tuple[float, float]:
+    text_edit = VEXPlainTextEdit()
+    text_edit.resize(800, 600)
+    text_edit.show()
+    QtWidgets.QApplication.processEvents()
+
+    code = "\n".join(VEX_LINES[i % len(VEX_LINES)] for i in range(NUMBER_OF_LINES))
+
+    start_time = time.perf_counter()
+
+    # The base class call highlights the whole document before returning.
+    if deferred:
+        text_edit.setPlainText(code)
+    else:
+        QtWidgets.QPlainTextEdit.setPlainText(text_edit, code)
+
+    QtWidgets.QApplication.processEvents()
+    first_paint_time = time.perf_counter() - start_time
+
+    while text_edit.vex_syntax_highlighter.is_deferred():
+        QtWidgets.QApplication.processEvents()
+
+    highlighted_time = time.perf_counter() - start_time
+
+    text_edit.symbols_thread_pool.waitForDone()
+    text_edit.deleteLater()
+
+    return first_paint_time, highlighted_time
+
+
+def main() -> None:
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QtWidgets.QApplication(sys.argv)
+
+    print(f"{NUMBER_OF_LINES} lines {'first paint':>14} {'highlighted':>14}")
+
+    for label, deferred in (("synchronous", False), ("deferred", True)):
+        first_paint_time, highlighted_time = measure(deferred)
+
+        print(
+            f"{label:>11} "
+            f"{first_paint_time * 1e3:>14.1f} ms "
+            f"{highlighted_time * 1e3:>11.1f} ms"
+        )
+
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+import tempfile
+import shutil
+import timeit
+import glob
+import os
+
+from vex_manager.core.library_index import LibraryIndex
+from vex_manager.core.library_index import FILE_EXTENSION
+
+
+LIBRARY_SIZES = (1_000, 10_000, 100_000)
+REPEAT = 5
+
+
+def create_vex_library(folder_path: str, number_of_files: int) -> None:
+    for i in range(number_of_files):
+        vex_file_path = os.path.join(folder_path, f"VEX{i:06}{FILE_EXTENSION}")
+        open(vex_file_path, "w").close()
+
+
+def glob_get_vex_files(library_path: str) -> list[str]:
+    vex_files = []
+
+    if os.path.exists(library_path):
+        vex_file_paths = glob.glob(os.path.join(library_path, f"*{FILE_EXTENSION}"))
+
+        for vex_file_path in vex_file_paths:
+            vex_files.append(os.path.normpath(vex_file_path))
+
+    return vex_files
+
+
+def glob_contains_name(library_path: str, name: str) -> bool:
+    for file in glob.glob(os.path.join(library_path, f"*{FILE_EXTENSION}")):
+        if os.path.basename(file)[: -len(FILE_EXTENSION)] == name:
+            return True
+
+    return False
+
+
+def best_time(statement) -> float:
+    return min(timeit.repeat(statement, number=1, repeat=REPEAT)) * 1000
+
+
+def benchmark(number_of_files: int) -> None:
+    folder_path = tempfile.mkdtemp(prefix="vex-manager-benchmark-")
+    cache_path = tempfile.mkdtemp(prefix="vex-manager-benchmark-cache-")
+
+    try:
+        create_vex_library(folder_path, number_of_files)
+
+        # Age the directory mtime so the index trusts it on coarse filesystems.
+        os.utime(folder_path, (0, 1_000_000_000))
+
+        glob_list_time = best_time(lambda: glob_get_vex_files(folder_path))
+        glob_exists_time = best_time(lambda: glob_contains_name(folder_path, "VEX"))
+
+        def cold_scan() -> None:
+            cold_library_index = LibraryIndex(folder_path, cache_path=cache_path)
+            cold_library_index.revalidate()
+
+            os.remove(cold_library_index.cache_file_path)
+
+        cold_time = best_time(cold_scan)
+
+        library_index = LibraryIndex(folder_path, cache_path=cache_path)
+        library_index.revalidate()
+
+        persisted_time = best_time(
+            lambda: LibraryIndex(folder_path, cache_path=cache_path).revalidate()
+        )
+        index_list_time = best_time(library_index.get_vex_files)
+        index_exists_time = best_time(lambda: library_index.contains_name("VEX"))
+
+        print(f"{number_of_files:>7} files")
+        print(f"    glob list            {glob_list_time:10.3f} ms")
+        print(f"    glob exists          {glob_exists_time:10.3f} ms")
+        print(f"    index cold scan      {cold_time:10.3f} ms")
+        print(f"    index from cache     {persisted_time:10.3f} ms")
+        print(f"    index list           {index_list_time:10.3f} ms")
+        print(f"    index exists         {index_exists_time:10.3f} ms")
+    finally:
+        shutil.rmtree(folder_path, ignore_errors=True)
+        shutil.rmtree(cache_path, ignore_errors=True)
+
+
+def main() -> None:
+    for number_of_files in LIBRARY_SIZES:
+        benchmark(number_of_files)
+
+
+if __name__ == "__main__":
+    main()
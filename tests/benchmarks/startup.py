@@ -0,0 +1,70 @@
+import subprocess
+import statistics
+import sys
+
+
+REPEAT = 10
+
+IMPORT_SCRIPT = """
+import time
+
+start_time = time.perf_counter()
+
+import vex_manager.gui.vex_manager_ui
+
+print(time.perf_counter() - start_time)
+"""
+
+FIRST_PAINT_SCRIPT = """
+from PySide2 import QtWidgets
+
+import time
+
+application = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+start_time = time.perf_counter()
+
+from vex_manager import VEXManagerUI
+
+vex_manager_ui = VEXManagerUI()
+vex_manager_ui.show()
+vex_manager_ui.repaint()
+QtWidgets.QApplication.processEvents()
+
+print(time.perf_counter() - start_time)
+"""
+
+
+def measure(script: str) -> float:
+    # Every run needs a fresh interpreter, so nothing is already imported.
+    times = []
+
+    for _ in range(REPEAT):
+        result = subprocess.run(
+            [sys.executable, "-c", script], check=True, capture_output=True, text=True
+        )
+        times.append(float(result.stdout.strip().splitlines()[-1]))
+
+    return statistics.median(times)
+
+
+def measure_imported_modules() -> list[str]:
+    script = (
+        "import sys; import vex_manager.gui.vex_manager_ui; "
+        "print(' '.join(sorted(sys.modules)))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], check=True, capture_output=True, text=True
+    )
+
+    return [
+        module_name
+        for module_name in result.stdout.split()
+        if module_name.startswith("vex_manager")
+    ]
+
+
+if __name__ == "__main__":
+    print(f"Import: {measure(IMPORT_SCRIPT) * 1000:.1f} ms.")
+    print(f"First paint: {measure(FIRST_PAINT_SCRIPT) * 1000:.1f} ms.")
+    print(f"Modules imported: {' '.join(measure_imported_modules())}")
@@ -0,0 +1,83 @@
+import timeit
+import re
+
+from vex_manager.config import VEXSyntaxis
+import vex_manager.core.vex_lexer as vex_lexer
+
+
+NUMBER_OF_LINES = 5_000
+REPEAT = 5
+
+VEX_LINES = (
+    "float amplitude = chf('amplitude') * 2.5;",
+    "vector offset = noise(@P * 0.5) - set(0.5, 0.5, 0.5);",
+    "foreach (int point; pcfind(0, 'P', @P, 1.0, 10)) {",
+    '    string name = "point // not a comment";',
+    "    v@Cd += point(0, 'Cd', point); // accumulate",
+    "}",
+    "if (i@ptnum % 2 == 0) removepoint(0, @ptnum);",
+)
+
+
+def create_vex_code(number_of_lines: int) -> list[str]:
+    return [VEX_LINES[i % len(VEX_LINES)] for i in range(number_of_lines)]
+
+
+def create_regex_passes() -> list[re.Pattern]:
+    keywords = "|".join(VEXSyntaxis.KEYWORDS)
+    data_types = "|".join(VEXSyntaxis.DATA_TYPES)
+    vex_functions = "|".join(VEXSyntaxis.VEX_FUNCTIONS)
+
+    return [
+        re.compile(r"\b\d+(\.\d+)?\b"),
+        re.compile(rf"\b({vex_functions})\b"),
+        re.compile(rf"\b({keywords})\b"),
+        re.compile(rf"\b({data_types})\b"),
+        re.compile(r"[\w]*@[\w-]+"),
+        re.compile(r"//.*"),
+        re.compile(r'(["\'])((?:\\.|[^"\\])*)\1'),
+    ]
+
+
+def regex_passes_highlight(lines: list[str], regex_passes: list[re.Pattern]) -> int:
+    number_of_spans = 0
+
+    for line in lines:
+        number_of_spans += 1
+
+        for regex_pass in regex_passes:
+            for _ in regex_pass.finditer(line):
+                number_of_spans += 1
+
+    return number_of_spans
+
+
+def lexer_highlight(lines: list[str]) -> int:
+    number_of_spans = 0
+
+    for line in lines:
+        number_of_spans += len(vex_lexer.tokenize(line))
+
+    return number_of_spans
+
+
+def main() -> None:
+    lines = create_vex_code(NUMBER_OF_LINES)
+    regex_passes = create_regex_passes()
+
+    regex_passes_time = min(
+        timeit.repeat(
+            lambda: regex_passes_highlight(lines, regex_passes), number=1, repeat=REPEAT
+        )
+    )
+    lexer_time = min(
+        timeit.repeat(lambda: lexer_highlight(lines), number=1, repeat=REPEAT)
+    )
+
+    print(f"{NUMBER_OF_LINES} lines")
+    print(f"    seven regex passes   {regex_passes_time * 1000:10.3f} ms")
+    print(f"    single-pass lexer    {lexer_time * 1000:10.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+from PySide2 import QtWidgets
+from PySide2 import QtCore
+from PySide2 import QtTest
+from PySide2 import QtGui
+
+import timeit
+import sys
+import os
+
+from vex_manager.gui.vex_plain_text_edit import VEXPlainTextEdit
+
+
+DOCUMENT_SIZES = (10, 1_000, 5_000, 20_000)
+NUMBER_OF_KEYSTROKES = 200
+REPEAT = 5
+
+VEX_LINE = "v@Cd = set(fit01(@P.y, 0, 1), 0.5, 1.0);"
+
+
+def create_text_edit(number_of_lines: int) -> VEXPlainTextEdit:
+    text_edit = VEXPlainTextEdit()
+    text_edit.setPlainText("\n".join([VEX_LINE] * number_of_lines))
+
+    return text_edit
+
+
+def move_cursor_to_middle(text_edit: VEXPlainTextEdit, column: int) -> None:
+    block = text_edit.document().findBlockByNumber(text_edit.blockCount() // 2)
+
+    text_cursor = QtGui.QTextCursor(block)
+    text_cursor.movePosition(
+        QtGui.QTextCursor.Right, QtGui.QTextCursor.MoveAnchor, column
+    )
+    text_edit.setTextCursor(text_cursor)
+
+
+def type_closing_brackets(text_edit: VEXPlainTextEdit) -> None:
+    for _ in range(NUMBER_OF_KEYSTROKES):
+        QtTest.QTest.keyClick(text_edit, QtCore.Qt.Key_ParenRight)
+        QtTest.QTest.keyClick(text_edit, QtCore.Qt.Key_Left)
+
+
+def type_new_lines(text_edit: VEXPlainTextEdit) -> None:
+    for _ in range(NUMBER_OF_KEYSTROKES):
+        QtTest.QTest.keyClick(text_edit, QtCore.Qt.Key_Return)
+
+
+def type_completion_prefixes(text_edit: VEXPlainTextEdit) -> None:
+    for _ in range(NUMBER_OF_KEYSTROKES // 4):
+        QtTest.QTest.keyClick(text_edit, QtCore.Qt.Key_F)
+        QtTest.QTest.keyClick(text_edit, QtCore.Qt.Key_I)
+        QtTest.QTest.keyClick(text_edit, QtCore.Qt.Key_Backspace)
+        QtTest.QTest.keyClick(text_edit, QtCore.Qt.Key_Backspace)
+
+
+def measure(number_of_lines: int) -> tuple[float, float, float]:
+    text_edit = create_text_edit(number_of_lines)
+
+    # Document symbols are scanned in the background after the text is set.
+    text_edit.symbols_thread_pool.waitForDone()
+    QtWidgets.QApplication.processEvents()
+
+    # Right before the first closing parenthesis, so ")" is typed over.
+    move_cursor_to_middle(text_edit, VEX_LINE.index(")"))
+    closing_bracket_time = min(
+        timeit.repeat(lambda: type_closing_brackets(text_edit), number=1, repeat=REPEAT)
+    )
+
+    # Right after the first opening parenthesis, so Enter auto indents.
+    move_cursor_to_middle(text_edit, VEX_LINE.index("(") + 1)
+    new_line_time = min(
+        timeit.repeat(lambda: type_new_lines(text_edit), number=1, repeat=REPEAT)
+    )
+
+    # Each "fi" shows the completion popup, the backspaces update and hide it.
+    move_cursor_to_middle(text_edit, 0)
+    completion_time = min(
+        timeit.repeat(
+            lambda: type_completion_prefixes(text_edit), number=1, repeat=REPEAT
+        )
+    )
+
+    text_edit.deleteLater()
+
+    return (
+        closing_bracket_time / (NUMBER_OF_KEYSTROKES * 2),
+        new_line_time / NUMBER_OF_KEYSTROKES,
+        completion_time / NUMBER_OF_KEYSTROKES,
+    )
+
+
+def main() -> None:
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QtWidgets.QApplication(sys.argv)
+
+    print(f"{'lines':>10} {'closing bracket':>18} {'enter':>12} {'completion':>13}")
+
+    for number_of_lines in DOCUMENT_SIZES:
+        closing_bracket_time, new_line_time, completion_time = measure(number_of_lines)
+
+        print(
+            f"{number_of_lines:>10} "
+            f"{closing_bracket_time * 1e6:>15.1f} us "
+            f"{new_line_time * 1e6:>9.1f} us "
+            f"{completion_time * 1e6:>10.1f} us"
+        )
+
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
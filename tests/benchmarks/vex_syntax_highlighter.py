@@ -0,0 +1,116 @@
+from PySide2 import QtWidgets
+
+import timeit
+import copy
+import sys
+import os
+
+from vex_manager.gui.vex_syntax_highlighter import VEXSyntaxHighlighter
+from vex_manager.core.preferences import DEFAULT_PREFERENCES
+from vex_manager.config import ColorScheme
+
+
+DOCUMENT_SIZES = (1_000, 5_000, 20_000)
+REPEAT = 5
+
+VEX_LINES = (
+    "float amplitude = chf('amplitude') * 2.5;",
+    "vector offset = noise(@P * 0.5) - set(0.5, 0.5, 0.5);",
+    "v@Cd = set(fit01(@P.y, 0, 1), 0.5, 1.0);",
+    "if (i@ptnum % 2 == 0) removepoint(0, @ptnum);",
+)
+
+
+def create_plain_text_edit(number_of_lines: int) -> QtWidgets.QPlainTextEdit:
+    plain_text_edit = QtWidgets.QPlainTextEdit()
+    plain_text_edit.setPlainText(
+        "\n".join(VEX_LINES[i % len(VEX_LINES)] for i in range(number_of_lines))
+    )
+
+    return plain_text_edit
+
+
+def create_color_schemes() -> list[dict]:
+    color_scheme = DEFAULT_PREFERENCES["color_scheme"]
+    color_schemes = []
+
+    # Alternate the number color, so every call changes exactly one format.
+    for red in (255, 0):
+        changed_color_scheme = copy.deepcopy(color_scheme)
+        changed_color_scheme[ColorScheme.NUMBERS.value["name"]] = [red, 128, 128]
+        color_schemes.append(changed_color_scheme)
+
+    return color_schemes
+
+
+def clear_token_cache(plain_text_edit: QtWidgets.QPlainTextEdit) -> None:
+    block = plain_text_edit.document().firstBlock()
+
+    while block.isValid():
+        block.setUserData(None)
+        block = block.next()
+
+
+def measure(number_of_lines: int) -> tuple[float, float, float]:
+    plain_text_edit = create_plain_text_edit(number_of_lines)
+
+    vex_syntax_highlighter = VEXSyntaxHighlighter(plain_text_edit.document())
+    color_scheme = DEFAULT_PREFERENCES["color_scheme"]
+    vex_syntax_highlighter.set_vex_systax_highlighter_colors(color_scheme)
+    QtWidgets.QApplication.processEvents()
+
+    # Lexing every block again, as rehighlighting did before the token cache.
+    def relex() -> None:
+        clear_token_cache(plain_text_edit)
+        vex_syntax_highlighter.rehighlight()
+
+    relex_time = min(timeit.repeat(relex, number=1, repeat=REPEAT))
+
+    color_schemes = create_color_schemes()
+    recolor_time = min(
+        timeit.repeat(
+            lambda: [
+                vex_syntax_highlighter.set_vex_systax_highlighter_colors(color_scheme)
+                for color_scheme in color_schemes
+            ],
+            number=1,
+            repeat=REPEAT,
+        )
+    ) / len(color_schemes)
+
+    unchanged_time = min(
+        timeit.repeat(
+            lambda: vex_syntax_highlighter.set_vex_systax_highlighter_colors(
+                color_schemes[-1]
+            ),
+            number=1,
+            repeat=REPEAT,
+        )
+    )
+
+    plain_text_edit.deleteLater()
+
+    return relex_time, recolor_time, unchanged_time
+
+
+def main() -> None:
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QtWidgets.QApplication(sys.argv)
+
+    print(f"{'lines':>10} {'relex':>12} {'recolor':>12} {'unchanged':>12}")
+
+    for number_of_lines in DOCUMENT_SIZES:
+        relex_time, recolor_time, unchanged_time = measure(number_of_lines)
+
+        print(
+            f"{number_of_lines:>10} "
+            f"{relex_time * 1e3:>9.1f} ms "
+            f"{recolor_time * 1e3:>9.1f} ms "
+            f"{unchanged_time * 1e3:>9.3f} ms"
+        )
+
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
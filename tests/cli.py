@@ -0,0 +1,61 @@
+import subprocess
+import time
+import sys
+import os
+
+import vex_manager.cli as cli
+
+
+FILE_EXTENSION = ".vfl"
+
+
+def create_vex_library() -> str:
+    home_path = os.path.expanduser("~")
+    folder_path = os.path.join(home_path, "vex-manager-test", "cli")
+    os.makedirs(folder_path, exist_ok=True)
+
+    for i in range(5):
+        vex_file_path = os.path.join(folder_path, f"VEX{i + 1:02}{FILE_EXTENSION}")
+
+        with open(vex_file_path, "w") as file_for_write:
+            file_for_write.write(f"@P.y += {i};\n")
+
+    return folder_path
+
+
+def run_commands() -> None:
+    folder_path = create_vex_library()
+
+    for arguments in (
+        ["list"],
+        ["search", "vex03"],
+        ["new", "Lift"],
+        ["rename", "Lift", "Raise"],
+        ["delete", "Raise"],
+        ["stats"],
+    ):
+        print(f"{arguments!r} returned {cli.main(['-l', folder_path, *arguments])}.")
+
+
+def startup_time() -> None:
+    folder_path = create_vex_library()
+    command = [sys.executable, "-m", "vex_manager", "-l", folder_path, "list"]
+
+    start_time = time.perf_counter()
+    subprocess.run(command, check=True, capture_output=True)
+    print(f"'list' ran in {time.perf_counter() - start_time:.4f} seconds.")
+
+    # The command-line interface must not need Houdini or Qt.
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *command[1:]],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    print(f"Imports hou {' hou' in result.stderr.replace('|', ' ')}.")
+    print(f"Imports PySide2 {'PySide2' in result.stderr}.")
+
+
+if __name__ == "__main__":
+    run_commands()
+    startup_time()
@@ -0,0 +1,62 @@
+import hou_stand_in
+
+scene = hou_stand_in.install()
+
+import vex_manager.core.vex_manager as vex_manager
+
+
+def create_scene() -> None:
+    for i in range(100):
+        scene.add_wrangle(f"/obj/geo1/attribwrangle{i + 1}", code="@P.y = 0;")
+
+    scene.add_wrangle("/obj/geo1/volumewrangle1", type_name="volumewrangle")
+    scene.root.addChild(hou_stand_in.Node("/obj/geo1/null1", "null"))
+
+    custom_node = hou_stand_in.Node(
+        "/obj/geo1/studio_deformer1",
+        "studio::deformer::1.0",
+        [hou_stand_in.Parm("deformer_code")],
+    )
+    scene.root.addChild(custom_node)
+
+
+def apply_vex_code() -> None:
+    nodes = vex_manager.find_wrangle_nodes()
+    updated_nodes = vex_manager.apply_vex_code(nodes, "@P.y += 1;", insert=True)
+
+    print(f"Updated {len(updated_nodes)} nodes.")
+    print(f"Undo groups {scene.undo_groups!r}.")
+    print(f"Update mode restored to {scene.update_mode!r}.")
+    print(repr(updated_nodes[0].parm("snippet").evalAsString()))
+
+
+def find_wrangle_nodes() -> None:
+    nodes = vex_manager.find_wrangle_nodes(type_pattern="volume*")
+    print([node.path() for node in nodes])
+
+    nodes = vex_manager.find_wrangle_nodes(path_pattern="*/attribwrangle1?")
+    print(f"Matched {len(nodes)} nodes by path.")
+
+
+def register_wrangle_node_type() -> None:
+    vex_manager.register_wrangle_node_type("studio::deformer::1.0", "deformer_code")
+
+    nodes = vex_manager.find_wrangle_nodes(type_pattern="studio::*")
+    vex_manager.apply_vex_code(nodes, "@P *= 2;")
+
+    print([node.parm("deformer_code").evalAsString() for node in nodes])
+
+
+def set_vex_code_in_selected_wrangle_nodes() -> None:
+    scene.selected_nodes = vex_manager.find_wrangle_nodes()[:3]
+    updated_nodes = vex_manager.set_vex_code_in_selected_wrangle_nodes("@Cd = 1;")
+
+    print([node.parm("snippet").evalAsString() for node in updated_nodes])
+
+
+if __name__ == "__main__":
+    create_scene()
+    apply_vex_code()
+    find_wrangle_nodes()
+    register_wrangle_node_type()
+    set_vex_code_in_selected_wrangle_nodes()
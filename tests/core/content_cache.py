@@ -0,0 +1,66 @@
+import os
+
+import vex_manager.core as core
+
+
+FILE_EXTENSION = ".vfl"
+
+
+def create_vex_library() -> str:
+    home_path = os.path.expanduser("~")
+    folder_path = os.path.join(home_path, "vex-manager-test", "content-cache")
+    os.makedirs(folder_path, exist_ok=True)
+
+    for i in range(5):
+        vex_file_path = os.path.join(folder_path, f"VEX{i + 1:02}{FILE_EXTENSION}")
+
+        with open(vex_file_path, "w") as file_for_write:
+            file_for_write.write(f"@P.y += {i};\n" * 10)
+
+    return folder_path
+
+
+def load() -> None:
+    folder_path = create_vex_library()
+    content_cache = core.ContentCache()
+
+    for vex_file_name in sorted(os.listdir(folder_path)):
+        content_cache.load(os.path.join(folder_path, vex_file_name))
+
+    vex_file_path = os.path.join(folder_path, f"VEX01{FILE_EXTENSION}")
+
+    print(f"Cached: {content_cache.contains(vex_file_path)}.")
+    print(repr(content_cache.get(vex_file_path)))
+
+
+def eviction() -> None:
+    folder_path = create_vex_library()
+    content_cache = core.ContentCache(max_characters=300)
+
+    for vex_file_name in sorted(os.listdir(folder_path)):
+        content_cache.load(os.path.join(folder_path, vex_file_name))
+
+    for vex_file_name in sorted(os.listdir(folder_path)):
+        vex_file_path = os.path.join(folder_path, vex_file_name)
+        print(f"{vex_file_name!r} cached: {content_cache.contains(vex_file_path)}.")
+
+
+def apply_change_set() -> None:
+    folder_path = create_vex_library()
+    content_cache = core.ContentCache()
+
+    vex_file_path = os.path.join(folder_path, f"VEX01{FILE_EXTENSION}")
+    new_vex_file_path = os.path.join(folder_path, f"VEX99{FILE_EXTENSION}")
+
+    content_cache.load(vex_file_path)
+    content_cache.apply_change_set(
+        core.ChangeSet(renamed=[(vex_file_path, new_vex_file_path)])
+    )
+
+    print(f"Renamed entry cached: {content_cache.contains(new_vex_file_path)}.")
+
+
+if __name__ == "__main__":
+    load()
+    eviction()
+    apply_change_set()
@@ -0,0 +1,70 @@
+import os
+
+import vex_manager.core.content_index as content_index
+import vex_manager.core.library_index as library_index
+import vex_manager.core.library_diff as library_diff
+
+
+FILE_EXTENSION = ".vfl"
+
+VEX_SNIPPETS = (
+    "@P.y += noise(@P);\n",
+    "v@Cd = chramp('color', @P.x);\n",
+    "int handle = pcopen(0, 'P', @P, 1.0, 10);\n",
+)
+
+
+def create_vex_library() -> str:
+    home_path = os.path.expanduser("~")
+    folder_path = os.path.join(home_path, "vex-manager-test", "content-index")
+    os.makedirs(folder_path, exist_ok=True)
+
+    for i, vex_snippet in enumerate(VEX_SNIPPETS):
+        vex_file_path = os.path.join(folder_path, f"VEX{i + 1:02}{FILE_EXTENSION}")
+
+        with open(vex_file_path, "w") as file_for_write:
+            file_for_write.write(vex_snippet)
+
+    return folder_path
+
+
+def search() -> None:
+    folder_path = create_vex_library()
+    records = library_index.get_library_index(folder_path).get_records()
+
+    index = content_index.get_content_index(folder_path)
+    index.build(records)
+
+    for text in ("@Cd", "noise", "pcop", "chramp color"):
+        print(f"{text!r} -> {sorted(index.search(text) or [])}")
+
+
+def update_and_save() -> None:
+    folder_path = create_vex_library()
+    records = library_index.get_library_index(folder_path).get_records()
+
+    index = content_index.get_content_index(folder_path)
+    index.build(records)
+    cache_mtime = os.stat(index.cache_file_path).st_mtime_ns
+
+    vex_file_path = records[0].path
+
+    with open(vex_file_path, "a") as file_for_write:
+        file_for_write.write("float edited = 1;\n")
+
+    index.update(library_diff.ChangeSet(modified=[vex_file_path]))
+
+    assert index.search("edited") == {vex_file_path}
+    assert os.stat(index.cache_file_path).st_mtime_ns == cache_mtime
+
+    index.save_cache()
+    cached_files = index._load_cache()
+
+    assert "edited" in cached_files[os.path.basename(vex_file_path)][2]
+
+    print(f"Token cache saved to {index.cache_file_path!r}.")
+
+
+if __name__ == "__main__":
+    search()
+    update_and_save()
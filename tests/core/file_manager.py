@@ -51,6 +51,24 @@ def get_vex_files() -> None:
     print(vex_files)
 
 
+def read_file_chunks() -> None:
+    folder_path = create_vex_library()
+    vex_file_path = os.path.join(folder_path, f"VEX04{FILE_EXTENSION}")
+
+    code = "".join(f"// Line {i}\r\n@P.y += {i};\r\n" for i in range(10_000))
+
+    with open(vex_file_path, "w", newline="") as file_for_write:
+        file_for_write.write(code)
+
+    chunks = list(file_manager.read_file_chunks(vex_file_path, chunk_size=1_000))
+
+    # \r\n pairs split across chunks still read as one newline.
+    assert "".join(text for text, _ in chunks) == code.replace("\r\n", "\n")
+    assert chunks[-1][1] == os.path.getsize(vex_file_path)
+
+    print(f"{len(chunks)} chunks read.")
+
+
 def rename_vex_file() -> None:
     folder_path = create_vex_library()
     vex_file_path = os.path.join(folder_path, f"VEX02{FILE_EXTENSION}")
@@ -59,8 +77,19 @@ def rename_vex_file() -> None:
     # file_manager.rename_vex_file(vex_file_path, 'VEX02')
 
 
+def write_vex_file() -> None:
+    folder_path = create_vex_library()
+    vex_file_path = os.path.join(folder_path, f"VEX03{FILE_EXTENSION}")
+
+    written = file_manager.write_vex_file(vex_file_path, "@P.y += 1;\n", fsync=True)
+
+    print(f"Written: {written}.")
+
+
 if __name__ == "__main__":
     create_new_file()
     delete_file()
     rename_vex_file()
+    write_vex_file()
+    read_file_chunks()
     get_vex_files()
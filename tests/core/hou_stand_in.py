@@ -0,0 +1,180 @@
+import contextlib
+import itertools
+import types
+import sys
+
+
+_session_ids = itertools.count(1)
+
+
+class Parm:
+    def __init__(self, name: str, value: str = "") -> None:
+        self._name = name
+        self._value = value
+
+        self.number_of_sets = 0
+
+    def evalAsString(self) -> str:
+        return self._value
+
+    def name(self) -> str:
+        return self._name
+
+    def set(self, value: str) -> None:
+        self._value = value
+        self.number_of_sets += 1
+
+
+class NodeType:
+    def __init__(self, name: str) -> None:
+        self._name = name
+
+    def name(self) -> str:
+        return self._name
+
+
+class Node:
+    def __init__(
+        self,
+        path: str,
+        type_name: str = "subnet",
+        parms: list[Parm] | None = None,
+    ) -> None:
+        self._path = path
+        self._type = NodeType(type_name)
+        self._parms = {parm.name(): parm for parm in parms or []}
+        self._children: list[Node] = []
+        self._user_data: dict[str, str] = {}
+        self._session_id = next(_session_ids)
+
+    def addChild(self, node: "Node") -> "Node":
+        self._children.append(node)
+
+        return node
+
+    def allSubChildren(self) -> list["Node"]:
+        sub_children = []
+
+        for child in self._children:
+            sub_children.append(child)
+            sub_children.extend(child.allSubChildren())
+
+        return sub_children
+
+    def destroyChild(self, node: "Node") -> None:
+        self._children.remove(node)
+
+    def destroyUserData(self, name: str) -> None:
+        self._user_data.pop(name, None)
+
+    def name(self) -> str:
+        return self._path.rsplit("/", 1)[-1]
+
+    def parm(self, name: str) -> Parm | None:
+        return self._parms.get(name)
+
+    def parms(self) -> list[Parm]:
+        return list(self._parms.values())
+
+    def path(self) -> str:
+        return self._path
+
+    def sessionId(self) -> int:
+        return self._session_id
+
+    def setUserData(self, name: str, value: str) -> None:
+        self._user_data[name] = value
+
+    def type(self) -> NodeType:
+        return self._type
+
+    def userData(self, name: str) -> str | None:
+        return self._user_data.get(name)
+
+
+class Scene:
+    def __init__(self) -> None:
+        self.root = Node("/")
+        self.selected_nodes: list[Node] = []
+
+        self.update_mode = "AutoUpdate"
+        self.undo_groups: list[str] = []
+        self.hip_file_callbacks: list = []
+        self.nodes_by_session_id: dict[int, Node] = {}
+
+    def add_wrangle(
+        self, path: str, type_name: str = "attribwrangle", code: str = ""
+    ) -> Node:
+        parm_name = "vexsnippet" if type_name == "volumewrangle" else "snippet"
+        node = Node(path, type_name, [Parm("class"), Parm(parm_name, code)])
+        self.nodes_by_session_id[node.sessionId()] = node
+
+        return self.root.addChild(node)
+
+    def delete_node(self, node: Node) -> None:
+        self.root.destroyChild(node)
+        del self.nodes_by_session_id[node.sessionId()]
+
+    def find_node(self, path: str) -> Node | None:
+        if path == "/":
+            return self.root
+
+        for node in self.root.allSubChildren():
+            if node.path() == path:
+                return node
+
+        return
+
+    def find_node_by_session_id(self, session_id: int) -> Node | None:
+        return self.nodes_by_session_id.get(session_id)
+
+    def clear(self) -> None:
+        self.root = Node("/")
+        self.selected_nodes.clear()
+        self.nodes_by_session_id.clear()
+
+        for callback in list(self.hip_file_callbacks):
+            callback("AfterClear")
+
+
+def install() -> Scene:
+    try:
+        import hou
+
+        if not getattr(hou, "is_stand_in", False):
+            raise RuntimeError("A real hou module is available, use a scratch scene.")
+    except ImportError:
+        pass
+
+    scene = Scene()
+
+    @contextlib.contextmanager
+    def group(label: str):
+        scene.undo_groups.append(label)
+
+        yield
+
+    def set_update_mode(update_mode: str) -> None:
+        scene.update_mode = update_mode
+
+    hou = types.ModuleType("hou")
+    hou.is_stand_in = True
+    hou.Node = Node
+    hou.Parm = Parm
+    hou.hipFile = types.SimpleNamespace(
+        addEventCallback=scene.hip_file_callbacks.append,
+        eventCallbacks=lambda: tuple(scene.hip_file_callbacks),
+    )
+    hou.hipFileEventType = types.SimpleNamespace(
+        AfterClear="AfterClear", AfterLoad="AfterLoad", AfterMerge="AfterMerge"
+    )
+    hou.node = scene.find_node
+    hou.nodeBySessionId = scene.find_node_by_session_id
+    hou.selectedNodes = lambda: list(scene.selected_nodes)
+    hou.undos = types.SimpleNamespace(group=group)
+    hou.updateMode = types.SimpleNamespace(AutoUpdate="AutoUpdate", Manual="Manual")
+    hou.updateModeSetting = lambda: scene.update_mode
+    hou.setUpdateMode = set_update_mode
+    sys.modules["hou"] = hou
+
+    return scene
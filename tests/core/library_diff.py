@@ -0,0 +1,51 @@
+import shutil
+import os
+
+from vex_manager.core.library_index import LibraryIndex
+import vex_manager.core.library_diff as library_diff
+
+
+FILE_EXTENSION = ".vfl"
+
+
+def create_vex_library() -> str:
+    home_path = os.path.expanduser("~")
+    folder_path = os.path.join(home_path, "vex-manager-test", "library-diff")
+    shutil.rmtree(folder_path, ignore_errors=True)
+    os.makedirs(folder_path)
+
+    for i in range(5):
+        vex_file_path = os.path.join(folder_path, f"VEX{i + 1:02}{FILE_EXTENSION}")
+
+        with open(vex_file_path, "w") as file_for_write:
+            file_for_write.write(f"@P.y += {i};\n")
+
+    return folder_path
+
+
+def diff_snapshots() -> None:
+    folder_path = create_vex_library()
+    library_index = LibraryIndex(folder_path)
+    previous_snapshot = library_index.get_snapshot(force=True)
+
+    os.rename(
+        os.path.join(folder_path, f"VEX01{FILE_EXTENSION}"),
+        os.path.join(folder_path, f"renamed{FILE_EXTENSION}"),
+    )
+    os.remove(os.path.join(folder_path, f"VEX02{FILE_EXTENSION}"))
+    open(os.path.join(folder_path, f"added{FILE_EXTENSION}"), "w").close()
+
+    with open(os.path.join(folder_path, f"VEX03{FILE_EXTENSION}"), "a") as file:
+        file.write("@Cd = {1, 0, 0};\n")
+
+    current_snapshot = library_index.get_snapshot(force=True)
+    change_set = library_diff.diff_snapshots(previous_snapshot, current_snapshot)
+
+    print(f"Added {change_set.added}.")
+    print(f"Removed {change_set.removed}.")
+    print(f"Renamed {change_set.renamed}.")
+    print(f"Modified {change_set.modified}.")
+
+
+if __name__ == "__main__":
+    diff_snapshots()
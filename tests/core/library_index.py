@@ -0,0 +1,51 @@
+import os
+
+import vex_manager.core.library_index as library_index
+
+
+FILE_EXTENSION = ".vfl"
+
+
+def create_vex_library() -> str:
+    home_path = os.path.expanduser("~")
+    folder_path = os.path.join(home_path, "vex-manager-test", "library-index")
+    os.makedirs(folder_path, exist_ok=True)
+
+    for i in range(5):
+        vex_file_path = os.path.join(folder_path, f"VEX{i + 1:02}{FILE_EXTENSION}")
+
+        if not os.path.exists(vex_file_path):
+            with open(vex_file_path, "w") as file_for_write:
+                file_for_write.write(f"@P.y += {i};\n")
+
+    return folder_path
+
+
+def get_vex_files() -> None:
+    folder_path = create_vex_library()
+    index = library_index.get_library_index(folder_path)
+
+    print(index.get_vex_files())
+    print(f"Index cache {index.cache_file_path!r}.")
+
+
+def contains_name() -> None:
+    folder_path = create_vex_library()
+    index = library_index.get_library_index(folder_path)
+
+    print(f"VEX01 in library: {index.contains_name('VEX01')}.")
+    print(f"VEX99 in library: {index.contains_name('VEX99')}.")
+
+
+def get_content_hashes() -> None:
+    folder_path = create_vex_library()
+    index = library_index.get_library_index(folder_path)
+
+    for file_path, content_hash in index.get_content_hashes().items():
+        print(f"{os.path.basename(file_path)!r} {content_hash}")
+
+
+if __name__ == "__main__":
+    get_vex_files()
+    contains_name()
+    get_content_hashes()
@@ -0,0 +1,49 @@
+import json
+import os
+
+import vex_manager.core.preferences as preferences
+
+
+def get_preferences_path() -> str:
+    home_path = os.path.expanduser("~")
+    folder_path = os.path.join(home_path, "vex-manager-test", "preferences")
+    os.makedirs(folder_path, exist_ok=True)
+
+    return os.path.join(folder_path, "vexmanagerpreferences.json")
+
+
+def preferences_changed(change: preferences.PreferencesChange) -> None:
+    print(f"Changed keys {sorted(change.keys())!r}.")
+
+
+def update() -> None:
+    service = preferences.Preferences(get_preferences_path())
+    service.subscribe(preferences_changed)
+
+    service.update({"tab_size": 2, "font_size": 10})
+    service.update({"tab_size": 2})
+
+    print(f"Tab size {service.get('tab_size')}.")
+
+
+def revalidate() -> None:
+    preferences_path = get_preferences_path()
+    service = preferences.Preferences(preferences_path)
+    service.get_all()
+    service.subscribe(preferences_changed)
+
+    with open(preferences_path, "r") as file_for_read:
+        settings = json.load(file_for_read)
+
+    settings["auto_indent"] = not settings.get("auto_indent", True)
+
+    with open(preferences_path, "w") as file_for_write:
+        json.dump(settings, file_for_write, indent=4)
+
+    print(f"Reloaded: {service.revalidate()}.")
+    print(f"Reloaded again: {service.revalidate()}.")
+
+
+if __name__ == "__main__":
+    update()
+    revalidate()
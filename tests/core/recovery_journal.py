@@ -0,0 +1,104 @@
+import tempfile
+import os
+
+import vex_manager.core.recovery_journal as recovery_journal
+
+
+CODE = "float amplitude = chf('amplitude');\n@P.y += amplitude;\n"
+
+
+def compute_diff() -> None:
+    old_text = CODE * 1_000
+    new_text = f"{old_text[:500]}v@Cd = 1;{old_text[520:]}"
+
+    diff = recovery_journal.compute_diff(old_text, new_text)
+
+    assert diff == (500, 520, "v@Cd = 1;")
+    assert recovery_journal.apply_diff(old_text, diff) == new_text
+    assert recovery_journal.compute_diff(old_text, old_text) == (
+        len(old_text),
+        len(old_text),
+        "",
+    )
+
+    print(f"Diff {diff}.")
+
+
+def journal_and_recover() -> None:
+    with tempfile.TemporaryDirectory() as folder_path:
+        library_path = os.path.join(folder_path, "library")
+        os.makedirs(library_path)
+
+        file_path = os.path.join(library_path, "VEX01.vfl")
+
+        with open(file_path, "w") as file_for_write:
+            file_for_write.write(CODE)
+
+        journal = recovery_journal.RecoveryJournal(
+            library_path, recovery_path=os.path.join(folder_path, "recovery")
+        )
+
+        # Typing a line in two batches.
+        journal.update([(file_path, f"{CODE}v@Cd")], [])
+        journal.update([(file_path, f"{CODE}v@Cd = 1;\n")], [])
+
+        assert journal.contains(os.path.join(library_path, ".", "VEX01.vfl"))
+        assert not journal.contains(os.path.join(f"{library_path}2", "VEX01.vfl"))
+
+        journal_file_path = journal._get_journal_file_path(file_path)
+
+        with open(journal_file_path, "r") as file_for_read:
+            print(file_for_read.read(), end="")
+
+        # A crash while appending leaves a cut record behind.
+        with open(journal_file_path, "a") as file_for_write:
+            file_for_write.write('[45,45,"@P.x')
+
+        recovered_files = recovery_journal.RecoveryJournal(
+            library_path, recovery_path=os.path.join(folder_path, "recovery")
+        ).read()
+
+        assert [recovered_file.content for recovered_file in recovered_files] == [
+            f"{CODE}v@Cd = 1;\n"
+        ]
+
+        # Saved since, the journal no longer applies and is dropped.
+        with open(file_path, "w") as file_for_write:
+            file_for_write.write(f"{CODE}v@Cd = 1;\n")
+
+        assert not journal.read()
+        assert not os.path.exists(journal_file_path)
+
+        journal.update([(file_path, "")], [])
+        journal.update([], [file_path])
+
+        assert not os.path.exists(journal_file_path)
+
+        # Saved under one spelling of the path and edited under another.
+        journal.update([(file_path, f"{CODE}v@Cd")], [])
+        journal.discard(os.path.join(library_path, ".", "VEX01.vfl"))
+        journal.update([(file_path, f"{CODE}v@Cd = 1;\n@P.y")], [])
+
+        assert [recovered_file.content for recovered_file in journal.read()] == [
+            f"{CODE}v@Cd = 1;\n@P.y"
+        ]
+
+        # Recovery put off, the next session carries on from the journal.
+        next_journal = recovery_journal.RecoveryJournal(
+            library_path, recovery_path=os.path.join(folder_path, "recovery")
+        )
+        next_journal.update([(file_path, f"{CODE}v@Cd = 1;\n@P.y += 1;")], [])
+
+        assert [recovered_file.content for recovered_file in journal.read()] == [
+            f"{CODE}v@Cd = 1;\n@P.y += 1;"
+        ]
+
+        with open(journal_file_path, "r") as file_for_read:
+            assert len(file_for_read.read().splitlines()) == 3
+
+    print(f"{len(recovered_files)} file recovered.")
+
+
+if __name__ == "__main__":
+    compute_diff()
+    journal_and_recover()
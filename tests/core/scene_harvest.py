@@ -0,0 +1,68 @@
+import hou_stand_in
+
+scene = hou_stand_in.install()
+
+import os
+
+import vex_manager.core.scene_harvest as scene_harvest
+import vex_manager.core.vex_manager as vex_manager
+
+
+FILE_EXTENSION = ".vfl"
+NUMBER_OF_NODES = 20_000
+
+
+def create_vex_library() -> str:
+    home_path = os.path.expanduser("~")
+    folder_path = os.path.join(home_path, "vex-manager-test", "scene-harvest")
+    os.makedirs(folder_path, exist_ok=True)
+
+    for i in range(5):
+        vex_file_path = os.path.join(folder_path, f"VEX{i + 1:02}{FILE_EXTENSION}")
+
+        with open(vex_file_path, "w") as file_for_write:
+            file_for_write.write(f"@P.y += {i};\n")
+
+    return folder_path
+
+
+def create_scene(folder_path: str) -> None:
+    for i in range(NUMBER_OF_NODES):
+        # Trailing whitespace is ignored by the content hash.
+        scene.add_wrangle(f"/obj/geo1/attribwrangle{i + 1}", code=f"@P.y += {i % 6};  ")
+
+    vex_file_path = os.path.join(folder_path, f"VEX02{FILE_EXTENSION}")
+    drifted_node = scene.add_wrangle("/obj/geo1/drifted1")
+    vex_manager.apply_vex_code(
+        [drifted_node], "@P.y += 1;", library_file_path=vex_file_path
+    )
+    vex_manager.apply_vex_code([drifted_node], "@P.y += 100;", insert=True)
+
+    # Same name in another library, not drifted from this one.
+    other_vex_file_path = os.path.join(f"{folder_path}-other", f"VEX02{FILE_EXTENSION}")
+    other_node = scene.add_wrangle("/obj/geo1/other1")
+    vex_manager.apply_vex_code(
+        [other_node], "@P.y += 50;", library_file_path=other_vex_file_path
+    )
+
+
+def harvest_scene() -> None:
+    folder_path = create_vex_library()
+    create_scene(folder_path)
+
+    report = scene_harvest.harvest_scene(folder_path)
+
+    print(f"Harvested {report.number_of_nodes} snippets.")
+
+    for file_path, node_paths in sorted(report.used.items()):
+        print(f"{os.path.basename(file_path)!r} used by {len(node_paths)} nodes.")
+
+    print(f"Unsaved snippets {len(report.unsaved)}.")
+    print(f"Drifted snippets {report.drifted!r}.")
+
+    assert list(report.drifted) == ["/obj/geo1/drifted1"]
+    assert "/obj/geo1/other1" in report.unsaved
+
+
+if __name__ == "__main__":
+    harvest_scene()
@@ -0,0 +1,80 @@
+import hou_stand_in
+
+scene = hou_stand_in.install()
+
+import time
+import os
+
+import vex_manager.core.vex_manager as vex_manager
+
+
+FILE_EXTENSION = ".vfl"
+NUMBER_OF_NODES = 20_000
+NUMBER_OF_LINKED_NODES = 500
+
+
+def create_scene(vex_file_path: str) -> list[hou_stand_in.Node]:
+    for i in range(NUMBER_OF_NODES):
+        scene.add_wrangle(f"/obj/geo1/attribwrangle{i + 1}", code=f"@P.y += {i};")
+
+    linked_nodes = [
+        scene.add_wrangle(f"/obj/geo2/attribwrangle{i + 1}")
+        for i in range(NUMBER_OF_LINKED_NODES)
+    ]
+    vex_manager.apply_vex_code(
+        linked_nodes, "@P.y += 1;", library_file_path=vex_file_path, linked=True
+    )
+
+    return linked_nodes
+
+
+def propagate_vex_code() -> None:
+    home_path = os.path.expanduser("~")
+    vex_file_path = os.path.join(home_path, f"VEX01{FILE_EXTENSION}")
+    new_vex_file_path = os.path.join(home_path, f"VEX02{FILE_EXTENSION}")
+
+    linked_nodes = create_scene(vex_file_path)
+    scene.delete_node(linked_nodes[0])
+    vex_manager.apply_vex_code([linked_nodes[1]], "@P.y += 2;")
+
+    # The first call indexes the scene, later calls only visit linked nodes.
+    start_time = time.perf_counter()
+    updated_nodes = vex_manager.propagate_vex_code(vex_file_path, "@P.y += 10;")
+    print(
+        f"Propagated to {len(updated_nodes)} nodes in "
+        f"{time.perf_counter() - start_time:.4f} seconds."
+    )
+
+    start_time = time.perf_counter()
+    updated_nodes = vex_manager.propagate_vex_code(vex_file_path, "@P.y += 20;")
+    print(
+        f"Propagated to {len(updated_nodes)} nodes in "
+        f"{time.perf_counter() - start_time:.4f} seconds."
+    )
+
+    updated_nodes = vex_manager.propagate_vex_code(vex_file_path, "@P.y += 20;")
+    print(f"Unchanged snippet propagated to {len(updated_nodes)} nodes.")
+
+    print(f"Undo groups {len(scene.undo_groups)}.")
+
+    # Same name in another library, its nodes are left alone.
+    other_vex_file_path = os.path.join(home_path, "other", f"VEX01{FILE_EXTENSION}")
+    other_node = scene.add_wrangle("/obj/geo3/attribwrangle1")
+    vex_manager.apply_vex_code(
+        [other_node], "@P.y += 1;", library_file_path=other_vex_file_path, linked=True
+    )
+
+    vex_manager.rename_snippet_links(vex_file_path, new_vex_file_path)
+    updated_nodes = vex_manager.propagate_vex_code(new_vex_file_path, "@P.y += 30;")
+    print(f"Renamed snippet propagated to {len(updated_nodes)} nodes.")
+
+    assert other_node not in updated_nodes
+    assert vex_manager.get_linked_nodes(other_vex_file_path) == [other_node]
+    assert other_node.parm("snippet").evalAsString() == "@P.y += 1;"
+
+    scene.clear()
+    print(f"Linked nodes after clear {vex_manager.get_linked_nodes(vex_file_path)}.")
+
+
+if __name__ == "__main__":
+    propagate_vex_code()
@@ -0,0 +1,27 @@
+import vex_manager.core.vex_lexer as vex_lexer
+
+
+VEX_CODE = """/* Multi-line
+   comment */
+float amplitude = chf("amplitude"); // Single-line comment
+string message = "multi-line \\
+string";
+v@Cd = noise(@P * amplitude);
+"""
+
+
+def tokenize_block() -> None:
+    state = vex_lexer.LexerState.NORMAL
+
+    for line in VEX_CODE.splitlines():
+        tokens, state = vex_lexer.tokenize_block(line, state)
+        spans = [
+            (line[start : start + length], token_type.name)
+            for start, length, token_type in tokens
+        ]
+
+        print(f"{line!r} {spans} {state.name}")
+
+
+if __name__ == "__main__":
+    tokenize_block()
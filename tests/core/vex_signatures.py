@@ -0,0 +1,79 @@
+import timeit
+
+import vex_manager.config.compile_vex_signatures as compile_vex_signatures
+import vex_manager.core.vex_signatures as vex_signatures
+import vex_manager.core.vex_lexer as vex_lexer
+
+
+NUMBER_OF_LOOKUPS = 10_000
+
+
+def parse_usages() -> None:
+    usages = [
+        "float fit(float value, float omin, float omax, float nmin, float nmax)",
+        "void append(<type>&array[], <type>value)",
+        "int setpointattrib(int geohandle, string name, int point_num, "
+        '<type>value, string mode="set")',
+        "string sprintf(string format, ...)",
+        "matrix3 ident()",
+        "not a signature",
+    ]
+    signatures = compile_vex_signatures.compile_signatures(iter(usages))
+
+    for name, overloads in signatures.items():
+        print(name, overloads)
+
+
+def find_calls() -> None:
+    texts = [
+        "float value = fit(",
+        "float value = fit(@P.y, 0, ",
+        "vector pos = set(length(v), ",
+        'int points[] = nearpoints(0, @P, chf("radius"), ',
+        "if (@P.y > 0) {",
+        "@P.y = 1;",
+        "float values[] = {1, ",
+    ]
+
+    for text in texts:
+        print(f"{text!r}: {vex_signatures.find_call(text)}")
+
+    # Commas and parentheses in strings and comments are not arguments.
+    calls = {
+        'printf("a, b", ': ("printf", 1),
+        'printf("a, b", x) ; printf(")", ': ("printf", 1),
+        "fit(@P.y /* a, b) */, ": ("fit", 1),
+        'printf("(", ': ("printf", 1),
+    }
+
+    for text, call in calls.items():
+        tokens, _ = vex_lexer.tokenize_block(text)
+
+        assert vex_signatures.find_call(text, tokens) == call, text
+
+    # Tokens come from the whole line, the cursor may sit inside a string.
+    tokens, _ = vex_lexer.tokenize_block('printf("a, b", x);')
+    assert vex_signatures.find_call('printf("a, ', tokens) == ("printf", 0)
+
+
+def load_signatures() -> None:
+    vex_signatures.unload()
+
+    load_time = timeit.timeit(lambda: vex_signatures.get_signatures("fit"), number=1)
+    print(f"Loaded {vex_signatures.is_loaded()} in {load_time * 1e3:.2f} ms.")
+
+    lookup_time = timeit.timeit(
+        lambda: vex_signatures.get_signatures("setpointattrib"),
+        number=NUMBER_OF_LOOKUPS,
+    )
+    print(f"Lookup: {lookup_time / NUMBER_OF_LOOKUPS * 1e6:.2f} us.")
+
+    for name in ("fit", "setpointattrib", "printf", "unknown"):
+        for signature in vex_signatures.get_signatures(name):
+            print(signature.format())
+
+
+if __name__ == "__main__":
+    parse_usages()
+    find_calls()
+    load_signatures()
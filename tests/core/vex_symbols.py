@@ -0,0 +1,95 @@
+import random
+import timeit
+
+import vex_manager.config.compile_vex_syntaxis as compile_vex_syntaxis
+import vex_manager.core.vex_symbols as vex_symbols
+import vex_manager.core.vex_lexer as vex_lexer
+import vex_manager.config as config
+from vex_manager.config import VEXSyntaxis
+
+
+NUMBER_OF_LOOKUPS = 10_000
+
+
+def check_tables() -> None:
+    assert compile_vex_syntaxis.is_in_sync()
+    assert (
+        config.VEXSyntaxisTables.SOURCE_HASH == compile_vex_syntaxis.get_source_hash()
+    )
+
+    print("Tables in sync.")
+
+    names = sorted(
+        set(VEXSyntaxis.KEYWORDS)
+        | set(VEXSyntaxis.DATA_TYPES)
+        | set(VEXSyntaxis.VEX_FUNCTIONS)
+    )
+    prefixes = {name[:length] for name in names for length in range(len(name) + 1)}
+    prefixes.update(["agentz", "Dx", "xyzdistx", "noise_"])
+
+    mismatches = [
+        prefix
+        for prefix in prefixes
+        if vex_symbols.get_symbols_with_prefix(prefix)
+        != tuple(name for name in names if name.startswith(prefix))
+    ]
+    print(f"Checked {len(prefixes)} prefixes, mismatches {mismatches!r}.")
+
+    print(vex_symbols.get_symbols_with_prefix("fit"))
+    print(vex_symbols.is_vex_function("noise"), vex_symbols.is_keyword("foreach"))
+
+
+def update_document_symbols() -> None:
+    lines = [f"float value{i} = fit01(@P.y, 0, 1);" for i in range(1_000)]
+    document_symbols = vex_symbols.DocumentSymbols.from_lines(lines)
+    random_generator = random.Random(0)
+
+    for _ in range(1_000):
+        first_block = random_generator.randrange(len(lines))
+        number_of_blocks = random_generator.randint(0, 3)
+        new_lines = [
+            f"vector @N{random_generator.randrange(50)} = normal;"
+            for _ in range(random_generator.randint(0, 3))
+        ]
+
+        # An edit always leaves at least one block.
+        if len(lines) - number_of_blocks + len(new_lines) < 1:
+            continue
+
+        lines[first_block : first_block + number_of_blocks] = new_lines
+        document_symbols.replace_blocks(
+            first_block,
+            number_of_blocks,
+            [
+                vex_symbols.extract_symbols(line, vex_lexer.tokenize(line))
+                for line in new_lines
+            ],
+        )
+
+    scanned_document_symbols = vex_symbols.DocumentSymbols.from_lines(lines)
+    symbols = document_symbols.get_symbols_with_prefix("")
+    scanned_symbols = scanned_document_symbols.get_symbols_with_prefix("")
+    print(f"Incremental symbols match a full scan {symbols == scanned_symbols}.")
+    print(vex_symbols.get_completions("@N1", document_symbols)[:5])
+
+
+def compare_lookups() -> None:
+    linear_time = timeit.timeit(
+        lambda: "xyzdist" in VEXSyntaxis.VEX_FUNCTIONS, number=NUMBER_OF_LOOKUPS
+    )
+    set_time = timeit.timeit(
+        lambda: vex_symbols.is_vex_function("xyzdist"), number=NUMBER_OF_LOOKUPS
+    )
+    prefix_time = timeit.timeit(
+        lambda: vex_symbols.get_symbols_with_prefix("xyzd"), number=NUMBER_OF_LOOKUPS
+    )
+
+    print(f"List membership: {linear_time / NUMBER_OF_LOOKUPS * 1e6:.2f} us.")
+    print(f"Set membership: {set_time / NUMBER_OF_LOOKUPS * 1e6:.2f} us.")
+    print(f"Prefix lookup: {prefix_time / NUMBER_OF_LOOKUPS * 1e6:.2f} us.")
+
+
+if __name__ == "__main__":
+    check_tables()
+    update_document_symbols()
+    compare_lookups()
@@ -0,0 +1,111 @@
+from PySide2 import QtWidgets
+
+import tempfile
+import time
+import sys
+import os
+
+from vex_manager.gui.vex_editor_widget import VEXEditorWidget
+import vex_manager.core as core
+
+
+NUMBER_OF_FILES = 5
+NUMBER_OF_LINES = 3_000
+
+VEX_LINE = "v@Cd = set(fit01(@P.y, 0, 1), 0.5, 1.0); // color"
+
+
+def display(vex_editor_widget: VEXEditorWidget, file_path: str) -> float:
+    start_time = time.perf_counter()
+
+    vex_editor_widget.set_file_path(file_path)
+    vex_editor_widget.display_code()
+    QtWidgets.QApplication.processEvents()
+
+    return time.perf_counter() - start_time
+
+
+def switch_documents(folder_path: str) -> None:
+    file_paths = []
+
+    for i in range(NUMBER_OF_FILES):
+        file_path = os.path.join(folder_path, f"VEX{i + 1:02}.vfl")
+        file_paths.append(file_path)
+
+        with open(file_path, "w") as file_for_write:
+            file_for_write.write("\n".join([f"{VEX_LINE} {i}"] * NUMBER_OF_LINES))
+
+    vex_editor_widget = VEXEditorWidget()
+    vex_editor_widget.show()
+    vex_plain_text_editor = vex_editor_widget.vex_plain_text_editor
+
+    for file_path in file_paths:
+        vex_editor_widget.content_cache.load(file_path)
+
+    first_time = display(vex_editor_widget, file_paths[0])
+    document = vex_plain_text_editor.document()
+
+    vex_plain_text_editor.textCursor().insertText("float amplitude = 1;\n")
+    vex_plain_text_editor.verticalScrollBar().setValue(1_000)
+
+    display(vex_editor_widget, file_paths[1])
+    swap_time = display(vex_editor_widget, file_paths[0])
+
+    # Same document, edits, undo stack and scroll position included.
+    assert vex_plain_text_editor.document() is document
+    assert vex_plain_text_editor.toPlainText().startswith("float amplitude = 1;")
+    assert vex_plain_text_editor.document().isUndoAvailable()
+    assert vex_plain_text_editor.verticalScrollBar().value() == 1_000
+
+    print(f"First display: {first_time * 1e3:.1f} ms, swap: {swap_time * 1e3:.1f} ms.")
+
+    # Room for about two documents, the one in the editor is never evicted.
+    vex_editor_widget.document_pool.max_characters = (
+        (len(VEX_LINE) + 3) * NUMBER_OF_LINES * 2
+    )
+
+    for file_path in file_paths:
+        display(vex_editor_widget, file_path)
+
+    pooled_paths = [
+        file_path
+        for file_path in file_paths
+        if vex_editor_widget.document_pool.get(file_path) is not None
+    ]
+
+    # The first document has unsaved edits, so it stays as well.
+    assert pooled_paths == [file_paths[0], file_paths[-1]]
+
+    print(f"Pooled after eviction: {[os.path.basename(p) for p in pooled_paths]}.")
+
+    # Written by something else, so the pooled document is read again.
+    with open(file_paths[-2], "w") as file_for_write:
+        file_for_write.write("int i = 0;")
+
+    vex_editor_widget.content_cache.invalidate(file_paths[-2])
+    display(vex_editor_widget, file_paths[-2])
+
+    while vex_plain_text_editor.isReadOnly():
+        QtWidgets.QApplication.processEvents()
+
+    assert vex_plain_text_editor.toPlainText() == "int i = 0;"
+
+    renamed_file_path = os.path.join(folder_path, "renamed.vfl")
+    os.rename(file_paths[-2], renamed_file_path)
+    vex_editor_widget.apply_change_set(
+        core.ChangeSet(renamed=[(file_paths[-2], renamed_file_path)])
+    )
+    assert vex_editor_widget.document_pool.get(renamed_file_path) is not None
+
+    print("External change and rename handled.")
+
+    vex_editor_widget.content_thread_pool.waitForDone()
+    vex_plain_text_editor.symbols_thread_pool.waitForDone()
+
+
+if __name__ == "__main__":
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QtWidgets.QApplication(sys.argv)
+
+    with tempfile.TemporaryDirectory() as folder_path:
+        switch_documents(folder_path)
@@ -0,0 +1,19 @@
+from PySide2 import QtWidgets
+
+import sys
+
+from vex_manager.gui.file_explorer_tree_view import FileExplorerTreeView
+
+
+def main():
+    app = QtWidgets.QApplication(sys.argv)
+
+    texture_settings_widget = FileExplorerTreeView()
+    texture_settings_widget.set_paths([f"Item {i}.vfl" for i in range(100_000)])
+    texture_settings_widget.show()
+
+    sys.exit(app.exec_())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,35 @@
 from PySide2 import QtWidgets
 
 import sys
+import os
 
 from vex_manager.gui.file_explorer_widget import FileExplorerWidget
 
 
+FILE_EXTENSION = ".vfl"
+
+
+def create_vex_library() -> str:
+    home_path = os.path.expanduser("~")
+    folder_path = os.path.join(home_path, "vex-manager-test", "file-explorer")
+    os.makedirs(folder_path, exist_ok=True)
+
+    for i in range(10):
+        vex_file_path = os.path.join(folder_path, f"VEX{i + 1:02}{FILE_EXTENSION}")
+
+        if not os.path.exists(vex_file_path):
+            open(vex_file_path, "a").close()
+
+    return folder_path
+
+
 def main():
     app = QtWidgets.QApplication(sys.argv)
 
     texture_settings_widget = FileExplorerWidget()
+    texture_settings_widget.set_library_path(create_vex_library())
     texture_settings_widget.show()
 
-    for i in range(10):
-        item = QtWidgets.QTreeWidgetItem()
-        item.setText(0, f"Item {i}")
-        texture_settings_widget.file_explorer_tree_widget.addTopLevelItem(item)
-
     sys.exit(app.exec_())
 
 
@@ -1,13 +1,79 @@
 from PySide2 import QtWidgets
+from PySide2 import QtCore
+from PySide2 import QtTest
+from PySide2 import QtGui
 
 import sys
 
 from vex_manager.gui.vex_plain_text_edit import VEXPlainTextEdit
 
 
+def send_key_events() -> None:
+    text_edit = VEXPlainTextEdit()
+    text_edit.show()
+
+    # Qt prints exceptions raised in event handlers and carries on.
+    errors = []
+    excepthook = sys.excepthook
+    sys.excepthook = lambda *exc_info: errors.append(exc_info[1])
+
+    try:
+        for key in (
+            QtCore.Qt.Key_F,
+            QtCore.Qt.Key_ParenLeft,
+            QtCore.Qt.Key_Return,
+            QtCore.Qt.Key_Backspace,
+            QtCore.Qt.Key_QuoteDbl,
+        ):
+            QtTest.QTest.keyClick(text_edit, key)
+
+        point_size = text_edit.font.pointSize()
+        QtTest.QTest.keyClick(text_edit, QtCore.Qt.Key_Plus, QtCore.Qt.ControlModifier)
+    finally:
+        sys.excepthook = excepthook
+
+    assert not errors, errors
+    assert text_edit.font.pointSize() == point_size + 1
+
+    print(f"Key events handled: {text_edit.toPlainText()!r}.")
+
+    text_edit.deleteLater()
+
+
+def scan_pasted_blocks() -> None:
+    text_edit = VEXPlainTextEdit()
+    text_edit.setPlainText("float alpha = 1;\n" * 1_000)
+
+    def wait_for_symbols() -> None:
+        text_edit.symbols_thread_pool.waitForDone()
+        QtWidgets.QApplication.processEvents()
+
+    wait_for_symbols()
+
+    # Pasted blocks are scanned on their own, without copying the whole document.
+    scans = []
+    text_edit.toPlainText = lambda: scans.append(True) or ""
+
+    text_cursor = QtGui.QTextCursor(text_edit.document())
+    text_cursor.setPosition(170)
+    text_cursor.insertText("".join(f"vector beta{i} = 0;\n" for i in range(1_000)))
+    wait_for_symbols()
+
+    assert not scans
+    assert text_edit.document_symbols.contains("beta999")
+    assert text_edit.document_symbols.get_number_of_blocks() == 2_001
+
+    print("Pasted blocks scanned.")
+
+    text_edit.deleteLater()
+
+
 def main():
     app = QtWidgets.QApplication(sys.argv)
 
+    send_key_events()
+    scan_pasted_blocks()
+
     texture_settings_widget = VEXPlainTextEdit()
     texture_settings_widget.show()
 
@@ -0,0 +1,66 @@
+from PySide2 import QtWidgets
+from PySide2 import QtGui
+
+import sys
+import os
+
+from vex_manager.gui.vex_syntax_highlighter import VEXSyntaxHighlighter
+import vex_manager.gui.vex_token_cache as vex_token_cache
+import vex_manager.core.vex_lexer as vex_lexer
+
+
+NUMBER_OF_LINES = 1_000
+
+VEX_LINE = "v@Cd = set(fit01(@P.y, 0, 1), 0.5, 1.0); // color"
+
+
+def count_tokenized_blocks() -> None:
+    number_of_tokenized_blocks = 0
+    tokenize_block = vex_lexer.tokenize_block
+
+    def counting_tokenize_block(*args):
+        nonlocal number_of_tokenized_blocks
+        number_of_tokenized_blocks += 1
+
+        return tokenize_block(*args)
+
+    vex_lexer.tokenize_block = counting_tokenize_block
+
+    # A bare QTextDocument has no layout and emits no contentsChange.
+    plain_text_edit = QtWidgets.QPlainTextEdit()
+    plain_text_edit.setPlainText("\n".join([VEX_LINE] * NUMBER_OF_LINES))
+    document = plain_text_edit.document()
+    vex_syntax_highlighter = VEXSyntaxHighlighter(document)
+
+    # The first highlight is deferred to the event loop.
+    QtWidgets.QApplication.processEvents()
+    print(f"Set text: {number_of_tokenized_blocks} blocks tokenized.")
+
+    number_of_tokenized_blocks = 0
+    text_cursor = QtGui.QTextCursor(document.findBlockByNumber(NUMBER_OF_LINES // 2))
+    text_cursor.insertText("float amplitude = 1;")
+    print(f"Single-line edit: {number_of_tokenized_blocks} blocks tokenized.")
+
+    number_of_tokenized_blocks = 0
+    text_cursor.insertText("/* ")
+    print(f"Open block comment: {number_of_tokenized_blocks} blocks tokenized.")
+
+    number_of_tokenized_blocks = 0
+    vex_syntax_highlighter.rehighlight()
+    print(f"Rehighlight: {number_of_tokenized_blocks} blocks tokenized.")
+
+    number_of_tokenized_blocks = 0
+    block = document.findBlockByNumber(NUMBER_OF_LINES // 2)
+    symbols = vex_token_cache.get_block_symbols(block)
+    token = vex_token_cache.get_token_at(block, len("float amplitude = 1;/* "))
+    print(f"Symbols {sorted(symbols)}, token {token}.")
+    print(f"Editor queries: {number_of_tokenized_blocks} blocks tokenized.")
+
+    vex_lexer.tokenize_block = tokenize_block
+
+
+if __name__ == "__main__":
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QtWidgets.QApplication(sys.argv)
+
+    count_tokenized_blocks()
@@ -1,8 +1,17 @@
+from typing import Any
 import logging
 
-from vex_manager.gui.vex_manager_ui import VEXManagerUI
-
 
 logging.basicConfig(format=f"%(levelname)s: [VEX Manager] %(message)s")
 logger = logging.getLogger("vex_manager")
 # logger.setLevel(logging.DEBUG)
+
+
+# The UI needs Qt and hou, which the command-line interface must not import.
+def __getattr__(name: str) -> Any:
+    if name == "VEXManagerUI":
+        from vex_manager.gui.vex_manager_ui import VEXManagerUI
+
+        return VEXManagerUI
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,7 @@
+import sys
+
+from vex_manager.cli import main
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,231 @@
+from pathlib import Path
+import argparse
+import logging
+import shutil
+import sys
+import os
+
+from vex_manager.core.file_manager import create_new_vex_file
+from vex_manager.core.file_manager import rename_vex_file
+from vex_manager.core.file_manager import write_vex_file
+from vex_manager.core.file_manager import delete_file
+from vex_manager.core.content_index import get_content_index
+from vex_manager.core.library_index import get_library_index
+from vex_manager.core.library_index import FILE_EXTENSION
+import vex_manager.utils as utils
+
+
+logger = logging.getLogger(f"vex_manager.{__name__}")
+
+LIBRARY_PATH_ENVIRONMENT_VARIABLE = "VEX_MANAGER_LIBRARY_PATH"
+
+
+def _get_file_path(library_path: str, name: str) -> str:
+    file_path = get_library_index(library_path).get_path(Path(name).stem)
+
+    if not file_path:
+        logger.error(f"{name!r} not found in {library_path!r}.")
+
+    return file_path
+
+
+def _list(arguments: argparse.Namespace) -> int:
+    library_index = get_library_index(arguments.library_path)
+
+    for file_path in library_index.get_vex_files():
+        print(file_path if arguments.paths else Path(file_path).stem)
+
+    return 0
+
+
+def _search(arguments: argparse.Namespace) -> int:
+    library_index = get_library_index(arguments.library_path)
+    records = library_index.get_records()
+
+    content_index = get_content_index(arguments.library_path)
+
+    if not content_index.is_ready():
+        content_index.build(records)
+
+    text = arguments.text.lower()
+    content_matches = content_index.search(text) or set()
+
+    for file_path in library_index.get_vex_files():
+        if text in Path(file_path).stem.lower() or file_path in content_matches:
+            print(file_path if arguments.paths else Path(file_path).stem)
+
+    return 0
+
+
+def _new(arguments: argparse.Namespace) -> int:
+    name = arguments.name
+
+    if name and not utils.is_valid_file_name(name):
+        logger.error(f"{name!r} is not a valid file name.")
+
+        return 1
+
+    if arguments.file == "-":
+        code = sys.stdin.read()
+    elif arguments.file:
+        with open(arguments.file, "r") as file_for_read:
+            code = file_for_read.read()
+    else:
+        code = ""
+
+    file_path, _ = create_new_vex_file(arguments.library_path, name=name)
+
+    if not file_path:
+        return 1
+
+    if code and not write_vex_file(file_path, code):
+        return 1
+
+    get_library_index(arguments.library_path).add_file(file_path)
+
+    print(file_path)
+
+    return 0
+
+
+def _rename(arguments: argparse.Namespace) -> int:
+    file_path = _get_file_path(arguments.library_path, arguments.name)
+
+    if not file_path:
+        return 1
+
+    new_file_path, _ = rename_vex_file(file_path, arguments.new_name)
+
+    if new_file_path == file_path:
+        return 1
+
+    print(new_file_path)
+
+    return 0
+
+
+def _delete(arguments: argparse.Namespace) -> int:
+    file_path = _get_file_path(arguments.library_path, arguments.name)
+
+    if not file_path:
+        return 1
+
+    delete_file(file_path)
+
+    return 0
+
+
+def _export(arguments: argparse.Namespace) -> int:
+    library_index = get_library_index(arguments.library_path)
+
+    if arguments.names:
+        file_paths = [
+            _get_file_path(arguments.library_path, name) for name in arguments.names
+        ]
+
+        if not all(file_paths):
+            return 1
+    else:
+        file_paths = library_index.get_vex_files()
+
+    os.makedirs(arguments.destination, exist_ok=True)
+
+    for file_path in file_paths:
+        shutil.copy2(file_path, arguments.destination)
+
+    print(f"{len(file_paths)} files exported to {arguments.destination!r}.")
+
+    return 0
+
+
+def _stats(arguments: argparse.Namespace) -> int:
+    library_index = get_library_index(arguments.library_path)
+    records = library_index.get_records()
+    content_hashes = library_index.get_content_hashes()
+
+    number_of_duplicates = len(content_hashes) - len(set(content_hashes.values()))
+    number_of_empty_files = sum(1 for record in records if not record.size)
+    total_size = sum(record.size for record in records)
+
+    print(f"Library path: {library_index.library_path}")
+    print(f"Files: {len(records)}")
+    print(f"Total size: {total_size} bytes")
+    print(f"Empty files: {number_of_empty_files}")
+    print(f"Duplicate files: {number_of_duplicates}")
+
+    return 0
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="vex_manager",
+        description="Query and maintain a VEX Manager library without Houdini.",
+    )
+    parser.add_argument(
+        "-l",
+        "--library-path",
+        default=os.environ.get(LIBRARY_PATH_ENVIRONMENT_VARIABLE, ""),
+        help=f"library folder (default: ${LIBRARY_PATH_ENVIRONMENT_VARIABLE})",
+    )
+    parser.add_argument("-v", "--verbose", action="store_true")
+
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = subparsers.add_parser("list", help="list the library files")
+    list_parser.add_argument("--paths", action="store_true", help="print full paths")
+    list_parser.set_defaults(function=_list)
+
+    search_parser = subparsers.add_parser(
+        "search", help="search the library by file name and content"
+    )
+    search_parser.add_argument("text")
+    search_parser.add_argument("--paths", action="store_true", help="print full paths")
+    search_parser.set_defaults(function=_search)
+
+    new_parser = subparsers.add_parser("new", help="create a library file")
+    new_parser.add_argument("name", nargs="?", default="")
+    new_parser.add_argument(
+        "-f", "--file", default="", help="read the code from a file, or - for stdin"
+    )
+    new_parser.set_defaults(function=_new)
+
+    rename_parser = subparsers.add_parser("rename", help="rename a library file")
+    rename_parser.add_argument("name")
+    rename_parser.add_argument("new_name")
+    rename_parser.set_defaults(function=_rename)
+
+    delete_parser = subparsers.add_parser("delete", help="delete a library file")
+    delete_parser.add_argument("name")
+    delete_parser.set_defaults(function=_delete)
+
+    export_parser = subparsers.add_parser(
+        "export", help="copy library files to a folder"
+    )
+    export_parser.add_argument("destination")
+    export_parser.add_argument(
+        "names", nargs="*", help=f"files to export (default: all {FILE_EXTENSION})"
+    )
+    export_parser.set_defaults(function=_export)
+
+    stats_parser = subparsers.add_parser("stats", help="print library statistics")
+    stats_parser.set_defaults(function=_stats)
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = create_parser()
+    arguments = parser.parse_args(argv)
+
+    if arguments.verbose:
+        logging.getLogger("vex_manager").setLevel(logging.DEBUG)
+
+    if not arguments.library_path:
+        parser.error(
+            f"no library path, use --library-path or "
+            f"${LIBRARY_PATH_ENVIRONMENT_VARIABLE}."
+        )
+    elif not os.path.isdir(arguments.library_path):
+        parser.error(f"library path {arguments.library_path!r} does not exist.")
+
+    return arguments.function(arguments)
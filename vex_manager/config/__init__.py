@@ -1,5 +1,43 @@
-from vex_manager.config.color_scheme import ColorScheme
+from typing import Any
+import importlib
+import logging
 
-from vex_manager.config.vex_syntaxis import VEXSyntaxis
+from vex_manager.config.color_scheme import ColorScheme
 
 from vex_manager.config.wrangle_nodes import WrangleNodes
+
+
+logger = logging.getLogger(f"vex_manager.{__name__}")
+
+# The syntax tables are large and only needed once code is highlighted.
+_SYNTAX_ATTRIBUTES = {
+    "VEXSyntaxis": "vex_manager.config.vex_syntaxis",
+    "VEXSyntaxisTables": "vex_manager.config.vex_syntaxis_tables",
+}
+
+
+def _check_source_hash(source_hash: str) -> None:
+    compile_vex_syntaxis = importlib.import_module(
+        "vex_manager.config.compile_vex_syntaxis"
+    )
+
+    if source_hash != compile_vex_syntaxis.get_source_hash():
+        logger.warning(
+            "VEX syntax tables are out of date with vex_syntaxis.py, run "
+            "python -m vex_manager.config.compile_vex_syntaxis."
+        )
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _SYNTAX_ATTRIBUTES.get(name)
+
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+
+    if name == "VEXSyntaxisTables":
+        _check_source_hash(value.SOURCE_HASH)
+
+    return value
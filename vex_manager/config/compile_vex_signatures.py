@@ -0,0 +1,188 @@
+"""Compile VEX function signatures from the help of a Houdini install.
+
+The output goes to ~/.vex_manager/cache/vex_signatures.json, the file the editor loads
+first. The vex_signatures.json bundled next to this script is a hand-picked snapshot of
+about 85 common functions out of the ~1100 in VEXSyntaxis.VEX_FUNCTIONS, other
+functions only get signatures once this script has been run.
+"""
+
+from typing import Iterator
+from pathlib import Path
+import argparse
+import zipfile
+import json
+import sys
+import os
+import re
+
+import vex_manager.utils as utils
+
+
+SIGNATURES_FILE_NAME = "vex_signatures.json"
+
+USAGE_PATTERN = re.compile(r"^:usage:\s*`(?P<usage>[^`]+)`", re.MULTILINE)
+SIGNATURE_PATTERN = re.compile(
+    r"^(?P<return_type>.+?)\s*\b(?P<name>[A-Za-z_]\w*)\s*\((?P<arguments>.*)\)\s*;?$"
+)
+ARGUMENT_PATTERN = re.compile(
+    r"^(?P<type>.*?)\s*(?P<name>&?\s*[A-Za-z_]\w*(?:\[\])?)\s*(?:=\s*(?P<default>.+))?$"
+)
+
+
+def _split_arguments(arguments: str) -> list[str]:
+    split_arguments = []
+    depth = 0
+    start = 0
+
+    for index, character in enumerate(arguments):
+        if character in "([{<":
+            depth += 1
+        elif character in ")]}>":
+            depth -= 1
+        elif character == "," and not depth:
+            split_arguments.append(arguments[start:index].strip())
+            start = index + 1
+
+    split_arguments.append(arguments[start:].strip())
+
+    return [argument for argument in split_arguments if argument]
+
+
+def parse_argument(argument: str) -> list[str]:
+    if argument == "...":
+        return ["...", ""]
+
+    match = ARGUMENT_PATTERN.match(argument)
+
+    if match is None or not match.group("type"):
+        return [argument, ""]
+
+    parsed_argument = [match.group("type"), match.group("name").replace(" ", "")]
+
+    if match.group("default"):
+        parsed_argument.append(match.group("default").strip())
+
+    return parsed_argument
+
+
+def parse_signature(usage: str) -> tuple[str, list] | None:
+    match = SIGNATURE_PATTERN.match(" ".join(usage.split()))
+
+    if match is None:
+        return
+
+    arguments = [
+        parse_argument(argument)
+        for argument in _split_arguments(match.group("arguments"))
+    ]
+
+    return match.group("name"), [match.group("return_type"), arguments]
+
+
+def read_help_usages(help_path: str) -> Iterator[str]:
+    # $HFS/houdini/help ships the VEX pages zipped, an extracted copy also works.
+    vex_zip_path = os.path.join(help_path, "vex.zip")
+
+    if os.path.isfile(vex_zip_path):
+        with zipfile.ZipFile(vex_zip_path) as vex_zip:
+            for name in sorted(vex_zip.namelist()):
+                if name.startswith("functions/") and name.endswith(".txt"):
+                    text = vex_zip.read(name).decode("utf-8", errors="replace")
+
+                    for match in USAGE_PATTERN.finditer(text):
+                        yield match.group("usage")
+
+        return
+
+    functions_path = Path(help_path, "vex", "functions")
+
+    for file_path in sorted(functions_path.glob("*.txt")):
+        text = file_path.read_text(encoding="utf-8", errors="replace")
+
+        for match in USAGE_PATTERN.finditer(text):
+            yield match.group("usage")
+
+
+def read_usages(file_path: str) -> Iterator[str]:
+    with open(file_path, "r") as file_for_read:
+        for line in file_for_read:
+            line = line.strip()
+
+            if line and not line.startswith("#"):
+                yield line
+
+
+def compile_signatures(usages: Iterator[str]) -> dict[str, list]:
+    signatures: dict[str, list] = {}
+
+    for usage in usages:
+        parsed_signature = parse_signature(usage)
+
+        if parsed_signature is None:
+            continue
+
+        name, signature = parsed_signature
+        overloads = signatures.setdefault(name, [])
+
+        if signature not in overloads:
+            overloads.append(signature)
+
+    return signatures
+
+
+def format_signatures(signatures: dict[str, list]) -> str:
+    # One function per line keeps the bundled snapshot diffable.
+    lines = [
+        f"{json.dumps(name)}: {json.dumps(signatures[name], separators=(',', ':'))}"
+        for name in sorted(signatures)
+    ]
+
+    return "{\n" + ",\n".join(lines) + "\n}\n"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Compile VEX function signatures from the Houdini help."
+    )
+    parser.add_argument(
+        "--help-path",
+        default=os.path.join(os.environ.get("HFS", ""), "houdini", "help"),
+        help="Houdini help folder (default: $HFS/houdini/help)",
+    )
+    parser.add_argument(
+        "--usages", default="", help="read one usage per line from a text file instead"
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default=os.path.join(utils.get_cache_path(), SIGNATURES_FILE_NAME),
+        help=f"output file (default: ~/.vex_manager/cache/{SIGNATURES_FILE_NAME})",
+    )
+    arguments = parser.parse_args(argv)
+
+    if arguments.usages:
+        usages = read_usages(arguments.usages)
+    elif os.path.isdir(arguments.help_path):
+        usages = read_help_usages(arguments.help_path)
+    else:
+        parser.error(f"help path {arguments.help_path!r} does not exist.")
+
+    signatures = compile_signatures(usages)
+
+    if not signatures:
+        print("No signatures found.", file=sys.stderr)
+
+        return 1
+
+    os.makedirs(os.path.dirname(os.path.abspath(arguments.output)), exist_ok=True)
+
+    with open(arguments.output, "w") as file_for_write:
+        file_for_write.write(format_signatures(signatures))
+
+    print(f"{len(signatures)} functions written to {arguments.output}.")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,171 @@
+from pathlib import Path
+import argparse
+import hashlib
+import json
+import sys
+
+from vex_manager.config.vex_syntaxis import VEXSyntaxis
+
+
+TABLES_FILE_PATH = Path(__file__).with_name("vex_syntaxis_tables.py")
+LINE_LENGTH = 88
+
+HEADER = (
+    "# Generated by vex_manager/config/compile_vex_syntaxis.py from vex_syntaxis.py.\n"
+    "# Do not edit, run python -m vex_manager.config.compile_vex_syntaxis instead.\n"
+)
+
+
+def get_source_hash() -> str:
+    source = json.dumps(
+        [VEXSyntaxis.KEYWORDS, VEXSyntaxis.DATA_TYPES, VEXSyntaxis.VEX_FUNCTIONS]
+    )
+
+    return hashlib.sha1(source.encode("utf-8")).hexdigest()
+
+
+def _build_trie(
+    names: list[str], start: int, end: int, depth: int, nodes: list[tuple]
+) -> int:
+    # Chains of single children are merged into one edge.
+    node_index = len(nodes)
+    children = {}
+    nodes.append((start, end, children))
+
+    index = start
+
+    while index < end:
+        if len(names[index]) == depth:
+            index += 1
+
+            continue
+
+        character = names[index][depth]
+        child_end = index
+
+        while child_end < end and names[child_end][depth] == character:
+            child_end += 1
+
+        label_end = depth + 1
+        child_names = names[index:child_end]
+
+        while all(len(name) > label_end for name in child_names) and (
+            len({name[label_end] for name in child_names}) == 1
+        ):
+            label_end += 1
+
+        children[character] = (
+            names[index][depth:label_end],
+            _build_trie(names, index, child_end, label_end, nodes),
+        )
+        index = child_end
+
+    return node_index
+
+
+def _format_items(items: list[str], indent: str) -> str:
+    lines = []
+    line = ""
+
+    for item in items:
+        if line and len(indent) + len(line) + len(item) + 2 > LINE_LENGTH:
+            lines.append(f"{indent}{line}")
+            line = ""
+
+        line = f"{line} {item}," if line else f"{item},"
+
+    if line:
+        lines.append(f"{indent}{line}")
+
+    return "\n".join(lines)
+
+
+def _format_names(names: list[str]) -> str:
+    return _format_items([json.dumps(name) for name in sorted(names)], " " * 8)
+
+
+def _format_frozenset(name: str, names: list[str]) -> str:
+    return f"    {name} = frozenset({{\n{_format_names(names)}\n    }})"
+
+
+def _format_node(node: tuple) -> str:
+    start, end, children = node
+    edges = [
+        f"{json.dumps(character)}: ({json.dumps(label)}, {child_index})"
+        for character, (label, child_index) in children.items()
+    ]
+    formatted_node = f"        ({start}, {end}, {{{', '.join(edges)}}}),"
+
+    if len(formatted_node) <= LINE_LENGTH:
+        return formatted_node
+
+    return (
+        f"        ({start}, {end}, {{\n"
+        f"{_format_items(edges, ' ' * 12)}\n"
+        f"        }}),"
+    )
+
+
+def compile_tables() -> str:
+    names = sorted(
+        set(VEXSyntaxis.KEYWORDS)
+        | set(VEXSyntaxis.DATA_TYPES)
+        | set(VEXSyntaxis.VEX_FUNCTIONS)
+    )
+
+    nodes = []
+    _build_trie(names, 0, len(names), 0, nodes)
+    formatted_nodes = "\n".join(_format_node(node) for node in nodes)
+
+    return (
+        f"{HEADER}\n"
+        f"# fmt: off\n"
+        f"class VEXSyntaxisTables:\n"
+        f"    SOURCE_HASH = {json.dumps(get_source_hash())}\n\n"
+        f"{_format_frozenset('KEYWORDS', VEXSyntaxis.KEYWORDS)}\n\n"
+        f"{_format_frozenset('DATA_TYPES', VEXSyntaxis.DATA_TYPES)}\n\n"
+        f"{_format_frozenset('VEX_FUNCTIONS', VEXSyntaxis.VEX_FUNCTIONS)}\n\n"
+        f"    # Every name, sorted, so a prefix matches a contiguous slice.\n"
+        f"    NAMES = (\n{_format_names(names)}\n    )\n\n"
+        f"    # Compact prefix trie, node 0 is the root. Each node is (start, end,\n"
+        f"    # {{first character: (edge label, child node)}}) and its prefix matches\n"
+        f"    # NAMES[start:end].\n"
+        f"    TRIE = (\n{formatted_nodes}\n    )\n"
+        f"# fmt: on\n"
+    )
+
+
+def is_in_sync() -> bool:
+    if not TABLES_FILE_PATH.exists():
+        return False
+
+    return TABLES_FILE_PATH.read_text(encoding="utf-8") == compile_tables()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Compile the VEX syntax lists into lookup tables."
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="exit with an error if the tables are out of date instead of writing",
+    )
+    arguments = parser.parse_args(argv)
+
+    if arguments.check:
+        if is_in_sync():
+            return 0
+
+        print(f"{TABLES_FILE_PATH} is out of date.", file=sys.stderr)
+
+        return 1
+
+    TABLES_FILE_PATH.write_text(compile_tables(), encoding="utf-8")
+    print(f"{TABLES_FILE_PATH} written.")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
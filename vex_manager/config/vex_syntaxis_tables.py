@@ -0,0 +1,2344 @@
+# Generated by vex_manager/config/compile_vex_syntaxis.py from vex_syntaxis.py.
+# Do not edit, run python -m vex_manager.config.compile_vex_syntaxis instead.
+
+# fmt: off
+class VEXSyntaxisTables:
+    SOURCE_HASH = "0f334e57b329ab8183b4bd4c41b1e165fcbeb80e"
+
+    KEYWORDS = frozenset({
+        "break", "const", "continue", "do", "else", "export", "false", "for", "foreach",
+        "forpoints", "function", "gather", "if", "illuminance", "import", "return",
+        "struct", "true", "void", "while",
+    })
+
+    DATA_TYPES = frozenset({
+        "bsdf", "dict", "float", "int", "matrix", "matrix2", "matrix3", "string",
+        "struct", "vector", "vector2", "vector4",
+    })
+
+    VEX_FUNCTIONS = frozenset({
+        "Du", "Dv", "Dw", "abs", "abspath", "accessframe", "acos", "addattrib",
+        "adddetailattrib", "addpoint", "addpointattrib", "addprim", "addprimattrib",
+        "addvariablename", "addvertex", "addvertexattrib", "addvisualizer",
+        "agentaddclip", "agentchannelcount", "agentchannelnames", "agentchannelvalue",
+        "agentchannelvalues", "agentclipcatalog", "agentclipchannel",
+        "agentclipchannelnames", "agentcliplayerblend", "agentcliplength",
+        "agentclipnames", "agentclipsample", "agentclipsamplelocal",
+        "agentclipsamplerate", "agentclipsampleworld", "agentclipstarttime",
+        "agentcliptimes", "agentcliptransformgroups", "agentclipweights",
+        "agentcollisionlayer", "agentcollisionlayers", "agentcurrentlayer",
+        "agentcurrentlayers", "agentfindclip", "agentfindlayer",
+        "agentfindtransformgroup", "agentlayerbindings", "agentlayers",
+        "agentlayershapes", "agentlocaltransform", "agentlocaltransforms",
+        "agentmetadata", "agentrestlocaltransform", "agentrestworldtransform",
+        "agentrigchildren", "agentrigfind", "agentrigfindchannel", "agentrigparent",
+        "agentsolvefbik", "agenttransformcount", "agenttransformgroupmember",
+        "agenttransformgroupmemberchannel", "agenttransformgroups",
+        "agenttransformgroupweight", "agenttransformnames", "agenttransformtolocal",
+        "agenttransformtoworld", "agentworldtransform", "agentworldtransforms",
+        "albedo", "alphaname", "ambient", "anoise", "append", "area", "argsort",
+        "array", "ashikhmin", "asin", "assert_enabled", "assign", "atan", "atan2",
+        "atof", "atoi", "atten", "attrib", "attribclass", "attribdataid", "attribsize",
+        "attribtype", "attribtypeinfo", "avg", "binput", "blackbody", "blinn",
+        "blinnBRDF", "bouncelabel", "bouncemask", "bumpname", "cbrt", "ceil", "ch",
+        "ch2", "ch3", "ch4", "chadd", "chattr", "chattrnames", "chdict", "chend",
+        "chendf", "chendt", "chexpr", "chexprf", "chexprt", "chf", "chi", "chiang",
+        "chiang_fur", "chid", "chindex", "chinput", "chinputlimits", "chname",
+        "chnames", "chnumchan", "chop", "choplocal", "choplocalt", "chopt", "chp",
+        "chprim_clear", "chprim_destroykey", "chprim_end", "chprim_eval",
+        "chprim_insertkey", "chprim_keycount", "chprim_keytimes", "chprim_keyvalues",
+        "chprim_length", "chprim_setkeyaccel", "chprim_setkeyslope",
+        "chprim_setkeyvalue", "chprim_start", "chr", "chramp", "chrampderiv", "chrate",
+        "chreadbuf", "chremove", "chremoveattr", "chrename", "chresizebuf", "chs",
+        "chsetattr", "chsetlength", "chsetrate", "chsetstart", "chsop", "chsraw",
+        "chstart", "chstartf", "chstartt", "chu", "chv", "chwritebuf", "cinput",
+        "ckspline", "clamp", "clip", "colormap", "colorname", "combinelocaltransform",
+        "computenormal", "concat", "cone", "cos", "cosh", "cospi", "cracktransform",
+        "create_cdf", "create_pdf", "cregioncapturetransform", "cregiondeformtransform",
+        "cregionoverridetransform", "cross", "cspline", "ctransform", "curlgxnoise",
+        "curlgxnoise2d", "curlnoise", "curlnoise2d", "curlxnoise", "curlxnoise2d",
+        "curvearclen", "cvex_bsdf", "cwnoise", "decode", "decodeattrib", "decodeparm",
+        "decodeutf8", "degrees", "depthmap", "depthname", "detail", "detailattrib",
+        "detailattribsize", "detailattribtype", "detailattribtypeinfo",
+        "detailintrinsic", "determinant", "diag", "diagonalizesymmetric", "diffuse",
+        "diffuseBRDF", "dihedral", "dimport", "distance", "distance2",
+        "distance_pointline", "distance_pointray", "distance_pointsegment", "dot",
+        "dsmpixel", "efit", "eigenvalues", "encode", "encodeattrib", "encodeparm",
+        "encodeutf8", "endswith", "environment", "erf", "erf_inv", "erfc", "error",
+        "eulertoquaternion", "eval_bsdf", "exp", "expand_udim", "expandedgegroup",
+        "expandpointgroup", "expandprimgroup", "expandvertexgroup",
+        "extractlocaltransform", "fastshadow", "filamentsample", "file_stat",
+        "filter_remap", "filtershadow", "filterstep", "find", "findattribval",
+        "findattribvalcount", "findlowerbound", "findlowerboundsorted", "findsorted",
+        "finput", "fit", "fit01", "fit10", "fit11", "floor", "flownoise", "flowpnoise",
+        "foreach", "forpoints", "frac", "fresnel", "fromNDC", "frontface", "fuzzify",
+        "fuzzy_and", "fuzzy_defuzz_centroid", "fuzzy_nand", "fuzzy_nor", "fuzzy_not",
+        "fuzzy_nxor", "fuzzy_or", "fuzzy_xor", "gather", "geoself", "geounwrap",
+        "getattrib", "getattribute", "getbbox", "getbbox_center", "getbbox_max",
+        "getbbox_min", "getbbox_size", "getblurP", "getbounces", "getbounds", "getcomp",
+        "getcomponents", "getderiv", "getfogname", "getglobalraylevel", "getgroupid",
+        "getlight", "getlightid", "getlightname", "getlights", "getlightscope",
+        "getlocalcurvature", "getmaterial", "getmaterialid", "getobjectid",
+        "getobjectname", "getpackedtransform", "getphotonlight", "getpointbbox",
+        "getpointbbox_center", "getpointbbox_max", "getpointbbox_min",
+        "getpointbbox_size", "getprimid", "getptextureid", "getraylevel",
+        "getrayweight", "getsamplestore", "getscope", "getsmoothP", "getspace",
+        "getuvtangents", "ggx", "gradient", "gxnoise", "gxnoised", "hair", "has_udim",
+        "hasattrib", "hasdetailattrib", "haslight", "hasmetadata", "hasplane",
+        "haspointattrib", "hasprimattrib", "hasvertexattrib", "hedge_dstpoint",
+        "hedge_dstvertex", "hedge_equivcount", "hedge_isequiv", "hedge_isprimary",
+        "hedge_isvalid", "hedge_next", "hedge_nextequiv", "hedge_postdstpoint",
+        "hedge_postdstvertex", "hedge_presrcpoint", "hedge_presrcvertex", "hedge_prev",
+        "hedge_prim", "hedge_primary", "hedge_srcpoint", "hedge_srcvertex",
+        "henyeygreenstein", "hex_adjacent", "hex_faceindex", "hscript_noise",
+        "hscript_rand", "hscript_snoise", "hscript_sturb", "hscript_turb", "hsvtorgb",
+        "iaspect", "ichname", "ident", "idtopoint", "idtoprim", "iend", "iendtime",
+        "ihasplane", "illuminance", "importance_remap", "inedgegroup", "inpointgroup",
+        "inprimgroup", "insert", "instance", "integratehoseksky", "interpolate",
+        "intersect", "intersect_all", "intersect_lights", "inumplanes", "invert",
+        "invertexgroup", "invlerp", "iplaneindex", "iplanename", "iplanesize", "irate",
+        "irradiance", "isalpha", "isbound", "isconnected", "isdigit", "isfinite",
+        "isfogray", "isframes", "isinf", "islpeactive", "isnan", "isotropic",
+        "israytracing", "issamples", "isseconds", "isshadingRHS", "isshadowray",
+        "istart", "istarttime", "isuvrendering", "isvalidindex", "isvarying", "itoa",
+        "ixres", "iyres", "join", "json_dumps", "json_loads", "keys", "kspline", "len",
+        "length", "length2", "lerp", "lightbounces", "lightid", "lightstate",
+        "limit_sample_space", "limport", "lkspline", "log", "log10", "lookat",
+        "lspline", "lstrip", "luminance", "lumname", "makebasis", "maketransform",
+        "makevalidvarname", "mask_bsdf", "maskname", "match", "matchvex_blinn",
+        "matchvex_specular", "mattrib", "max", "mdensity", "metadata", "metaimport",
+        "metamarch", "metanext", "metastart", "metaweight", "min", "minpos", "mspace",
+        "mwnoise", "mx_cellnoise", "mx_perlin", "mx_voronoi", "mx_worley",
+        "nametopoint", "nametoprim", "nbouncetypes", "ndcdepth", "nearpoint",
+        "nearpoints", "nedgesgroup", "neighbour", "neighbourcount", "neighbours",
+        "newsampler", "nextsample", "ninput", "ninputs", "noise", "noised", "norm_1",
+        "norm_fro", "norm_inf", "norm_max", "norm_spectral", "normal_bsdf", "normalize",
+        "normalname", "npoints", "npointsgroup", "nprimitives", "nprimitivesgroup",
+        "nrandom", "ntransform", "nuniqueval", "nvertices", "nverticesgroup",
+        "objectstate", "occlusion", "ocean_sample", "ocio_activedisplays",
+        "ocio_activeviews", "ocio_import", "ocio_parsecolorspace", "ocio_roles",
+        "ocio_spaces", "ocio_transform", "ocio_transformview", "onoise", "opdigits",
+        "opend", "opfullpath", "opid", "opparentbonetransform", "opparenttransform",
+        "opparmtransform", "oppreconstrainttransform", "oppreparmtransform",
+        "opprerawparmtransform", "oppretransform", "oprawparmtransform", "opstart",
+        "optransform", "ord", "orthographic", "osd_facecount", "osd_firstpatch",
+        "osd_limitsurface", "osd_limitsurfacevertex", "osd_lookupface",
+        "osd_lookuppatch", "osd_patchcount", "osd_patches", "outerproduct", "ow_nspace",
+        "ow_space", "ow_vspace", "pack_inttosafefloat", "packedtransform", "pathtrace",
+        "pcclose", "pccone", "pccone_radius", "pcconvex", "pcexport", "pcfarthest",
+        "pcfilter", "pcfind", "pcfind_radius", "pcgenerate", "pcimport",
+        "pcimportbyidx3", "pcimportbyidx4", "pcimportbyidxf", "pcimportbyidxi",
+        "pcimportbyidxp", "pcimportbyidxs", "pcimportbyidxv", "pciterate", "pcline",
+        "pcline_radius", "pcnumfound", "pcopen", "pcopenlod", "pcsampleleaf",
+        "pcsegment", "pcsegment_radius", "pcsize", "pcunshaded", "pcwrite",
+        "perspective", "pgfind", "phong", "phongBRDF", "phonglobe", "photonmap",
+        "pinvert", "planeindex", "planename", "planepointdistance", "planesize",
+        "planesphereintersect", "pluralize", "pnoise", "point", "pointattrib",
+        "pointattribsize", "pointattribtype", "pointattribtypeinfo", "pointedge",
+        "pointhedge", "pointhedgenext", "pointlocaltransforms", "pointname",
+        "pointprims", "pointtransform", "pointtransformrigid", "pointtransforms",
+        "pointtransformsrigid", "pointvertex", "pointvertices", "polardecomp",
+        "polyneighbours", "pop", "pow", "predicate_incircle", "predicate_insphere",
+        "predicate_orient2d", "predicate_orient3d", "premul", "prerotate", "prescale",
+        "pretranslate", "prim", "prim_attribute", "prim_normal", "primarclen",
+        "primattrib", "primattribsize", "primattribtype", "primattribtypeinfo",
+        "primduv", "primfind", "primhedge", "priminteriorweights", "primintrinsic",
+        "primpoint", "primpoints", "primuv", "primuvconvert", "primvertex",
+        "primvertexcount", "primvertices", "print_once", "printf", "product",
+        "ptexture", "ptlined", "ptransform", "push", "pxnoised", "qconvert",
+        "qdistance", "qinvert", "qmultiply", "qrotate", "quaternion",
+        "quaterniontoeuler", "radians", "ramp_lookup", "ramp_pack", "ramp_unpack",
+        "rand", "random", "random_brj", "random_fhash", "random_ihash",
+        "random_poisson", "random_shash", "random_sobol", "rawcolormap", "rayhittest",
+        "rayimport", "re_find", "re_findall", "re_match", "re_replace", "re_split",
+        "reflect", "reflectlight", "refract", "refractlight", "relativepath", "relbbox",
+        "relpath", "relpointbbox", "removeattrib", "removedetailattrib", "removeindex",
+        "removepoint", "removepointattrib", "removepointgroup", "removeprim",
+        "removeprimattrib", "removeprimgroup", "removevalue", "removevertex",
+        "removevertexattrib", "removevertexgroup", "renderstate", "reorder", "replace",
+        "replace_match", "resample_linear", "resize", "resolvemissedray", "reverse",
+        "rgbtohsv", "rgbtoxyz", "rint", "rotate", "rotate_x_to", "rstrip",
+        "sample_bsdf", "sample_cauchy", "sample_cdf", "sample_circle_arc",
+        "sample_circle_edge_uniform", "sample_circle_ring_uniform",
+        "sample_circle_slice", "sample_circle_uniform", "sample_direction_cone",
+        "sample_direction_uniform", "sample_discrete", "sample_exponential",
+        "sample_geometry", "sample_hemisphere", "sample_hypersphere_cone",
+        "sample_hypersphere_uniform", "sample_light", "sample_lognormal",
+        "sample_lognormal_by_median", "sample_normal", "sample_orientation_cone",
+        "sample_orientation_uniform", "sample_photon", "sample_sphere_cone",
+        "sample_sphere_shell_uniform", "sample_sphere_uniform", "sampledisk", "scale",
+        "scatter", "select", "sensor_panorama_create", "sensor_panorama_getcolor",
+        "sensor_panorama_getcone", "sensor_panorama_getdepth", "sensor_save",
+        "serialize", "set", "setagentchannelvalue", "setagentchannelvalues",
+        "setagentclipnames", "setagentclips", "setagentcliptimes",
+        "setagentclipweights", "setagentcollisionlayer", "setagentcollisionlayers",
+        "setagentcurrentlayer", "setagentcurrentlayers", "setagentlocaltransform",
+        "setagentlocaltransforms", "setagentworldtransform", "setagentworldtransforms",
+        "setattrib", "setattribtypeinfo", "setcomp", "setcurrentlight",
+        "setdetailattrib", "setdetailintrinsic", "setedgegroup", "setpackedtransform",
+        "setpointattrib", "setpointgroup", "setpointlocaltransforms",
+        "setpointtransform", "setpointtransforms", "setprimattrib", "setprimgroup",
+        "setprimintrinsic", "setprimvertex", "setsamplestore", "setvertexattrib",
+        "setvertexgroup", "setvertexpoint", "shadow", "shadow_light", "shadowmap",
+        "shimport", "shl", "shr", "shrz", "sign", "simport", "sin", "sinh", "sinpi",
+        "sleep", "slerp", "slerpv", "slice", "slideframe", "smooth", "smoothrotation",
+        "snoise", "solid_angle", "solveconstraint", "solvecubic", "solvecurve",
+        "solvefbik", "solveik", "solvephysfbik", "solvepoly", "solvequadratic",
+        "solvetriangleSSS", "sort", "specular", "specularBRDF", "spline", "spline_cdf",
+        "split", "split_bsdf", "splitpath", "sprintf", "sqrt", "sssapprox",
+        "startswith", "storelightexport", "strip", "strlen", "sum", "surfacedist",
+        "svddecomp", "switch", "swizzle", "tan", "tanh", "tanpi", "tet_adjacent",
+        "tet_faceindex", "teximport", "texprintf", "texture", "texture3d",
+        "texture3dBox", "titlecase", "toNDC", "tolower", "toupper", "tr", "trace",
+        "translate", "translucent", "transpose", "trunc", "tw_nspace", "tw_space",
+        "tw_vspace", "typeid", "uniqueval", "uniquevals", "unpack_intfromsafefloat",
+        "unserialize", "upush", "usd_addattrib", "usd_addcollectionexclude",
+        "usd_addcollectioninclude", "usd_addinversetotransformorder", "usd_addorient",
+        "usd_addprim", "usd_addprimvar", "usd_addrelationshiptarget", "usd_addrotate",
+        "usd_addscale", "usd_addschemaattrib", "usd_addtotransformorder",
+        "usd_addtransform", "usd_addtranslate", "usd_applyapi", "usd_attrib",
+        "usd_attribelement", "usd_attriblen", "usd_attribnames", "usd_attribsize",
+        "usd_attribtimesamples", "usd_attribtypename", "usd_blockattrib",
+        "usd_blockprimvar", "usd_blockprimvarindices", "usd_blockrelationship",
+        "usd_boundmaterialpath", "usd_childnames", "usd_clearmetadata",
+        "usd_cleartransformorder", "usd_collectioncomputedpaths",
+        "usd_collectioncontains", "usd_collectionexcludes",
+        "usd_collectionexpansionrule", "usd_collectionincludes", "usd_drawmode",
+        "usd_findtransformname", "usd_flattenediprimvar",
+        "usd_flattenediprimvarelement", "usd_flattenedprimvar",
+        "usd_flattenedprimvarelement", "usd_getbbox", "usd_getbbox_center",
+        "usd_getbbox_max", "usd_getbbox_min", "usd_getbbox_size", "usd_getbounds",
+        "usd_getpointinstancebounds", "usd_hasapi", "usd_haspayload", "usd_iprimvar",
+        "usd_iprimvarelement", "usd_iprimvarelementsize", "usd_iprimvarindices",
+        "usd_iprimvarinterpolation", "usd_iprimvarlen", "usd_iprimvarnames",
+        "usd_iprimvarsize", "usd_iprimvartimesamples", "usd_iprimvartypename",
+        "usd_isabstract", "usd_isactive", "usd_isarray", "usd_isarrayiprimvar",
+        "usd_isarraymetadata", "usd_isarrayprimvar", "usd_isattrib", "usd_iscollection",
+        "usd_iscollectionpath", "usd_isindexediprimvar", "usd_isindexedprimvar",
+        "usd_isinstance", "usd_isiprimvar", "usd_iskind", "usd_ismetadata",
+        "usd_ismodel", "usd_isprim", "usd_isprimvar", "usd_isrelationship",
+        "usd_isstage", "usd_istransformreset", "usd_istype", "usd_isvisible",
+        "usd_kind", "usd_localtransform", "usd_makeattribpath",
+        "usd_makecollectionpath", "usd_makepropertypath", "usd_makerelationshippath",
+        "usd_makevalidprimname", "usd_makevalidprimpath", "usd_metadata",
+        "usd_metadataelement", "usd_metadatalen", "usd_metadatanames", "usd_name",
+        "usd_parentpath", "usd_pointinstance_getbbox",
+        "usd_pointinstance_getbbox_center", "usd_pointinstance_getbbox_max",
+        "usd_pointinstance_getbbox_min", "usd_pointinstance_getbbox_size",
+        "usd_pointinstance_relbbox", "usd_pointinstancetransform", "usd_primvar",
+        "usd_primvarattribname", "usd_primvarelement", "usd_primvarelementsize",
+        "usd_primvarindices", "usd_primvarinterpolation", "usd_primvarlen",
+        "usd_primvarnames", "usd_primvarsize", "usd_primvartimesamples",
+        "usd_primvartypename", "usd_purpose", "usd_relationshipforwardedtargets",
+        "usd_relationshipnames", "usd_relationshiptargets", "usd_relbbox",
+        "usd_removerelationshiptarget", "usd_setactive", "usd_setattrib",
+        "usd_setattribelement", "usd_setcollectionexcludes",
+        "usd_setcollectionexpansionrule", "usd_setcollectionincludes",
+        "usd_setdrawmode", "usd_setkind", "usd_setmetadata", "usd_setmetadataelement",
+        "usd_setprimvar", "usd_setprimvarelement", "usd_setprimvarelementsize",
+        "usd_setprimvarindices", "usd_setprimvarinterpolation", "usd_setpurpose",
+        "usd_setrelationshiptargets", "usd_settransformorder", "usd_settransformreset",
+        "usd_setvariantselection", "usd_setvisibility", "usd_setvisible",
+        "usd_specifier", "usd_transformname", "usd_transformorder",
+        "usd_transformsuffix", "usd_transformtype", "usd_typename",
+        "usd_uniquetransformname", "usd_variants", "usd_variantselection",
+        "usd_variantsets", "usd_worldtransform", "uvdist", "uvintersect", "uvsample",
+        "uvunwrap", "variance", "velocityname", "vertex", "vertexattrib",
+        "vertexattribsize", "vertexattribtype", "vertexattribtypeinfo",
+        "vertexcurveparam", "vertexhedge", "vertexindex", "vertexnext", "vertexpoint",
+        "vertexprev", "vertexprim", "vertexprimindex", "vnoise", "volume",
+        "volumecubicsample", "volumecubicsamplev", "volumegradient", "volumeindex",
+        "volumeindexactive", "volumeindexi", "volumeindexorigin", "volumeindexp",
+        "volumeindextopos", "volumeindexu", "volumeindexv", "volumepostoindex",
+        "volumeres", "volumesample", "volumesamplei", "volumesamplep", "volumesampleu",
+        "volumesamplev", "volumesmoothsample", "volumesmoothsamplev", "volumetypeid",
+        "volumevoxeldiameter", "vtransform", "warning", "weightarrayblend",
+        "weightarrayfromname", "weightarraynormalize", "weightarraythreshold",
+        "windingnumber", "windingnumber2d", "wireblinn", "wirediffuse", "wnoise",
+        "wo_nspace", "wo_space", "wo_vspace", "writepixel", "wt_nspace", "wt_space",
+        "wt_vspace", "xnoise", "xnoised", "xyzdist", "xyztorgb",
+    })
+
+    # Every name, sorted, so a prefix matches a contiguous slice.
+    NAMES = (
+        "Du", "Dv", "Dw", "abs", "abspath", "accessframe", "acos", "addattrib",
+        "adddetailattrib", "addpoint", "addpointattrib", "addprim", "addprimattrib",
+        "addvariablename", "addvertex", "addvertexattrib", "addvisualizer",
+        "agentaddclip", "agentchannelcount", "agentchannelnames", "agentchannelvalue",
+        "agentchannelvalues", "agentclipcatalog", "agentclipchannel",
+        "agentclipchannelnames", "agentcliplayerblend", "agentcliplength",
+        "agentclipnames", "agentclipsample", "agentclipsamplelocal",
+        "agentclipsamplerate", "agentclipsampleworld", "agentclipstarttime",
+        "agentcliptimes", "agentcliptransformgroups", "agentclipweights",
+        "agentcollisionlayer", "agentcollisionlayers", "agentcurrentlayer",
+        "agentcurrentlayers", "agentfindclip", "agentfindlayer",
+        "agentfindtransformgroup", "agentlayerbindings", "agentlayers",
+        "agentlayershapes", "agentlocaltransform", "agentlocaltransforms",
+        "agentmetadata", "agentrestlocaltransform", "agentrestworldtransform",
+        "agentrigchildren", "agentrigfind", "agentrigfindchannel", "agentrigparent",
+        "agentsolvefbik", "agenttransformcount", "agenttransformgroupmember",
+        "agenttransformgroupmemberchannel", "agenttransformgroups",
+        "agenttransformgroupweight", "agenttransformnames", "agenttransformtolocal",
+        "agenttransformtoworld", "agentworldtransform", "agentworldtransforms",
+        "albedo", "alphaname", "ambient", "anoise", "append", "area", "argsort",
+        "array", "ashikhmin", "asin", "assert_enabled", "assign", "atan", "atan2",
+        "atof", "atoi", "atten", "attrib", "attribclass", "attribdataid", "attribsize",
+        "attribtype", "attribtypeinfo", "avg", "binput", "blackbody", "blinn",
+        "blinnBRDF", "bouncelabel", "bouncemask", "break", "bsdf", "bumpname", "cbrt",
+        "ceil", "ch", "ch2", "ch3", "ch4", "chadd", "chattr", "chattrnames", "chdict",
+        "chend", "chendf", "chendt", "chexpr", "chexprf", "chexprt", "chf", "chi",
+        "chiang", "chiang_fur", "chid", "chindex", "chinput", "chinputlimits", "chname",
+        "chnames", "chnumchan", "chop", "choplocal", "choplocalt", "chopt", "chp",
+        "chprim_clear", "chprim_destroykey", "chprim_end", "chprim_eval",
+        "chprim_insertkey", "chprim_keycount", "chprim_keytimes", "chprim_keyvalues",
+        "chprim_length", "chprim_setkeyaccel", "chprim_setkeyslope",
+        "chprim_setkeyvalue", "chprim_start", "chr", "chramp", "chrampderiv", "chrate",
+        "chreadbuf", "chremove", "chremoveattr", "chrename", "chresizebuf", "chs",
+        "chsetattr", "chsetlength", "chsetrate", "chsetstart", "chsop", "chsraw",
+        "chstart", "chstartf", "chstartt", "chu", "chv", "chwritebuf", "cinput",
+        "ckspline", "clamp", "clip", "colormap", "colorname", "combinelocaltransform",
+        "computenormal", "concat", "cone", "const", "continue", "cos", "cosh", "cospi",
+        "cracktransform", "create_cdf", "create_pdf", "cregioncapturetransform",
+        "cregiondeformtransform", "cregionoverridetransform", "cross", "cspline",
+        "ctransform", "curlgxnoise", "curlgxnoise2d", "curlnoise", "curlnoise2d",
+        "curlxnoise", "curlxnoise2d", "curvearclen", "cvex_bsdf", "cwnoise", "decode",
+        "decodeattrib", "decodeparm", "decodeutf8", "degrees", "depthmap", "depthname",
+        "detail", "detailattrib", "detailattribsize", "detailattribtype",
+        "detailattribtypeinfo", "detailintrinsic", "determinant", "diag",
+        "diagonalizesymmetric", "dict", "diffuse", "diffuseBRDF", "dihedral", "dimport",
+        "distance", "distance2", "distance_pointline", "distance_pointray",
+        "distance_pointsegment", "do", "dot", "dsmpixel", "efit", "eigenvalues", "else",
+        "encode", "encodeattrib", "encodeparm", "encodeutf8", "endswith", "environment",
+        "erf", "erf_inv", "erfc", "error", "eulertoquaternion", "eval_bsdf", "exp",
+        "expand_udim", "expandedgegroup", "expandpointgroup", "expandprimgroup",
+        "expandvertexgroup", "export", "extractlocaltransform", "false", "fastshadow",
+        "filamentsample", "file_stat", "filter_remap", "filtershadow", "filterstep",
+        "find", "findattribval", "findattribvalcount", "findlowerbound",
+        "findlowerboundsorted", "findsorted", "finput", "fit", "fit01", "fit10",
+        "fit11", "float", "floor", "flownoise", "flowpnoise", "for", "foreach",
+        "forpoints", "frac", "fresnel", "fromNDC", "frontface", "function", "fuzzify",
+        "fuzzy_and", "fuzzy_defuzz_centroid", "fuzzy_nand", "fuzzy_nor", "fuzzy_not",
+        "fuzzy_nxor", "fuzzy_or", "fuzzy_xor", "gather", "geoself", "geounwrap",
+        "getattrib", "getattribute", "getbbox", "getbbox_center", "getbbox_max",
+        "getbbox_min", "getbbox_size", "getblurP", "getbounces", "getbounds", "getcomp",
+        "getcomponents", "getderiv", "getfogname", "getglobalraylevel", "getgroupid",
+        "getlight", "getlightid", "getlightname", "getlights", "getlightscope",
+        "getlocalcurvature", "getmaterial", "getmaterialid", "getobjectid",
+        "getobjectname", "getpackedtransform", "getphotonlight", "getpointbbox",
+        "getpointbbox_center", "getpointbbox_max", "getpointbbox_min",
+        "getpointbbox_size", "getprimid", "getptextureid", "getraylevel",
+        "getrayweight", "getsamplestore", "getscope", "getsmoothP", "getspace",
+        "getuvtangents", "ggx", "gradient", "gxnoise", "gxnoised", "hair", "has_udim",
+        "hasattrib", "hasdetailattrib", "haslight", "hasmetadata", "hasplane",
+        "haspointattrib", "hasprimattrib", "hasvertexattrib", "hedge_dstpoint",
+        "hedge_dstvertex", "hedge_equivcount", "hedge_isequiv", "hedge_isprimary",
+        "hedge_isvalid", "hedge_next", "hedge_nextequiv", "hedge_postdstpoint",
+        "hedge_postdstvertex", "hedge_presrcpoint", "hedge_presrcvertex", "hedge_prev",
+        "hedge_prim", "hedge_primary", "hedge_srcpoint", "hedge_srcvertex",
+        "henyeygreenstein", "hex_adjacent", "hex_faceindex", "hscript_noise",
+        "hscript_rand", "hscript_snoise", "hscript_sturb", "hscript_turb", "hsvtorgb",
+        "iaspect", "ichname", "ident", "idtopoint", "idtoprim", "iend", "iendtime",
+        "if", "ihasplane", "illuminance", "import", "importance_remap", "inedgegroup",
+        "inpointgroup", "inprimgroup", "insert", "instance", "int", "integratehoseksky",
+        "interpolate", "intersect", "intersect_all", "intersect_lights", "inumplanes",
+        "invert", "invertexgroup", "invlerp", "iplaneindex", "iplanename", "iplanesize",
+        "irate", "irradiance", "isalpha", "isbound", "isconnected", "isdigit",
+        "isfinite", "isfogray", "isframes", "isinf", "islpeactive", "isnan",
+        "isotropic", "israytracing", "issamples", "isseconds", "isshadingRHS",
+        "isshadowray", "istart", "istarttime", "isuvrendering", "isvalidindex",
+        "isvarying", "itoa", "ixres", "iyres", "join", "json_dumps", "json_loads",
+        "keys", "kspline", "len", "length", "length2", "lerp", "lightbounces",
+        "lightid", "lightstate", "limit_sample_space", "limport", "lkspline", "log",
+        "log10", "lookat", "lspline", "lstrip", "luminance", "lumname", "makebasis",
+        "maketransform", "makevalidvarname", "mask_bsdf", "maskname", "match",
+        "matchvex_blinn", "matchvex_specular", "matrix", "matrix2", "matrix3",
+        "mattrib", "max", "mdensity", "metadata", "metaimport", "metamarch", "metanext",
+        "metastart", "metaweight", "min", "minpos", "mspace", "mwnoise", "mx_cellnoise",
+        "mx_perlin", "mx_voronoi", "mx_worley", "nametopoint", "nametoprim",
+        "nbouncetypes", "ndcdepth", "nearpoint", "nearpoints", "nedgesgroup",
+        "neighbour", "neighbourcount", "neighbours", "newsampler", "nextsample",
+        "ninput", "ninputs", "noise", "noised", "norm_1", "norm_fro", "norm_inf",
+        "norm_max", "norm_spectral", "normal_bsdf", "normalize", "normalname",
+        "npoints", "npointsgroup", "nprimitives", "nprimitivesgroup", "nrandom",
+        "ntransform", "nuniqueval", "nvertices", "nverticesgroup", "objectstate",
+        "occlusion", "ocean_sample", "ocio_activedisplays", "ocio_activeviews",
+        "ocio_import", "ocio_parsecolorspace", "ocio_roles", "ocio_spaces",
+        "ocio_transform", "ocio_transformview", "onoise", "opdigits", "opend",
+        "opfullpath", "opid", "opparentbonetransform", "opparenttransform",
+        "opparmtransform", "oppreconstrainttransform", "oppreparmtransform",
+        "opprerawparmtransform", "oppretransform", "oprawparmtransform", "opstart",
+        "optransform", "ord", "orthographic", "osd_facecount", "osd_firstpatch",
+        "osd_limitsurface", "osd_limitsurfacevertex", "osd_lookupface",
+        "osd_lookuppatch", "osd_patchcount", "osd_patches", "outerproduct", "ow_nspace",
+        "ow_space", "ow_vspace", "pack_inttosafefloat", "packedtransform", "pathtrace",
+        "pcclose", "pccone", "pccone_radius", "pcconvex", "pcexport", "pcfarthest",
+        "pcfilter", "pcfind", "pcfind_radius", "pcgenerate", "pcimport",
+        "pcimportbyidx3", "pcimportbyidx4", "pcimportbyidxf", "pcimportbyidxi",
+        "pcimportbyidxp", "pcimportbyidxs", "pcimportbyidxv", "pciterate", "pcline",
+        "pcline_radius", "pcnumfound", "pcopen", "pcopenlod", "pcsampleleaf",
+        "pcsegment", "pcsegment_radius", "pcsize", "pcunshaded", "pcwrite",
+        "perspective", "pgfind", "phong", "phongBRDF", "phonglobe", "photonmap",
+        "pinvert", "planeindex", "planename", "planepointdistance", "planesize",
+        "planesphereintersect", "pluralize", "pnoise", "point", "pointattrib",
+        "pointattribsize", "pointattribtype", "pointattribtypeinfo", "pointedge",
+        "pointhedge", "pointhedgenext", "pointlocaltransforms", "pointname",
+        "pointprims", "pointtransform", "pointtransformrigid", "pointtransforms",
+        "pointtransformsrigid", "pointvertex", "pointvertices", "polardecomp",
+        "polyneighbours", "pop", "pow", "predicate_incircle", "predicate_insphere",
+        "predicate_orient2d", "predicate_orient3d", "premul", "prerotate", "prescale",
+        "pretranslate", "prim", "prim_attribute", "prim_normal", "primarclen",
+        "primattrib", "primattribsize", "primattribtype", "primattribtypeinfo",
+        "primduv", "primfind", "primhedge", "priminteriorweights", "primintrinsic",
+        "primpoint", "primpoints", "primuv", "primuvconvert", "primvertex",
+        "primvertexcount", "primvertices", "print_once", "printf", "product",
+        "ptexture", "ptlined", "ptransform", "push", "pxnoised", "qconvert",
+        "qdistance", "qinvert", "qmultiply", "qrotate", "quaternion",
+        "quaterniontoeuler", "radians", "ramp_lookup", "ramp_pack", "ramp_unpack",
+        "rand", "random", "random_brj", "random_fhash", "random_ihash",
+        "random_poisson", "random_shash", "random_sobol", "rawcolormap", "rayhittest",
+        "rayimport", "re_find", "re_findall", "re_match", "re_replace", "re_split",
+        "reflect", "reflectlight", "refract", "refractlight", "relativepath", "relbbox",
+        "relpath", "relpointbbox", "removeattrib", "removedetailattrib", "removeindex",
+        "removepoint", "removepointattrib", "removepointgroup", "removeprim",
+        "removeprimattrib", "removeprimgroup", "removevalue", "removevertex",
+        "removevertexattrib", "removevertexgroup", "renderstate", "reorder", "replace",
+        "replace_match", "resample_linear", "resize", "resolvemissedray", "return",
+        "reverse", "rgbtohsv", "rgbtoxyz", "rint", "rotate", "rotate_x_to", "rstrip",
+        "sample_bsdf", "sample_cauchy", "sample_cdf", "sample_circle_arc",
+        "sample_circle_edge_uniform", "sample_circle_ring_uniform",
+        "sample_circle_slice", "sample_circle_uniform", "sample_direction_cone",
+        "sample_direction_uniform", "sample_discrete", "sample_exponential",
+        "sample_geometry", "sample_hemisphere", "sample_hypersphere_cone",
+        "sample_hypersphere_uniform", "sample_light", "sample_lognormal",
+        "sample_lognormal_by_median", "sample_normal", "sample_orientation_cone",
+        "sample_orientation_uniform", "sample_photon", "sample_sphere_cone",
+        "sample_sphere_shell_uniform", "sample_sphere_uniform", "sampledisk", "scale",
+        "scatter", "select", "sensor_panorama_create", "sensor_panorama_getcolor",
+        "sensor_panorama_getcone", "sensor_panorama_getdepth", "sensor_save",
+        "serialize", "set", "setagentchannelvalue", "setagentchannelvalues",
+        "setagentclipnames", "setagentclips", "setagentcliptimes",
+        "setagentclipweights", "setagentcollisionlayer", "setagentcollisionlayers",
+        "setagentcurrentlayer", "setagentcurrentlayers", "setagentlocaltransform",
+        "setagentlocaltransforms", "setagentworldtransform", "setagentworldtransforms",
+        "setattrib", "setattribtypeinfo", "setcomp", "setcurrentlight",
+        "setdetailattrib", "setdetailintrinsic", "setedgegroup", "setpackedtransform",
+        "setpointattrib", "setpointgroup", "setpointlocaltransforms",
+        "setpointtransform", "setpointtransforms", "setprimattrib", "setprimgroup",
+        "setprimintrinsic", "setprimvertex", "setsamplestore", "setvertexattrib",
+        "setvertexgroup", "setvertexpoint", "shadow", "shadow_light", "shadowmap",
+        "shimport", "shl", "shr", "shrz", "sign", "simport", "sin", "sinh", "sinpi",
+        "sleep", "slerp", "slerpv", "slice", "slideframe", "smooth", "smoothrotation",
+        "snoise", "solid_angle", "solveconstraint", "solvecubic", "solvecurve",
+        "solvefbik", "solveik", "solvephysfbik", "solvepoly", "solvequadratic",
+        "solvetriangleSSS", "sort", "specular", "specularBRDF", "spline", "spline_cdf",
+        "split", "split_bsdf", "splitpath", "sprintf", "sqrt", "sssapprox",
+        "startswith", "storelightexport", "string", "strip", "strlen", "struct", "sum",
+        "surfacedist", "svddecomp", "switch", "swizzle", "tan", "tanh", "tanpi",
+        "tet_adjacent", "tet_faceindex", "teximport", "texprintf", "texture",
+        "texture3d", "texture3dBox", "titlecase", "toNDC", "tolower", "toupper", "tr",
+        "trace", "translate", "translucent", "transpose", "true", "trunc", "tw_nspace",
+        "tw_space", "tw_vspace", "typeid", "uniqueval", "uniquevals",
+        "unpack_intfromsafefloat", "unserialize", "upush", "usd_addattrib",
+        "usd_addcollectionexclude", "usd_addcollectioninclude",
+        "usd_addinversetotransformorder", "usd_addorient", "usd_addprim",
+        "usd_addprimvar", "usd_addrelationshiptarget", "usd_addrotate", "usd_addscale",
+        "usd_addschemaattrib", "usd_addtotransformorder", "usd_addtransform",
+        "usd_addtranslate", "usd_applyapi", "usd_attrib", "usd_attribelement",
+        "usd_attriblen", "usd_attribnames", "usd_attribsize", "usd_attribtimesamples",
+        "usd_attribtypename", "usd_blockattrib", "usd_blockprimvar",
+        "usd_blockprimvarindices", "usd_blockrelationship", "usd_boundmaterialpath",
+        "usd_childnames", "usd_clearmetadata", "usd_cleartransformorder",
+        "usd_collectioncomputedpaths", "usd_collectioncontains",
+        "usd_collectionexcludes", "usd_collectionexpansionrule",
+        "usd_collectionincludes", "usd_drawmode", "usd_findtransformname",
+        "usd_flattenediprimvar", "usd_flattenediprimvarelement", "usd_flattenedprimvar",
+        "usd_flattenedprimvarelement", "usd_getbbox", "usd_getbbox_center",
+        "usd_getbbox_max", "usd_getbbox_min", "usd_getbbox_size", "usd_getbounds",
+        "usd_getpointinstancebounds", "usd_hasapi", "usd_haspayload", "usd_iprimvar",
+        "usd_iprimvarelement", "usd_iprimvarelementsize", "usd_iprimvarindices",
+        "usd_iprimvarinterpolation", "usd_iprimvarlen", "usd_iprimvarnames",
+        "usd_iprimvarsize", "usd_iprimvartimesamples", "usd_iprimvartypename",
+        "usd_isabstract", "usd_isactive", "usd_isarray", "usd_isarrayiprimvar",
+        "usd_isarraymetadata", "usd_isarrayprimvar", "usd_isattrib", "usd_iscollection",
+        "usd_iscollectionpath", "usd_isindexediprimvar", "usd_isindexedprimvar",
+        "usd_isinstance", "usd_isiprimvar", "usd_iskind", "usd_ismetadata",
+        "usd_ismodel", "usd_isprim", "usd_isprimvar", "usd_isrelationship",
+        "usd_isstage", "usd_istransformreset", "usd_istype", "usd_isvisible",
+        "usd_kind", "usd_localtransform", "usd_makeattribpath",
+        "usd_makecollectionpath", "usd_makepropertypath", "usd_makerelationshippath",
+        "usd_makevalidprimname", "usd_makevalidprimpath", "usd_metadata",
+        "usd_metadataelement", "usd_metadatalen", "usd_metadatanames", "usd_name",
+        "usd_parentpath", "usd_pointinstance_getbbox",
+        "usd_pointinstance_getbbox_center", "usd_pointinstance_getbbox_max",
+        "usd_pointinstance_getbbox_min", "usd_pointinstance_getbbox_size",
+        "usd_pointinstance_relbbox", "usd_pointinstancetransform", "usd_primvar",
+        "usd_primvarattribname", "usd_primvarelement", "usd_primvarelementsize",
+        "usd_primvarindices", "usd_primvarinterpolation", "usd_primvarlen",
+        "usd_primvarnames", "usd_primvarsize", "usd_primvartimesamples",
+        "usd_primvartypename", "usd_purpose", "usd_relationshipforwardedtargets",
+        "usd_relationshipnames", "usd_relationshiptargets", "usd_relbbox",
+        "usd_removerelationshiptarget", "usd_setactive", "usd_setattrib",
+        "usd_setattribelement", "usd_setcollectionexcludes",
+        "usd_setcollectionexpansionrule", "usd_setcollectionincludes",
+        "usd_setdrawmode", "usd_setkind", "usd_setmetadata", "usd_setmetadataelement",
+        "usd_setprimvar", "usd_setprimvarelement", "usd_setprimvarelementsize",
+        "usd_setprimvarindices", "usd_setprimvarinterpolation", "usd_setpurpose",
+        "usd_setrelationshiptargets", "usd_settransformorder", "usd_settransformreset",
+        "usd_setvariantselection", "usd_setvisibility", "usd_setvisible",
+        "usd_specifier", "usd_transformname", "usd_transformorder",
+        "usd_transformsuffix", "usd_transformtype", "usd_typename",
+        "usd_uniquetransformname", "usd_variants", "usd_variantselection",
+        "usd_variantsets", "usd_worldtransform", "uvdist", "uvintersect", "uvsample",
+        "uvunwrap", "variance", "vector", "vector2", "vector4", "velocityname",
+        "vertex", "vertexattrib", "vertexattribsize", "vertexattribtype",
+        "vertexattribtypeinfo", "vertexcurveparam", "vertexhedge", "vertexindex",
+        "vertexnext", "vertexpoint", "vertexprev", "vertexprim", "vertexprimindex",
+        "vnoise", "void", "volume", "volumecubicsample", "volumecubicsamplev",
+        "volumegradient", "volumeindex", "volumeindexactive", "volumeindexi",
+        "volumeindexorigin", "volumeindexp", "volumeindextopos", "volumeindexu",
+        "volumeindexv", "volumepostoindex", "volumeres", "volumesample",
+        "volumesamplei", "volumesamplep", "volumesampleu", "volumesamplev",
+        "volumesmoothsample", "volumesmoothsamplev", "volumetypeid",
+        "volumevoxeldiameter", "vtransform", "warning", "weightarrayblend",
+        "weightarrayfromname", "weightarraynormalize", "weightarraythreshold", "while",
+        "windingnumber", "windingnumber2d", "wireblinn", "wirediffuse", "wnoise",
+        "wo_nspace", "wo_space", "wo_vspace", "writepixel", "wt_nspace", "wt_space",
+        "wt_vspace", "xnoise", "xnoised", "xyzdist", "xyztorgb",
+    )
+
+    # Compact prefix trie, node 0 is the root. Each node is (start, end,
+    # {first character: (edge label, child node)}) and its prefix matches
+    # NAMES[start:end].
+    TRIE = (
+        (0, 1099, {
+            "D": ("D", 1), "a": ("a", 5), "b": ("b", 121), "c": ("c", 133),
+            "d": ("d", 257), "e": ("e", 292), "f": ("f", 321), "g": ("g", 377),
+            "h": ("h", 442), "i": ("i", 496), "j": ("j", 569), "k": ("k", 574),
+            "l": ("l", 577), "m": ("m", 602), "n": ("n", 638), "o": ("o", 679),
+            "p": ("p", 735), "q": ("q", 869), "r": ("r", 877), "s": ("s", 949),
+            "t": ("t", 1119), "u": ("u", 1154), "v": ("v", 1379), "w": ("w", 1429),
+            "x": ("x", 1453),
+        }),
+        (0, 3, {"u": ("u", 2), "v": ("v", 3), "w": ("w", 4)}),
+        (0, 1, {}),
+        (1, 2, {}),
+        (2, 3, {}),
+        (3, 90, {
+            "b": ("bs", 6), "c": ("c", 8), "d": ("dd", 11), "g": ("gent", 24),
+            "l": ("l", 90), "m": ("mbient", 93), "n": ("noise", 94), "p": ("ppend", 95),
+            "r": ("r", 96), "s": ("s", 100), "t": ("t", 106), "v": ("vg", 120),
+        }),
+        (3, 5, {"p": ("path", 7)}),
+        (4, 5, {}),
+        (5, 7, {"c": ("cessframe", 9), "o": ("os", 10)}),
+        (5, 6, {}),
+        (6, 7, {}),
+        (7, 17, {
+            "a": ("attrib", 12), "d": ("detailattrib", 13), "p": ("p", 14),
+            "v": ("v", 19),
+        }),
+        (7, 8, {}),
+        (8, 9, {}),
+        (9, 13, {"o": ("oint", 15), "r": ("rim", 17)}),
+        (9, 11, {"a": ("attrib", 16)}),
+        (10, 11, {}),
+        (11, 13, {"a": ("attrib", 18)}),
+        (12, 13, {}),
+        (13, 17, {
+            "a": ("ariablename", 20), "e": ("ertex", 21), "i": ("isualizer", 23),
+        }),
+        (13, 14, {}),
+        (14, 16, {"a": ("attrib", 22)}),
+        (15, 16, {}),
+        (16, 17, {}),
+        (17, 66, {
+            "a": ("addclip", 25), "c": ("c", 26), "f": ("find", 55), "l": ("l", 59),
+            "m": ("metadata", 66), "r": ("r", 67), "s": ("solvefbik", 76),
+            "t": ("transform", 77), "w": ("worldtransform", 88),
+        }),
+        (17, 18, {}),
+        (18, 40, {
+            "h": ("hannel", 27), "l": ("lip", 32), "o": ("ollisionlayer", 51),
+            "u": ("urrentlayer", 53),
+        }),
+        (18, 22, {"c": ("count", 28), "n": ("names", 29), "v": ("value", 30)}),
+        (18, 19, {}),
+        (19, 20, {}),
+        (20, 22, {"s": ("s", 31)}),
+        (21, 22, {}),
+        (22, 36, {
+            "c": ("c", 33), "l": ("l", 37), "n": ("names", 40), "s": ("s", 41),
+            "t": ("t", 47), "w": ("weights", 50),
+        }),
+        (22, 25, {"a": ("atalog", 34), "h": ("hannel", 35)}),
+        (22, 23, {}),
+        (23, 25, {"n": ("names", 36)}),
+        (24, 25, {}),
+        (25, 27, {"a": ("ayerblend", 38), "e": ("ength", 39)}),
+        (25, 26, {}),
+        (26, 27, {}),
+        (27, 28, {}),
+        (28, 33, {"a": ("ample", 42), "t": ("tarttime", 46)}),
+        (28, 32, {"l": ("local", 43), "r": ("rate", 44), "w": ("world", 45)}),
+        (29, 30, {}),
+        (30, 31, {}),
+        (31, 32, {}),
+        (32, 33, {}),
+        (33, 35, {"i": ("imes", 48), "r": ("ransformgroups", 49)}),
+        (33, 34, {}),
+        (34, 35, {}),
+        (35, 36, {}),
+        (36, 38, {"s": ("s", 52)}),
+        (37, 38, {}),
+        (38, 40, {"s": ("s", 54)}),
+        (39, 40, {}),
+        (40, 43, {"c": ("clip", 56), "l": ("layer", 57), "t": ("transformgroup", 58)}),
+        (40, 41, {}),
+        (41, 42, {}),
+        (42, 43, {}),
+        (43, 48, {"a": ("ayer", 60), "o": ("ocaltransform", 64)}),
+        (43, 46, {"b": ("bindings", 61), "s": ("s", 62)}),
+        (43, 44, {}),
+        (44, 46, {"h": ("hapes", 63)}),
+        (45, 46, {}),
+        (46, 48, {"s": ("s", 65)}),
+        (47, 48, {}),
+        (48, 49, {}),
+        (49, 55, {"e": ("est", 68), "i": ("ig", 71)}),
+        (49, 51, {"l": ("localtransform", 69), "w": ("worldtransform", 70)}),
+        (49, 50, {}),
+        (50, 51, {}),
+        (51, 55, {"c": ("children", 72), "f": ("find", 73), "p": ("parent", 75)}),
+        (51, 52, {}),
+        (52, 54, {"c": ("channel", 74)}),
+        (53, 54, {}),
+        (54, 55, {}),
+        (55, 56, {}),
+        (56, 64, {
+            "c": ("count", 78), "g": ("group", 79), "n": ("names", 84), "t": ("to", 85),
+        }),
+        (56, 57, {}),
+        (57, 61, {"m": ("member", 80), "s": ("s", 82), "w": ("weight", 83)}),
+        (57, 59, {"c": ("channel", 81)}),
+        (58, 59, {}),
+        (59, 60, {}),
+        (60, 61, {}),
+        (61, 62, {}),
+        (62, 64, {"l": ("local", 86), "w": ("world", 87)}),
+        (62, 63, {}),
+        (63, 64, {}),
+        (64, 66, {"s": ("s", 89)}),
+        (65, 66, {}),
+        (66, 68, {"b": ("bedo", 91), "p": ("phaname", 92)}),
+        (66, 67, {}),
+        (67, 68, {}),
+        (68, 69, {}),
+        (69, 70, {}),
+        (70, 71, {}),
+        (71, 74, {"e": ("ea", 97), "g": ("gsort", 98), "r": ("ray", 99)}),
+        (71, 72, {}),
+        (72, 73, {}),
+        (73, 74, {}),
+        (74, 78, {"h": ("hikhmin", 101), "i": ("in", 102), "s": ("s", 103)}),
+        (74, 75, {}),
+        (75, 76, {}),
+        (76, 78, {"e": ("ert_enabled", 104), "i": ("ign", 105)}),
+        (76, 77, {}),
+        (77, 78, {}),
+        (78, 89, {"a": ("an", 107), "o": ("o", 109), "t": ("t", 112)}),
+        (78, 80, {"2": ("2", 108)}),
+        (79, 80, {}),
+        (80, 82, {"f": ("f", 110), "i": ("i", 111)}),
+        (80, 81, {}),
+        (81, 82, {}),
+        (82, 89, {"e": ("en", 113), "r": ("rib", 114)}),
+        (82, 83, {}),
+        (83, 89, {
+            "c": ("class", 115), "d": ("dataid", 116), "s": ("size", 117),
+            "t": ("type", 118),
+        }),
+        (84, 85, {}),
+        (85, 86, {}),
+        (86, 87, {}),
+        (87, 89, {"i": ("info", 119)}),
+        (88, 89, {}),
+        (89, 90, {}),
+        (90, 99, {
+            "i": ("input", 122), "l": ("l", 123), "o": ("ounce", 127),
+            "r": ("reak", 130), "s": ("sdf", 131), "u": ("umpname", 132),
+        }),
+        (90, 91, {}),
+        (91, 94, {"a": ("ackbody", 124), "i": ("inn", 125)}),
+        (91, 92, {}),
+        (92, 94, {"B": ("BRDF", 126)}),
+        (93, 94, {}),
+        (94, 96, {"l": ("label", 128), "m": ("mask", 129)}),
+        (94, 95, {}),
+        (95, 96, {}),
+        (96, 97, {}),
+        (97, 98, {}),
+        (98, 99, {}),
+        (99, 199, {
+            "b": ("brt", 134), "e": ("eil", 135), "h": ("h", 136), "i": ("input", 213),
+            "k": ("kspline", 214), "l": ("l", 215), "o": ("o", 218), "r": ("r", 233),
+            "s": ("spline", 244), "t": ("transform", 245), "u": ("ur", 246),
+            "v": ("vex_bsdf", 255), "w": ("wnoise", 256),
+        }),
+        (99, 100, {}),
+        (100, 101, {}),
+        (101, 166, {
+            "2": ("2", 137), "3": ("3", 138), "4": ("4", 139), "a": ("a", 140),
+            "d": ("dict", 144), "e": ("e", 145), "f": ("f", 152), "i": ("i", 153),
+            "n": ("n", 161), "o": ("op", 165), "p": ("p", 169), "r": ("r", 188),
+            "s": ("s", 199), "u": ("u", 210), "v": ("v", 211), "w": ("writebuf", 212),
+        }),
+        (102, 103, {}),
+        (103, 104, {}),
+        (104, 105, {}),
+        (105, 108, {"d": ("dd", 141), "t": ("ttr", 142)}),
+        (105, 106, {}),
+        (106, 108, {"n": ("names", 143)}),
+        (107, 108, {}),
+        (108, 109, {}),
+        (109, 115, {"n": ("nd", 146), "x": ("xpr", 149)}),
+        (109, 112, {"f": ("f", 147), "t": ("t", 148)}),
+        (110, 111, {}),
+        (111, 112, {}),
+        (112, 115, {"f": ("f", 150), "t": ("t", 151)}),
+        (113, 114, {}),
+        (114, 115, {}),
+        (115, 116, {}),
+        (116, 123, {"a": ("ang", 154), "d": ("d", 156), "n": ("n", 157)}),
+        (117, 119, {"_": ("_fur", 155)}),
+        (118, 119, {}),
+        (119, 120, {}),
+        (120, 123, {"d": ("dex", 158), "p": ("put", 159)}),
+        (120, 121, {}),
+        (121, 123, {"l": ("limits", 160)}),
+        (122, 123, {}),
+        (123, 126, {"a": ("ame", 162), "u": ("umchan", 164)}),
+        (123, 125, {"s": ("s", 163)}),
+        (124, 125, {}),
+        (125, 126, {}),
+        (126, 130, {"l": ("local", 166), "t": ("t", 168)}),
+        (127, 129, {"t": ("t", 167)}),
+        (128, 129, {}),
+        (129, 130, {}),
+        (130, 144, {"r": ("rim_", 170)}),
+        (131, 144, {
+            "c": ("clear", 171), "d": ("destroykey", 172), "e": ("e", 173),
+            "i": ("insertkey", 176), "k": ("key", 177), "l": ("length", 181),
+            "s": ("s", 182),
+        }),
+        (131, 132, {}),
+        (132, 133, {}),
+        (133, 135, {"n": ("nd", 174), "v": ("val", 175)}),
+        (133, 134, {}),
+        (134, 135, {}),
+        (135, 136, {}),
+        (136, 139, {"c": ("count", 178), "t": ("times", 179), "v": ("values", 180)}),
+        (136, 137, {}),
+        (137, 138, {}),
+        (138, 139, {}),
+        (139, 140, {}),
+        (140, 144, {"e": ("etkey", 183), "t": ("tart", 187)}),
+        (140, 143, {"a": ("accel", 184), "s": ("slope", 185), "v": ("value", 186)}),
+        (140, 141, {}),
+        (141, 142, {}),
+        (142, 143, {}),
+        (143, 144, {}),
+        (144, 153, {"a": ("a", 189), "e": ("e", 193)}),
+        (145, 148, {"m": ("mp", 190), "t": ("te", 192)}),
+        (145, 147, {"d": ("deriv", 191)}),
+        (146, 147, {}),
+        (147, 148, {}),
+        (148, 153, {
+            "a": ("adbuf", 194), "m": ("move", 195), "n": ("name", 197),
+            "s": ("sizebuf", 198),
+        }),
+        (148, 149, {}),
+        (149, 151, {"a": ("attr", 196)}),
+        (150, 151, {}),
+        (151, 152, {}),
+        (152, 153, {}),
+        (153, 163, {
+            "e": ("et", 200), "o": ("op", 205), "r": ("raw", 206), "t": ("tart", 207),
+        }),
+        (154, 158, {
+            "a": ("attr", 201), "l": ("length", 202), "r": ("rate", 203),
+            "s": ("start", 204),
+        }),
+        (154, 155, {}),
+        (155, 156, {}),
+        (156, 157, {}),
+        (157, 158, {}),
+        (158, 159, {}),
+        (159, 160, {}),
+        (160, 163, {"f": ("f", 208), "t": ("t", 209)}),
+        (161, 162, {}),
+        (162, 163, {}),
+        (163, 164, {}),
+        (164, 165, {}),
+        (165, 166, {}),
+        (166, 167, {}),
+        (167, 168, {}),
+        (168, 170, {"a": ("amp", 216), "i": ("ip", 217)}),
+        (168, 169, {}),
+        (169, 170, {}),
+        (170, 181, {
+            "l": ("lor", 219), "m": ("m", 222), "n": ("n", 225), "s": ("s", 230),
+        }),
+        (170, 172, {"m": ("map", 220), "n": ("name", 221)}),
+        (170, 171, {}),
+        (171, 172, {}),
+        (172, 174, {"b": ("binelocaltransform", 223), "p": ("putenormal", 224)}),
+        (172, 173, {}),
+        (173, 174, {}),
+        (174, 178, {
+            "c": ("cat", 226), "e": ("e", 227), "s": ("st", 228), "t": ("tinue", 229),
+        }),
+        (174, 175, {}),
+        (175, 176, {}),
+        (176, 177, {}),
+        (177, 178, {}),
+        (178, 181, {"h": ("h", 231), "p": ("pi", 232)}),
+        (179, 180, {}),
+        (180, 181, {}),
+        (181, 188, {"a": ("acktransform", 234), "e": ("e", 235), "o": ("oss", 243)}),
+        (181, 182, {}),
+        (182, 187, {"a": ("ate_", 236), "g": ("gion", 239)}),
+        (182, 184, {"c": ("cdf", 237), "p": ("pdf", 238)}),
+        (182, 183, {}),
+        (183, 184, {}),
+        (184, 187, {
+            "c": ("capturetransform", 240), "d": ("deformtransform", 241),
+            "o": ("overridetransform", 242),
+        }),
+        (184, 185, {}),
+        (185, 186, {}),
+        (186, 187, {}),
+        (187, 188, {}),
+        (188, 189, {}),
+        (189, 190, {}),
+        (190, 197, {"l": ("l", 247), "v": ("vearclen", 254)}),
+        (190, 196, {"g": ("gxnoise", 248), "n": ("noise", 250), "x": ("xnoise", 252)}),
+        (190, 192, {"2": ("2d", 249)}),
+        (191, 192, {}),
+        (192, 194, {"2": ("2d", 251)}),
+        (193, 194, {}),
+        (194, 196, {"2": ("2d", 253)}),
+        (195, 196, {}),
+        (196, 197, {}),
+        (197, 198, {}),
+        (198, 199, {}),
+        (199, 228, {
+            "e": ("e", 258), "i": ("i", 275), "o": ("o", 289), "s": ("smpixel", 291),
+        }),
+        (199, 213, {
+            "c": ("code", 259), "g": ("grees", 263), "p": ("pth", 264), "t": ("t", 267),
+        }),
+        (199, 203, {"a": ("attrib", 260), "p": ("parm", 261), "u": ("utf8", 262)}),
+        (200, 201, {}),
+        (201, 202, {}),
+        (202, 203, {}),
+        (203, 204, {}),
+        (204, 206, {"m": ("map", 265), "n": ("name", 266)}),
+        (204, 205, {}),
+        (205, 206, {}),
+        (206, 213, {"a": ("ail", 268), "e": ("erminant", 274)}),
+        (206, 212, {"a": ("attrib", 269), "i": ("intrinsic", 273)}),
+        (207, 211, {"s": ("size", 270), "t": ("type", 271)}),
+        (208, 209, {}),
+        (209, 211, {"i": ("info", 272)}),
+        (210, 211, {}),
+        (211, 212, {}),
+        (212, 213, {}),
+        (213, 225, {
+            "a": ("ag", 276), "c": ("ct", 278), "f": ("ffuse", 279),
+            "h": ("hedral", 281), "m": ("mport", 282), "s": ("stance", 283),
+        }),
+        (213, 215, {"o": ("onalizesymmetric", 277)}),
+        (214, 215, {}),
+        (215, 216, {}),
+        (216, 218, {"B": ("BRDF", 280)}),
+        (217, 218, {}),
+        (218, 219, {}),
+        (219, 220, {}),
+        (220, 225, {"2": ("2", 284), "_": ("_point", 285)}),
+        (221, 222, {}),
+        (222, 225, {"l": ("line", 286), "r": ("ray", 287), "s": ("segment", 288)}),
+        (222, 223, {}),
+        (223, 224, {}),
+        (224, 225, {}),
+        (225, 227, {"t": ("t", 290)}),
+        (226, 227, {}),
+        (227, 228, {}),
+        (228, 251, {
+            "f": ("fit", 293), "i": ("igenvalues", 294), "l": ("lse", 295),
+            "n": ("n", 296), "r": ("r", 303), "u": ("ulertoquaternion", 308),
+            "v": ("val_bsdf", 309), "x": ("x", 310),
+        }),
+        (228, 229, {}),
+        (229, 230, {}),
+        (230, 231, {}),
+        (231, 237, {"c": ("code", 297), "d": ("dswith", 301), "v": ("vironment", 302)}),
+        (231, 235, {"a": ("attrib", 298), "p": ("parm", 299), "u": ("utf8", 300)}),
+        (232, 233, {}),
+        (233, 234, {}),
+        (234, 235, {}),
+        (235, 236, {}),
+        (236, 237, {}),
+        (237, 241, {"f": ("f", 304), "r": ("ror", 307)}),
+        (237, 240, {"_": ("_inv", 305), "c": ("c", 306)}),
+        (238, 239, {}),
+        (239, 240, {}),
+        (240, 241, {}),
+        (241, 242, {}),
+        (242, 243, {}),
+        (243, 251, {"p": ("p", 311), "t": ("tractlocaltransform", 320)}),
+        (243, 250, {"a": ("and", 312), "o": ("ort", 319)}),
+        (244, 249, {
+            "_": ("_udim", 313), "e": ("edgegroup", 314), "p": ("p", 315),
+            "v": ("vertexgroup", 318),
+        }),
+        (244, 245, {}),
+        (245, 246, {}),
+        (246, 248, {"o": ("ointgroup", 316), "r": ("rimgroup", 317)}),
+        (246, 247, {}),
+        (247, 248, {}),
+        (248, 249, {}),
+        (249, 250, {}),
+        (250, 251, {}),
+        (251, 290, {
+            "a": ("a", 322), "i": ("i", 325), "l": ("lo", 347), "o": ("or", 353),
+            "r": ("r", 356), "u": ("u", 362),
+        }),
+        (251, 253, {"l": ("lse", 323), "s": ("stshadow", 324)}),
+        (251, 252, {}),
+        (252, 253, {}),
+        (253, 269, {"l": ("l", 326), "n": ("n", 334), "t": ("t", 342)}),
+        (253, 258, {
+            "a": ("amentsample", 327), "e": ("e_stat", 328), "t": ("ter", 329),
+        }),
+        (253, 254, {}),
+        (254, 255, {}),
+        (255, 258, {"_": ("_remap", 330), "s": ("s", 331)}),
+        (255, 256, {}),
+        (256, 258, {"h": ("hadow", 332), "t": ("tep", 333)}),
+        (256, 257, {}),
+        (257, 258, {}),
+        (258, 265, {"d": ("d", 335), "p": ("put", 341)}),
+        (258, 264, {
+            "a": ("attribval", 336), "l": ("lowerbound", 338), "s": ("sorted", 340),
+        }),
+        (259, 261, {"c": ("count", 337)}),
+        (260, 261, {}),
+        (261, 263, {"s": ("sorted", 339)}),
+        (262, 263, {}),
+        (263, 264, {}),
+        (264, 265, {}),
+        (265, 269, {"0": ("01", 343), "1": ("1", 344)}),
+        (266, 267, {}),
+        (267, 269, {"0": ("0", 345), "1": ("1", 346)}),
+        (267, 268, {}),
+        (268, 269, {}),
+        (269, 273, {"a": ("at", 348), "o": ("or", 349), "w": ("w", 350)}),
+        (269, 270, {}),
+        (270, 271, {}),
+        (271, 273, {"n": ("noise", 351), "p": ("pnoise", 352)}),
+        (271, 272, {}),
+        (272, 273, {}),
+        (273, 276, {"e": ("each", 354), "p": ("points", 355)}),
+        (274, 275, {}),
+        (275, 276, {}),
+        (276, 280, {"a": ("ac", 357), "e": ("esnel", 358), "o": ("o", 359)}),
+        (276, 277, {}),
+        (277, 278, {}),
+        (278, 280, {"m": ("mNDC", 360), "n": ("ntface", 361)}),
+        (278, 279, {}),
+        (279, 280, {}),
+        (280, 290, {"n": ("nction", 363), "z": ("zz", 364)}),
+        (280, 281, {}),
+        (281, 290, {"i": ("ify", 365), "y": ("y_", 366)}),
+        (281, 282, {}),
+        (282, 290, {
+            "a": ("and", 367), "d": ("defuzz_centroid", 368), "n": ("n", 369),
+            "o": ("or", 375), "x": ("xor", 376),
+        }),
+        (282, 283, {}),
+        (283, 284, {}),
+        (284, 288, {"a": ("and", 370), "o": ("o", 371), "x": ("xor", 374)}),
+        (284, 285, {}),
+        (285, 287, {"r": ("r", 372), "t": ("t", 373)}),
+        (285, 286, {}),
+        (286, 287, {}),
+        (287, 288, {}),
+        (288, 289, {}),
+        (289, 290, {}),
+        (290, 339, {
+            "a": ("ather", 378), "e": ("e", 379), "g": ("gx", 438),
+            "r": ("radient", 439), "x": ("xnoise", 440),
+        }),
+        (290, 291, {}),
+        (291, 335, {"o": ("o", 380), "t": ("t", 383)}),
+        (291, 293, {"s": ("self", 381), "u": ("unwrap", 382)}),
+        (291, 292, {}),
+        (292, 293, {}),
+        (293, 335, {
+            "a": ("attrib", 384), "b": ("b", 386), "c": ("comp", 398),
+            "d": ("deriv", 400), "f": ("fogname", 401), "g": ("g", 402),
+            "l": ("l", 405), "m": ("material", 412), "o": ("object", 414),
+            "p": ("p", 417), "r": ("ray", 429), "s": ("s", 432),
+            "u": ("uvtangents", 437),
+        }),
+        (293, 295, {"u": ("ute", 385)}),
+        (294, 295, {}),
+        (295, 303, {"b": ("box", 387), "l": ("lurP", 394), "o": ("oun", 395)}),
+        (295, 300, {"_": ("_", 388)}),
+        (296, 300, {"c": ("center", 389), "m": ("m", 390), "s": ("size", 393)}),
+        (296, 297, {}),
+        (297, 299, {"a": ("ax", 391), "i": ("in", 392)}),
+        (297, 298, {}),
+        (298, 299, {}),
+        (299, 300, {}),
+        (300, 301, {}),
+        (301, 303, {"c": ("ces", 396), "d": ("ds", 397)}),
+        (301, 302, {}),
+        (302, 303, {}),
+        (303, 305, {"o": ("onents", 399)}),
+        (304, 305, {}),
+        (305, 306, {}),
+        (306, 307, {}),
+        (307, 309, {"l": ("lobalraylevel", 403), "r": ("roupid", 404)}),
+        (307, 308, {}),
+        (308, 309, {}),
+        (309, 315, {"i": ("ight", 406), "o": ("ocalcurvature", 411)}),
+        (309, 314, {"i": ("id", 407), "n": ("name", 408), "s": ("s", 409)}),
+        (310, 311, {}),
+        (311, 312, {}),
+        (312, 314, {"c": ("cope", 410)}),
+        (313, 314, {}),
+        (314, 315, {}),
+        (315, 317, {"i": ("id", 413)}),
+        (316, 317, {}),
+        (317, 319, {"i": ("id", 415), "n": ("name", 416)}),
+        (317, 318, {}),
+        (318, 319, {}),
+        (319, 328, {
+            "a": ("ackedtransform", 418), "h": ("hotonlight", 419),
+            "o": ("ointbbox", 420), "r": ("rimid", 427), "t": ("textureid", 428),
+        }),
+        (319, 320, {}),
+        (320, 321, {}),
+        (321, 326, {"_": ("_", 421)}),
+        (322, 326, {"c": ("center", 422), "m": ("m", 423), "s": ("size", 426)}),
+        (322, 323, {}),
+        (323, 325, {"a": ("ax", 424), "i": ("in", 425)}),
+        (323, 324, {}),
+        (324, 325, {}),
+        (325, 326, {}),
+        (326, 327, {}),
+        (327, 328, {}),
+        (328, 330, {"l": ("level", 430), "w": ("weight", 431)}),
+        (328, 329, {}),
+        (329, 330, {}),
+        (330, 334, {
+            "a": ("amplestore", 433), "c": ("cope", 434), "m": ("moothP", 435),
+            "p": ("pace", 436),
+        }),
+        (330, 331, {}),
+        (331, 332, {}),
+        (332, 333, {}),
+        (333, 334, {}),
+        (334, 335, {}),
+        (335, 336, {}),
+        (336, 337, {}),
+        (337, 339, {"d": ("d", 441)}),
+        (338, 339, {}),
+        (339, 375, {"a": ("a", 443), "e": ("e", 456), "s": ("s", 487)}),
+        (339, 349, {"i": ("ir", 444), "s": ("s", 445)}),
+        (339, 340, {}),
+        (340, 349, {
+            "_": ("_udim", 446), "a": ("attrib", 447), "d": ("detailattrib", 448),
+            "l": ("light", 449), "m": ("metadata", 450), "p": ("p", 451),
+            "v": ("vertexattrib", 455),
+        }),
+        (340, 341, {}),
+        (341, 342, {}),
+        (342, 343, {}),
+        (343, 344, {}),
+        (344, 345, {}),
+        (345, 348, {
+            "l": ("lane", 452), "o": ("ointattrib", 453), "r": ("rimattrib", 454),
+        }),
+        (345, 346, {}),
+        (346, 347, {}),
+        (347, 348, {}),
+        (348, 349, {}),
+        (349, 369, {
+            "d": ("dge_", 457), "n": ("nyeygreenstein", 483), "x": ("x_", 484),
+        }),
+        (349, 366, {
+            "d": ("dst", 458), "e": ("equivcount", 461), "i": ("is", 462),
+            "n": ("next", 466), "p": ("p", 468), "s": ("src", 480),
+        }),
+        (349, 351, {"p": ("point", 459), "v": ("vertex", 460)}),
+        (349, 350, {}),
+        (350, 351, {}),
+        (351, 352, {}),
+        (352, 355, {"e": ("equiv", 463), "p": ("primary", 464), "v": ("valid", 465)}),
+        (352, 353, {}),
+        (353, 354, {}),
+        (354, 355, {}),
+        (355, 357, {"e": ("equiv", 467)}),
+        (356, 357, {}),
+        (357, 364, {"o": ("ostdst", 469), "r": ("r", 472)}),
+        (357, 359, {"p": ("point", 470), "v": ("vertex", 471)}),
+        (357, 358, {}),
+        (358, 359, {}),
+        (359, 364, {"e": ("e", 473), "i": ("im", 478)}),
+        (359, 362, {"s": ("src", 474), "v": ("v", 477)}),
+        (359, 361, {"p": ("point", 475), "v": ("vertex", 476)}),
+        (359, 360, {}),
+        (360, 361, {}),
+        (361, 362, {}),
+        (362, 364, {"a": ("ary", 479)}),
+        (363, 364, {}),
+        (364, 366, {"p": ("point", 481), "v": ("vertex", 482)}),
+        (364, 365, {}),
+        (365, 366, {}),
+        (366, 367, {}),
+        (367, 369, {"a": ("adjacent", 485), "f": ("faceindex", 486)}),
+        (367, 368, {}),
+        (368, 369, {}),
+        (369, 375, {"c": ("cript_", 488), "v": ("vtorgb", 495)}),
+        (369, 374, {
+            "n": ("noise", 489), "r": ("rand", 490), "s": ("s", 491),
+            "t": ("turb", 494),
+        }),
+        (369, 370, {}),
+        (370, 371, {}),
+        (371, 373, {"n": ("noise", 492), "t": ("turb", 493)}),
+        (371, 372, {}),
+        (372, 373, {}),
+        (373, 374, {}),
+        (374, 375, {}),
+        (375, 431, {
+            "a": ("aspect", 497), "c": ("chname", 498), "d": ("d", 499),
+            "e": ("end", 504), "f": ("f", 506), "h": ("hasplane", 507),
+            "l": ("lluminance", 508), "m": ("mport", 509), "n": ("n", 511),
+            "p": ("plane", 533), "r": ("r", 537), "s": ("s", 540), "t": ("toa", 566),
+            "x": ("xres", 567), "y": ("yres", 568),
+        }),
+        (375, 376, {}),
+        (376, 377, {}),
+        (377, 380, {"e": ("ent", 500), "t": ("top", 501)}),
+        (377, 378, {}),
+        (378, 380, {"o": ("oint", 502), "r": ("rim", 503)}),
+        (378, 379, {}),
+        (379, 380, {}),
+        (380, 382, {"t": ("time", 505)}),
+        (381, 382, {}),
+        (382, 383, {}),
+        (383, 384, {}),
+        (384, 385, {}),
+        (385, 387, {"a": ("ance_remap", 510)}),
+        (386, 387, {}),
+        (387, 402, {
+            "e": ("edgegroup", 512), "p": ("p", 513), "s": ("s", 516), "t": ("t", 519),
+            "u": ("umplanes", 528), "v": ("v", 529),
+        }),
+        (387, 388, {}),
+        (388, 390, {"o": ("ointgroup", 514), "r": ("rimgroup", 515)}),
+        (388, 389, {}),
+        (389, 390, {}),
+        (390, 392, {"e": ("ert", 517), "t": ("tance", 518)}),
+        (390, 391, {}),
+        (391, 392, {}),
+        (392, 398, {"e": ("e", 520)}),
+        (393, 398, {"g": ("gratehoseksky", 521), "r": ("r", 522)}),
+        (393, 394, {}),
+        (394, 398, {"p": ("polate", 523), "s": ("sect", 524)}),
+        (394, 395, {}),
+        (395, 398, {"_": ("_", 525)}),
+        (396, 398, {"a": ("all", 526), "l": ("lights", 527)}),
+        (396, 397, {}),
+        (397, 398, {}),
+        (398, 399, {}),
+        (399, 402, {"e": ("ert", 530), "l": ("lerp", 532)}),
+        (399, 401, {"e": ("exgroup", 531)}),
+        (400, 401, {}),
+        (401, 402, {}),
+        (402, 405, {"i": ("index", 534), "n": ("name", 535), "s": ("size", 536)}),
+        (402, 403, {}),
+        (403, 404, {}),
+        (404, 405, {}),
+        (405, 407, {"a": ("ate", 538), "r": ("radiance", 539)}),
+        (405, 406, {}),
+        (406, 407, {}),
+        (407, 428, {
+            "a": ("alpha", 541), "b": ("bound", 542), "c": ("connected", 543),
+            "d": ("digit", 544), "f": ("f", 545), "i": ("inf", 549),
+            "l": ("lpeactive", 550), "n": ("nan", 551), "o": ("otropic", 552),
+            "r": ("raytracing", 553), "s": ("s", 554), "t": ("tart", 560),
+            "u": ("uvrendering", 562), "v": ("va", 563),
+        }),
+        (407, 408, {}),
+        (408, 409, {}),
+        (409, 410, {}),
+        (410, 411, {}),
+        (411, 414, {"i": ("inite", 546), "o": ("ogray", 547), "r": ("rames", 548)}),
+        (411, 412, {}),
+        (412, 413, {}),
+        (413, 414, {}),
+        (414, 415, {}),
+        (415, 416, {}),
+        (416, 417, {}),
+        (417, 418, {}),
+        (418, 419, {}),
+        (419, 423, {"a": ("amples", 555), "e": ("econds", 556), "h": ("had", 557)}),
+        (419, 420, {}),
+        (420, 421, {}),
+        (421, 423, {"i": ("ingRHS", 558), "o": ("owray", 559)}),
+        (421, 422, {}),
+        (422, 423, {}),
+        (423, 425, {"t": ("time", 561)}),
+        (424, 425, {}),
+        (425, 426, {}),
+        (426, 428, {"l": ("lidindex", 564), "r": ("rying", 565)}),
+        (426, 427, {}),
+        (427, 428, {}),
+        (428, 429, {}),
+        (429, 430, {}),
+        (430, 431, {}),
+        (431, 434, {"o": ("oin", 570), "s": ("son_", 571)}),
+        (431, 432, {}),
+        (432, 434, {"d": ("dumps", 572), "l": ("loads", 573)}),
+        (432, 433, {}),
+        (433, 434, {}),
+        (434, 436, {"e": ("eys", 575), "s": ("spline", 576)}),
+        (434, 435, {}),
+        (435, 436, {}),
+        (436, 453, {
+            "e": ("e", 578), "i": ("i", 583), "k": ("kspline", 591), "o": ("o", 592),
+            "s": ("s", 596), "u": ("um", 599),
+        }),
+        (436, 440, {"n": ("n", 579), "r": ("rp", 582)}),
+        (436, 439, {"g": ("gth", 580)}),
+        (437, 439, {"2": ("2", 581)}),
+        (438, 439, {}),
+        (439, 440, {}),
+        (440, 445, {"g": ("ght", 584), "m": ("m", 588)}),
+        (440, 443, {"b": ("bounces", 585), "i": ("id", 586), "s": ("state", 587)}),
+        (440, 441, {}),
+        (441, 442, {}),
+        (442, 443, {}),
+        (443, 445, {"i": ("it_sample_space", 589), "p": ("port", 590)}),
+        (443, 444, {}),
+        (444, 445, {}),
+        (445, 446, {}),
+        (446, 449, {"g": ("g", 593), "o": ("okat", 595)}),
+        (446, 448, {"1": ("10", 594)}),
+        (447, 448, {}),
+        (448, 449, {}),
+        (449, 451, {"p": ("pline", 597), "t": ("trip", 598)}),
+        (449, 450, {}),
+        (450, 451, {}),
+        (451, 453, {"i": ("inance", 600), "n": ("name", 601)}),
+        (451, 452, {}),
+        (452, 453, {}),
+        (453, 481, {
+            "a": ("a", 603), "d": ("density", 621), "e": ("eta", 622), "i": ("in", 629),
+            "s": ("space", 631), "w": ("wnoise", 632), "x": ("x_", 633),
+        }),
+        (453, 466, {
+            "k": ("ke", 604), "s": ("sk", 608), "t": ("t", 611), "x": ("x", 620),
+        }),
+        (453, 456, {
+            "b": ("basis", 605), "t": ("transform", 606), "v": ("validvarname", 607),
+        }),
+        (453, 454, {}),
+        (454, 455, {}),
+        (455, 456, {}),
+        (456, 458, {"_": ("_bsdf", 609), "n": ("name", 610)}),
+        (456, 457, {}),
+        (457, 458, {}),
+        (458, 465, {"c": ("ch", 612), "r": ("rix", 616), "t": ("trib", 619)}),
+        (458, 461, {"v": ("vex_", 613)}),
+        (459, 461, {"b": ("blinn", 614), "s": ("specular", 615)}),
+        (459, 460, {}),
+        (460, 461, {}),
+        (461, 464, {"2": ("2", 617), "3": ("3", 618)}),
+        (462, 463, {}),
+        (463, 464, {}),
+        (464, 465, {}),
+        (465, 466, {}),
+        (466, 467, {}),
+        (467, 473, {
+            "d": ("data", 623), "i": ("import", 624), "m": ("march", 625),
+            "n": ("next", 626), "s": ("start", 627), "w": ("weight", 628),
+        }),
+        (467, 468, {}),
+        (468, 469, {}),
+        (469, 470, {}),
+        (470, 471, {}),
+        (471, 472, {}),
+        (472, 473, {}),
+        (473, 475, {"p": ("pos", 630)}),
+        (474, 475, {}),
+        (475, 476, {}),
+        (476, 477, {}),
+        (477, 481, {
+            "c": ("cellnoise", 634), "p": ("perlin", 635), "v": ("voronoi", 636),
+            "w": ("worley", 637),
+        }),
+        (477, 478, {}),
+        (478, 479, {}),
+        (479, 480, {}),
+        (480, 481, {}),
+        (481, 514, {
+            "a": ("ametop", 639), "b": ("bouncetypes", 642), "d": ("dcdepth", 643),
+            "e": ("e", 644), "i": ("input", 653), "o": ("o", 655), "p": ("p", 669),
+            "r": ("random", 674), "t": ("transform", 675), "u": ("uniqueval", 676),
+            "v": ("vertices", 677),
+        }),
+        (481, 483, {"o": ("oint", 640), "r": ("rim", 641)}),
+        (481, 482, {}),
+        (482, 483, {}),
+        (483, 484, {}),
+        (484, 485, {}),
+        (485, 493, {
+            "a": ("arpoint", 645), "d": ("dgesgroup", 647), "i": ("ighbour", 648),
+            "w": ("wsampler", 651), "x": ("xtsample", 652),
+        }),
+        (485, 487, {"s": ("s", 646)}),
+        (486, 487, {}),
+        (487, 488, {}),
+        (488, 491, {"c": ("count", 649), "s": ("s", 650)}),
+        (489, 490, {}),
+        (490, 491, {}),
+        (491, 492, {}),
+        (492, 493, {}),
+        (493, 495, {"s": ("s", 654)}),
+        (494, 495, {}),
+        (495, 505, {"i": ("ise", 656), "r": ("rm", 658)}),
+        (495, 497, {"d": ("d", 657)}),
+        (496, 497, {}),
+        (497, 505, {"_": ("_", 659), "a": ("al", 665)}),
+        (497, 502, {
+            "1": ("1", 660), "f": ("fro", 661), "i": ("inf", 662), "m": ("max", 663),
+            "s": ("spectral", 664),
+        }),
+        (497, 498, {}),
+        (498, 499, {}),
+        (499, 500, {}),
+        (500, 501, {}),
+        (501, 502, {}),
+        (502, 505, {"_": ("_bsdf", 666), "i": ("ize", 667), "n": ("name", 668)}),
+        (502, 503, {}),
+        (503, 504, {}),
+        (504, 505, {}),
+        (505, 509, {"o": ("oints", 670), "r": ("rimitives", 672)}),
+        (505, 507, {"g": ("group", 671)}),
+        (506, 507, {}),
+        (507, 509, {"g": ("group", 673)}),
+        (508, 509, {}),
+        (509, 510, {}),
+        (510, 511, {}),
+        (511, 512, {}),
+        (512, 514, {"g": ("group", 678)}),
+        (513, 514, {}),
+        (514, 554, {
+            "b": ("bjectstate", 680), "c": ("c", 681), "n": ("noise", 694),
+            "p": ("p", 695), "r": ("r", 714), "s": ("sd_", 717),
+            "u": ("uterproduct", 730), "w": ("w_", 731),
+        }),
+        (514, 515, {}),
+        (515, 525, {
+            "c": ("clusion", 682), "e": ("ean_sample", 683), "i": ("io_", 684),
+        }),
+        (515, 516, {}),
+        (516, 517, {}),
+        (517, 525, {
+            "a": ("active", 685), "i": ("import", 688), "p": ("parsecolorspace", 689),
+            "r": ("roles", 690), "s": ("spaces", 691), "t": ("transform", 692),
+        }),
+        (517, 519, {"d": ("displays", 686), "v": ("views", 687)}),
+        (517, 518, {}),
+        (518, 519, {}),
+        (519, 520, {}),
+        (520, 521, {}),
+        (521, 522, {}),
+        (522, 523, {}),
+        (523, 525, {"v": ("view", 693)}),
+        (524, 525, {}),
+        (525, 526, {}),
+        (526, 540, {
+            "d": ("digits", 696), "e": ("end", 697), "f": ("fullpath", 698),
+            "i": ("id", 699), "p": ("p", 700), "r": ("rawparmtransform", 711),
+            "s": ("start", 712), "t": ("transform", 713),
+        }),
+        (526, 527, {}),
+        (527, 528, {}),
+        (528, 529, {}),
+        (529, 530, {}),
+        (530, 537, {"a": ("ar", 701), "r": ("re", 706)}),
+        (530, 533, {"e": ("ent", 702), "m": ("mtransform", 705)}),
+        (530, 532, {"b": ("bonetransform", 703), "t": ("transform", 704)}),
+        (530, 531, {}),
+        (531, 532, {}),
+        (532, 533, {}),
+        (533, 537, {
+            "c": ("constrainttransform", 707), "p": ("parmtransform", 708),
+            "r": ("rawparmtransform", 709), "t": ("transform", 710),
+        }),
+        (533, 534, {}),
+        (534, 535, {}),
+        (535, 536, {}),
+        (536, 537, {}),
+        (537, 538, {}),
+        (538, 539, {}),
+        (539, 540, {}),
+        (540, 542, {"d": ("d", 715), "t": ("thographic", 716)}),
+        (540, 541, {}),
+        (541, 542, {}),
+        (542, 550, {"f": ("f", 718), "l": ("l", 721), "p": ("patch", 727)}),
+        (542, 544, {"a": ("acecount", 719), "i": ("irstpatch", 720)}),
+        (542, 543, {}),
+        (543, 544, {}),
+        (544, 548, {"i": ("imitsurface", 722), "o": ("ookup", 724)}),
+        (544, 546, {"v": ("vertex", 723)}),
+        (545, 546, {}),
+        (546, 548, {"f": ("face", 725), "p": ("patch", 726)}),
+        (546, 547, {}),
+        (547, 548, {}),
+        (548, 550, {"c": ("count", 728), "e": ("es", 729)}),
+        (548, 549, {}),
+        (549, 550, {}),
+        (550, 551, {}),
+        (551, 554, {"n": ("nspace", 732), "s": ("space", 733), "v": ("vspace", 734)}),
+        (551, 552, {}),
+        (552, 553, {}),
+        (553, 554, {}),
+        (554, 658, {
+            "a": ("a", 736), "c": ("c", 741), "e": ("erspective", 779),
+            "g": ("gfind", 780), "h": ("ho", 781), "i": ("invert", 786),
+            "l": ("l", 787), "n": ("noise", 796), "o": ("o", 797), "r": ("r", 821),
+            "t": ("t", 863), "u": ("ush", 867), "x": ("xnoised", 868),
+        }),
+        (554, 557, {"c": ("ck", 737), "t": ("thtrace", 740)}),
+        (554, 556, {"_": ("_inttosafefloat", 738), "e": ("edtransform", 739)}),
+        (554, 555, {}),
+        (555, 556, {}),
+        (556, 557, {}),
+        (557, 587, {
+            "c": ("c", 742), "e": ("export", 748), "f": ("f", 749),
+            "g": ("generate", 755), "i": ("i", 756), "l": ("line", 767),
+            "n": ("numfound", 769), "o": ("open", 770), "s": ("s", 772),
+            "u": ("unshaded", 777), "w": ("write", 778),
+        }),
+        (557, 561, {"l": ("lose", 743), "o": ("on", 744)}),
+        (557, 558, {}),
+        (558, 561, {"e": ("e", 745), "v": ("vex", 747)}),
+        (558, 560, {"_": ("_radius", 746)}),
+        (559, 560, {}),
+        (560, 561, {}),
+        (561, 562, {}),
+        (562, 566, {"a": ("arthest", 750), "i": ("i", 751)}),
+        (562, 563, {}),
+        (563, 566, {"l": ("lter", 752), "n": ("nd", 753)}),
+        (563, 564, {}),
+        (564, 566, {"_": ("_radius", 754)}),
+        (565, 566, {}),
+        (566, 567, {}),
+        (567, 576, {"m": ("mport", 757), "t": ("terate", 766)}),
+        (567, 575, {"b": ("byidx", 758)}),
+        (568, 575, {
+            "3": ("3", 759), "4": ("4", 760), "f": ("f", 761), "i": ("i", 762),
+            "p": ("p", 763), "s": ("s", 764), "v": ("v", 765),
+        }),
+        (568, 569, {}),
+        (569, 570, {}),
+        (570, 571, {}),
+        (571, 572, {}),
+        (572, 573, {}),
+        (573, 574, {}),
+        (574, 575, {}),
+        (575, 576, {}),
+        (576, 578, {"_": ("_radius", 768)}),
+        (577, 578, {}),
+        (578, 579, {}),
+        (579, 581, {"l": ("lod", 771)}),
+        (580, 581, {}),
+        (581, 585, {"a": ("ampleleaf", 773), "e": ("egment", 774), "i": ("ize", 776)}),
+        (581, 582, {}),
+        (582, 584, {"_": ("_radius", 775)}),
+        (583, 584, {}),
+        (584, 585, {}),
+        (585, 586, {}),
+        (586, 587, {}),
+        (587, 588, {}),
+        (588, 589, {}),
+        (589, 593, {"n": ("ng", 782), "t": ("tonmap", 785)}),
+        (589, 592, {"B": ("BRDF", 783), "l": ("lobe", 784)}),
+        (590, 591, {}),
+        (591, 592, {}),
+        (592, 593, {}),
+        (593, 594, {}),
+        (594, 600, {"a": ("ane", 788), "u": ("uralize", 795)}),
+        (594, 599, {
+            "i": ("index", 789), "n": ("name", 790), "p": ("pointdistance", 791),
+            "s": ("s", 792),
+        }),
+        (594, 595, {}),
+        (595, 596, {}),
+        (596, 597, {}),
+        (597, 599, {"i": ("ize", 793), "p": ("phereintersect", 794)}),
+        (597, 598, {}),
+        (598, 599, {}),
+        (599, 600, {}),
+        (600, 601, {}),
+        (601, 622, {
+            "i": ("int", 798), "l": ("l", 816), "p": ("p", 819), "w": ("w", 820),
+        }),
+        (601, 618, {
+            "a": ("attrib", 799), "e": ("edge", 803), "h": ("hedge", 804),
+            "l": ("localtransforms", 806), "n": ("name", 807), "p": ("prims", 808),
+            "t": ("transform", 809), "v": ("vert", 813),
+        }),
+        (602, 606, {"s": ("size", 800), "t": ("type", 801)}),
+        (603, 604, {}),
+        (604, 606, {"i": ("info", 802)}),
+        (605, 606, {}),
+        (606, 607, {}),
+        (607, 609, {"n": ("next", 805)}),
+        (608, 609, {}),
+        (609, 610, {}),
+        (610, 611, {}),
+        (611, 612, {}),
+        (612, 616, {"r": ("rigid", 810), "s": ("s", 811)}),
+        (613, 614, {}),
+        (614, 616, {"r": ("rigid", 812)}),
+        (615, 616, {}),
+        (616, 618, {"e": ("ex", 814), "i": ("ices", 815)}),
+        (616, 617, {}),
+        (617, 618, {}),
+        (618, 620, {"a": ("ardecomp", 817), "y": ("yneighbours", 818)}),
+        (618, 619, {}),
+        (619, 620, {}),
+        (620, 621, {}),
+        (621, 622, {}),
+        (622, 653, {"e": ("e", 822), "i": ("i", 834), "o": ("oduct", 862)}),
+        (622, 630, {
+            "d": ("dicate_", 823), "m": ("mul", 830), "r": ("rotate", 831),
+            "s": ("scale", 832), "t": ("translate", 833),
+        }),
+        (622, 626, {"i": ("in", 824), "o": ("orient", 827)}),
+        (622, 624, {"c": ("circle", 825), "s": ("sphere", 826)}),
+        (622, 623, {}),
+        (623, 624, {}),
+        (624, 626, {"2": ("2d", 828), "3": ("3d", 829)}),
+        (624, 625, {}),
+        (625, 626, {}),
+        (626, 627, {}),
+        (627, 628, {}),
+        (628, 629, {}),
+        (629, 630, {}),
+        (630, 652, {"m": ("m", 835), "n": ("nt", 859)}),
+        (630, 650, {
+            "_": ("_", 836), "a": ("a", 839), "d": ("duv", 845), "f": ("find", 846),
+            "h": ("hedge", 847), "i": ("int", 848), "p": ("point", 851),
+            "u": ("uv", 853), "v": ("vert", 855),
+        }),
+        (631, 633, {"a": ("attribute", 837), "n": ("normal", 838)}),
+        (631, 632, {}),
+        (632, 633, {}),
+        (633, 638, {"r": ("rclen", 840), "t": ("ttrib", 841)}),
+        (633, 634, {}),
+        (634, 638, {"s": ("size", 842), "t": ("type", 843)}),
+        (635, 636, {}),
+        (636, 638, {"i": ("info", 844)}),
+        (637, 638, {}),
+        (638, 639, {}),
+        (639, 640, {}),
+        (640, 641, {}),
+        (641, 643, {"e": ("eriorweights", 849), "r": ("rinsic", 850)}),
+        (641, 642, {}),
+        (642, 643, {}),
+        (643, 645, {"s": ("s", 852)}),
+        (644, 645, {}),
+        (645, 647, {"c": ("convert", 854)}),
+        (646, 647, {}),
+        (647, 650, {"e": ("ex", 856), "i": ("ices", 858)}),
+        (647, 649, {"c": ("count", 857)}),
+        (648, 649, {}),
+        (649, 650, {}),
+        (650, 652, {"_": ("_once", 860), "f": ("f", 861)}),
+        (650, 651, {}),
+        (651, 652, {}),
+        (652, 653, {}),
+        (653, 656, {"e": ("exture", 864), "l": ("lined", 865), "r": ("ransform", 866)}),
+        (653, 654, {}),
+        (654, 655, {}),
+        (655, 656, {}),
+        (656, 657, {}),
+        (657, 658, {}),
+        (658, 665, {
+            "c": ("convert", 870), "d": ("distance", 871), "i": ("invert", 872),
+            "m": ("multiply", 873), "r": ("rotate", 874), "u": ("uaternion", 875),
+        }),
+        (658, 659, {}),
+        (659, 660, {}),
+        (660, 661, {}),
+        (661, 662, {}),
+        (662, 663, {}),
+        (663, 665, {"t": ("toeuler", 876)}),
+        (664, 665, {}),
+        (665, 721, {
+            "a": ("a", 878), "e": ("e", 898), "g": ("gbto", 942), "i": ("int", 945),
+            "o": ("otate", 946), "s": ("strip", 948),
+        }),
+        (665, 680, {
+            "d": ("dians", 879), "m": ("mp_", 880), "n": ("nd", 884),
+            "w": ("wcolormap", 894), "y": ("y", 895),
+        }),
+        (665, 666, {}),
+        (666, 669, {"l": ("lookup", 881), "p": ("pack", 882), "u": ("unpack", 883)}),
+        (666, 667, {}),
+        (667, 668, {}),
+        (668, 669, {}),
+        (669, 677, {"o": ("om", 885)}),
+        (670, 677, {"_": ("_", 886)}),
+        (671, 677, {
+            "b": ("brj", 887), "f": ("fhash", 888), "i": ("ihash", 889),
+            "p": ("poisson", 890), "s": ("s", 891),
+        }),
+        (671, 672, {}),
+        (672, 673, {}),
+        (673, 674, {}),
+        (674, 675, {}),
+        (675, 677, {"h": ("hash", 892), "o": ("obol", 893)}),
+        (675, 676, {}),
+        (676, 677, {}),
+        (677, 678, {}),
+        (678, 680, {"h": ("hittest", 896), "i": ("import", 897)}),
+        (678, 679, {}),
+        (679, 680, {}),
+        (680, 715, {
+            "_": ("_", 899), "f": ("f", 905), "l": ("l", 910), "m": ("move", 916),
+            "n": ("nderstate", 932), "o": ("order", 933), "p": ("place", 934),
+            "s": ("s", 936), "t": ("turn", 940), "v": ("verse", 941),
+        }),
+        (680, 685, {
+            "f": ("find", 900), "m": ("match", 902), "r": ("replace", 903),
+            "s": ("split", 904),
+        }),
+        (680, 682, {"a": ("all", 901)}),
+        (681, 682, {}),
+        (682, 683, {}),
+        (683, 684, {}),
+        (684, 685, {}),
+        (685, 689, {"l": ("lect", 906), "r": ("ract", 908)}),
+        (685, 687, {"l": ("light", 907)}),
+        (686, 687, {}),
+        (687, 689, {"l": ("light", 909)}),
+        (688, 689, {}),
+        (689, 693, {"a": ("ativepath", 911), "b": ("bbox", 912), "p": ("p", 913)}),
+        (689, 690, {}),
+        (690, 691, {}),
+        (691, 693, {"a": ("ath", 914), "o": ("ointbbox", 915)}),
+        (691, 692, {}),
+        (692, 693, {}),
+        (693, 706, {
+            "a": ("attrib", 917), "d": ("detailattrib", 918), "i": ("index", 919),
+            "p": ("p", 920), "v": ("v", 927),
+        }),
+        (693, 694, {}),
+        (694, 695, {}),
+        (695, 696, {}),
+        (696, 702, {"o": ("oint", 921), "r": ("rim", 924)}),
+        (696, 699, {"a": ("attrib", 922), "g": ("group", 923)}),
+        (697, 698, {}),
+        (698, 699, {}),
+        (699, 702, {"a": ("attrib", 925), "g": ("group", 926)}),
+        (700, 701, {}),
+        (701, 702, {}),
+        (702, 706, {"a": ("alue", 928), "e": ("ertex", 929)}),
+        (702, 703, {}),
+        (703, 706, {"a": ("attrib", 930), "g": ("group", 931)}),
+        (704, 705, {}),
+        (705, 706, {}),
+        (706, 707, {}),
+        (707, 708, {}),
+        (708, 710, {"_": ("_match", 935)}),
+        (709, 710, {}),
+        (710, 713, {
+            "a": ("ample_linear", 937), "i": ("ize", 938), "o": ("olvemissedray", 939),
+        }),
+        (710, 711, {}),
+        (711, 712, {}),
+        (712, 713, {}),
+        (713, 714, {}),
+        (714, 715, {}),
+        (715, 717, {"h": ("hsv", 943), "x": ("xyz", 944)}),
+        (715, 716, {}),
+        (716, 717, {}),
+        (717, 718, {}),
+        (718, 720, {"_": ("_x_to", 947)}),
+        (719, 720, {}),
+        (720, 721, {}),
+        (721, 845, {
+            "a": ("ample", 950), "c": ("ca", 988), "e": ("e", 991), "h": ("h", 1049),
+            "i": ("i", 1057), "l": ("l", 1063), "m": ("mooth", 1071),
+            "n": ("noise", 1073), "o": ("o", 1074), "p": ("p", 1091),
+            "q": ("qrt", 1101), "s": ("ssapprox", 1102), "t": ("t", 1103),
+            "u": ("u", 1112), "v": ("vddecomp", 1115), "w": ("wi", 1116),
+        }),
+        (721, 748, {"_": ("_", 951), "d": ("disk", 987)}),
+        (721, 747, {
+            "b": ("bsdf", 952), "c": ("c", 953), "d": ("di", 962),
+            "e": ("exponential", 967), "g": ("geometry", 968), "h": ("h", 969),
+            "l": ("l", 974), "n": ("normal", 978), "o": ("orientation_", 979),
+            "p": ("photon", 982), "s": ("sphere_", 983),
+        }),
+        (721, 722, {}),
+        (722, 729, {"a": ("auchy", 954), "d": ("df", 955), "i": ("ircle_", 956)}),
+        (722, 723, {}),
+        (723, 724, {}),
+        (724, 729, {
+            "a": ("arc", 957), "e": ("edge_uniform", 958), "r": ("ring_uniform", 959),
+            "s": ("slice", 960), "u": ("uniform", 961),
+        }),
+        (724, 725, {}),
+        (725, 726, {}),
+        (726, 727, {}),
+        (727, 728, {}),
+        (728, 729, {}),
+        (729, 732, {"r": ("rection_", 963), "s": ("screte", 966)}),
+        (729, 731, {"c": ("cone", 964), "u": ("uniform", 965)}),
+        (729, 730, {}),
+        (730, 731, {}),
+        (731, 732, {}),
+        (732, 733, {}),
+        (733, 734, {}),
+        (734, 737, {"e": ("emisphere", 970), "y": ("ypersphere_", 971)}),
+        (734, 735, {}),
+        (735, 737, {"c": ("cone", 972), "u": ("uniform", 973)}),
+        (735, 736, {}),
+        (736, 737, {}),
+        (737, 740, {"i": ("ight", 975), "o": ("ognormal", 976)}),
+        (737, 738, {}),
+        (738, 740, {"_": ("_by_median", 977)}),
+        (739, 740, {}),
+        (740, 741, {}),
+        (741, 743, {"c": ("cone", 980), "u": ("uniform", 981)}),
+        (741, 742, {}),
+        (742, 743, {}),
+        (743, 744, {}),
+        (744, 747, {
+            "c": ("cone", 984), "s": ("shell_uniform", 985), "u": ("uniform", 986),
+        }),
+        (744, 745, {}),
+        (745, 746, {}),
+        (746, 747, {}),
+        (747, 748, {}),
+        (748, 750, {"l": ("le", 989), "t": ("tter", 990)}),
+        (748, 749, {}),
+        (749, 750, {}),
+        (750, 793, {
+            "l": ("lect", 992), "n": ("nsor_", 993), "r": ("rialize", 1002),
+            "t": ("t", 1003),
+        }),
+        (750, 751, {}),
+        (751, 756, {"p": ("panorama_", 994), "s": ("save", 1001)}),
+        (751, 755, {"c": ("create", 995), "g": ("get", 996)}),
+        (751, 752, {}),
+        (752, 755, {"c": ("co", 997), "d": ("depth", 1000)}),
+        (752, 754, {"l": ("lor", 998), "n": ("ne", 999)}),
+        (752, 753, {}),
+        (753, 754, {}),
+        (754, 755, {}),
+        (755, 756, {}),
+        (756, 757, {}),
+        (757, 793, {
+            "a": ("a", 1004), "c": ("c", 1024), "d": ("detail", 1027),
+            "e": ("edgegroup", 1030), "p": ("p", 1031), "s": ("samplestore", 1044),
+            "v": ("vertex", 1045),
+        }),
+        (758, 774, {"g": ("gent", 1005), "t": ("ttrib", 1022)}),
+        (758, 772, {
+            "c": ("c", 1006), "l": ("localtransform", 1018),
+            "w": ("worldtransform", 1020),
+        }),
+        (758, 768, {
+            "h": ("hannelvalue", 1007), "l": ("lip", 1009),
+            "o": ("ollisionlayer", 1014), "u": ("urrentlayer", 1016),
+        }),
+        (758, 760, {"s": ("s", 1008)}),
+        (759, 760, {}),
+        (760, 764, {
+            "n": ("names", 1010), "s": ("s", 1011), "t": ("times", 1012),
+            "w": ("weights", 1013),
+        }),
+        (760, 761, {}),
+        (761, 762, {}),
+        (762, 763, {}),
+        (763, 764, {}),
+        (764, 766, {"s": ("s", 1015)}),
+        (765, 766, {}),
+        (766, 768, {"s": ("s", 1017)}),
+        (767, 768, {}),
+        (768, 770, {"s": ("s", 1019)}),
+        (769, 770, {}),
+        (770, 772, {"s": ("s", 1021)}),
+        (771, 772, {}),
+        (772, 774, {"t": ("typeinfo", 1023)}),
+        (773, 774, {}),
+        (774, 776, {"o": ("omp", 1025), "u": ("urrentlight", 1026)}),
+        (774, 775, {}),
+        (775, 776, {}),
+        (776, 778, {"a": ("attrib", 1028), "i": ("intrinsic", 1029)}),
+        (776, 777, {}),
+        (777, 778, {}),
+        (778, 779, {}),
+        (779, 789, {
+            "a": ("ackedtransform", 1032), "o": ("oint", 1033), "r": ("rim", 1039),
+        }),
+        (779, 780, {}),
+        (780, 785, {
+            "a": ("attrib", 1034), "g": ("group", 1035), "l": ("localtransforms", 1036),
+            "t": ("transform", 1037),
+        }),
+        (780, 781, {}),
+        (781, 782, {}),
+        (782, 783, {}),
+        (783, 785, {"s": ("s", 1038)}),
+        (784, 785, {}),
+        (785, 789, {
+            "a": ("attrib", 1040), "g": ("group", 1041), "i": ("intrinsic", 1042),
+            "v": ("vertex", 1043),
+        }),
+        (785, 786, {}),
+        (786, 787, {}),
+        (787, 788, {}),
+        (788, 789, {}),
+        (789, 790, {}),
+        (790, 793, {"a": ("attrib", 1046), "g": ("group", 1047), "p": ("point", 1048)}),
+        (790, 791, {}),
+        (791, 792, {}),
+        (792, 793, {}),
+        (793, 800, {
+            "a": ("adow", 1050), "i": ("import", 1053), "l": ("l", 1054),
+            "r": ("r", 1055),
+        }),
+        (793, 796, {"_": ("_light", 1051), "m": ("map", 1052)}),
+        (794, 795, {}),
+        (795, 796, {}),
+        (796, 797, {}),
+        (797, 798, {}),
+        (798, 800, {"z": ("z", 1056)}),
+        (799, 800, {}),
+        (800, 805, {"g": ("gn", 1058), "m": ("mport", 1059), "n": ("n", 1060)}),
+        (800, 801, {}),
+        (801, 802, {}),
+        (802, 805, {"h": ("h", 1061), "p": ("pi", 1062)}),
+        (803, 804, {}),
+        (804, 805, {}),
+        (805, 810, {"e": ("e", 1064), "i": ("i", 1068)}),
+        (805, 808, {"e": ("ep", 1065), "r": ("rp", 1066)}),
+        (805, 806, {}),
+        (806, 808, {"v": ("v", 1067)}),
+        (807, 808, {}),
+        (808, 810, {"c": ("ce", 1069), "d": ("deframe", 1070)}),
+        (808, 809, {}),
+        (809, 810, {}),
+        (810, 812, {"r": ("rotation", 1072)}),
+        (811, 812, {}),
+        (812, 813, {}),
+        (813, 824, {"l": ("l", 1075), "r": ("rt", 1090)}),
+        (813, 823, {"i": ("id_angle", 1076), "v": ("ve", 1077)}),
+        (813, 814, {}),
+        (814, 823, {
+            "c": ("c", 1078), "f": ("fbik", 1083), "i": ("ik", 1084), "p": ("p", 1085),
+            "q": ("quadratic", 1088), "t": ("triangleSSS", 1089),
+        }),
+        (814, 817, {"o": ("onstraint", 1079), "u": ("u", 1080)}),
+        (814, 815, {}),
+        (815, 817, {"b": ("bic", 1081), "r": ("rve", 1082)}),
+        (815, 816, {}),
+        (816, 817, {}),
+        (817, 818, {}),
+        (818, 819, {}),
+        (819, 821, {"h": ("hysfbik", 1086), "o": ("oly", 1087)}),
+        (819, 820, {}),
+        (820, 821, {}),
+        (821, 822, {}),
+        (822, 823, {}),
+        (823, 824, {}),
+        (824, 832, {"e": ("ecular", 1092), "l": ("li", 1094), "r": ("rintf", 1100)}),
+        (824, 826, {"B": ("BRDF", 1093)}),
+        (825, 826, {}),
+        (826, 831, {"n": ("ne", 1095), "t": ("t", 1097)}),
+        (826, 828, {"_": ("_cdf", 1096)}),
+        (827, 828, {}),
+        (828, 831, {"_": ("_bsdf", 1098), "p": ("path", 1099)}),
+        (829, 830, {}),
+        (830, 831, {}),
+        (831, 832, {}),
+        (832, 833, {}),
+        (833, 834, {}),
+        (834, 840, {
+            "a": ("artswith", 1104), "o": ("orelightexport", 1105), "r": ("r", 1106),
+        }),
+        (834, 835, {}),
+        (835, 836, {}),
+        (836, 840, {"i": ("i", 1107), "l": ("len", 1110), "u": ("uct", 1111)}),
+        (836, 838, {"n": ("ng", 1108), "p": ("p", 1109)}),
+        (836, 837, {}),
+        (837, 838, {}),
+        (838, 839, {}),
+        (839, 840, {}),
+        (840, 842, {"m": ("m", 1113), "r": ("rfacedist", 1114)}),
+        (840, 841, {}),
+        (841, 842, {}),
+        (842, 843, {}),
+        (843, 845, {"t": ("tch", 1117), "z": ("zzle", 1118)}),
+        (843, 844, {}),
+        (844, 845, {}),
+        (845, 870, {
+            "a": ("an", 1120), "e": ("e", 1123), "i": ("itlecase", 1133),
+            "o": ("o", 1134), "r": ("r", 1138), "w": ("w_", 1149), "y": ("ypeid", 1153),
+        }),
+        (845, 848, {"h": ("h", 1121), "p": ("pi", 1122)}),
+        (846, 847, {}),
+        (847, 848, {}),
+        (848, 855, {"t": ("t_", 1124), "x": ("x", 1127)}),
+        (848, 850, {"a": ("adjacent", 1125), "f": ("faceindex", 1126)}),
+        (848, 849, {}),
+        (849, 850, {}),
+        (850, 855, {"i": ("import", 1128), "p": ("printf", 1129), "t": ("ture", 1130)}),
+        (850, 851, {}),
+        (851, 852, {}),
+        (852, 855, {"3": ("3d", 1131)}),
+        (853, 855, {"B": ("Box", 1132)}),
+        (854, 855, {}),
+        (855, 856, {}),
+        (856, 859, {"N": ("NDC", 1135), "l": ("lower", 1136), "u": ("upper", 1137)}),
+        (856, 857, {}),
+        (857, 858, {}),
+        (858, 859, {}),
+        (859, 866, {"a": ("a", 1139), "u": ("u", 1146)}),
+        (860, 864, {"c": ("ce", 1140), "n": ("ns", 1141)}),
+        (860, 861, {}),
+        (861, 864, {"l": ("l", 1142), "p": ("pose", 1145)}),
+        (861, 863, {"a": ("ate", 1143), "u": ("ucent", 1144)}),
+        (861, 862, {}),
+        (862, 863, {}),
+        (863, 864, {}),
+        (864, 866, {"e": ("e", 1147), "n": ("nc", 1148)}),
+        (864, 865, {}),
+        (865, 866, {}),
+        (866, 869, {
+            "n": ("nspace", 1150), "s": ("space", 1151), "v": ("vspace", 1152),
+        }),
+        (866, 867, {}),
+        (867, 868, {}),
+        (868, 869, {}),
+        (869, 870, {}),
+        (870, 1033, {
+            "n": ("n", 1155), "p": ("push", 1160), "s": ("sd_", 1161), "v": ("v", 1374),
+        }),
+        (870, 874, {
+            "i": ("iqueval", 1156), "p": ("pack_intfromsafefloat", 1158),
+            "s": ("serialize", 1159),
+        }),
+        (870, 872, {"s": ("s", 1157)}),
+        (871, 872, {}),
+        (872, 873, {}),
+        (873, 874, {}),
+        (874, 875, {}),
+        (875, 1029, {
+            "a": ("a", 1162), "b": ("b", 1192), "c": ("c", 1199),
+            "d": ("drawmode", 1212), "f": ("f", 1213), "g": ("get", 1220),
+            "h": ("has", 1231), "i": ("i", 1234), "k": ("kind", 1277),
+            "l": ("localtransform", 1278), "m": ("m", 1279), "n": ("name", 1292),
+            "p": ("p", 1293), "r": ("re", 1320), "s": ("s", 1328), "t": ("t", 1361),
+            "u": ("uniquetransformname", 1368), "v": ("variants", 1369),
+            "w": ("worldtransform", 1373),
+        }),
+        (875, 897, {"d": ("dd", 1163), "p": ("pplyapi", 1183), "t": ("ttrib", 1184)}),
+        (875, 889, {
+            "a": ("attrib", 1164), "c": ("collection", 1165),
+            "i": ("inversetotransformorder", 1168), "o": ("orient", 1169),
+            "p": ("prim", 1170), "r": ("r", 1172), "s": ("sc", 1175), "t": ("t", 1178),
+        }),
+        (875, 876, {}),
+        (876, 878, {"e": ("exclude", 1166), "i": ("include", 1167)}),
+        (876, 877, {}),
+        (877, 878, {}),
+        (878, 879, {}),
+        (879, 880, {}),
+        (880, 882, {"v": ("var", 1171)}),
+        (881, 882, {}),
+        (882, 884, {"e": ("elationshiptarget", 1173), "o": ("otate", 1174)}),
+        (882, 883, {}),
+        (883, 884, {}),
+        (884, 886, {"a": ("ale", 1176), "h": ("hemaattrib", 1177)}),
+        (884, 885, {}),
+        (885, 886, {}),
+        (886, 889, {"o": ("otransformorder", 1179), "r": ("rans", 1180)}),
+        (886, 887, {}),
+        (887, 889, {"f": ("form", 1181), "l": ("late", 1182)}),
+        (887, 888, {}),
+        (888, 889, {}),
+        (889, 890, {}),
+        (890, 897, {
+            "e": ("element", 1185), "l": ("len", 1186), "n": ("names", 1187),
+            "s": ("size", 1188), "t": ("t", 1189),
+        }),
+        (891, 892, {}),
+        (892, 893, {}),
+        (893, 894, {}),
+        (894, 895, {}),
+        (895, 897, {"i": ("imesamples", 1190), "y": ("ypename", 1191)}),
+        (895, 896, {}),
+        (896, 897, {}),
+        (897, 902, {"l": ("lock", 1193), "o": ("oundmaterialpath", 1198)}),
+        (897, 901, {
+            "a": ("attrib", 1194), "p": ("primvar", 1195), "r": ("relationship", 1197),
+        }),
+        (897, 898, {}),
+        (898, 900, {"i": ("indices", 1196)}),
+        (899, 900, {}),
+        (900, 901, {}),
+        (901, 902, {}),
+        (902, 910, {
+            "h": ("hildnames", 1200), "l": ("lear", 1201), "o": ("ollection", 1204),
+        }),
+        (902, 903, {}),
+        (903, 905, {"m": ("metadata", 1202), "t": ("transformorder", 1203)}),
+        (903, 904, {}),
+        (904, 905, {}),
+        (905, 910, {"c": ("co", 1205), "e": ("ex", 1208), "i": ("includes", 1211)}),
+        (905, 907, {"m": ("mputedpaths", 1206), "n": ("ntains", 1207)}),
+        (905, 906, {}),
+        (906, 907, {}),
+        (907, 909, {"c": ("cludes", 1209), "p": ("pansionrule", 1210)}),
+        (907, 908, {}),
+        (908, 909, {}),
+        (909, 910, {}),
+        (910, 911, {}),
+        (911, 916, {"i": ("indtransformname", 1214), "l": ("lattened", 1215)}),
+        (911, 912, {}),
+        (912, 916, {"i": ("iprimvar", 1216), "p": ("primvar", 1218)}),
+        (912, 914, {"e": ("element", 1217)}),
+        (913, 914, {}),
+        (914, 916, {"e": ("element", 1219)}),
+        (915, 916, {}),
+        (916, 923, {"b": ("b", 1221), "p": ("pointinstancebounds", 1230)}),
+        (916, 922, {"b": ("box", 1222), "o": ("ounds", 1229)}),
+        (916, 921, {"_": ("_", 1223)}),
+        (917, 921, {"c": ("center", 1224), "m": ("m", 1225), "s": ("size", 1228)}),
+        (917, 918, {}),
+        (918, 920, {"a": ("ax", 1226), "i": ("in", 1227)}),
+        (918, 919, {}),
+        (919, 920, {}),
+        (920, 921, {}),
+        (921, 922, {}),
+        (922, 923, {}),
+        (923, 925, {"a": ("api", 1232), "p": ("payload", 1233)}),
+        (923, 924, {}),
+        (924, 925, {}),
+        (925, 958, {"p": ("primvar", 1235), "s": ("s", 1247)}),
+        (925, 935, {
+            "e": ("element", 1236), "i": ("in", 1238), "l": ("len", 1241),
+            "n": ("names", 1242), "s": ("size", 1243), "t": ("t", 1244),
+        }),
+        (926, 928, {"s": ("size", 1237)}),
+        (927, 928, {}),
+        (928, 930, {"d": ("dices", 1239), "t": ("terpolation", 1240)}),
+        (928, 929, {}),
+        (929, 930, {}),
+        (930, 931, {}),
+        (931, 932, {}),
+        (932, 933, {}),
+        (933, 935, {"i": ("imesamples", 1245), "y": ("ypename", 1246)}),
+        (933, 934, {}),
+        (934, 935, {}),
+        (935, 958, {
+            "a": ("a", 1248), "c": ("collection", 1256), "i": ("i", 1258),
+            "k": ("kind", 1265), "m": ("m", 1266), "p": ("prim", 1269),
+            "r": ("relationship", 1271), "s": ("stage", 1272), "t": ("t", 1273),
+            "v": ("visible", 1276),
+        }),
+        (935, 942, {
+            "b": ("bstract", 1249), "c": ("ctive", 1250), "r": ("rray", 1251),
+            "t": ("ttrib", 1255),
+        }),
+        (935, 936, {}),
+        (936, 937, {}),
+        (937, 941, {
+            "i": ("iprimvar", 1252), "m": ("metadata", 1253), "p": ("primvar", 1254),
+        }),
+        (938, 939, {}),
+        (939, 940, {}),
+        (940, 941, {}),
+        (941, 942, {}),
+        (942, 944, {"p": ("path", 1257)}),
+        (943, 944, {}),
+        (944, 948, {"n": ("n", 1259), "p": ("primvar", 1264)}),
+        (944, 947, {"d": ("dexed", 1260), "s": ("stance", 1263)}),
+        (944, 946, {"i": ("iprimvar", 1261), "p": ("primvar", 1262)}),
+        (944, 945, {}),
+        (945, 946, {}),
+        (946, 947, {}),
+        (947, 948, {}),
+        (948, 949, {}),
+        (949, 951, {"e": ("etadata", 1267), "o": ("odel", 1268)}),
+        (949, 950, {}),
+        (950, 951, {}),
+        (951, 953, {"v": ("var", 1270)}),
+        (952, 953, {}),
+        (953, 954, {}),
+        (954, 955, {}),
+        (955, 957, {"r": ("ransformreset", 1274), "y": ("ype", 1275)}),
+        (955, 956, {}),
+        (956, 957, {}),
+        (957, 958, {}),
+        (958, 959, {}),
+        (959, 960, {}),
+        (960, 970, {"a": ("ake", 1280), "e": ("etadata", 1288)}),
+        (960, 966, {
+            "a": ("attribpath", 1281), "c": ("collectionpath", 1282),
+            "p": ("propertypath", 1283), "r": ("relationshippath", 1284),
+            "v": ("validprim", 1285),
+        }),
+        (960, 961, {}),
+        (961, 962, {}),
+        (962, 963, {}),
+        (963, 964, {}),
+        (964, 966, {"n": ("name", 1286), "p": ("path", 1287)}),
+        (964, 965, {}),
+        (965, 966, {}),
+        (966, 970, {"e": ("element", 1289), "l": ("len", 1290), "n": ("names", 1291)}),
+        (967, 968, {}),
+        (968, 969, {}),
+        (969, 970, {}),
+        (970, 971, {}),
+        (971, 991, {
+            "a": ("arentpath", 1294), "o": ("ointinstance", 1295),
+            "r": ("rimvar", 1306), "u": ("urpose", 1319),
+        }),
+        (971, 972, {}),
+        (972, 979, {"_": ("_", 1296), "t": ("transform", 1305)}),
+        (972, 978, {"g": ("getbbox", 1297), "r": ("relbbox", 1304)}),
+        (972, 977, {"_": ("_", 1298)}),
+        (973, 977, {"c": ("center", 1299), "m": ("m", 1300), "s": ("size", 1303)}),
+        (973, 974, {}),
+        (974, 976, {"a": ("ax", 1301), "i": ("in", 1302)}),
+        (974, 975, {}),
+        (975, 976, {}),
+        (976, 977, {}),
+        (977, 978, {}),
+        (978, 979, {}),
+        (979, 990, {
+            "a": ("attribname", 1307), "e": ("element", 1308), "i": ("in", 1310),
+            "l": ("len", 1313), "n": ("names", 1314), "s": ("size", 1315),
+            "t": ("t", 1316),
+        }),
+        (980, 981, {}),
+        (981, 983, {"s": ("size", 1309)}),
+        (982, 983, {}),
+        (983, 985, {"d": ("dices", 1311), "t": ("terpolation", 1312)}),
+        (983, 984, {}),
+        (984, 985, {}),
+        (985, 986, {}),
+        (986, 987, {}),
+        (987, 988, {}),
+        (988, 990, {"i": ("imesamples", 1317), "y": ("ypename", 1318)}),
+        (988, 989, {}),
+        (989, 990, {}),
+        (990, 991, {}),
+        (991, 996, {"l": ("l", 1321), "m": ("moverelationshiptarget", 1327)}),
+        (991, 995, {"a": ("ationship", 1322), "b": ("bbox", 1326)}),
+        (991, 994, {
+            "f": ("forwardedtargets", 1323), "n": ("names", 1324),
+            "t": ("targets", 1325),
+        }),
+        (991, 992, {}),
+        (992, 993, {}),
+        (993, 994, {}),
+        (994, 995, {}),
+        (995, 996, {}),
+        (996, 1019, {"e": ("et", 1329), "p": ("pecifier", 1360)}),
+        (996, 1018, {
+            "a": ("a", 1330), "c": ("collection", 1334), "d": ("drawmode", 1339),
+            "k": ("kind", 1340), "m": ("metadata", 1341), "p": ("p", 1343),
+            "r": ("relationshiptargets", 1351), "t": ("transform", 1352),
+            "v": ("v", 1355),
+        }),
+        (996, 999, {"c": ("ctive", 1331), "t": ("ttrib", 1332)}),
+        (996, 997, {}),
+        (997, 999, {"e": ("element", 1333)}),
+        (998, 999, {}),
+        (999, 1002, {"e": ("ex", 1335), "i": ("includes", 1338)}),
+        (999, 1001, {"c": ("cludes", 1336), "p": ("pansionrule", 1337)}),
+        (999, 1000, {}),
+        (1000, 1001, {}),
+        (1001, 1002, {}),
+        (1002, 1003, {}),
+        (1003, 1004, {}),
+        (1004, 1006, {"e": ("element", 1342)}),
+        (1005, 1006, {}),
+        (1006, 1012, {"r": ("rimvar", 1344), "u": ("urpose", 1350)}),
+        (1006, 1011, {"e": ("element", 1345), "i": ("in", 1347)}),
+        (1007, 1009, {"s": ("size", 1346)}),
+        (1008, 1009, {}),
+        (1009, 1011, {"d": ("dices", 1348), "t": ("terpolation", 1349)}),
+        (1009, 1010, {}),
+        (1010, 1011, {}),
+        (1011, 1012, {}),
+        (1012, 1013, {}),
+        (1013, 1015, {"o": ("order", 1353), "r": ("reset", 1354)}),
+        (1013, 1014, {}),
+        (1014, 1015, {}),
+        (1015, 1018, {"a": ("ariantselection", 1356), "i": ("isib", 1357)}),
+        (1015, 1016, {}),
+        (1016, 1018, {"i": ("ility", 1358), "l": ("le", 1359)}),
+        (1016, 1017, {}),
+        (1017, 1018, {}),
+        (1018, 1019, {}),
+        (1019, 1024, {"r": ("ransform", 1362), "y": ("ypename", 1367)}),
+        (1019, 1023, {
+            "n": ("name", 1363), "o": ("order", 1364), "s": ("suffix", 1365),
+            "t": ("type", 1366),
+        }),
+        (1019, 1020, {}),
+        (1020, 1021, {}),
+        (1021, 1022, {}),
+        (1022, 1023, {}),
+        (1023, 1024, {}),
+        (1024, 1025, {}),
+        (1025, 1028, {"e": ("e", 1370)}),
+        (1026, 1028, {"l": ("lection", 1371), "t": ("ts", 1372)}),
+        (1026, 1027, {}),
+        (1027, 1028, {}),
+        (1028, 1029, {}),
+        (1029, 1033, {
+            "d": ("dist", 1375), "i": ("intersect", 1376), "s": ("sample", 1377),
+            "u": ("unwrap", 1378),
+        }),
+        (1029, 1030, {}),
+        (1030, 1031, {}),
+        (1031, 1032, {}),
+        (1032, 1033, {}),
+        (1033, 1077, {
+            "a": ("ariance", 1380), "e": ("e", 1381), "n": ("noise", 1401),
+            "o": ("o", 1402), "t": ("transform", 1428),
+        }),
+        (1033, 1034, {}),
+        (1034, 1051, {
+            "c": ("ctor", 1382), "l": ("locityname", 1385), "r": ("rtex", 1386),
+        }),
+        (1034, 1037, {"2": ("2", 1383), "4": ("4", 1384)}),
+        (1035, 1036, {}),
+        (1036, 1037, {}),
+        (1037, 1038, {}),
+        (1038, 1051, {
+            "a": ("attrib", 1387), "c": ("curveparam", 1391), "h": ("hedge", 1392),
+            "i": ("index", 1393), "n": ("next", 1394), "p": ("p", 1395),
+        }),
+        (1039, 1043, {"s": ("size", 1388), "t": ("type", 1389)}),
+        (1040, 1041, {}),
+        (1041, 1043, {"i": ("info", 1390)}),
+        (1042, 1043, {}),
+        (1043, 1044, {}),
+        (1044, 1045, {}),
+        (1045, 1046, {}),
+        (1046, 1047, {}),
+        (1047, 1051, {"o": ("oint", 1396), "r": ("r", 1397)}),
+        (1047, 1048, {}),
+        (1048, 1051, {"e": ("ev", 1398), "i": ("im", 1399)}),
+        (1048, 1049, {}),
+        (1049, 1051, {"i": ("index", 1400)}),
+        (1050, 1051, {}),
+        (1051, 1052, {}),
+        (1052, 1076, {"i": ("id", 1403), "l": ("lume", 1404)}),
+        (1052, 1053, {}),
+        (1053, 1076, {
+            "c": ("cubicsample", 1405), "g": ("gradient", 1407), "i": ("index", 1408),
+            "p": ("postoindex", 1416), "r": ("res", 1417), "s": ("s", 1418),
+            "t": ("typeid", 1426), "v": ("voxeldiameter", 1427),
+        }),
+        (1054, 1056, {"v": ("v", 1406)}),
+        (1055, 1056, {}),
+        (1056, 1057, {}),
+        (1057, 1065, {
+            "a": ("active", 1409), "i": ("i", 1410), "o": ("origin", 1411),
+            "p": ("p", 1412), "t": ("topos", 1413), "u": ("u", 1414), "v": ("v", 1415),
+        }),
+        (1058, 1059, {}),
+        (1059, 1060, {}),
+        (1060, 1061, {}),
+        (1061, 1062, {}),
+        (1062, 1063, {}),
+        (1063, 1064, {}),
+        (1064, 1065, {}),
+        (1065, 1066, {}),
+        (1066, 1067, {}),
+        (1067, 1074, {"a": ("ample", 1419), "m": ("moothsample", 1424)}),
+        (1067, 1072, {
+            "i": ("i", 1420), "p": ("p", 1421), "u": ("u", 1422), "v": ("v", 1423),
+        }),
+        (1068, 1069, {}),
+        (1069, 1070, {}),
+        (1070, 1071, {}),
+        (1071, 1072, {}),
+        (1072, 1074, {"v": ("v", 1425)}),
+        (1073, 1074, {}),
+        (1074, 1075, {}),
+        (1075, 1076, {}),
+        (1076, 1077, {}),
+        (1077, 1095, {
+            "a": ("arning", 1430), "e": ("eightarray", 1431), "h": ("hile", 1436),
+            "i": ("i", 1437), "n": ("noise", 1443), "o": ("o_", 1444),
+            "r": ("ritepixel", 1448), "t": ("t_", 1449),
+        }),
+        (1077, 1078, {}),
+        (1078, 1082, {
+            "b": ("blend", 1432), "f": ("fromname", 1433), "n": ("normalize", 1434),
+            "t": ("threshold", 1435),
+        }),
+        (1078, 1079, {}),
+        (1079, 1080, {}),
+        (1080, 1081, {}),
+        (1081, 1082, {}),
+        (1082, 1083, {}),
+        (1083, 1087, {"n": ("ndingnumber", 1438), "r": ("re", 1440)}),
+        (1083, 1085, {"2": ("2d", 1439)}),
+        (1084, 1085, {}),
+        (1085, 1087, {"b": ("blinn", 1441), "d": ("diffuse", 1442)}),
+        (1085, 1086, {}),
+        (1086, 1087, {}),
+        (1087, 1088, {}),
+        (1088, 1091, {
+            "n": ("nspace", 1445), "s": ("space", 1446), "v": ("vspace", 1447),
+        }),
+        (1088, 1089, {}),
+        (1089, 1090, {}),
+        (1090, 1091, {}),
+        (1091, 1092, {}),
+        (1092, 1095, {
+            "n": ("nspace", 1450), "s": ("space", 1451), "v": ("vspace", 1452),
+        }),
+        (1092, 1093, {}),
+        (1093, 1094, {}),
+        (1094, 1095, {}),
+        (1095, 1099, {"n": ("noise", 1454), "y": ("yz", 1456)}),
+        (1095, 1097, {"d": ("d", 1455)}),
+        (1096, 1097, {}),
+        (1097, 1099, {"d": ("dist", 1457), "t": ("torgb", 1458)}),
+        (1097, 1098, {}),
+        (1098, 1099, {}),
+    )
+# fmt: on
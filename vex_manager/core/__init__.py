@@ -1,6 +1,63 @@
-from vex_manager.core.vex_manager import set_vex_code_in_selected_wrangle_node
+from typing import Any
+import importlib
 
 from vex_manager.core.file_manager import create_new_vex_file
 from vex_manager.core.file_manager import delete_file
 from vex_manager.core.file_manager import get_vex_files
+from vex_manager.core.file_manager import read_file_chunks
 from vex_manager.core.file_manager import rename_vex_file
+from vex_manager.core.file_manager import write_vex_file
+
+from vex_manager.core.library_index import compute_content_hash
+from vex_manager.core.library_index import get_library_index
+from vex_manager.core.library_index import LibraryIndex
+
+from vex_manager.core.library_diff import diff_snapshots
+from vex_manager.core.library_diff import ChangeSet
+
+from vex_manager.core.content_index import get_content_index
+from vex_manager.core.content_index import ContentIndex
+
+from vex_manager.core.preferences import get_preferences
+from vex_manager.core.preferences import Preferences
+from vex_manager.core.preferences import PreferencesChange
+
+from vex_manager.core.content_cache import ContentCache
+
+from vex_manager.core.recovery_journal import get_file_key
+from vex_manager.core.recovery_journal import RecoveryJournal
+from vex_manager.core.recovery_journal import RecoveredFile
+
+
+# Modules importing hou are loaded on first access, so the rest of the core can be
+# used from plain Python.
+_HOU_ATTRIBUTES = {
+    "set_vex_code_in_selected_wrangle_node": "vex_manager.core.vex_manager",
+    "set_vex_code_in_selected_wrangle_nodes": "vex_manager.core.vex_manager",
+    "find_wrangle_nodes": "vex_manager.core.vex_manager",
+    "get_snippet_id": "vex_manager.core.vex_manager",
+    "get_snippet_origin": "vex_manager.core.vex_manager",
+    "get_linked_nodes": "vex_manager.core.vex_manager",
+    "get_snippet_parm": "vex_manager.core.vex_manager",
+    "get_wrangle_node_types": "vex_manager.core.vex_manager",
+    "is_wrangle_node_type": "vex_manager.core.vex_manager",
+    "register_wrangle_node_type": "vex_manager.core.vex_manager",
+    "rename_snippet_links": "vex_manager.core.vex_manager",
+    "build_snippet_links": "vex_manager.core.vex_manager",
+    "propagate_vex_code": "vex_manager.core.vex_manager",
+    "apply_vex_code": "vex_manager.core.vex_manager",
+    "harvest_scene": "vex_manager.core.scene_harvest",
+    "HarvestReport": "vex_manager.core.scene_harvest",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _HOU_ATTRIBUTES.get(name)
+
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+
+    return value
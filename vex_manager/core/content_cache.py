@@ -0,0 +1,131 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+import threading
+import logging
+import os
+
+from vex_manager.core.library_diff import ChangeSet
+
+
+logger = logging.getLogger(f"vex_manager.{__name__}")
+
+MAX_CACHE_CHARACTERS = 8_000_000
+
+
+@dataclass(slots=True)
+class CacheEntry:
+    content: str
+    mtime: int
+    size: int
+
+
+class ContentCache:
+    def __init__(self, max_characters: int = MAX_CACHE_CHARACTERS) -> None:
+        self.max_characters = max_characters
+
+        self._lock = threading.Lock()
+
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._number_of_characters = 0
+
+    def _pop_entry(self, path: str) -> CacheEntry | None:
+        entry = self._entries.pop(path, None)
+
+        if entry:
+            self._number_of_characters -= len(entry.content)
+
+        return entry
+
+    def _put_entry(self, path: str, entry: CacheEntry) -> None:
+        self._pop_entry(path)
+
+        if len(entry.content) > self.max_characters:
+            return
+
+        self._entries[path] = entry
+        self._number_of_characters += len(entry.content)
+
+        while self._number_of_characters > self.max_characters:
+            _, evicted_entry = self._entries.popitem(last=False)
+            self._number_of_characters -= len(evicted_entry.content)
+
+    def apply_change_set(self, change_set: ChangeSet) -> None:
+        with self._lock:
+            for path in change_set.removed + change_set.modified:
+                self._pop_entry(path)
+
+            for path, new_path in change_set.renamed:
+                entry = self._pop_entry(path)
+
+                if entry:
+                    self._put_entry(new_path, entry)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._number_of_characters = 0
+
+    def contains(self, path: str) -> bool:
+        with self._lock:
+            return os.path.normpath(path) in self._entries
+
+    def get(self, path: str) -> str | None:
+        path = os.path.normpath(path)
+
+        with self._lock:
+            entry = self._entries.get(path)
+
+            if not entry:
+                return
+
+            self._entries.move_to_end(path)
+
+            return entry.content
+
+    def invalidate(self, path: str) -> None:
+        with self._lock:
+            self._pop_entry(os.path.normpath(path))
+
+    def load(self, path: str) -> str | None:
+        path = os.path.normpath(path)
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            self.invalidate(path)
+
+            return
+
+        with self._lock:
+            entry = self._entries.get(path)
+
+            if entry and (entry.mtime, entry.size) == (stat.st_mtime_ns, stat.st_size):
+                self._entries.move_to_end(path)
+
+                return entry.content
+
+        try:
+            with open(path, "r") as file_for_read:
+                content = file_for_read.read()
+        except (OSError, ValueError) as error:
+            logger.error(f"Could not read {path!r}: {error}")
+
+            return
+
+        with self._lock:
+            self._put_entry(path, CacheEntry(content, stat.st_mtime_ns, stat.st_size))
+
+        return content
+
+    def put(self, path: str, content: str) -> None:
+        path = os.path.normpath(path)
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            self.invalidate(path)
+
+            return
+
+        with self._lock:
+            self._put_entry(path, CacheEntry(content, stat.st_mtime_ns, stat.st_size))
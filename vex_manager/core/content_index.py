@@ -0,0 +1,304 @@
+from typing import Callable
+import threading
+import logging
+import bisect
+import json
+import re
+import os
+
+from vex_manager.core.library_index import get_library_cache_name
+from vex_manager.core.library_index import LibraryRecord
+from vex_manager.core.library_diff import ChangeSet
+import vex_manager.utils as utils
+
+
+logger = logging.getLogger(f"vex_manager.{__name__}")
+
+TOKEN_PATTERN = re.compile(r"@?[A-Za-z_]\w*")
+
+# Shorter search terms only match whole tokens, longer ones match token prefixes.
+MINIMUM_PREFIX_LENGTH = 2
+
+
+def tokenize_content(code: str) -> frozenset[str]:
+    tokens = set()
+
+    for token in TOKEN_PATTERN.findall(code):
+        token = token.lower()
+        tokens.add(token)
+
+        if token.startswith("@"):
+            tokens.add(token[1:])
+
+    return frozenset(tokens)
+
+
+class ContentIndex:
+    VERSION = 1
+
+    def __init__(self, library_path: str, cache_path: str = "") -> None:
+        self.library_path = os.path.normpath(library_path)
+        self.cache_path = cache_path or utils.get_cache_path()
+
+        cache_name = get_library_cache_name(self.library_path)
+        self.cache_file_path = os.path.join(
+            self.cache_path, f"{cache_name}.tokens.json"
+        )
+
+        self._lock = threading.Lock()
+
+        self._stats_by_path: dict[str, tuple[int, int]] = {}
+        self._tokens_by_path: dict[str, frozenset[str]] = {}
+        self._paths_by_token: dict[str, set[str]] = {}
+        self._sorted_tokens: list[str] | None = None
+
+        self._ready = False
+        self._is_dirty = False
+
+    def _add_tokens(self, path: str, tokens: frozenset[str]) -> None:
+        self._tokens_by_path[path] = tokens
+
+        for token in tokens:
+            paths = self._paths_by_token.get(token)
+
+            if paths is None:
+                self._paths_by_token[token] = {path}
+                self._sorted_tokens = None
+            else:
+                paths.add(path)
+
+    def _remove_tokens(self, path: str) -> frozenset[str]:
+        tokens = self._tokens_by_path.pop(path, frozenset())
+
+        for token in tokens:
+            paths = self._paths_by_token.get(token)
+
+            if paths is not None:
+                paths.discard(path)
+
+                if not paths:
+                    del self._paths_by_token[token]
+                    self._sorted_tokens = None
+
+        return tokens
+
+    def _load_cache(self) -> dict[str, tuple[int, int, frozenset[str]]]:
+        if not os.path.exists(self.cache_file_path):
+            return {}
+
+        try:
+            with open(self.cache_file_path, "r") as file_for_read:
+                cache = json.load(file_for_read)
+        except (OSError, ValueError) as error:
+            logger.debug(
+                f"Could not read token cache {self.cache_file_path!r}: {error}"
+            )
+
+            return {}
+
+        if cache.get("version") != ContentIndex.VERSION:
+            return {}
+
+        vocabulary = cache.get("tokens", [])
+        cached_files = {}
+
+        for name, (mtime, size, token_ids) in cache.get("files", {}).items():
+            tokens = frozenset(vocabulary[token_id] for token_id in token_ids)
+            cached_files[name] = (mtime, size, tokens)
+
+        return cached_files
+
+    def save_cache(self) -> None:
+        with self._lock:
+            if not self._is_dirty:
+                return
+
+            # Copied under the lock and encoded outside it, searches keep running.
+            stats_by_path = dict(self._stats_by_path)
+            tokens_by_path = dict(self._tokens_by_path)
+            self._is_dirty = False
+
+        token_ids = {}
+        files = {}
+
+        for path, tokens in tokens_by_path.items():
+            mtime, size = stats_by_path[path]
+            ids = [token_ids.setdefault(token, len(token_ids)) for token in tokens]
+            files[os.path.basename(path)] = (mtime, size, ids)
+
+        cache = {
+            "version": ContentIndex.VERSION,
+            "tokens": list(token_ids),
+            "files": files,
+        }
+
+        temp_file_path = f"{self.cache_file_path}.{os.getpid()}.tmp"
+
+        try:
+            os.makedirs(self.cache_path, exist_ok=True)
+
+            # Encoded in one shot, json.dump streams through the pure Python encoder.
+            with open(temp_file_path, "w") as file_for_write:
+                file_for_write.write(json.dumps(cache, separators=(",", ":")))
+
+            os.replace(temp_file_path, self.cache_file_path)
+        except OSError as error:
+            logger.debug(
+                f"Could not write token cache {self.cache_file_path!r}: {error}"
+            )
+
+    @staticmethod
+    def _read_tokens(path: str) -> tuple[int, int, frozenset[str]] | None:
+        try:
+            stat = os.stat(path)
+
+            with open(path, "r") as file_for_read:
+                tokens = tokenize_content(file_for_read.read())
+        except (OSError, ValueError) as error:
+            logger.debug(f"Could not index {path!r}: {error}")
+
+            return
+
+        return stat.st_mtime_ns, stat.st_size, tokens
+
+    def build(
+        self,
+        records: list[LibraryRecord],
+        is_cancelled: Callable[[], bool] | None = None,
+    ) -> bool:
+        cached_files = self._load_cache()
+
+        stats_by_path = {}
+        tokens_by_path = {}
+        number_of_reads = 0
+
+        for record in records:
+            if is_cancelled and is_cancelled():
+                return False
+
+            cached_file = cached_files.get(os.path.basename(record.path))
+
+            if cached_file and cached_file[:2] == (record.mtime, record.size):
+                mtime, size, tokens = cached_file
+            else:
+                result = self._read_tokens(record.path)
+
+                if not result:
+                    continue
+
+                mtime, size, tokens = result
+                number_of_reads += 1
+
+            stats_by_path[record.path] = (mtime, size)
+            tokens_by_path[record.path] = tokens
+
+        paths_by_token = {}
+
+        for path, tokens in tokens_by_path.items():
+            for token in tokens:
+                paths_by_token.setdefault(token, set()).add(path)
+
+        with self._lock:
+            self._stats_by_path = stats_by_path
+            self._tokens_by_path = tokens_by_path
+            self._paths_by_token = paths_by_token
+            self._sorted_tokens = None
+            self._ready = True
+            self._is_dirty = bool(
+                number_of_reads or len(cached_files) != len(tokens_by_path)
+            )
+
+        self.save_cache()
+
+        logger.debug(
+            f"Content index built for {len(tokens_by_path)} files "
+            f"({number_of_reads} read from disk)."
+        )
+
+        return True
+
+    def is_ready(self) -> bool:
+        return self._ready
+
+    def search(self, text: str) -> set[str] | None:
+        terms = TOKEN_PATTERN.findall(text.lower())
+
+        if not terms or not self._ready:
+            return
+
+        matches = None
+
+        with self._lock:
+            if self._sorted_tokens is None:
+                self._sorted_tokens = sorted(self._paths_by_token)
+
+            for term in terms:
+                term_matches = set()
+
+                if len(term.lstrip("@")) < MINIMUM_PREFIX_LENGTH:
+                    term_matches.update(self._paths_by_token.get(term, ()))
+                else:
+                    index = bisect.bisect_left(self._sorted_tokens, term)
+
+                    while index < len(self._sorted_tokens):
+                        token = self._sorted_tokens[index]
+
+                        if not token.startswith(term):
+                            break
+
+                        term_matches.update(self._paths_by_token[token])
+                        index += 1
+
+                matches = term_matches if matches is None else matches & term_matches
+
+                if not matches:
+                    break
+
+        return matches
+
+    def update(self, change_set: ChangeSet) -> None:
+        if not self._ready:
+            return
+
+        results = {}
+
+        for path in change_set.added + change_set.modified:
+            result = self._read_tokens(path)
+
+            if result:
+                results[path] = result
+
+        with self._lock:
+            for path in change_set.removed:
+                self._remove_tokens(path)
+                self._stats_by_path.pop(path, None)
+
+            for path, new_path in change_set.renamed:
+                tokens = self._remove_tokens(path)
+                stat = self._stats_by_path.pop(path, None)
+
+                if stat:
+                    self._stats_by_path[new_path] = stat
+                    self._add_tokens(new_path, tokens)
+
+            for path, (mtime, size, tokens) in results.items():
+                self._remove_tokens(path)
+                self._stats_by_path[path] = (mtime, size)
+                self._add_tokens(path, tokens)
+
+            if change_set:
+                self._is_dirty = True
+
+
+_content_indexes: dict[str, ContentIndex] = {}
+
+
+def get_content_index(library_path: str) -> ContentIndex:
+    library_key = os.path.normcase(os.path.abspath(library_path))
+    content_index = _content_indexes.get(library_key)
+
+    if not content_index:
+        content_index = ContentIndex(library_path)
+        _content_indexes[library_key] = content_index
+
+    return content_index
@@ -1,15 +1,22 @@
+from typing import Iterator
 from pathlib import Path
 import logging
-import glob
+import codecs
+import locale
+import shutil
+import mmap
+import io
 import re
 import os
 
+from vex_manager.core.library_index import get_library_index
+from vex_manager.core.library_index import FILE_EXTENSION
 import vex_manager.utils as utils
 
 
 logger = logging.getLogger(f"vex_manager.{__name__}")
 
-FILE_EXTENSION = ".vfl"
+CHUNK_SIZE = 16 * 1024
 
 
 def create_new_vex_file(library_path: str, name: str = "") -> tuple[str, str]:
@@ -22,16 +29,14 @@ def create_new_vex_file(library_path: str, name: str = "") -> tuple[str, str]:
     elif not name:
         name = "VEX"
 
+    library_index = get_library_index(library_path)
     vex_file_path = os.path.join(library_path, f"{name}{FILE_EXTENSION}")
 
-    if os.path.exists(vex_file_path):
-        files = glob.glob(f"{library_path}/*{FILE_EXTENSION}")
-        files.sort(reverse=True)
-
+    if library_index.contains_name(name):
         value = 1
 
-        for file in files:
-            base_name = os.path.basename(file)
+        for file_name in library_index.get_names():
+            base_name = f"{file_name}{FILE_EXTENSION}"
             match = re.search(r"%s(\d{2})%s" % (name, FILE_EXTENSION), base_name)
 
             if match:
@@ -49,6 +54,7 @@ def create_new_vex_file(library_path: str, name: str = "") -> tuple[str, str]:
         base_name = name
 
     open(new_vex_file_path, "w").close()
+    library_index.add_file(new_vex_file_path)
 
     logger.debug(f"{new_vex_file_path!r} created.")
 
@@ -57,7 +63,11 @@ def create_new_vex_file(library_path: str, name: str = "") -> tuple[str, str]:
 
 def delete_file(file_path: str) -> None:
     if os.path.exists(file_path):
+        library_index = get_library_index(os.path.dirname(file_path))
+        library_index.revalidate()
+
         os.remove(file_path)
+        library_index.remove_file(file_path)
 
         logger.debug(f"{file_path!r} deleted.")
     else:
@@ -65,15 +75,84 @@ def delete_file(file_path: str) -> None:
 
 
 def get_vex_files(library_path: str) -> list[str]:
-    vex_files = []
+    if not library_path:
+        return []
+
+    return get_library_index(library_path).get_vex_files()
+
+
+def write_vex_file(file_path: str, code: str, fsync: bool = False) -> bool:
+    temp_file_path = f"{file_path}.{os.getpid()}.tmp"
+
+    try:
+        with open(temp_file_path, "w") as file_for_write:
+            file_for_write.write(code)
+
+            if fsync:
+                file_for_write.flush()
+                os.fsync(file_for_write.fileno())
+
+        if os.path.exists(file_path):
+            shutil.copymode(file_path, temp_file_path)
+
+        os.replace(temp_file_path, file_path)
+
+        if fsync and hasattr(os, "O_DIRECTORY"):
+            directory_descriptor = os.open(os.path.dirname(file_path), os.O_RDONLY)
+
+            try:
+                os.fsync(directory_descriptor)
+            finally:
+                os.close(directory_descriptor)
+    except OSError as error:
+        logger.error(f"Could not write {file_path!r}: {error}")
+
+        if os.path.exists(temp_file_path):
+            os.remove(temp_file_path)
+
+        return False
 
-    if os.path.exists(library_path):
-        vex_file_paths = glob.glob(os.path.join(library_path, f"*{FILE_EXTENSION}"))
+    logger.debug(f"{file_path!r} written.")
 
-        for vex_file_path in vex_file_paths:
-            vex_files.append(os.path.normpath(vex_file_path))
+    return True
 
-    return vex_files
+
+def read_file_chunks(
+    file_path: str, chunk_size: int = CHUNK_SIZE
+) -> Iterator[tuple[str, int]]:
+    # Decoded like open(file_path, "r"), newlines included, with the bytes read so far.
+    decoder = io.IncrementalNewlineDecoder(
+        codecs.getincrementaldecoder(locale.getpreferredencoding(False))(),
+        translate=True,
+    )
+
+    with open(file_path, "rb") as file_for_read:
+        try:
+            buffer = mmap.mmap(file_for_read.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            # Empty files and filesystems without mmap support are read instead.
+            buffer = None
+
+        try:
+            position = 0
+
+            while True:
+                if buffer is not None:
+                    data = buffer[position : position + chunk_size]
+                else:
+                    data = file_for_read.read(chunk_size)
+
+                position += len(data)
+                text = decoder.decode(data, final=not data)
+
+                if text:
+                    yield text, position
+
+                if not data:
+                    break
+        finally:
+            if buffer is not None:
+                buffer.close()
 
 
 def rename_vex_file(file_path: str, new_name: str) -> tuple[str, str]:
@@ -94,23 +173,22 @@ def rename_vex_file(file_path: str, new_name: str) -> tuple[str, str]:
         logger.error(f"{file_path!r} is a directory.")
     else:
         library_path = os.path.dirname(file_path)
-
-        for file in glob.glob(os.path.join(library_path, "*")):
-            if new_name == Path(file).stem:
-                logger.error(f"{file_path!r} already exists.")
-
+        library_index = get_library_index(library_path)
         new_file_path = os.path.join(library_path, new_name)
 
         if os.path.normpath(new_file_path) == os.path.normpath(file_path):
             new_file_path = file_path
 
             logger.debug(f"{new_file_path!r} is the same name.")
-        elif os.path.exists(new_file_path):
-            new_file_path = file_path
-
+        elif library_index.contains_path(new_file_path) or os.path.exists(
+            new_file_path
+        ):
             logger.error(f"{new_file_path!r} already exists.")
+
+            new_file_path = file_path
         else:
             os.rename(file_path, new_file_path)
+            library_index.rename_file(file_path, new_file_path)
 
             logger.debug(f"Renamed file {file_path!r} -> {new_file_path!r}")
 
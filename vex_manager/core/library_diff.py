@@ -0,0 +1,82 @@
+from dataclasses import dataclass
+from dataclasses import field
+import logging
+
+from vex_manager.core.library_index import LibraryRecord
+
+
+logger = logging.getLogger(f"vex_manager.{__name__}")
+
+
+@dataclass(slots=True)
+class ChangeSet:
+    added: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    renamed: list[tuple[str, str]] = field(default_factory=list)
+    modified: list[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.renamed or self.modified)
+
+
+def _is_modified(previous_record: LibraryRecord, current_record: LibraryRecord) -> bool:
+    return (
+        previous_record.mtime != current_record.mtime
+        or previous_record.size != current_record.size
+    )
+
+
+def diff_snapshots(
+    previous_snapshot: dict[str, LibraryRecord],
+    current_snapshot: dict[str, LibraryRecord],
+) -> ChangeSet:
+    change_set = ChangeSet()
+
+    previous_paths = previous_snapshot.keys()
+    current_paths = current_snapshot.keys()
+
+    removed_paths = previous_paths - current_paths
+    added_paths = current_paths - previous_paths
+
+    removed_paths_by_inode = {}
+
+    for path in removed_paths:
+        inode = previous_snapshot[path].inode
+
+        if inode:
+            removed_paths_by_inode[inode] = path
+
+    for path in sorted(added_paths):
+        current_record = current_snapshot[path]
+        previous_path = removed_paths_by_inode.get(current_record.inode)
+
+        # A rename keeps the mtime, a reused inode from a delete + create does not.
+        if previous_path and not _is_modified(
+            previous_snapshot[previous_path], current_record
+        ):
+            del removed_paths_by_inode[current_record.inode]
+
+            change_set.renamed.append((previous_path, path))
+        else:
+            change_set.added.append(path)
+
+    renamed_paths = {previous_path for previous_path, path in change_set.renamed}
+    change_set.removed = sorted(removed_paths - renamed_paths)
+
+    for path in previous_paths & current_paths:
+        previous_record = previous_snapshot[path]
+        current_record = current_snapshot[path]
+
+        if previous_record is current_record:
+            continue
+        elif previous_record.inode != current_record.inode or _is_modified(
+            previous_record, current_record
+        ):
+            change_set.modified.append(path)
+
+    logger.debug(
+        f"{len(change_set.added)} added, {len(change_set.removed)} removed, "
+        f"{len(change_set.renamed)} renamed, {len(change_set.modified)} modified."
+    )
+
+    return change_set
@@ -0,0 +1,396 @@
+from dataclasses import dataclass
+import hashlib
+import logging
+import json
+import time
+import os
+
+import vex_manager.utils as utils
+
+
+logger = logging.getLogger(f"vex_manager.{__name__}")
+
+FILE_EXTENSION = ".vfl"
+
+# Whole-second directory mtimes (NFS, some SMB shares) younger than this may hide a
+# later change made within the same tick, so they are not trusted until they age.
+DIRECTORY_MTIME_RESOLUTION = 2.0
+
+
+@dataclass(slots=True)
+class LibraryRecord:
+    name: str
+    path: str
+    mtime: int
+    size: int
+    inode: int
+    content_hash: str = ""
+
+
+def compute_content_hash(code: str) -> str:
+    lines = code.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    normalized_code = "\n".join(line.rstrip() for line in lines).strip()
+
+    return hashlib.sha1(normalized_code.encode("utf-8")).hexdigest()
+
+
+def get_library_cache_name(library_path: str) -> str:
+    library_key = os.path.normcase(os.path.abspath(library_path))
+
+    return hashlib.sha1(library_key.encode("utf-8")).hexdigest()
+
+
+class LibraryIndex:
+    VERSION = 2
+
+    def __init__(self, library_path: str, cache_path: str = "") -> None:
+        self.library_path = os.path.normpath(library_path)
+        self.cache_path = cache_path or utils.get_cache_path()
+
+        cache_name = get_library_cache_name(self.library_path)
+        self.cache_file_path = os.path.join(self.cache_path, f"{cache_name}.json")
+
+        self._records: dict[str, LibraryRecord] = {}
+        self._paths_by_name: dict[str, str] = {}
+        self._sorted_paths: list[str] | None = None
+
+        self._directory_mtime = -1
+        self._directory_mtime_stable = False
+        self._cache_loaded = False
+
+    def _get_directory_mtime(self) -> int:
+        try:
+            return os.stat(self.library_path).st_mtime_ns
+        except OSError:
+            return -1
+
+    def _set_directory_mtime(self, directory_mtime: int) -> None:
+        fine_grained = directory_mtime % 1_000_000_000 != 0
+        age = time.time() - directory_mtime / 1e9
+
+        self._directory_mtime = directory_mtime
+        self._directory_mtime_stable = fine_grained or age > DIRECTORY_MTIME_RESOLUTION
+
+    def _add_record(self, record: LibraryRecord) -> None:
+        if record.path not in self._records:
+            self._sorted_paths = None
+
+        self._records[record.path] = record
+        self._paths_by_name[record.name] = record.path
+
+    def _remove_record(self, path: str) -> LibraryRecord | None:
+        record = self._records.pop(path, None)
+
+        if record:
+            self._sorted_paths = None
+
+        if record and self._paths_by_name.get(record.name) == path:
+            del self._paths_by_name[record.name]
+
+        return record
+
+    def _load_cache(self) -> None:
+        self._cache_loaded = True
+
+        if not os.path.exists(self.cache_file_path):
+            return
+
+        try:
+            with open(self.cache_file_path, "r") as file_for_read:
+                cache = json.load(file_for_read)
+        except (OSError, ValueError) as error:
+            logger.debug(
+                f"Could not read index cache {self.cache_file_path!r}: {error}"
+            )
+
+            return
+
+        if (
+            cache.get("version") != LibraryIndex.VERSION
+            or cache.get("library_path") != self.library_path
+        ):
+            return
+
+        for name, mtime, size, inode, content_hash in cache.get("records", []):
+            path = os.path.join(self.library_path, f"{name}{FILE_EXTENSION}")
+            record = LibraryRecord(name, path, mtime, size, inode, content_hash)
+            self._add_record(record)
+
+        self._set_directory_mtime(cache.get("directory_mtime", -1))
+
+        logger.debug(f"Loaded {len(self._records)} records from index cache.")
+
+    def _save_cache(self) -> None:
+        cache = {
+            "version": LibraryIndex.VERSION,
+            "library_path": self.library_path,
+            "directory_mtime": self._directory_mtime,
+            "records": [
+                (
+                    record.name,
+                    record.mtime,
+                    record.size,
+                    record.inode,
+                    record.content_hash,
+                )
+                for record in self._records.values()
+            ],
+        }
+
+        temp_file_path = f"{self.cache_file_path}.{os.getpid()}.tmp"
+
+        try:
+            os.makedirs(self.cache_path, exist_ok=True)
+
+            with open(temp_file_path, "w") as file_for_write:
+                json.dump(cache, file_for_write, separators=(",", ":"))
+
+            os.replace(temp_file_path, self.cache_file_path)
+        except OSError as error:
+            logger.debug(
+                f"Could not write index cache {self.cache_file_path!r}: {error}"
+            )
+
+    def _scan(self, directory_mtime: int) -> None:
+        records = {}
+
+        try:
+            with os.scandir(self.library_path) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(FILE_EXTENSION):
+                        continue
+
+                    try:
+                        if not entry.is_file():
+                            continue
+
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+
+                    path = os.path.normpath(entry.path)
+                    previous_record = self._records.get(path)
+
+                    if (
+                        previous_record
+                        and previous_record.mtime == stat.st_mtime_ns
+                        and previous_record.size == stat.st_size
+                        and previous_record.inode == stat.st_ino
+                    ):
+                        records[path] = previous_record
+                    else:
+                        records[path] = LibraryRecord(
+                            name=entry.name[: -len(FILE_EXTENSION)],
+                            path=path,
+                            mtime=stat.st_mtime_ns,
+                            size=stat.st_size,
+                            inode=stat.st_ino,
+                        )
+        except OSError as error:
+            logger.error(f"Could not scan library path {self.library_path!r}: {error}")
+
+        self._records.clear()
+        self._paths_by_name.clear()
+        self._sorted_paths = None
+
+        for record in records.values():
+            self._add_record(record)
+
+        self._set_directory_mtime(directory_mtime)
+        self._save_cache()
+
+        logger.debug(f"Indexed {len(self._records)} VEX files.")
+
+    def _stat_record(self, path: str) -> LibraryRecord | None:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return
+
+        file_name = os.path.basename(path)
+
+        return LibraryRecord(
+            name=file_name[: -len(FILE_EXTENSION)],
+            path=path,
+            mtime=stat.st_mtime_ns,
+            size=stat.st_size,
+            inode=stat.st_ino,
+        )
+
+    def _is_synced(self) -> bool:
+        return self._cache_loaded and self._directory_mtime >= 0
+
+    def _sync_directory_mtime(self) -> None:
+        self._set_directory_mtime(self._get_directory_mtime())
+        self._save_cache()
+
+    def revalidate(self, force: bool = False) -> bool:
+        if not self._cache_loaded:
+            self._load_cache()
+
+        directory_mtime = self._get_directory_mtime()
+
+        if directory_mtime < 0:
+            if self._records:
+                self._records.clear()
+                self._paths_by_name.clear()
+                self._sorted_paths = None
+
+                return True
+
+            return False
+        elif (
+            not force
+            and directory_mtime == self._directory_mtime
+            and self._directory_mtime_stable
+        ):
+            return False
+
+        self._scan(directory_mtime)
+
+        return True
+
+    def add_file(self, file_path: str) -> None:
+        if not self._is_synced():
+            return
+
+        file_path = os.path.normpath(file_path)
+        record = self._stat_record(file_path)
+
+        if record:
+            self._add_record(record)
+
+        self._sync_directory_mtime()
+
+    def remove_file(self, file_path: str) -> None:
+        if not self._is_synced():
+            return
+
+        file_path = os.path.normpath(file_path)
+
+        self._remove_record(file_path)
+        self._sync_directory_mtime()
+
+    def rename_file(self, file_path: str, new_file_path: str) -> None:
+        if not self._is_synced():
+            return
+
+        file_path = os.path.normpath(file_path)
+        new_file_path = os.path.normpath(new_file_path)
+
+        self._remove_record(file_path)
+
+        record = self._stat_record(new_file_path)
+
+        if record:
+            self._add_record(record)
+
+        self._sync_directory_mtime()
+
+    def contains_name(self, name: str) -> bool:
+        self.revalidate()
+
+        return name in self._paths_by_name
+
+    def contains_path(self, file_path: str) -> bool:
+        self.revalidate()
+
+        return os.path.normpath(file_path) in self._records
+
+    def get_content_hash(self, file_path: str) -> str:
+        content_hashes = self.get_content_hashes([file_path])
+
+        return content_hashes.get(os.path.normpath(file_path), "")
+
+    def get_content_hashes(self, file_paths: list[str] | None = None) -> dict[str, str]:
+        self.revalidate()
+
+        if file_paths is None:
+            file_paths = list(self._records)
+
+        content_hashes = {}
+        updated = False
+
+        for file_path in file_paths:
+            file_path = os.path.normpath(file_path)
+            record = self._records.get(file_path)
+
+            if not record:
+                continue
+
+            current_record = self._stat_record(file_path)
+
+            if not current_record:
+                continue
+            elif (
+                not record.content_hash
+                or current_record.mtime != record.mtime
+                or current_record.size != record.size
+            ):
+                try:
+                    with open(file_path, "r") as file_for_read:
+                        current_record.content_hash = compute_content_hash(
+                            file_for_read.read()
+                        )
+                except (OSError, ValueError) as error:
+                    logger.error(f"Could not read {file_path!r}: {error}")
+
+                    continue
+
+                self._add_record(current_record)
+                record = current_record
+                updated = True
+
+            content_hashes[file_path] = record.content_hash
+
+        if updated:
+            self._save_cache()
+
+        return content_hashes
+
+    def get_names(self) -> list[str]:
+        self.revalidate()
+
+        return sorted(self._paths_by_name)
+
+    def get_path(self, name: str) -> str:
+        self.revalidate()
+
+        return self._paths_by_name.get(name, "")
+
+    def get_record(self, file_path: str) -> LibraryRecord | None:
+        self.revalidate()
+
+        return self._records.get(os.path.normpath(file_path))
+
+    def get_records(self) -> list[LibraryRecord]:
+        self.revalidate()
+
+        return list(self._records.values())
+
+    def get_snapshot(self, force: bool = False) -> dict[str, LibraryRecord]:
+        self.revalidate(force=force)
+
+        return dict(self._records)
+
+    def get_vex_files(self) -> list[str]:
+        self.revalidate()
+
+        if self._sorted_paths is None:
+            self._sorted_paths = sorted(self._records)
+
+        return list(self._sorted_paths)
+
+
+_library_indexes: dict[str, LibraryIndex] = {}
+
+
+def get_library_index(library_path: str) -> LibraryIndex:
+    library_key = os.path.normcase(os.path.abspath(library_path))
+    library_index = _library_indexes.get(library_key)
+
+    if not library_index:
+        library_index = LibraryIndex(library_path)
+        _library_indexes[library_key] = library_index
+
+    return library_index
@@ -0,0 +1,197 @@
+from dataclasses import dataclass
+from typing import Any, Callable
+import logging
+import weakref
+import copy
+import json
+import os
+
+from vex_manager.config import ColorScheme
+import vex_manager.utils as utils
+
+
+logger = logging.getLogger(f"vex_manager.{__name__}")
+
+DEFAULT_PREFERENCES = {
+    "library_path": "",
+    "warn_before_deleting_a_file": True,
+    "fsync_on_save": False,
+    "backspace_on_tab_stop": True,
+    "insert_closing_brackets": True,
+    "insert_closing_quotes": True,
+    "font": "Source Sans Pro",
+    "font_size": 8,
+    "color_scheme": {
+        color_scheme.value["name"]: list(color_scheme.value["color"])
+        for color_scheme in ColorScheme
+    },
+    "tab_size": 4,
+    "auto_indent": True,
+}
+
+
+@dataclass(slots=True)
+class PreferencesChange:
+    changes: dict[str, Any]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.changes
+
+    def __getitem__(self, key: str) -> Any:
+        return self.changes[key]
+
+    def __bool__(self) -> bool:
+        return bool(self.changes)
+
+    def keys(self) -> set[str]:
+        return set(self.changes)
+
+
+class Preferences:
+    def __init__(self, preferences_path: str = "") -> None:
+        self.preferences_path = preferences_path or utils.get_preferences_path()
+
+        self._values = copy.deepcopy(DEFAULT_PREFERENCES)
+        self._file_stat: tuple[int, int] | None = None
+        self._loaded = False
+
+        self._subscribers: list[weakref.WeakMethod | Callable] = []
+
+    def _get_file_stat(self) -> tuple[int, int] | None:
+        try:
+            stat = os.stat(self.preferences_path)
+        except OSError:
+            return
+
+        return stat.st_mtime_ns, stat.st_size
+
+    def _read_file(self) -> dict[str, Any]:
+        values = copy.deepcopy(DEFAULT_PREFERENCES)
+
+        if self._file_stat is None:
+            return values
+
+        try:
+            with open(self.preferences_path, "r") as file_for_read:
+                values.update(json.load(file_for_read))
+        except (OSError, ValueError) as error:
+            logger.error(
+                f"Could not read preferences {self.preferences_path!r}: {error}"
+            )
+
+            return self._values
+
+        if not values["color_scheme"]:
+            values["color_scheme"] = copy.deepcopy(DEFAULT_PREFERENCES["color_scheme"])
+
+        return values
+
+    def _set_values(self, values: dict[str, Any]) -> None:
+        changes = {
+            key: copy.deepcopy(value)
+            for key, value in values.items()
+            if key not in self._values or self._values[key] != value
+        }
+        self._values = values
+
+        if changes:
+            self._notify(PreferencesChange(changes))
+
+    def _notify(self, change: PreferencesChange) -> None:
+        subscribers = []
+
+        for subscriber in list(self._subscribers):
+            callback = (
+                subscriber()
+                if isinstance(subscriber, weakref.WeakMethod)
+                else subscriber
+            )
+
+            if callback is None:
+                self._subscribers.remove(subscriber)
+            else:
+                subscribers.append(callback)
+
+        for callback in subscribers:
+            try:
+                callback(change)
+            except Exception as error:
+                logger.error(f"Preferences subscriber {callback!r} failed: {error}")
+
+        logger.debug(f"Preferences changed: {sorted(change.keys())!r}")
+
+    def revalidate(self) -> bool:
+        file_stat = self._get_file_stat()
+
+        if self._loaded and file_stat == self._file_stat:
+            return False
+
+        self._file_stat = file_stat
+        self._loaded = True
+        self._set_values(self._read_file())
+
+        return True
+
+    def get(self, key: str) -> Any:
+        self.revalidate()
+
+        return copy.deepcopy(self._values[key])
+
+    def get_all(self) -> dict[str, Any]:
+        self.revalidate()
+
+        return copy.deepcopy(self._values)
+
+    def update(self, values: dict[str, Any]) -> None:
+        self.revalidate()
+
+        # Round trip through JSON so the values compare equal to a later reload.
+        new_values = copy.deepcopy(self._values)
+        new_values.update(json.loads(json.dumps(values)))
+
+        temp_file_path = f"{self.preferences_path}.{os.getpid()}.tmp"
+
+        try:
+            os.makedirs(os.path.dirname(self.preferences_path), exist_ok=True)
+
+            with open(temp_file_path, "w") as file_for_write:
+                json.dump(new_values, file_for_write, indent=4)
+
+            os.replace(temp_file_path, self.preferences_path)
+        except OSError as error:
+            logger.error(
+                f"Could not write preferences {self.preferences_path!r}: {error}"
+            )
+
+            return
+
+        self._file_stat = self._get_file_stat()
+        self._set_values(new_values)
+
+    def subscribe(self, callback: Callable[[PreferencesChange], None]) -> None:
+        if hasattr(callback, "__self__"):
+            self._subscribers.append(weakref.WeakMethod(callback))
+        else:
+            self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[PreferencesChange], None]) -> None:
+        for subscriber in list(self._subscribers):
+            if isinstance(subscriber, weakref.WeakMethod):
+                subscriber_callback = subscriber()
+            else:
+                subscriber_callback = subscriber
+
+            if subscriber_callback is None or subscriber_callback == callback:
+                self._subscribers.remove(subscriber)
+
+
+_preferences: Preferences | None = None
+
+
+def get_preferences() -> Preferences:
+    global _preferences
+
+    if not _preferences:
+        _preferences = Preferences()
+
+    return _preferences
@@ -0,0 +1,252 @@
+from dataclasses import dataclass
+import threading
+import hashlib
+import logging
+import json
+import os
+
+from vex_manager.core.library_index import get_library_cache_name
+import vex_manager.utils as utils
+
+
+logger = logging.getLogger(f"vex_manager.{__name__}")
+
+JOURNAL_EXTENSION = ".journal"
+
+
+@dataclass(slots=True)
+class RecoveredFile:
+    file_path: str
+    content: str
+
+
+def _hash_text(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def _read_text(file_path: str) -> str | None:
+    try:
+        with open(file_path, "r") as file_for_read:
+            return file_for_read.read()
+    except (OSError, ValueError):
+        return
+
+
+def get_file_key(file_path: str) -> str:
+    return os.path.normcase(os.path.abspath(file_path))
+
+
+def _get_common_prefix_length(text: str, other_text: str) -> int:
+    # Halving slices keeps the comparisons in C for long snippets.
+    low = 0
+    high = min(len(text), len(other_text))
+
+    while low < high:
+        middle = (low + high + 1) // 2
+
+        if text[low:middle] == other_text[low:middle]:
+            low = middle
+        else:
+            high = middle - 1
+
+    return low
+
+
+def compute_diff(old_text: str, new_text: str) -> tuple[int, int, str]:
+    start = _get_common_prefix_length(old_text, new_text)
+
+    end_length = _get_common_prefix_length(
+        old_text[start:][::-1], new_text[start:][::-1]
+    )
+
+    return (
+        start,
+        len(old_text) - end_length,
+        new_text[start : len(new_text) - end_length],
+    )
+
+
+def apply_diff(text: str, diff: tuple[int, int, str]) -> str:
+    start, end, replacement = diff
+
+    return f"{text[:start]}{replacement}{text[end:]}"
+
+
+class RecoveryJournal:
+    def __init__(self, library_path: str, recovery_path: str = "") -> None:
+        self.library_path = os.path.normpath(library_path)
+        self.recovery_path = os.path.join(
+            recovery_path or utils.get_recovery_path(),
+            get_library_cache_name(self.library_path),
+        )
+
+        self._library_key = get_file_key(self.library_path)
+
+        self._lock = threading.Lock()
+
+        # The text each journal currently reconstructs, the next diff starts from it,
+        # by file key.
+        self._journaled_texts: dict[str, str] = {}
+
+    def _get_journal_file_path(self, file_path: str) -> str:
+        file_key = get_file_key(file_path)
+        journal_name = hashlib.sha1(file_key.encode("utf-8")).hexdigest()
+
+        return os.path.join(self.recovery_path, f"{journal_name}{JOURNAL_EXTENSION}")
+
+    def _append(self, file_path: str, text: str) -> None:
+        file_key = get_file_key(file_path)
+        previous_text = self._journaled_texts.get(file_key)
+        records = []
+
+        journal_file_path = self._get_journal_file_path(file_path)
+
+        # Left from an earlier session whose recovery was put off, carried on.
+        if previous_text is None and os.path.exists(journal_file_path):
+            recovered_file = self._read_journal(journal_file_path)
+
+            if recovered_file is not None:
+                previous_text = recovered_file.content
+
+        is_new_journal = previous_text is None
+
+        # New journals start from the file on disk, so they only hold the edits.
+        if is_new_journal:
+            previous_text = _read_text(file_path) or ""
+            records.append(
+                {"path": os.path.abspath(file_path), "hash": _hash_text(previous_text)}
+            )
+
+        records.append(compute_diff(previous_text, text))
+
+        try:
+            os.makedirs(self.recovery_path, exist_ok=True)
+
+            # A new journal truncates any stale or unreadable one left at its path.
+            mode = "w" if is_new_journal else "a"
+
+            with open(journal_file_path, mode) as file_for_write:
+                for record in records:
+                    file_for_write.write(
+                        f"{json.dumps(record, separators=(',', ':'))}\n"
+                    )
+        except OSError as error:
+            logger.error(f"Could not journal {file_path!r}: {error}")
+
+            self._journaled_texts.pop(file_key, None)
+
+            return
+
+        self._journaled_texts[file_key] = text
+
+    def _discard(self, file_path: str) -> None:
+        self._journaled_texts.pop(get_file_key(file_path), None)
+
+        journal_file_path = self._get_journal_file_path(file_path)
+
+        if os.path.exists(journal_file_path):
+            try:
+                os.remove(journal_file_path)
+            except OSError as error:
+                logger.error(f"Could not remove {journal_file_path!r}: {error}")
+
+    def _read_journal(self, journal_file_path: str) -> RecoveredFile | None:
+        try:
+            with open(journal_file_path, "r") as file_for_read:
+                lines = file_for_read.read().splitlines()
+        except (OSError, ValueError) as error:
+            logger.error(f"Could not read {journal_file_path!r}: {error}")
+
+            return
+
+        try:
+            header = json.loads(lines[0])
+            file_path = header["path"]
+            base_hash = header["hash"]
+        except (IndexError, KeyError, TypeError, ValueError):
+            logger.warning(f"{journal_file_path!r} is not a recovery journal.")
+
+            return
+
+        base_text = _read_text(file_path)
+
+        if base_text is None or _hash_text(base_text) != base_hash:
+            logger.warning(
+                f"{file_path!r} changed since it was journaled, "
+                f"its unsaved edits cannot be recovered."
+            )
+
+            return
+
+        content = base_text
+
+        for line in lines[1:]:
+            # A crash can cut the last record short.
+            try:
+                content = apply_diff(content, json.loads(line))
+            except (TypeError, ValueError):
+                break
+
+        if content == base_text:
+            return
+
+        return RecoveredFile(file_path, content)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._journaled_texts.clear()
+
+            if not os.path.isdir(self.recovery_path):
+                return
+
+            for name in os.listdir(self.recovery_path):
+                if name.endswith(JOURNAL_EXTENSION):
+                    try:
+                        os.remove(os.path.join(self.recovery_path, name))
+                    except OSError as error:
+                        logger.error(f"Could not remove {name!r}: {error}")
+
+    def contains(self, file_path: str) -> bool:
+        return get_file_key(file_path).startswith(f"{self._library_key}{os.sep}")
+
+    def discard(self, file_path: str) -> None:
+        with self._lock:
+            self._discard(file_path)
+
+    def read(self) -> list[RecoveredFile]:
+        recovered_files = []
+
+        with self._lock:
+            if not os.path.isdir(self.recovery_path):
+                return recovered_files
+
+            for name in sorted(os.listdir(self.recovery_path)):
+                if not name.endswith(JOURNAL_EXTENSION):
+                    continue
+
+                journal_file_path = os.path.join(self.recovery_path, name)
+                recovered_file = self._read_journal(journal_file_path)
+
+                if recovered_file is not None:
+                    recovered_files.append(recovered_file)
+
+                    continue
+
+                try:
+                    os.remove(journal_file_path)
+                except OSError as error:
+                    logger.error(f"Could not remove {journal_file_path!r}: {error}")
+
+        return recovered_files
+
+    def update(
+        self, changes: list[tuple[str, str]], discarded_file_paths: list[str]
+    ) -> None:
+        with self._lock:
+            for file_path in discarded_file_paths:
+                self._discard(file_path)
+
+            for file_path, text in changes:
+                self._append(file_path, text)
+
+        logger.debug(f"{len(changes)} files journaled.")
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import hou
+
+from dataclasses import dataclass, field
+import logging
+
+from vex_manager.core.snippet_links import get_snippet_link_index
+from vex_manager.core.library_index import compute_content_hash
+from vex_manager.core.library_index import get_library_index
+from vex_manager.core.vex_manager import get_snippet_origin
+from vex_manager.core.vex_manager import get_snippet_id
+from vex_manager.core.vex_manager import get_snippet_parm
+from vex_manager.core.vex_manager import is_wrangle_node_type
+
+
+logger = logging.getLogger(f"vex_manager.{__name__}")
+
+
+@dataclass(slots=True)
+class HarvestReport:
+    used: dict[str, list[str]] = field(default_factory=dict)
+    unsaved: list[str] = field(default_factory=list)
+    drifted: dict[str, str] = field(default_factory=dict)
+    number_of_nodes: int = 0
+
+
+def harvest_scene(library_path: str, root_path: str = "/") -> HarvestReport:
+    report = HarvestReport()
+    root_node = hou.node(root_path)
+
+    if root_node is None:
+        logger.error(f"Node {root_path!r} does not exist.")
+
+        return report
+
+    library_index = get_library_index(library_path)
+    content_hashes = library_index.get_content_hashes()
+
+    paths_by_hash = {}
+
+    for file_path, content_hash in sorted(content_hashes.items()):
+        paths_by_hash.setdefault(content_hash, file_path)
+
+    paths_by_id = {
+        get_snippet_id(record.path): record.path
+        for record in library_index.get_records()
+        if record.path in content_hashes
+    }
+
+    snippet_link_index = get_snippet_link_index()
+
+    for node in root_node.allSubChildren():
+        if not is_wrangle_node_type(node.type().name()):
+            continue
+
+        snippet_parm = get_snippet_parm(node)
+
+        if snippet_parm is None:
+            continue
+
+        code = snippet_parm.evalAsString()
+
+        if not code.strip():
+            continue
+
+        report.number_of_nodes += 1
+
+        node_path = node.path()
+        content_hash = compute_content_hash(code)
+
+        origin = get_snippet_origin(node)
+        origin_path = paths_by_id.get(origin.get("id")) if origin else None
+
+        if origin and origin.get("linked"):
+            snippet_link_index.add(node.sessionId(), origin["id"])
+
+        if origin_path and content_hashes[origin_path] != content_hash:
+            report.drifted[node_path] = origin_path
+        elif origin_path:
+            report.used.setdefault(origin_path, []).append(node_path)
+        elif content_hash in paths_by_hash:
+            report.used.setdefault(paths_by_hash[content_hash], []).append(node_path)
+        else:
+            report.unsaved.append(node_path)
+
+    logger.debug(
+        f"Harvested {report.number_of_nodes} snippets: {len(report.used)} library "
+        f"files used, {len(report.unsaved)} unsaved, {len(report.drifted)} drifted."
+    )
+
+    return report
@@ -0,0 +1,54 @@
+import logging
+
+
+logger = logging.getLogger(f"vex_manager.{__name__}")
+
+
+class SnippetLinkIndex:
+    def __init__(self) -> None:
+        self._session_ids_by_id: dict[str, set[int]] = {}
+        self._ids_by_session_id: dict[int, str] = {}
+
+        self._built = False
+
+    def add(self, session_id: int, library_id: str) -> None:
+        self.remove(session_id)
+
+        self._session_ids_by_id.setdefault(library_id, set()).add(session_id)
+        self._ids_by_session_id[session_id] = library_id
+
+    def clear(self) -> None:
+        self._session_ids_by_id.clear()
+        self._ids_by_session_id.clear()
+
+        self._built = False
+
+    def get_session_ids(self, library_id: str) -> set[int]:
+        return set(self._session_ids_by_id.get(library_id, ()))
+
+    def is_built(self) -> bool:
+        return self._built
+
+    def remove(self, session_id: int) -> None:
+        library_id = self._ids_by_session_id.pop(session_id, None)
+
+        if library_id is None:
+            return
+
+        session_ids = self._session_ids_by_id[library_id]
+        session_ids.discard(session_id)
+
+        if not session_ids:
+            del self._session_ids_by_id[library_id]
+
+    def set_built(self) -> None:
+        self._built = True
+
+        logger.debug(f"Snippet links indexed for {len(self._ids_by_session_id)} nodes.")
+
+
+_snippet_link_index = SnippetLinkIndex()
+
+
+def get_snippet_link_index() -> SnippetLinkIndex:
+    return _snippet_link_index
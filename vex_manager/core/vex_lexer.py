@@ -0,0 +1,144 @@
+from enum import IntEnum
+import logging
+import re
+
+import vex_manager.config as config
+
+
+logger = logging.getLogger(f"vex_manager.{__name__}")
+
+
+class LexerState(IntEnum):
+    NORMAL = 0
+    BLOCK_COMMENT = 1
+    DOUBLE_QUOTED_STRING = 2
+    SINGLE_QUOTED_STRING = 3
+
+
+class TokenType(IntEnum):
+    PLAIN = 0
+    STRINGS = 1
+    NUMBERS = 2
+    COMMENTS = 3
+    FUNCTIONS = 4
+    KEYWORDS = 5
+    TYPES = 6
+    REFERENCES = 7
+
+
+# Strings ending in a line continuation backslash carry on into the next block.
+TOKEN_PATTERN = re.compile(
+    r"(?P<comment>//.*)"
+    r"|(?P<block_comment>/\*.*?(?:\*/|$))"
+    r"|(?P<string>([\"'])(?:\\.|(?!\4)[^\\])*(?:\4|\\$))"
+    r"|(?P<reference>\w*@[\w-]+)"
+    r"|(?P<identifier>[A-Za-z_]\w*)"
+    r"|(?P<number>\b\d+(?:\.\d+)?\b)"
+)
+
+GROUP_TOKEN_TYPES = {
+    "comment": TokenType.COMMENTS,
+    "reference": TokenType.REFERENCES,
+    "number": TokenType.NUMBERS,
+}
+
+BLOCK_COMMENT_END_PATTERN = re.compile(r"\*/")
+
+STRING_END_PATTERNS = {
+    LexerState.DOUBLE_QUOTED_STRING: re.compile(r'(?:\\.|[^"\\])*(?:"|\\$)'),
+    LexerState.SINGLE_QUOTED_STRING: re.compile(r"(?:\\.|[^'\\])*(?:'|\\$)"),
+}
+
+STRING_STATES = {
+    '"': LexerState.DOUBLE_QUOTED_STRING,
+    "'": LexerState.SINGLE_QUOTED_STRING,
+}
+
+
+_identifier_token_types: dict[str, TokenType] = {}
+
+
+def get_identifier_token_types() -> dict[str, TokenType]:
+    if not _identifier_token_types:
+        vex_syntaxis_tables = config.VEXSyntaxisTables
+
+        # Types win over keywords and keywords over functions ("struct", "foreach").
+        _identifier_token_types.update(
+            {
+                **dict.fromkeys(vex_syntaxis_tables.VEX_FUNCTIONS, TokenType.FUNCTIONS),
+                **dict.fromkeys(vex_syntaxis_tables.KEYWORDS, TokenType.KEYWORDS),
+                **dict.fromkeys(vex_syntaxis_tables.DATA_TYPES, TokenType.TYPES),
+            }
+        )
+
+    return _identifier_token_types
+
+
+def _get_block_comment_state(block_comment: str) -> LexerState:
+    if len(block_comment) >= 4 and block_comment.endswith("*/"):
+        return LexerState.NORMAL
+
+    return LexerState.BLOCK_COMMENT
+
+
+def _get_string_state(string: str) -> LexerState:
+    if string.endswith("\\"):
+        return STRING_STATES[string[0]]
+
+    return LexerState.NORMAL
+
+
+def tokenize_block(
+    text: str, state: int = LexerState.NORMAL
+) -> tuple[list[tuple[int, int, TokenType]], LexerState]:
+    tokens = []
+    position = 0
+
+    if state == LexerState.BLOCK_COMMENT:
+        match = BLOCK_COMMENT_END_PATTERN.search(text)
+        position = match.end() if match else len(text)
+
+        if position:
+            tokens.append((0, position, TokenType.COMMENTS))
+
+        if not match:
+            return tokens, LexerState.BLOCK_COMMENT
+    elif state in STRING_END_PATTERNS:
+        match = STRING_END_PATTERNS[state].match(text)
+        position = match.end() if match else len(text)
+
+        if position:
+            tokens.append((0, position, TokenType.STRINGS))
+
+        if match and match.group().endswith("\\") and position == len(text):
+            return tokens, LexerState(state)
+
+    state = LexerState.NORMAL
+
+    # Empty blocks, like the empty editor shown on startup, need no syntax tables.
+    identifier_token_types = get_identifier_token_types() if text else {}
+
+    for match in TOKEN_PATTERN.finditer(text, position):
+        group = match.lastgroup
+
+        if group == "identifier":
+            token_type = identifier_token_types.get(match.group(), TokenType.PLAIN)
+        elif group == "block_comment":
+            token_type = TokenType.COMMENTS
+            state = _get_block_comment_state(match.group())
+        elif group == "string":
+            token_type = TokenType.STRINGS
+            state = _get_string_state(match.group())
+        else:
+            token_type = GROUP_TOKEN_TYPES[group]
+
+        start, end = match.span()
+        tokens.append((start, end - start, token_type))
+
+    return tokens, state
+
+
+def tokenize(text: str) -> list[tuple[int, int, TokenType]]:
+    tokens, state = tokenize_block(text)
+
+    return tokens
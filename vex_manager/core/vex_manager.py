@@ -1,45 +1,337 @@
+from __future__ import annotations
+
 import hou
 
+from typing import Iterable
 import logging
+import fnmatch
+import json
+import os
 
+from vex_manager.core.snippet_links import get_snippet_link_index
+from vex_manager.core.library_index import get_library_cache_name
+from vex_manager.core.library_index import compute_content_hash
 from vex_manager.config import WrangleNodes
 
 
 logger = logging.getLogger(f"vex_manager.{__name__}")
 
+UNDO_GROUP_LABEL = "VEX Manager: Apply VEX Code"
+
+# Node user data recording which library snippet a node's code came from.
+ORIGIN_USER_DATA_NAME = "vexmanager_origin"
+
+WRANGLE_NODE_TYPES = frozenset(wrangle_node.value for wrangle_node in WrangleNodes)
+SNIPPET_PARM_NAMES = ("snippet", "vexsnippet")
+
+_custom_wrangle_node_types: dict[str, str] = {}
+_snippet_parm_names: dict[str, str | None] = {}
+
+
+def _find_snippet_parm_name(node: hou.Node) -> str | None:
+    custom_parm_name = _custom_wrangle_node_types.get(node.type().name())
+    parm_names = (custom_parm_name,) if custom_parm_name else SNIPPET_PARM_NAMES
+
+    for parm_name in parm_names:
+        if node.parm(parm_name) is not None:
+            return parm_name
+
+    return
+
+
+def get_snippet_parm(node: hou.Node) -> hou.Parm | None:
+    node_type_name = node.type().name()
+
+    if not is_wrangle_node_type(node_type_name):
+        return
+
+    parm_name = _snippet_parm_names.get(node_type_name)
+
+    if parm_name:
+        snippet_parm = node.parm(parm_name)
+
+        if snippet_parm is not None:
+            return snippet_parm
+
+    # Unknown type, or a type name shared by node types with different parms.
+    parm_name = _find_snippet_parm_name(node)
+    _snippet_parm_names[node_type_name] = parm_name
+
+    return node.parm(parm_name) if parm_name else None
+
+
+def get_wrangle_node_types() -> frozenset[str]:
+    return WRANGLE_NODE_TYPES | frozenset(_custom_wrangle_node_types)
+
+
+def is_wrangle_node_type(node_type_name: str) -> bool:
+    return (
+        node_type_name in WRANGLE_NODE_TYPES
+        or node_type_name in _custom_wrangle_node_types
+    )
+
+
+def register_wrangle_node_type(
+    node_type_name: str, snippet_parm_name: str = ""
+) -> None:
+    _custom_wrangle_node_types[node_type_name] = snippet_parm_name
+    _snippet_parm_names.pop(node_type_name, None)
+
+
+def get_snippet_id(library_file_path: str) -> str:
+    library_path, file_name = os.path.split(os.path.normpath(library_file_path))
+
+    # Qualified by library, snippets sharing a name in other libraries stay apart.
+    return f"{get_library_cache_name(library_path)}/{file_name}"
+
+
+def get_snippet_origin(node: hou.Node) -> dict | None:
+    origin = node.userData(ORIGIN_USER_DATA_NAME)
+
+    if not origin:
+        return
+
+    try:
+        return json.loads(origin)
+    except ValueError:
+        logger.debug(f"Invalid snippet origin on {node.path()!r}.")
+
+        return
+
+
+def _set_snippet_origin(node: hou.Node, origin: dict | None) -> None:
+    if origin:
+        node.setUserData(ORIGIN_USER_DATA_NAME, json.dumps(origin))
+    elif node.userData(ORIGIN_USER_DATA_NAME) is not None:
+        node.destroyUserData(ORIGIN_USER_DATA_NAME)
+
+    snippet_link_index = get_snippet_link_index()
+
+    if origin and origin.get("linked"):
+        snippet_link_index.add(node.sessionId(), origin["id"])
+    else:
+        snippet_link_index.remove(node.sessionId())
+
+
+def _hip_file_changed(event_type: hou.hipFileEventType) -> None:
+    if event_type in (
+        hou.hipFileEventType.AfterClear,
+        hou.hipFileEventType.AfterLoad,
+        hou.hipFileEventType.AfterMerge,
+    ):
+        get_snippet_link_index().clear()
+
+
+def _set_snippet_code(snippet_parm: hou.Parm, vex_code: str, insert: bool) -> None:
+    if insert:
+        current_code = snippet_parm.evalAsString()
+
+        if current_code:
+            new_vex_code = f"{current_code}\n\n{vex_code}"
+        else:
+            new_vex_code = vex_code
+    else:
+        new_vex_code = vex_code
+
+    snippet_parm.set(new_vex_code)
+
+
+def apply_vex_code(
+    nodes: Iterable[hou.Node],
+    vex_code: str,
+    insert: bool = False,
+    library_file_path: str = "",
+    linked: bool = False,
+) -> list[hou.Node]:
+    updated_nodes = []
+
+    if not vex_code:
+        return updated_nodes
+
+    origin = None
+
+    if library_file_path:
+        origin = {
+            "id": get_snippet_id(library_file_path),
+            "hash": compute_content_hash(vex_code),
+        }
+
+        if linked:
+            origin["linked"] = True
+
+    with hou.undos.group(UNDO_GROUP_LABEL):
+        update_mode = hou.updateModeSetting()
+        hou.setUpdateMode(hou.updateMode.Manual)
+
+        try:
+            for node in nodes:
+                snippet_parm = get_snippet_parm(node)
+
+                if snippet_parm is None:
+                    logger.debug(f"{node.path()!r} has no snippet parm, skipped.")
 
-def set_vex_code_in_selected_wrangle_node(vex_code: str, insert: bool = False) -> None:
+                    continue
+
+                _set_snippet_code(snippet_parm, vex_code, insert)
+
+                # Inserted code no longer matches its origin, so it is left to drift.
+                if not insert:
+                    _set_snippet_origin(node, origin)
+
+                updated_nodes.append(node)
+        finally:
+            hou.setUpdateMode(update_mode)
+
+    logger.debug(f"VEX code applied to {len(updated_nodes)} nodes.")
+
+    return updated_nodes
+
+
+def build_snippet_links(root_path: str = "/") -> None:
+    snippet_link_index = get_snippet_link_index()
+    snippet_link_index.clear()
+
+    root_node = hou.node(root_path)
+
+    if root_node is not None:
+        for node in root_node.allSubChildren():
+            if not is_wrangle_node_type(node.type().name()):
+                continue
+
+            origin = get_snippet_origin(node)
+
+            if origin and origin.get("linked"):
+                snippet_link_index.add(node.sessionId(), origin["id"])
+
+    if root_path == "/":
+        snippet_link_index.set_built()
+
+        if _hip_file_changed not in hou.hipFile.eventCallbacks():
+            hou.hipFile.addEventCallback(_hip_file_changed)
+
+
+def get_linked_nodes(library_file_path: str) -> list[hou.Node]:
+    snippet_link_index = get_snippet_link_index()
+
+    if not snippet_link_index.is_built():
+        build_snippet_links()
+
+    library_id = get_snippet_id(library_file_path)
+    linked_nodes = []
+
+    for session_id in snippet_link_index.get_session_ids(library_id):
+        node = hou.nodeBySessionId(session_id)
+        origin = get_snippet_origin(node) if node is not None else None
+
+        # Deleted nodes, or nodes whose origin was changed outside VEX Manager.
+        if not origin or not origin.get("linked") or origin.get("id") != library_id:
+            snippet_link_index.remove(session_id)
+
+            continue
+
+        linked_nodes.append(node)
+
+    return linked_nodes
+
+
+def propagate_vex_code(library_file_path: str, vex_code: str) -> list[hou.Node]:
+    content_hash = compute_content_hash(vex_code)
+
+    outdated_nodes = [
+        node
+        for node in get_linked_nodes(library_file_path)
+        if get_snippet_origin(node).get("hash") != content_hash
+    ]
+
+    if not outdated_nodes:
+        return []
+
+    return apply_vex_code(
+        outdated_nodes, vex_code, library_file_path=library_file_path, linked=True
+    )
+
+
+def rename_snippet_links(library_file_path: str, new_library_file_path: str) -> None:
+    new_library_id = get_snippet_id(new_library_file_path)
+
+    for node in get_linked_nodes(library_file_path):
+        origin = get_snippet_origin(node)
+        origin["id"] = new_library_id
+        _set_snippet_origin(node, origin)
+
+
+def find_wrangle_nodes(
+    type_pattern: str = "*", path_pattern: str = "*", root_path: str = "/"
+) -> list[hou.Node]:
+    root_node = hou.node(root_path)
+
+    if root_node is None:
+        logger.error(f"Node {root_path!r} does not exist.")
+
+        return []
+
+    wrangle_nodes = []
+
+    for node in root_node.allSubChildren():
+        node_type_name = node.type().name()
+
+        if (
+            is_wrangle_node_type(node_type_name)
+            and fnmatch.fnmatchcase(node_type_name, type_pattern)
+            and fnmatch.fnmatchcase(node.path(), path_pattern)
+            and get_snippet_parm(node) is not None
+        ):
+            wrangle_nodes.append(node)
+
+    return wrangle_nodes
+
+
+def set_vex_code_in_selected_wrangle_node(
+    vex_code: str,
+    insert: bool = False,
+    library_file_path: str = "",
+    linked: bool = False,
+) -> None:
     if vex_code:
         selected_nodes = hou.selectedNodes()
 
         if selected_nodes:
             node = selected_nodes[-1]
-            wrangle_node_types = [node.value for node in WrangleNodes]
 
-            if node.type().name() in wrangle_node_types:
-                parms = [parm.name() for parm in node.parms()]
+            if is_wrangle_node_type(node.type().name()):
+                updated_nodes = apply_vex_code(
+                    [node],
+                    vex_code,
+                    insert=insert,
+                    library_file_path=library_file_path,
+                    linked=linked,
+                )
 
-                if "snippet" in parms:
-                    snippet_parm = node.parm("snippet")
-                elif "vexsnippet" in parms:
-                    snippet_parm = node.parm("vexsnippet")
-                else:
+                if not updated_nodes:
                     logger.error("No snippet parm found.")
-
-                    return
-
-                if insert:
-                    current_code = snippet_parm.evalAsString()
-
-                    if current_code:
-                        new_vex_code = f"{current_code}\n\n{vex_code}"
-                    else:
-                        new_vex_code = vex_code
-                else:
-                    new_vex_code = vex_code
-
-                snippet_parm.set(new_vex_code)
             else:
                 logger.error(f"{node.name()!r} is not a wrangle node.")
         else:
             logger.error("There is no selected node.")
+
+
+def set_vex_code_in_selected_wrangle_nodes(
+    vex_code: str,
+    insert: bool = False,
+    library_file_path: str = "",
+    linked: bool = False,
+) -> list[hou.Node]:
+    selected_nodes = hou.selectedNodes()
+
+    if not selected_nodes:
+        logger.error("There is no selected node.")
+
+        return []
+
+    return apply_vex_code(
+        selected_nodes,
+        vex_code,
+        insert=insert,
+        library_file_path=library_file_path,
+        linked=linked,
+    )
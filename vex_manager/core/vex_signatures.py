@@ -0,0 +1,155 @@
+from dataclasses import dataclass
+from typing import Iterable
+from pathlib import Path
+import logging
+import json
+import os
+import re
+
+from vex_manager.core.vex_lexer import TokenType
+import vex_manager.utils as utils
+
+
+logger = logging.getLogger(f"vex_manager.{__name__}")
+
+SIGNATURES_FILE_NAME = "vex_signatures.json"
+
+# Signatures compiled from a local Houdini install take precedence over the snapshot,
+# which only covers about 85 common functions.
+BUNDLED_SIGNATURES_PATH = str(
+    Path(__file__).parents[1].joinpath("config", SIGNATURES_FILE_NAME)
+)
+
+CALL_NAME_PATTERN = re.compile(r"([A-Za-z_]\w*)\s*$")
+
+# Punctuation inside these is not code, so call lookups step over them.
+SKIPPED_TOKEN_TYPES = frozenset((TokenType.STRINGS, TokenType.COMMENTS))
+
+_signatures: dict[str, list] | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class VEXArgument:
+    type: str
+    name: str
+    default: str = ""
+
+    def format(self) -> str:
+        argument = f"{self.type} {self.name}" if self.name else self.type
+
+        return f"{argument}={self.default}" if self.default else argument
+
+
+@dataclass(slots=True, frozen=True)
+class VEXSignature:
+    name: str
+    return_type: str
+    arguments: tuple[VEXArgument, ...]
+
+    def format(self) -> str:
+        arguments = ", ".join(argument.format() for argument in self.arguments)
+
+        return f"{self.return_type} {self.name}({arguments})"
+
+
+def get_signatures_path() -> str:
+    user_signatures_path = os.path.join(utils.get_cache_path(), SIGNATURES_FILE_NAME)
+
+    if os.path.isfile(user_signatures_path):
+        return user_signatures_path
+
+    return BUNDLED_SIGNATURES_PATH
+
+
+def _load_signatures() -> dict[str, list]:
+    signatures_path = get_signatures_path()
+
+    try:
+        with open(signatures_path, "r") as file_for_read:
+            signatures = json.load(file_for_read)
+    except (OSError, ValueError) as e:
+        logger.error(f"Could not load signatures from {signatures_path!r}: {e}")
+
+        return {}
+
+    logger.debug(f"{len(signatures)} signatures loaded from {signatures_path!r}.")
+
+    return signatures
+
+
+def is_loaded() -> bool:
+    return _signatures is not None
+
+
+def unload() -> None:
+    global _signatures
+
+    _signatures = None
+
+
+def get_signatures(name: str) -> tuple[VEXSignature, ...]:
+    global _signatures
+
+    if _signatures is None:
+        _signatures = _load_signatures()
+
+    return tuple(
+        VEXSignature(
+            name,
+            return_type,
+            tuple(VEXArgument(*argument) for argument in arguments),
+        )
+        for return_type, arguments in _signatures.get(name, ())
+    )
+
+
+def find_call(
+    text: str, tokens: Iterable[tuple[int, int, int]] = ()
+) -> tuple[str, int] | None:
+    skipped_spans = [
+        (start, start + length)
+        for start, length, token_type in tokens
+        if token_type in SKIPPED_TOKEN_TYPES
+    ]
+
+    skipped_start = len(text)
+
+    depth = 0
+    argument_index = 0
+
+    for index in range(len(text) - 1, -1, -1):
+        if index >= skipped_start:
+            continue
+
+        while skipped_spans and skipped_spans[-1][0] > index:
+            skipped_spans.pop()
+
+        if skipped_spans and index < skipped_spans[-1][1]:
+            skipped_start = skipped_spans.pop()[0]
+
+            continue
+
+        character = text[index]
+
+        if character in ")]}":
+            depth += 1
+        elif character in "[{":
+            if not depth:
+                return
+
+            depth -= 1
+        elif character == "(":
+            if depth:
+                depth -= 1
+
+                continue
+
+            match = CALL_NAME_PATTERN.search(text, 0, index)
+
+            return (match.group(1), argument_index) if match else None
+        elif character == ";":
+            return
+        elif character == "," and not depth:
+            argument_index += 1
+
+    return
@@ -0,0 +1,183 @@
+import logging
+import bisect
+import re
+
+from vex_manager.core.vex_lexer import LexerState
+from vex_manager.core.vex_lexer import TokenType
+import vex_manager.core.vex_lexer as vex_lexer
+import vex_manager.config as config
+
+
+logger = logging.getLogger(f"vex_manager.{__name__}")
+
+SYMBOL_PATTERN = re.compile(r"@?[A-Za-z_]\w*")
+
+# Shorter symbols are not worth completing.
+MINIMUM_SYMBOL_LENGTH = 2
+
+MAX_COMPLETIONS = 200
+
+
+def extract_symbols(
+    text: str, tokens: list[tuple[int, int, TokenType]]
+) -> frozenset[str]:
+    symbols = set()
+
+    # Known names complete from the syntax tables, comments and strings not at all.
+    for start, length, token_type in tokens:
+        if token_type == TokenType.PLAIN:
+            symbol = text[start : start + length]
+        elif token_type == TokenType.REFERENCES:
+            match = SYMBOL_PATTERN.match(text, text.index("@", start))
+            symbol = match.group() if match else ""
+        else:
+            continue
+
+        if len(symbol.lstrip("@")) >= MINIMUM_SYMBOL_LENGTH:
+            symbols.add(symbol)
+
+    return frozenset(symbols)
+
+
+def extract_lines_symbols(
+    lines: list[str], state: int = LexerState.NORMAL
+) -> list[frozenset[str]]:
+    block_symbols = []
+
+    for line in lines:
+        tokens, state = vex_lexer.tokenize_block(line, state)
+        block_symbols.append(extract_symbols(line, tokens))
+
+    return block_symbols
+
+
+class DocumentSymbols:
+    def __init__(self, block_symbols: list[frozenset[str]] | None = None) -> None:
+        self._block_symbols = block_symbols or [frozenset()]
+        self._counts: dict[str, int] = {}
+
+        for symbols in self._block_symbols:
+            for symbol in symbols:
+                self._counts[symbol] = self._counts.get(symbol, 0) + 1
+
+        self._sorted_symbols = sorted(self._counts)
+
+    @classmethod
+    def from_lines(cls, lines: list[str]) -> "DocumentSymbols":
+        return cls(extract_lines_symbols(lines))
+
+    def _add_symbols(self, symbols: frozenset[str]) -> None:
+        for symbol in symbols:
+            count = self._counts.get(symbol, 0)
+            self._counts[symbol] = count + 1
+
+            if not count:
+                bisect.insort(self._sorted_symbols, symbol)
+
+    def _remove_symbols(self, symbols: frozenset[str]) -> None:
+        for symbol in symbols:
+            count = self._counts[symbol] - 1
+
+            if count:
+                self._counts[symbol] = count
+            else:
+                del self._counts[symbol]
+
+                index = bisect.bisect_left(self._sorted_symbols, symbol)
+                del self._sorted_symbols[index]
+
+    def contains(self, symbol: str) -> bool:
+        return symbol in self._counts
+
+    def get_number_of_blocks(self) -> int:
+        return len(self._block_symbols)
+
+    def get_symbols_with_prefix(self, prefix: str) -> list[str]:
+        sorted_symbols = self._sorted_symbols
+
+        start = bisect.bisect_left(sorted_symbols, prefix)
+        end = start
+
+        while end < len(sorted_symbols) and sorted_symbols[end].startswith(prefix):
+            end += 1
+
+        return sorted_symbols[start:end]
+
+    def replace_blocks(
+        self,
+        first_block: int,
+        number_of_blocks: int,
+        new_block_symbols: list[frozenset[str]],
+    ) -> None:
+        old_block_symbols = self._block_symbols[
+            first_block : first_block + number_of_blocks
+        ]
+
+        for old_symbols, new_symbols in zip(old_block_symbols, new_block_symbols):
+            if old_symbols != new_symbols:
+                self._remove_symbols(old_symbols - new_symbols)
+                self._add_symbols(new_symbols - old_symbols)
+
+        shared_blocks = min(len(old_block_symbols), len(new_block_symbols))
+
+        for old_symbols in old_block_symbols[shared_blocks:]:
+            self._remove_symbols(old_symbols)
+
+        for new_symbols in new_block_symbols[shared_blocks:]:
+            self._add_symbols(new_symbols)
+
+        self._block_symbols[
+            first_block : first_block + number_of_blocks
+        ] = new_block_symbols
+
+
+def is_data_type(name: str) -> bool:
+    return name in config.VEXSyntaxisTables.DATA_TYPES
+
+
+def is_keyword(name: str) -> bool:
+    return name in config.VEXSyntaxisTables.KEYWORDS
+
+
+def is_vex_function(name: str) -> bool:
+    return name in config.VEXSyntaxisTables.VEX_FUNCTIONS
+
+
+def get_symbols_with_prefix(prefix: str) -> tuple[str, ...]:
+    vex_syntaxis_tables = config.VEXSyntaxisTables
+    trie = vex_syntaxis_tables.TRIE
+
+    node = trie[0]
+    depth = 0
+
+    while depth < len(prefix):
+        edge = node[2].get(prefix[depth])
+
+        if edge is None:
+            return ()
+
+        label, child_index = edge
+
+        # The prefix may end part way through the edge label.
+        if not label.startswith(prefix[depth : depth + len(label)]):
+            return ()
+
+        node = trie[child_index]
+        depth += len(label)
+
+    start, end, children = node
+
+    return vex_syntaxis_tables.NAMES[start:end]
+
+
+def get_completions(
+    prefix: str, document_symbols: DocumentSymbols | None = None
+) -> list[str]:
+    completions = set(get_symbols_with_prefix(prefix))
+
+    if document_symbols is not None:
+        completions.update(document_symbols.get_symbols_with_prefix(prefix))
+
+    completions.discard(prefix)
+
+    return sorted(completions)[:MAX_COMPLETIONS]
@@ -0,0 +1,167 @@
+from PySide2 import QtWidgets
+from PySide2 import QtCore
+
+import hou
+
+import logging
+
+import vex_manager.core as core
+
+
+logger = logging.getLogger(f"vex_manager.{__name__}")
+
+
+class BatchApplyUI(QtWidgets.QWidget):
+    WINDOW_NAME = "vexManagerBatchApply"
+    WINDOW_TITLE = "Batch Apply"
+
+    SELECTED_NODES = "Selected Nodes"
+    MATCHING_NODES = "Matching Nodes"
+
+    REPLACE_CODE = "Replace Code"
+    INSERT_CODE = "Insert Code"
+
+    def __init__(self, parent: QtWidgets.QWidget, f: QtCore.Qt.WindowFlags) -> None:
+        super().__init__(parent, f)
+
+        self.vex_code = ""
+        self.library_file_path = ""
+
+        self.resize(400, 200)
+        self.setObjectName(BatchApplyUI.WINDOW_NAME)
+        self.setWindowTitle(BatchApplyUI.WINDOW_TITLE)
+        self.setWindowFlags(self.windowFlags() ^ QtCore.Qt.WindowContextHelpButtonHint)
+
+        self._create_widgets()
+        self._create_layouts()
+        self._create_connections()
+
+    def _create_widgets(self) -> None:
+        self.target_combo_box = QtWidgets.QComboBox()
+        self.target_combo_box.addItems(
+            [BatchApplyUI.SELECTED_NODES, BatchApplyUI.MATCHING_NODES]
+        )
+
+        self.root_path_line_edit = QtWidgets.QLineEdit("/")
+
+        self.type_pattern_line_edit = QtWidgets.QLineEdit("*")
+
+        self.path_pattern_line_edit = QtWidgets.QLineEdit("*")
+
+        self.mode_combo_box = QtWidgets.QComboBox()
+        self.mode_combo_box.addItems(
+            [BatchApplyUI.REPLACE_CODE, BatchApplyUI.INSERT_CODE]
+        )
+
+        self.link_to_library_check_box = QtWidgets.QCheckBox("Link to Library")
+
+        self.apply_push_button = QtWidgets.QPushButton("Apply")
+
+        self.cancel_push_button = QtWidgets.QPushButton("Cancel")
+
+    def _create_layouts(self) -> None:
+        main_layout = QtWidgets.QVBoxLayout(self)
+        main_layout.setAlignment(QtCore.Qt.AlignTop)
+        main_layout.setContentsMargins(6, 6, 6, 6)
+        main_layout.setSpacing(6)
+
+        nodes_group_box = QtWidgets.QGroupBox("Nodes")
+        main_layout.addWidget(nodes_group_box)
+
+        nodes_form_layout = QtWidgets.QFormLayout()
+        nodes_form_layout.addRow("Apply To ", self.target_combo_box)
+        nodes_form_layout.addRow("Root Path ", self.root_path_line_edit)
+        nodes_form_layout.addRow("Type Pattern ", self.type_pattern_line_edit)
+        nodes_form_layout.addRow("Path Pattern ", self.path_pattern_line_edit)
+        nodes_form_layout.setContentsMargins(6, 6, 6, 6)
+        nodes_form_layout.setSpacing(6)
+        nodes_group_box.setLayout(nodes_form_layout)
+
+        code_group_box = QtWidgets.QGroupBox("Code")
+        main_layout.addWidget(code_group_box)
+
+        code_form_layout = QtWidgets.QFormLayout()
+        code_form_layout.addRow("Mode ", self.mode_combo_box)
+        code_form_layout.addRow("", self.link_to_library_check_box)
+        code_form_layout.setContentsMargins(6, 6, 6, 6)
+        code_form_layout.setSpacing(6)
+        code_group_box.setLayout(code_form_layout)
+
+        buttons_h_box_layout = QtWidgets.QHBoxLayout()
+        buttons_h_box_layout.addStretch()
+        buttons_h_box_layout.addWidget(self.apply_push_button)
+        buttons_h_box_layout.addWidget(self.cancel_push_button)
+        main_layout.addStretch()
+        main_layout.addLayout(buttons_h_box_layout)
+
+    def _create_connections(self) -> None:
+        self.target_combo_box.currentTextChanged.connect(
+            self._target_current_text_changed_combo_box
+        )
+        self.mode_combo_box.currentTextChanged.connect(
+            self._mode_current_text_changed_combo_box
+        )
+
+        self.apply_push_button.clicked.connect(self._apply_clicked_push_button)
+        self.cancel_push_button.clicked.connect(self.close)
+
+        self._target_current_text_changed_combo_box()
+        self._mode_current_text_changed_combo_box()
+
+    def _target_current_text_changed_combo_box(self) -> None:
+        matching_nodes = (
+            self.target_combo_box.currentText() == BatchApplyUI.MATCHING_NODES
+        )
+
+        self.root_path_line_edit.setEnabled(matching_nodes)
+        self.type_pattern_line_edit.setEnabled(matching_nodes)
+        self.path_pattern_line_edit.setEnabled(matching_nodes)
+
+    def _mode_current_text_changed_combo_box(self) -> None:
+        replace = self.mode_combo_box.currentText() == BatchApplyUI.REPLACE_CODE
+
+        self.link_to_library_check_box.setEnabled(
+            replace and bool(self.library_file_path)
+        )
+
+    def _apply_clicked_push_button(self) -> None:
+        if not self.vex_code:
+            logger.error("No VEX code to apply.")
+
+            return
+
+        insert = self.mode_combo_box.currentText() == BatchApplyUI.INSERT_CODE
+        linked = self.link_to_library_check_box.isChecked() and not insert
+
+        if self.target_combo_box.currentText() == BatchApplyUI.SELECTED_NODES:
+            updated_nodes = core.set_vex_code_in_selected_wrangle_nodes(
+                self.vex_code,
+                insert=insert,
+                library_file_path=self.library_file_path,
+                linked=linked,
+            )
+        else:
+            nodes = core.find_wrangle_nodes(
+                type_pattern=self.type_pattern_line_edit.text() or "*",
+                path_pattern=self.path_pattern_line_edit.text() or "*",
+                root_path=self.root_path_line_edit.text() or "/",
+            )
+            updated_nodes = core.apply_vex_code(
+                nodes,
+                self.vex_code,
+                insert=insert,
+                library_file_path=self.library_file_path,
+                linked=linked,
+            )
+
+        hou.ui.setStatusMessage(
+            f"VEX code applied to {len(updated_nodes)} wrangle nodes."
+        )
+
+        self.close()
+
+    def set_vex_code(self, vex_code: str, library_file_path: str = "") -> None:
+        self.vex_code = vex_code
+        self.library_file_path = library_file_path
+
+        self._mode_current_text_changed_combo_box()
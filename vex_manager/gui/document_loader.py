@@ -0,0 +1,94 @@
+from PySide2 import QtCore
+
+from typing import Iterator
+import logging
+import time
+import os
+
+from vex_manager.gui.vex_plain_text_edit import VEXPlainTextEdit
+import vex_manager.core as core
+
+
+logger = logging.getLogger(f"vex_manager.{__name__}")
+
+
+class DocumentLoader(QtCore.QObject):
+    progress_changed = QtCore.Signal(int)
+    finished = QtCore.Signal(str, bool)
+
+    # Seconds of appending per event loop turn.
+    SLICE_DURATION = 0.01
+
+    def __init__(self, vex_plain_text_edit: VEXPlainTextEdit) -> None:
+        super().__init__(vex_plain_text_edit)
+
+        self.vex_plain_text_edit = vex_plain_text_edit
+
+        self.file_path = ""
+        self.file_size = 0
+        self.chunks: Iterator[tuple[str, int]] | None = None
+
+        self.timer = QtCore.QTimer(self)
+        self.timer.setInterval(0)
+        self.timer.timeout.connect(self._load_timeout_timer)
+
+    def _load_timeout_timer(self) -> None:
+        end_time = time.perf_counter() + DocumentLoader.SLICE_DURATION
+        position = 0
+
+        try:
+            while time.perf_counter() < end_time:
+                chunk = next(self.chunks, None)
+
+                if chunk is None:
+                    self._finish(True)
+
+                    return
+
+                text, position = chunk
+                self.vex_plain_text_edit.append_text(text)
+        except (OSError, ValueError) as error:
+            logger.error(f"Could not read {self.file_path!r}: {error}")
+
+            self._finish(False)
+
+            return
+
+        self.progress_changed.emit(position * 100 // max(self.file_size, 1))
+
+    def _finish(self, loaded: bool) -> None:
+        file_path = self.file_path
+
+        self.cancel()
+
+        if loaded:
+            self.vex_plain_text_edit.end_streaming()
+
+            logger.debug(f"{file_path!r} streamed.")
+
+        self.finished.emit(file_path, loaded)
+
+    def is_loading(self) -> bool:
+        return self.chunks is not None
+
+    def start(self, file_path: str) -> None:
+        self.cancel()
+
+        self.file_path = file_path
+        self.file_size = os.path.getsize(file_path)
+        self.chunks = core.read_file_chunks(file_path)
+
+        self.vex_plain_text_edit.begin_streaming()
+        self.progress_changed.emit(0)
+        self.timer.start()
+
+    def cancel(self) -> None:
+        self.timer.stop()
+
+        if self.chunks is not None:
+            # Closes the file and its memory map.
+            self.chunks.close()
+            self.chunks = None
+
+        self.file_path = ""
+        self.file_size = 0
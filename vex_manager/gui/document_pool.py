@@ -0,0 +1,150 @@
+from PySide2 import QtGui
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import logging
+import os
+
+from vex_manager.core.library_diff import ChangeSet
+
+
+logger = logging.getLogger(f"vex_manager.{__name__}")
+
+MAX_POOL_CHARACTERS = 4_000_000
+
+
+@dataclass(slots=True)
+class DocumentEntry:
+    document: QtGui.QTextDocument
+    mtime: int
+    size: int
+    text_cursor: QtGui.QTextCursor | None = None
+    horizontal_scroll: int = 0
+    vertical_scroll: int = 0
+
+
+class DocumentPool:
+    def __init__(self, max_characters: int = MAX_POOL_CHARACTERS) -> None:
+        self.max_characters = max_characters
+
+        self._entries: OrderedDict[str, DocumentEntry] = OrderedDict()
+
+        # PySide keeps every document set on an editor alive, so the pool deletes the
+        # ones it drops, apart from the one in the editor.
+        self.current_document: QtGui.QTextDocument | None = None
+
+    def contains_document(self, document: QtGui.QTextDocument) -> bool:
+        return any(entry.document is document for entry in self._entries.values())
+
+    def _release(self, entry: DocumentEntry | None) -> None:
+        if entry and entry.document is not self.current_document:
+            entry.document.deleteLater()
+
+    # Documents grow and shrink with every edit, so they are measured when evicting.
+    def _evict(self) -> None:
+        number_of_characters = sum(
+            entry.document.characterCount() for entry in self._entries.values()
+        )
+
+        for path in list(self._entries):
+            if number_of_characters <= self.max_characters:
+                break
+
+            document = self._entries[path].document
+
+            # Unsaved edits are never evicted.
+            if document is self.current_document or document.isModified():
+                continue
+
+            evicted_entry = self._entries.pop(path)
+            number_of_characters -= evicted_entry.document.characterCount()
+            self._release(evicted_entry)
+
+            logger.debug(f"{path!r} document evicted.")
+
+    def apply_change_set(self, change_set: ChangeSet) -> None:
+        for path in change_set.removed:
+            self._release(self._entries.pop(path, None))
+
+        for path, new_path in change_set.renamed:
+            entry = self._entries.pop(path, None)
+
+            if entry:
+                self._entries[new_path] = entry
+
+    def clear(self) -> None:
+        for entry in self._entries.values():
+            self._release(entry)
+
+        self._entries.clear()
+
+    def get_documents(self) -> dict[str, QtGui.QTextDocument]:
+        return {path: entry.document for path, entry in self._entries.items()}
+
+    def get(self, path: str) -> DocumentEntry | None:
+        path = os.path.normpath(path)
+        entry = self._entries.get(path)
+
+        if not entry:
+            return
+
+        # Changed on disk by something other than this editor, unsaved edits win.
+        try:
+            stat = os.stat(path)
+            changed = (entry.mtime, entry.size) != (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            changed = True
+
+        if changed and not entry.document.isModified():
+            self._release(self._entries.pop(path))
+
+            return
+
+        self._entries.move_to_end(path)
+
+        return entry
+
+    def put(self, path: str, document: QtGui.QTextDocument) -> DocumentEntry | None:
+        path = os.path.normpath(path)
+        previous_entry = self._entries.pop(path, None)
+
+        if previous_entry and previous_entry.document is not document:
+            self._release(previous_entry)
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return
+
+        entry = DocumentEntry(document, stat.st_mtime_ns, stat.st_size)
+        self._entries[path] = entry
+        self._evict()
+
+        return entry
+
+    def mark_saved(self, path: str) -> None:
+        entry = self._entries.get(os.path.normpath(path))
+
+        if not entry:
+            return
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return
+
+        entry.mtime = stat.st_mtime_ns
+        entry.size = stat.st_size
+
+    def set_current_document(self, document: QtGui.QTextDocument) -> None:
+        previous_document = self.current_document
+        self.current_document = document
+
+        # Documents that never made it into the pool, as a cancelled stream, or
+        # dropped while in the editor go once the editor lets go of them.
+        if (
+            previous_document is not None
+            and previous_document is not document
+            and not self.contains_document(previous_document)
+        ):
+            previous_document.deleteLater()
@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+from PySide2 import QtCore
+
+from pathlib import Path
+import logging
+import os
+
+import vex_manager.core as core
+
+
+logger = logging.getLogger(f"vex_manager.{__name__}")
+
+
+class FileExplorerModel(QtCore.QAbstractItemModel):
+    FETCH_BATCH_SIZE = 500
+
+    file_renamed = QtCore.Signal(str)
+
+    def __init__(self, parent: QtCore.QObject | None = None) -> None:
+        super().__init__(parent)
+
+        self._paths: list[str] = []
+        self._names: list[str] = []
+        self._rows_by_path: dict[str, int] = {}
+
+        self._fetched_count = 0
+
+    def _rebuild_rows_by_path(self) -> None:
+        self._rows_by_path = {path: row for row, path in enumerate(self._paths)}
+
+    def _remove_rows(self, first_row: int, last_row: int) -> None:
+        visible_last_row = min(last_row, self._fetched_count - 1)
+
+        if first_row <= visible_last_row:
+            self.beginRemoveRows(QtCore.QModelIndex(), first_row, visible_last_row)
+
+        del self._paths[first_row : last_row + 1]
+        del self._names[first_row : last_row + 1]
+
+        if first_row <= visible_last_row:
+            self._fetched_count -= visible_last_row - first_row + 1
+            self.endRemoveRows()
+
+    def add_paths(self, paths: list[str]) -> None:
+        paths = [path for path in paths if path not in self._rows_by_path]
+
+        if not paths:
+            return
+
+        first_row = len(self._paths)
+        last_row = first_row + len(paths) - 1
+        all_fetched = self._fetched_count == first_row
+
+        if all_fetched:
+            self.beginInsertRows(QtCore.QModelIndex(), first_row, last_row)
+
+        for row, path in enumerate(paths, first_row):
+            self._paths.append(path)
+            self._names.append(Path(path).stem)
+            self._rows_by_path[path] = row
+
+        if all_fetched:
+            self._fetched_count = len(self._paths)
+            self.endInsertRows()
+
+    def apply_change_set(self, change_set: core.ChangeSet) -> None:
+        added_paths = list(change_set.added)
+
+        self.remove_paths(change_set.removed)
+
+        for path, new_path in change_set.renamed:
+            if path in self._rows_by_path:
+                self.set_path(path, new_path)
+            else:
+                added_paths.append(new_path)
+
+        self.add_paths(added_paths)
+
+    def fetch_all(self) -> None:
+        if self._fetched_count < len(self._paths):
+            self.beginInsertRows(
+                QtCore.QModelIndex(), self._fetched_count, len(self._paths) - 1
+            )
+            self._fetched_count = len(self._paths)
+            self.endInsertRows()
+
+    def fetch_path(self, path: str) -> QtCore.QModelIndex:
+        row = self._rows_by_path.get(path, -1)
+
+        if row < 0:
+            return QtCore.QModelIndex()
+        elif row >= self._fetched_count:
+            self.beginInsertRows(QtCore.QModelIndex(), self._fetched_count, row)
+            self._fetched_count = row + 1
+            self.endInsertRows()
+
+        return self.index(row, 0)
+
+    def get_name_at(self, row: int) -> str:
+        return self._names[row]
+
+    def get_path(self, index: QtCore.QModelIndex) -> str:
+        if not index.isValid():
+            return ""
+
+        return self._paths[index.row()]
+
+    def get_path_at(self, row: int) -> str:
+        return self._paths[row]
+
+    def remove_paths(self, paths: list[str]) -> None:
+        rows = sorted(
+            {self._rows_by_path[path] for path in paths if path in self._rows_by_path},
+            reverse=True,
+        )
+
+        if not rows:
+            return
+
+        last_row = rows[0]
+        first_row = last_row
+
+        for row in rows[1:]:
+            if row == first_row - 1:
+                first_row = row
+            else:
+                self._remove_rows(first_row, last_row)
+                first_row = last_row = row
+
+        self._remove_rows(first_row, last_row)
+        self._rebuild_rows_by_path()
+
+    def rename_path(self, path: str, new_name: str) -> str:
+        new_path, _ = core.rename_vex_file(file_path=path, new_name=new_name)
+
+        self.set_path(path, new_path)
+        self.file_renamed.emit(new_path)
+
+        return new_path
+
+    def set_path(self, path: str, new_path: str) -> None:
+        row = self._rows_by_path.pop(path, -1)
+
+        if row < 0:
+            return
+
+        self._paths[row] = new_path
+        self._names[row] = Path(new_path).stem
+        self._rows_by_path[new_path] = row
+
+        if row < self._fetched_count:
+            index = self.index(row, 0)
+            self.dataChanged.emit(index, index)
+
+    def set_paths(self, paths: list[str]) -> None:
+        self.beginResetModel()
+
+        self._paths = [os.path.normpath(path) for path in paths]
+        self._names = [Path(path).stem for path in self._paths]
+        self._rebuild_rows_by_path()
+
+        self._fetched_count = min(len(self._paths), FileExplorerModel.FETCH_BATCH_SIZE)
+
+        self.endResetModel()
+
+    def canFetchMore(self, parent: QtCore.QModelIndex) -> bool:
+        if parent.isValid():
+            return False
+
+        return self._fetched_count < len(self._paths)
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 1
+
+    def data(
+        self, index: QtCore.QModelIndex, role: int = QtCore.Qt.DisplayRole
+    ) -> str | None:
+        if not index.isValid():
+            return
+        elif role == QtCore.Qt.DisplayRole or role == QtCore.Qt.EditRole:
+            return self._names[index.row()]
+        elif role == QtCore.Qt.UserRole:
+            return self._paths[index.row()]
+
+        return
+
+    def fetchMore(self, parent: QtCore.QModelIndex) -> None:
+        if parent.isValid():
+            return
+
+        remainder = len(self._paths) - self._fetched_count
+        items_to_fetch = min(remainder, FileExplorerModel.FETCH_BATCH_SIZE)
+
+        if items_to_fetch <= 0:
+            return
+
+        self.beginInsertRows(
+            QtCore.QModelIndex(),
+            self._fetched_count,
+            self._fetched_count + items_to_fetch - 1,
+        )
+        self._fetched_count += items_to_fetch
+        self.endInsertRows()
+
+    def flags(self, index: QtCore.QModelIndex) -> QtCore.Qt.ItemFlags:
+        if not index.isValid():
+            return QtCore.Qt.NoItemFlags
+
+        return (
+            QtCore.Qt.ItemIsEditable
+            | QtCore.Qt.ItemIsEnabled
+            | QtCore.Qt.ItemIsSelectable
+            | QtCore.Qt.ItemNeverHasChildren
+        )
+
+    def index(
+        self,
+        row: int,
+        column: int,
+        parent: QtCore.QModelIndex = QtCore.QModelIndex(),
+    ) -> QtCore.QModelIndex:
+        if parent.isValid() or column != 0 or not 0 <= row < self._fetched_count:
+            return QtCore.QModelIndex()
+
+        return self.createIndex(row, column)
+
+    def parent(self, index: QtCore.QModelIndex) -> QtCore.QModelIndex:
+        return QtCore.QModelIndex()
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+
+        return self._fetched_count
+
+    def setData(
+        self, index: QtCore.QModelIndex, value: str, role: int = QtCore.Qt.EditRole
+    ) -> bool:
+        if not index.isValid() or role != QtCore.Qt.EditRole or not value:
+            return False
+
+        self.rename_path(self._paths[index.row()], value)
+
+        return True
+
+
+class FileExplorerProxyModel(QtCore.QSortFilterProxyModel):
+    def __init__(self, parent: QtCore.QObject | None = None) -> None:
+        super().__init__(parent)
+
+        self.filter_text = ""
+        self.content_matches: set[str] = set()
+
+        self.setDynamicSortFilter(True)
+        self.setSortCaseSensitivity(QtCore.Qt.CaseInsensitive)
+        self.sort(0, QtCore.Qt.AscendingOrder)
+
+    def set_filter_text(
+        self, text: str, content_matches: set[str] | None = None
+    ) -> None:
+        source_model = self.sourceModel()
+
+        if text and source_model:
+            source_model.fetch_all()
+
+        self.filter_text = text.lower()
+        self.content_matches = content_matches or set()
+
+        self.invalidateFilter()
+
+    def filterAcceptsRow(
+        self, source_row: int, source_parent: QtCore.QModelIndex
+    ) -> bool:
+        if not self.filter_text:
+            return True
+
+        source_model = self.sourceModel()
+
+        if self.filter_text in source_model.get_name_at(source_row).lower():
+            return True
+
+        return source_model.get_path_at(source_row) in self.content_matches
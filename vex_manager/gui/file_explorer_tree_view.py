@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from PySide2 import QtWidgets
+from PySide2 import QtGui
+from PySide2 import QtCore
+
+import logging
+import os
+
+from vex_manager.gui.file_explorer_model import FileExplorerProxyModel
+from vex_manager.gui.file_explorer_model import FileExplorerModel
+import vex_manager.core as core
+
+
+logger = logging.getLogger(f"vex_manager.{__name__}")
+
+
+class FileExplorerTreeView(QtWidgets.QTreeView):
+    current_path_changed = QtCore.Signal(str)
+    del_key_pressed = QtCore.Signal()
+    item_renamed = QtCore.Signal(str)
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self.file_explorer_model = FileExplorerModel(self)
+        self.file_explorer_proxy_model = FileExplorerProxyModel(self)
+        self.file_explorer_proxy_model.setSourceModel(self.file_explorer_model)
+        self.file_explorer_proxy_model.sort(0, QtCore.Qt.AscendingOrder)
+
+        self.setHeaderHidden(True)
+        self.setModel(self.file_explorer_proxy_model)
+        self.setRootIsDecorated(False)
+        self.setUniformRowHeights(True)
+
+        self._create_connections()
+
+    def _create_connections(self) -> None:
+        self.file_explorer_model.file_renamed.connect(self.item_renamed)
+        self.selectionModel().currentChanged.connect(
+            self._current_changed_selection_model
+        )
+
+    def _current_changed_selection_model(self, current: QtCore.QModelIndex) -> None:
+        self.current_path_changed.emit(self.get_path(current))
+
+    def apply_change_set(self, change_set: core.ChangeSet) -> None:
+        self.file_explorer_model.apply_change_set(change_set)
+
+    def find_index_by_path(self, path: str) -> QtCore.QModelIndex:
+        if not path:
+            return QtCore.QModelIndex()
+
+        source_index = self.file_explorer_model.fetch_path(os.path.normpath(path))
+
+        return self.file_explorer_proxy_model.mapFromSource(source_index)
+
+    def get_current_path(self) -> str:
+        return self.get_path(self.currentIndex())
+
+    def get_neighbor_paths(self, count: int = 1) -> list[str]:
+        current_index = self.currentIndex()
+
+        if not current_index.isValid():
+            return []
+
+        neighbor_paths = []
+        current_row = current_index.row()
+
+        for offset in range(1, count + 1):
+            for row in (current_row + offset, current_row - offset):
+                index = self.file_explorer_proxy_model.index(row, 0)
+
+                if index.isValid():
+                    neighbor_paths.append(self.get_path(index))
+
+        return neighbor_paths
+
+    def get_path(self, index: QtCore.QModelIndex) -> str:
+        source_index = self.file_explorer_proxy_model.mapToSource(index)
+
+        return self.file_explorer_model.get_path(source_index)
+
+    def remove_paths(self, paths: list[str]) -> None:
+        self.file_explorer_model.remove_paths(paths)
+
+    def rename_current_item(self, new_name: str = "") -> None:
+        current_path = self.get_current_path()
+
+        if current_path:
+            if not new_name:
+                new_name = self.currentIndex().data()
+
+            self.file_explorer_model.rename_path(current_path, new_name)
+
+    def set_current_path(self, path: str) -> bool:
+        index = self.find_index_by_path(path)
+
+        if index.isValid():
+            self.setCurrentIndex(index)
+            self.scrollTo(index)
+
+            return True
+
+        return False
+
+    def set_filter_text(
+        self, text: str, content_matches: set[str] | None = None
+    ) -> None:
+        self.file_explorer_proxy_model.set_filter_text(text, content_matches)
+
+    def set_paths(self, paths: list[str]) -> None:
+        self.file_explorer_model.set_paths(paths)
+
+    def keyPressEvent(self, event: QtGui.QKeyEvent) -> None:
+        if event.key() == QtCore.Qt.Key_Delete:
+            self.del_key_pressed.emit()
+        else:
+            super().keyPressEvent(event)
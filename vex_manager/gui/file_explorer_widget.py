@@ -1,16 +1,13 @@
 from PySide2 import QtWidgets
 from PySide2 import QtCore
-import shiboken2
 
 import hou
 
-from pathlib import Path
 import logging
-import json
 import os
 
-from vex_manager.gui.file_explorer_tree_widget import FileExplorerTreeWidget
-import vex_manager.utils as utils
+from vex_manager.gui.file_explorer_tree_view import FileExplorerTreeView
+from vex_manager.gui.workers import Worker
 import vex_manager.core as core
 
 
@@ -18,21 +15,37 @@ logger = logging.getLogger(f"vex_manager.{__name__}")
 
 
 class FileExplorerWidget(QtWidgets.QWidget):
-    PREFERENCES_PATH = utils.get_preferences_path()
-
     current_item_changed = QtCore.Signal(str)
     current_item_renamed = QtCore.Signal(str)
+    library_changed = QtCore.Signal(object)
 
     def __init__(self) -> None:
         super().__init__()
 
         self.library_path = ""
-        self.warn_before_deleting_a_file = True
+
+        self.preferences = core.get_preferences()
+        self.warn_before_deleting_a_file = self.preferences.get(
+            "warn_before_deleting_a_file"
+        )
 
         self.current_item_path = ""
 
         self.file_system_watcher = QtCore.QFileSystemWatcher()
-        self.number_of_files = -1
+        self.library_snapshot = {}
+        self.own_write_directory_mtime = -1
+
+        self.library_update_timer = QtCore.QTimer()
+        self.library_update_timer.setInterval(200)
+        self.library_update_timer.setSingleShot(True)
+
+        self.content_index = None
+        self.content_index_thread_pool = QtCore.QThreadPool()
+        self.content_index_thread_pool.setMaxThreadCount(1)
+
+        self.content_index_save_timer = QtCore.QTimer()
+        self.content_index_save_timer.setInterval(2000)
+        self.content_index_save_timer.setSingleShot(True)
 
         self._create_widgets()
         self._create_layouts()
@@ -42,7 +55,7 @@ class FileExplorerWidget(QtWidgets.QWidget):
         self.search_line_edit = QtWidgets.QLineEdit()
         self.search_line_edit.setPlaceholderText("Search...")
 
-        self.file_explorer_tree_widget = FileExplorerTreeWidget()
+        self.file_explorer_tree_view = FileExplorerTreeView()
 
         self.new_push_button = QtWidgets.QPushButton("New")
 
@@ -51,7 +64,7 @@ class FileExplorerWidget(QtWidgets.QWidget):
     def _create_layouts(self) -> None:
         main_layout = QtWidgets.QVBoxLayout(self)
         main_layout.addWidget(self.search_line_edit)
-        main_layout.addWidget(self.file_explorer_tree_widget)
+        main_layout.addWidget(self.file_explorer_tree_view)
         main_layout.setContentsMargins(QtCore.QMargins())
         main_layout.setSpacing(3)
 
@@ -64,123 +77,138 @@ class FileExplorerWidget(QtWidgets.QWidget):
         self.file_system_watcher.directoryChanged.connect(
             self._directory_changed_file_system_watcher
         )
+        self.library_update_timer.timeout.connect(self._update_tree_view_items)
+        self.content_index_save_timer.timeout.connect(self._save_content_index)
 
         self.search_line_edit.textChanged.connect(self._search_text_changed_line_edit)
-        self.file_explorer_tree_widget.del_key_pressed.connect(
-            self._file_explorer_del_key_pressed_tree_widget
+        self.file_explorer_tree_view.del_key_pressed.connect(
+            self._file_explorer_del_key_pressed_tree_view
         )
-        self.file_explorer_tree_widget.currentItemChanged.connect(
-            self._file_explorer_current_item_changed_tree_widget
+        self.file_explorer_tree_view.current_path_changed.connect(
+            self._file_explorer_current_path_changed_tree_view
         )
-        self.file_explorer_tree_widget.item_renamed.connect(
-            self._file_explorer_item_renamed_tree_widget
+        self.file_explorer_tree_view.item_renamed.connect(
+            self._file_explorer_item_renamed_tree_view
         )
         self.new_push_button.clicked.connect(self._new_clicked_push_button)
         self.delete_push_button.clicked.connect(self._delete_clicked_push_button)
 
-    def _load_preferences(self) -> None:
-        settings = {}
+        self.preferences.subscribe(self._preferences_changed)
 
-        if os.path.exists(FileExplorerWidget.PREFERENCES_PATH):
-            with open(FileExplorerWidget.PREFERENCES_PATH, "r") as file_for_read:
-                settings = json.load(file_for_read)
+    def _preferences_changed(self, change: core.PreferencesChange) -> None:
+        if "warn_before_deleting_a_file" in change:
+            self.warn_before_deleting_a_file = change["warn_before_deleting_a_file"]
 
-        self.warn_before_deleting_a_file = settings.get(
-            "warn_before_deleting_a_file", True
+    def _directory_changed_file_system_watcher(self) -> None:
+        self.library_update_timer.start()
+
+    def _search_text_changed_line_edit(self, text: str) -> None:
+        content_matches = (
+            self.content_index.search(text) if self.content_index else None
         )
 
-    def _directory_changed_file_system_watcher(self) -> None:
-        vex_files = core.get_vex_files(self.library_path)
+        self.file_explorer_tree_view.set_filter_text(text, content_matches)
 
-        if self.number_of_files != len(vex_files):
-            self._create_tree_widget_items()
-            self.select_current_item()
-        else:
-            item_paths = []
-            item_path_renamed = ""
-            file_path_renamed = ""
+    def _content_index_finished_worker(self) -> None:
+        if self.search_line_edit.text():
+            self._search_text_changed_line_edit(self.search_line_edit.text())
 
-            items = self.file_explorer_tree_widget.get_top_level_items()
+    def _file_explorer_del_key_pressed_tree_view(self) -> None:
+        self._delete_selected_item()
 
-            for item in items:
-                data = item.data(0, QtCore.Qt.UserRole)
-                item_paths.append(data)
+    def _file_explorer_current_path_changed_tree_view(self, file_path: str) -> None:
+        self.current_item_changed.emit(file_path)
 
-            for item_path in item_paths:
-                if item_path not in vex_files:
-                    item_path_renamed = item_path
+    def _file_explorer_item_renamed_tree_view(self, file_path: str) -> None:
+        self.current_item_renamed.emit(file_path)
 
-            for file_path in vex_files:
-                if file_path not in item_paths:
-                    file_path_renamed = file_path
+    def _new_clicked_push_button(self) -> None:
+        self.current_item_path, base_name = core.create_new_vex_file(self.library_path)
 
-            item = self.file_explorer_tree_widget.find_item_by_path(item_path_renamed)
+        self._update_tree_view_items()
+        self.select_current_item()
 
-            if item:
-                base_name = Path(file_path_renamed).stem
+    def _delete_clicked_push_button(self) -> None:
+        self._delete_selected_item()
 
-                item.setText(0, base_name)
-                item.setData(0, QtCore.Qt.UserRole, file_path_renamed)
+    def _create_tree_view_items(self) -> None:
+        self.library_snapshot = {}
 
-                self.current_item_renamed.emit(file_path_renamed)
+        if self.library_path:
+            library_index = core.get_library_index(self.library_path)
+            self.library_snapshot = library_index.get_snapshot()
 
-        logger.debug("File system watcher updated files.")
+        self.file_explorer_tree_view.set_paths(sorted(self.library_snapshot))
+        self._build_content_index()
 
-    def _search_text_changed_line_edit(self, text: str) -> None:
-        text = text.lower()
-        items = self.file_explorer_tree_widget.get_top_level_items()
+    def _build_content_index(self) -> None:
+        self._save_content_index()
 
-        for item in items:
-            item_text = item.text(0)
-            item.setHidden(text not in item_text.lower())
+        if not self.library_path:
+            self.content_index = None
 
-    def _file_explorer_del_key_pressed_tree_widget(self) -> None:
-        self._delete_selected_item()
+            return
 
-    def _file_explorer_current_item_changed_tree_widget(
-        self, item: QtWidgets.QTreeWidgetItem
-    ) -> None:
+        content_index = core.get_content_index(self.library_path)
+        self.content_index = content_index
 
-        data = item.data(0, QtCore.Qt.UserRole) if item else ""
+        worker = Worker(
+            content_index.build,
+            list(self.library_snapshot.values()),
+            is_cancelled=lambda: self.content_index is not content_index,
+        )
+        worker.signals.finished.connect(self._content_index_finished_worker)
+        self.content_index_thread_pool.start(worker)
 
-        self.current_item_changed.emit(data)
+    def _save_content_index(self) -> None:
+        if self.content_index:
+            worker = Worker(self.content_index.save_cache)
+            self.content_index_thread_pool.start(worker)
 
-    def _file_explorer_item_renamed_tree_widget(self, file_path: str) -> None:
-        self.current_item_renamed.emit(file_path)
+    def _update_tree_view_items(self) -> None:
+        if not self.library_path:
+            return
 
-    def _new_clicked_push_button(self) -> None:
-        self.current_item_path, base_name = core.create_new_vex_file(self.library_path)
+        library_index = core.get_library_index(self.library_path)
+        library_snapshot = library_index.get_snapshot(force=self._is_external_change())
+        change_set = core.diff_snapshots(self.library_snapshot, library_snapshot)
+        self.library_snapshot = library_snapshot
 
-        self._set_file_system_watcher()
-        self.select_current_item()
+        if not change_set:
+            return
 
-    def _delete_clicked_push_button(self) -> None:
-        self._delete_selected_item()
+        current_item_path = self.file_explorer_tree_view.get_current_path()
 
-    def _create_tree_widget_items(self) -> None:
-        self.file_explorer_tree_widget.clear()
+        self.file_explorer_tree_view.apply_change_set(change_set)
+        self.library_changed.emit(change_set)
 
-        if self.library_path:
-            vex_files = core.get_vex_files(self.library_path)
-            self.number_of_files = len(vex_files)
-
-            for file_path in vex_files:
-                item = QtWidgets.QTreeWidgetItem()
-                item.setData(0, QtCore.Qt.UserRole, file_path)
-                item.setFlags(
-                    QtCore.Qt.ItemIsEditable
-                    | QtCore.Qt.ItemIsEnabled
-                    | QtCore.Qt.ItemIsSelectable
-                )
-                item.setText(0, Path(file_path).stem)
-                self.file_explorer_tree_widget.addTopLevelItem(item)
+        if self.content_index:
+            worker = Worker(self.content_index.update, change_set)
+            worker.signals.finished.connect(self._content_index_finished_worker)
+            self.content_index_thread_pool.start(worker)
+            self.content_index_save_timer.start()
 
-    def _delete_selected_item(self) -> None:
-        item = self.file_explorer_tree_widget.currentItem()
+        for file_path, new_file_path in change_set.renamed:
+            if file_path == current_item_path:
+                self.current_item_renamed.emit(new_file_path)
+
+        logger.debug("File system watcher updated files.")
+
+    def _is_external_change(self) -> bool:
+        own_write_directory_mtime = self.own_write_directory_mtime
+        self.own_write_directory_mtime = -1
+
+        try:
+            directory_mtime = os.stat(self.library_path).st_mtime_ns
+        except OSError:
+            return True
 
-        if item:
-            self._load_preferences()
+        return directory_mtime != own_write_directory_mtime
 
+    def _delete_selected_item(self) -> None:
+        file_path = self.file_explorer_tree_view.get_current_path()
+
+        if file_path:
             result = 0  # result = 0 means that the user selected "Yes"
 
             if self.warn_before_deleting_a_file:
@@ -194,8 +222,7 @@ class FileExplorerWidget(QtWidgets.QWidget):
                 )
 
             if not result:
-                file_path = item.data(0, QtCore.Qt.UserRole)
-                shiboken2.delete(item)
+                self.file_explorer_tree_view.remove_paths([file_path])
                 core.delete_file(file_path)
         else:
             logger.debug("No VEX file selected to delete.")
@@ -220,17 +247,45 @@ class FileExplorerWidget(QtWidgets.QWidget):
     def get_library_path(self) -> str:
         return self.library_path
 
+    def get_neighbor_paths(self, count: int = 1) -> list[str]:
+        return self.file_explorer_tree_view.get_neighbor_paths(count)
+
     def select_current_item(self) -> None:
-        item = self.file_explorer_tree_widget.find_item_by_path(self.current_item_path)
+        if self.file_explorer_tree_view.set_current_path(self.current_item_path):
+            logger.debug(f"{self.current_item_path!r} item selected.")
+
+    def register_saved_file(self, file_path: str) -> None:
+        file_path = os.path.normpath(file_path)
+
+        if not self.library_path or file_path not in self.library_snapshot:
+            return
+
+        # Our own save updates the index and the snapshot, so the watcher event it
+        # triggers finds nothing to rescan or apply.
+        library_index = core.get_library_index(self.library_path)
+        library_index.add_file(file_path)
+        record = library_index.get_record(file_path)
+
+        if not record:
+            return
+
+        self.library_snapshot[file_path] = record
 
-        if item:
-            self.file_explorer_tree_widget.setCurrentItem(item)
+        try:
+            self.own_write_directory_mtime = os.stat(self.library_path).st_mtime_ns
+        except OSError:
+            self.own_write_directory_mtime = -1
 
-            logger.debug(f"{item.text(0)!r} item selected.")
+        if self.content_index:
+            worker = Worker(
+                self.content_index.update, core.ChangeSet(modified=[file_path])
+            )
+            worker.signals.finished.connect(self._content_index_finished_worker)
+            self.content_index_thread_pool.start(worker)
+            self.content_index_save_timer.start()
 
     def rename_current_item(self, new_name: str) -> None:
-        current_item = self.file_explorer_tree_widget.currentItem()
-        self.file_explorer_tree_widget.rename_item(item=current_item, new_name=new_name)
+        self.file_explorer_tree_view.rename_current_item(new_name)
 
     def set_current_path(self, file_path: str) -> None:
         self.current_item_path = file_path
@@ -239,4 +294,4 @@ class FileExplorerWidget(QtWidgets.QWidget):
         self.library_path = library_path
 
         self._set_file_system_watcher()
-        self._create_tree_widget_items()
+        self._create_tree_view_items()
@@ -5,11 +5,10 @@ from PySide2 import QtCore
 import hou
 
 import logging
-import json
 import os
 
 from vex_manager.config import ColorScheme
-import vex_manager.utils as utils
+import vex_manager.core as core
 
 logger = logging.getLogger(f"vex_manager.{__name__}")
 
@@ -23,8 +22,6 @@ class PreferencesUI(QtWidgets.QWidget):
     TABS_AND_SPACING = "Tabs and Spacing"
     FONTS_AND_COLORS = "Fonts and Colors"
 
-    PREFERENCES_PATH = utils.get_preferences_path()
-
     on_save_clicked = QtCore.Signal()
 
     def __init__(self, parent: QtWidgets.QWidget, f: QtCore.Qt.WindowFlags) -> None:
@@ -32,6 +29,8 @@ class PreferencesUI(QtWidgets.QWidget):
 
         self.color_scheme = {}
 
+        self.preferences = core.get_preferences()
+
         self.resize(400, 600)
         self.setObjectName(PreferencesUI.WINDOW_NAME)
         self.setWindowTitle(PreferencesUI.WINDOW_TITLE)
@@ -66,6 +65,8 @@ class PreferencesUI(QtWidgets.QWidget):
             "Warn Before Deleting a File"
         )
 
+        self.fsync_on_save_check_box = QtWidgets.QCheckBox("Flush Saves to Disk")
+
         self.backspace_on_tab_stop_check_box = QtWidgets.QCheckBox(
             "Backspace on Tab Stop"
         )
@@ -157,6 +158,15 @@ class PreferencesUI(QtWidgets.QWidget):
         warning_dialogs_v_box_layout.setSpacing(6)
         warning_dialogs_group_box.setLayout(warning_dialogs_v_box_layout)
 
+        saving_group_box = QtWidgets.QGroupBox("Saving")
+        general_v_box_layout.addWidget(saving_group_box)
+
+        saving_v_box_layout = QtWidgets.QVBoxLayout()
+        saving_v_box_layout.addWidget(self.fsync_on_save_check_box)
+        saving_v_box_layout.setContentsMargins(6, 6, 6, 6)
+        saving_v_box_layout.setSpacing(6)
+        saving_group_box.setLayout(saving_v_box_layout)
+
         self.code_editor_widget = QtWidgets.QWidget()
         self.code_editor_widget.setVisible(False)
         main_layout.addWidget(self.code_editor_widget)
@@ -281,44 +291,36 @@ class PreferencesUI(QtWidgets.QWidget):
         self.cancel_push_button.clicked.connect(self.close)
 
     def _load_preferences(self) -> None:
-        settings = {}
+        settings = self.preferences.get_all()
 
-        if os.path.exists(PreferencesUI.PREFERENCES_PATH):
-            with open(PreferencesUI.PREFERENCES_PATH, "r") as file_for_read:
-                settings = json.load(file_for_read)
-
-        self.library_path_line_edit.setText(settings.get("library_path", ""))
+        self.library_path_line_edit.setText(settings["library_path"])
         self.warn_before_deleting_a_file_check_box.setChecked(
-            settings.get("warn_before_deleting_a_file", True)
+            settings["warn_before_deleting_a_file"]
         )
+        self.fsync_on_save_check_box.setChecked(settings["fsync_on_save"])
 
         self.backspace_on_tab_stop_check_box.setChecked(
-            settings.get("backspace_on_tab_stop", True)
+            settings["backspace_on_tab_stop"]
         )
         self.insert_closing_brackets_check_box.setChecked(
-            settings.get("insert_closing_brackets", True)
+            settings["insert_closing_brackets"]
         )
         self.insert_closing_quotes_check_box.setChecked(
-            settings.get("insert_closing_quotes", True)
+            settings["insert_closing_quotes"]
         )
 
-        self.font_combo_box.setCurrentText(settings.get("font", "Source Sans Pro"))
-        self.font_size_spin_box.setValue(settings.get("font_size", 8))
-        self.color_scheme = settings.get("color_scheme", {})
-
-        if not self.color_scheme:
-            for color_scheme in ColorScheme:
-                color_scheme = color_scheme.value
+        self.font_combo_box.setCurrentText(settings["font"])
+        self.font_size_spin_box.setValue(settings["font_size"])
+        self.color_scheme = settings["color_scheme"]
 
-                self.color_scheme[color_scheme["name"]] = color_scheme["color"]
-
-        self.tab_size_spin_box.setValue(settings.get("tab_size", 4))
-        self.auto_indent_check_box.setChecked(settings.get("auto_indent", True))
+        self.tab_size_spin_box.setValue(settings["tab_size"])
+        self.auto_indent_check_box.setChecked(settings["auto_indent"])
 
     def _save_preferences(self) -> None:
         settings = {
             "library_path": self.library_path_line_edit.text(),
             "warn_before_deleting_a_file": self.warn_before_deleting_a_file_check_box.isChecked(),
+            "fsync_on_save": self.fsync_on_save_check_box.isChecked(),
             "backspace_on_tab_stop": self.backspace_on_tab_stop_check_box.isChecked(),
             "insert_closing_brackets": self.insert_closing_brackets_check_box.isChecked(),
             "insert_closing_quotes": self.insert_closing_quotes_check_box.isChecked(),
@@ -329,11 +331,7 @@ class PreferencesUI(QtWidgets.QWidget):
             "auto_indent": self.auto_indent_check_box.isChecked(),
         }
 
-        if PreferencesUI.PREFERENCES_PATH:
-            with open(PreferencesUI.PREFERENCES_PATH, "w") as file_for_write:
-                json.dump(settings, file_for_write, indent=4)
-        else:
-            logger.error(f"No preferences path.")
+        self.preferences.update(settings)
 
     def _preferences_categories_current_text_changed_combo_box(self) -> None:
         self.revert_to_default.setVisible(False)
@@ -407,7 +405,6 @@ class PreferencesUI(QtWidgets.QWidget):
     def _color_scheme_item_clicked_list_widget(
         self, item: QtWidgets.QListWidgetItem
     ) -> None:
-
         if item:
             color = QtWidgets.QColorDialog.getColor()
 
@@ -0,0 +1,137 @@
+from PySide2 import QtWidgets
+from PySide2 import QtCore
+
+import hou
+
+from pathlib import Path
+import logging
+
+import vex_manager.core as core
+
+
+logger = logging.getLogger(f"vex_manager.{__name__}")
+
+
+class SceneHarvestUI(QtWidgets.QWidget):
+    WINDOW_NAME = "vexManagerSceneHarvest"
+    WINDOW_TITLE = "Scene Harvest"
+
+    USED = "Used Library Snippets"
+    UNSAVED = "Unsaved Snippets"
+    DRIFTED = "Drifted Snippets"
+
+    def __init__(self, parent: QtWidgets.QWidget, f: QtCore.Qt.WindowFlags) -> None:
+        super().__init__(parent, f)
+
+        self.library_path = ""
+
+        self.resize(500, 600)
+        self.setObjectName(SceneHarvestUI.WINDOW_NAME)
+        self.setWindowTitle(SceneHarvestUI.WINDOW_TITLE)
+        self.setWindowFlags(self.windowFlags() ^ QtCore.Qt.WindowContextHelpButtonHint)
+
+        self._create_widgets()
+        self._create_layouts()
+        self._create_connections()
+
+    def _create_widgets(self) -> None:
+        self.root_path_line_edit = QtWidgets.QLineEdit("/")
+
+        self.harvest_tree_widget = QtWidgets.QTreeWidget()
+        self.harvest_tree_widget.setHeaderLabels(["Snippet", "Node"])
+        self.harvest_tree_widget.setUniformRowHeights(True)
+
+        self.summary_label = QtWidgets.QLabel()
+
+        self.scan_push_button = QtWidgets.QPushButton("Scan")
+
+        self.close_push_button = QtWidgets.QPushButton("Close")
+
+    def _create_layouts(self) -> None:
+        main_layout = QtWidgets.QVBoxLayout(self)
+        main_layout.setContentsMargins(6, 6, 6, 6)
+        main_layout.setSpacing(6)
+
+        root_path_form_layout = QtWidgets.QFormLayout()
+        root_path_form_layout.addRow("Root Path ", self.root_path_line_edit)
+        main_layout.addLayout(root_path_form_layout)
+
+        main_layout.addWidget(self.harvest_tree_widget)
+        main_layout.addWidget(self.summary_label)
+
+        buttons_h_box_layout = QtWidgets.QHBoxLayout()
+        buttons_h_box_layout.addWidget(self.scan_push_button)
+        buttons_h_box_layout.addStretch()
+        buttons_h_box_layout.addWidget(self.close_push_button)
+        main_layout.addLayout(buttons_h_box_layout)
+
+    def _create_connections(self) -> None:
+        self.harvest_tree_widget.itemDoubleClicked.connect(
+            self._harvest_item_double_clicked_tree_widget
+        )
+
+        self.scan_push_button.clicked.connect(self._scan_clicked_push_button)
+        self.close_push_button.clicked.connect(self.close)
+
+    def _harvest_item_double_clicked_tree_widget(
+        self, item: QtWidgets.QTreeWidgetItem
+    ) -> None:
+        node_path = item.data(0, QtCore.Qt.UserRole)
+        node = hou.node(node_path) if node_path else None
+
+        if node is not None:
+            node.setSelected(True, clear_all_selected=True)
+
+    def _scan_clicked_push_button(self) -> None:
+        self.harvest()
+
+    def _add_node_item(
+        self, parent_item: QtWidgets.QTreeWidgetItem, name: str, node_path: str
+    ) -> None:
+        item = QtWidgets.QTreeWidgetItem(parent_item, [name, node_path])
+        item.setData(0, QtCore.Qt.UserRole, node_path)
+
+    def _set_report(self, report: core.HarvestReport) -> None:
+        self.harvest_tree_widget.clear()
+
+        used_item = QtWidgets.QTreeWidgetItem([SceneHarvestUI.USED])
+        unsaved_item = QtWidgets.QTreeWidgetItem([SceneHarvestUI.UNSAVED])
+        drifted_item = QtWidgets.QTreeWidgetItem([SceneHarvestUI.DRIFTED])
+
+        for file_path, node_paths in sorted(report.used.items()):
+            file_item = QtWidgets.QTreeWidgetItem(
+                used_item, [Path(file_path).stem, f"{len(node_paths)} nodes"]
+            )
+
+            for node_path in node_paths:
+                self._add_node_item(file_item, Path(file_path).stem, node_path)
+
+        for node_path in report.unsaved:
+            self._add_node_item(unsaved_item, "", node_path)
+
+        for node_path, file_path in report.drifted.items():
+            self._add_node_item(drifted_item, Path(file_path).stem, node_path)
+
+        self.harvest_tree_widget.addTopLevelItems(
+            [used_item, unsaved_item, drifted_item]
+        )
+        self.harvest_tree_widget.resizeColumnToContents(0)
+
+        self.summary_label.setText(
+            f"{report.number_of_nodes} snippets, {len(report.used)} library files "
+            f"used, {len(report.unsaved)} unsaved, {len(report.drifted)} drifted."
+        )
+
+    def harvest(self) -> None:
+        if not self.library_path:
+            logger.error("Library path not set.")
+
+            return
+
+        report = core.harvest_scene(
+            self.library_path, root_path=self.root_path_line_edit.text() or "/"
+        )
+        self._set_report(report)
+
+    def set_library_path(self, library_path: str) -> None:
+        self.library_path = library_path
@@ -1,11 +1,19 @@
 from PySide2 import QtWidgets
 from PySide2 import QtCore
+from PySide2 import QtGui
 
+import hou
+
+from functools import partial
 from pathlib import Path
 import logging
 import os
 
 from vex_manager.gui.vex_plain_text_edit import VEXPlainTextEdit
+from vex_manager.gui.document_loader import DocumentLoader
+from vex_manager.gui.document_pool import DocumentEntry
+from vex_manager.gui.document_pool import DocumentPool
+from vex_manager.gui.workers import Worker
 import vex_manager.utils as utils
 import vex_manager.core as core
 
@@ -14,9 +22,13 @@ logger = logging.getLogger(f"vex_manager.{__name__}")
 
 
 class VEXEditorWidget(QtWidgets.QWidget):
+    file_saved = QtCore.Signal(str)
     name_editing_finished = QtCore.Signal(str)
     save_clicked = QtCore.Signal()
 
+    # Files this large are streamed into the editor instead of read whole.
+    STREAMING_FILE_SIZE = 1_000_000
+
     def __init__(self) -> None:
         super().__init__()
 
@@ -24,6 +36,42 @@ class VEXEditorWidget(QtWidgets.QWidget):
         self.base_name = ""
         self.library_path = ""
 
+        self.content_cache = core.ContentCache()
+        self.content_thread_pool = QtCore.QThreadPool()
+        self.content_thread_pool.setMaxThreadCount(2)
+
+        self.display_request = 0
+
+        # Recently displayed snippets keep their document, with its undo stack and
+        # highlighting, so switching back is a swap.
+        self.document_pool = DocumentPool()
+        self.document_entry: DocumentEntry | None = None
+
+        self.preferences = core.get_preferences()
+        self.fsync_on_save = self.preferences.get("fsync_on_save")
+
+        # Content, document and revision, the document is clean once written.
+        self.pending_saves: dict[str, tuple[str, QtGui.QTextDocument, int]] = {}
+        self.save_thread_pool = QtCore.QThreadPool()
+        self.save_thread_pool.setMaxThreadCount(1)
+
+        self.save_timer = QtCore.QTimer()
+        self.save_timer.setInterval(300)
+        self.save_timer.setSingleShot(True)
+
+        # Unsaved edits are journaled in batches on the save thread, by document
+        # revision so that untouched documents are skipped, keyed as the journal is.
+        self.recovery_journal: core.RecoveryJournal | None = None
+        self.journaled_revisions: dict[str, int] = {}
+
+        # Recovery put off until later, restored once its file is displayed so
+        # that new edits carry on from it.
+        self.postponed_files: dict[str, core.RecoveredFile] = {}
+
+        self.journal_timer = QtCore.QTimer()
+        self.journal_timer.setInterval(2000)
+        self.journal_timer.setSingleShot(True)
+
         self._create_widgets()
         self._create_layouts()
         self._create_connections()
@@ -33,16 +81,28 @@ class VEXEditorWidget(QtWidgets.QWidget):
 
         self.vex_plain_text_editor = VEXPlainTextEdit()
 
+        self.document_loader = DocumentLoader(self.vex_plain_text_editor)
+
+        self.load_progress_bar = QtWidgets.QProgressBar()
+        self.load_progress_bar.setFormat("Loading %p%")
+        self.load_progress_bar.setVisible(False)
+
         self.save_changes_push_button = QtWidgets.QPushButton("Save Changes")
 
         self.replace_code_push_button = QtWidgets.QPushButton("Replace Code")
 
         self.insert_code_push_button = QtWidgets.QPushButton("Insert Code")
 
+        self.link_to_library_check_box = QtWidgets.QCheckBox("Link to Library")
+        self.link_to_library_check_box.setToolTip(
+            "Update replaced wrangle nodes whenever this snippet is saved."
+        )
+
     def _create_layouts(self) -> None:
         main_layout = QtWidgets.QVBoxLayout(self)
         main_layout.addWidget(self.name_line_edit)
         main_layout.addWidget(self.vex_plain_text_editor)
+        main_layout.addWidget(self.load_progress_bar)
         main_layout.addWidget(self.save_changes_push_button)
         main_layout.setContentsMargins(QtCore.QMargins())
         main_layout.setSpacing(3)
@@ -50,6 +110,7 @@ class VEXEditorWidget(QtWidgets.QWidget):
         layout = QtWidgets.QHBoxLayout()
         layout.addWidget(self.replace_code_push_button)
         layout.addWidget(self.insert_code_push_button)
+        layout.addWidget(self.link_to_library_check_box)
         main_layout.addLayout(layout)
 
     def _create_connections(self) -> None:
@@ -66,16 +127,42 @@ class VEXEditorWidget(QtWidgets.QWidget):
             self._insert_code_clicked_push_button
         )
 
+        self.document_loader.progress_changed.connect(self.load_progress_bar.setValue)
+        self.document_loader.finished.connect(self._document_finished_loader)
+
+        self.vex_plain_text_editor.textChanged.connect(
+            self._text_changed_plain_text_edit
+        )
+        self.vex_plain_text_editor.modificationChanged.connect(
+            self._modification_changed_plain_text_edit
+        )
+
+        self.save_timer.timeout.connect(self.flush_saves)
+        self.journal_timer.timeout.connect(self.flush_journal)
+
+        self.preferences.subscribe(self._preferences_changed)
+
+    def _preferences_changed(self, change: core.PreferencesChange) -> None:
+        if "fsync_on_save" in change:
+            self.fsync_on_save = change["fsync_on_save"]
+
     def _name_editing_finished_line_edit(self) -> None:
         name = self.name_line_edit.text()
 
         if utils.is_valid_file_name(name):
             if os.path.exists(self.library_path):
+                self.flush_saves(wait=True)
                 self.name_editing_finished.emit(name)
         else:
             logger.error(f"Invalid file name {name!r}")
 
     def _save_changes_clicked_push_button(self) -> None:
+        # A partly loaded document would overwrite the rest of the file.
+        if self.document_loader.is_loading():
+            logger.error(f"{self.base_name!r} is still loading.")
+
+            return
+
         if self.file_path:
             self._save_file()
         else:
@@ -89,36 +176,353 @@ class VEXEditorWidget(QtWidgets.QWidget):
             )
 
             if self.file_path:
-
                 self._save_file()
+                self._pool_document()
 
                 self.save_clicked.emit()
 
     def _replace_code_clicked_push_button(self) -> None:
+        if self.document_loader.is_loading():
+            logger.error(f"{self.base_name!r} is still loading.")
+
+            return
+
         core.set_vex_code_in_selected_wrangle_node(
-            vex_code=self.vex_plain_text_editor.toPlainText()
+            vex_code=self.vex_plain_text_editor.toPlainText(),
+            library_file_path=self.file_path,
+            linked=self.link_to_library_check_box.isChecked(),
         )
 
     def _insert_code_clicked_push_button(self) -> None:
+        if self.document_loader.is_loading():
+            logger.error(f"{self.base_name!r} is still loading.")
+
+            return
+
         core.set_vex_code_in_selected_wrangle_node(
-            vex_code=self.vex_plain_text_editor.toPlainText(), insert=True
+            vex_code=self.vex_plain_text_editor.toPlainText(),
+            insert=True,
+            library_file_path=self.file_path,
+        )
+
+    def _text_changed_plain_text_edit(self) -> None:
+        if not self.journal_timer.isActive():
+            self.journal_timer.start()
+
+    def _modification_changed_plain_text_edit(self, modified: bool) -> None:
+        self.save_changes_push_button.setText(
+            "Save Changes *" if modified else "Save Changes"
         )
 
+    def _document_finished_loader(self, file_path: str, loaded: bool) -> None:
+        self.load_progress_bar.setVisible(False)
+
+        if loaded:
+            self.vex_plain_text_editor.setReadOnly(False)
+            self._pool_document(file_path)
+        else:
+            self._set_code("")
+
+    def _content_loaded_worker(self, display_request: int, content: str | None) -> None:
+        if display_request != self.display_request:
+            return
+
+        self._set_code(content or "")
+
+        if content is not None:
+            self._pool_document()
+
+    def _load_code(self, file_path: str, display_request: int) -> str | None:
+        if display_request != self.display_request:
+            return
+
+        return self.content_cache.load(file_path)
+
+    def _file_written_worker(
+        self,
+        file_path: str,
+        content: str,
+        document: QtGui.QTextDocument,
+        revision: int,
+        written: bool,
+    ) -> None:
+        if written:
+            # Edited since the save, those edits are still unsaved.
+            if (
+                document is self.vex_plain_text_editor.document()
+                or self.document_pool.contains_document(document)
+            ) and document.revision() == revision:
+                document.setModified(False)
+
+            self.document_pool.mark_saved(file_path)
+            self.file_saved.emit(file_path)
+
+            # The journal went with the write, edits made since are journaled again.
+            file_key = core.get_file_key(file_path)
+
+            if self.journaled_revisions.pop(file_key, None) is not None:
+                self.journal_timer.start()
+
+            updated_nodes = core.propagate_vex_code(file_path, content)
+
+            if updated_nodes:
+                logger.info(
+                    f"{Path(file_path).stem!r} propagated to "
+                    f"{len(updated_nodes)} linked nodes."
+                )
+
     def _save_file(self) -> None:
-        with open(self.file_path, "w") as file_to_write:
-            content = self.vex_plain_text_editor.toPlainText()
-            file_to_write.write(content)
+        document = self.vex_plain_text_editor.document()
+
+        self.pending_saves[self.file_path] = (
+            document.toPlainText(),
+            document,
+            document.revision(),
+        )
+        self.save_timer.start()
 
         self.name_line_edit.setText(self.base_name)
 
-        logger.debug(f"{self.file_path!r} saved.")
+        logger.debug(f"{self.file_path!r} save scheduled.")
 
-    def display_code(self) -> None:
-        if os.path.exists(self.file_path):
-            with open(self.file_path) as file_for_read:
-                self.vex_plain_text_editor.setPlainText(file_for_read.read())
+    def _write_file(self, file_path: str, content: str, fsync: bool) -> bool:
+        written = core.write_vex_file(file_path, content, fsync=fsync)
+
+        if written:
+            self.content_cache.put(file_path, content)
+
+            if self.recovery_journal is not None:
+                self.recovery_journal.discard(file_path)
+
+        return written
+
+    def _is_streamed(self, file_path: str) -> bool:
+        try:
+            return os.path.getsize(file_path) >= VEXEditorWidget.STREAMING_FILE_SIZE
+        except OSError:
+            return False
+
+    def _pool_document(self, file_path: str = "") -> None:
+        self.document_entry = self.document_pool.put(
+            file_path or self.file_path, self.vex_plain_text_editor.document()
+        )
+
+    def _set_document(self, document_entry: DocumentEntry | None = None) -> None:
+        vex_plain_text_editor = self.vex_plain_text_editor
+
+        if self.document_entry is not None:
+            self.document_entry.text_cursor = vex_plain_text_editor.textCursor()
+            self.document_entry.horizontal_scroll = (
+                vex_plain_text_editor.horizontalScrollBar().value()
+            )
+            self.document_entry.vertical_scroll = (
+                vex_plain_text_editor.verticalScrollBar().value()
+            )
+
+        self.document_entry = document_entry
+
+        if document_entry is None:
+            document = vex_plain_text_editor.create_document()
         else:
-            self.vex_plain_text_editor.setPlainText("")
+            document = document_entry.document
+
+        vex_plain_text_editor.setDocument(document)
+        self.document_pool.set_current_document(document)
+        self._modification_changed_plain_text_edit(document.isModified())
+
+        if document_entry is not None and document_entry.text_cursor is not None:
+            vex_plain_text_editor.setTextCursor(document_entry.text_cursor)
+            vex_plain_text_editor.horizontalScrollBar().setValue(
+                document_entry.horizontal_scroll
+            )
+            vex_plain_text_editor.verticalScrollBar().setValue(
+                document_entry.vertical_scroll
+            )
+
+    def _restore_document(self, recovered_file: core.RecoveredFile) -> None:
+        code = self.content_cache.load(recovered_file.file_path)
+
+        if code is None:
+            return
+
+        document = self.vex_plain_text_editor.create_document()
+        document.setPlainText(code)
+        document.setModified(False)
+
+        # A single undo step back to the saved code.
+        text_cursor = QtGui.QTextCursor(document)
+        text_cursor.select(QtGui.QTextCursor.Document)
+        text_cursor.insertText(recovered_file.content)
+
+        self.document_pool.put(recovered_file.file_path, document)
+
+        logger.info(
+            f"{Path(recovered_file.file_path).stem!r} unsaved changes restored."
+        )
+
+    def _recover_unsaved_changes(self) -> None:
+        recovered_files = self.recovery_journal.read()
+
+        if not recovered_files:
+            return
+
+        names = "\n".join(
+            Path(recovered_file.file_path).stem for recovered_file in recovered_files
+        )
+
+        result = hou.ui.displayCustomConfirmation(
+            f"Restore unsaved changes to these VEX files?\n\n{names}",
+            buttons=("Restore", "Discard", "Later"),
+            close_choice=2,
+            default_choice=0,
+            suppress=hou.confirmType.NoConfirmType,
+            title="Recovery",
+        )
+
+        if result == 2:
+            self.postponed_files = {
+                core.get_file_key(recovered_file.file_path): recovered_file
+                for recovered_file in recovered_files
+            }
+        elif result == 1:
+            self.recovery_journal.clear()
+        elif result == 0:
+            for recovered_file in recovered_files:
+                self._restore_document(recovered_file)
+
+            self.journal_timer.start()
+
+            if self.file_path:
+                self.display_code()
+
+    def _set_code(self, code: str) -> None:
+        self.vex_plain_text_editor.setPlainText(code)
+        self.vex_plain_text_editor.setReadOnly(False)
+
+    def apply_change_set(self, change_set: core.ChangeSet) -> None:
+        self.content_cache.apply_change_set(change_set)
+        self.document_pool.apply_change_set(change_set)
+
+    def display_code(self) -> None:
+        self.display_request += 1
+
+        if self.document_loader.is_loading():
+            self.document_loader.cancel()
+            self.load_progress_bar.setVisible(False)
+
+        document_entry = None
+
+        if self.file_path:
+            document_entry = self.document_pool.get(self.file_path)
+            recovered_file = self.postponed_files.pop(
+                core.get_file_key(self.file_path), None
+            )
+
+            if recovered_file is not None and document_entry is None:
+                self._restore_document(recovered_file)
+                document_entry = self.document_pool.get(self.file_path)
+
+        if document_entry is not None:
+            self._set_document(document_entry)
+            self.vex_plain_text_editor.setReadOnly(False)
+
+            return
+
+        # A fresh document, the previous one may still be in the pool.
+        self._set_document()
+
+        if not self.file_path:
+            self.vex_plain_text_editor.setReadOnly(False)
+
+            return
+
+        code = self.content_cache.get(self.file_path)
+
+        if code is not None:
+            self._set_code(code)
+            self._pool_document()
+
+            return
+
+        # Keep the previous snippet from being edited or saved under the new path.
+        self.vex_plain_text_editor.setReadOnly(True)
+
+        # Appended between event loop turns without holding the whole file in memory.
+        if self._is_streamed(self.file_path):
+            self.load_progress_bar.setValue(0)
+            self.load_progress_bar.setVisible(True)
+            self.document_loader.start(self.file_path)
+
+            return
+
+        worker = Worker(self._load_code, self.file_path, self.display_request)
+        worker.signals.finished.connect(
+            partial(self._content_loaded_worker, self.display_request)
+        )
+        self.content_thread_pool.start(worker, 1)
+
+    def prefetch_code(self, file_paths: list[str]) -> None:
+        for file_path in file_paths:
+            if self.content_cache.contains(file_path) or self._is_streamed(file_path):
+                continue
+
+            worker = Worker(self._load_code, file_path, self.display_request)
+            self.content_thread_pool.start(worker)
+
+    def flush_saves(self, wait: bool = False) -> None:
+        self.save_timer.stop()
+
+        for file_path, (content, document, revision) in self.pending_saves.items():
+            worker = Worker(self._write_file, file_path, content, self.fsync_on_save)
+            worker.signals.finished.connect(
+                partial(
+                    self._file_written_worker, file_path, content, document, revision
+                )
+            )
+            self.save_thread_pool.start(worker)
+
+        self.pending_saves.clear()
+
+        if wait:
+            self.save_thread_pool.waitForDone()
+
+    def flush_journal(self, wait: bool = False) -> None:
+        self.journal_timer.stop()
+
+        if self.recovery_journal is None:
+            return
+
+        changes = []
+        discarded_file_paths = []
+        file_keys = set()
+
+        for file_path, document in self.document_pool.get_documents().items():
+            # Pooled from another library, journaled there before the switch.
+            if not self.recovery_journal.contains(file_path):
+                continue
+
+            file_key = core.get_file_key(file_path)
+            file_keys.add(file_key)
+            revision = document.revision()
+
+            if document.isModified():
+                if self.journaled_revisions.get(file_key) != revision:
+                    changes.append((file_path, document.toPlainText()))
+                    self.journaled_revisions[file_key] = revision
+            elif self.journaled_revisions.pop(file_key, None) is not None:
+                discarded_file_paths.append(file_key)
+
+        # Renamed, deleted or reloaded since they were journaled.
+        for file_key in set(self.journaled_revisions) - file_keys:
+            del self.journaled_revisions[file_key]
+            discarded_file_paths.append(file_key)
+
+        if changes or discarded_file_paths:
+            worker = Worker(self.recovery_journal.update, changes, discarded_file_paths)
+            self.save_thread_pool.start(worker)
+
+        if wait:
+            self.save_thread_pool.waitForDone()
 
     def get_current_file_path(self) -> str:
         return self.file_path
@@ -137,3 +541,12 @@ class VEXEditorWidget(QtWidgets.QWidget):
 
     def set_library_path(self, library_path: str) -> None:
         self.library_path = library_path
+
+        self.flush_journal()
+        self.recovery_journal = None
+        self.journaled_revisions.clear()
+        self.postponed_files.clear()
+
+        if library_path:
+            self.recovery_journal = core.RecoveryJournal(library_path)
+            self._recover_unsaved_changes()
@@ -4,15 +4,11 @@ from PySide2 import QtGui
 
 import hou
 
-import webbrowser
 import logging
-import json
-import os
 
 from vex_manager.gui.file_explorer_widget import FileExplorerWidget
 from vex_manager.gui.vex_editor_widget import VEXEditorWidget
-from vex_manager.gui.preferences_ui import PreferencesUI
-import vex_manager.utils as utils
+import vex_manager.core as core
 
 
 logger = logging.getLogger(f"vex_manager.{__name__}")
@@ -22,8 +18,6 @@ class VEXManagerUI(QtWidgets.QWidget):
     WINDOW_NAME = "vexManager"
     WINDOW_TITLE = "VEX Manager"
 
-    PREFERENCES_PATH = utils.get_preferences_path()
-
     dialog_instance = None
 
     @classmethod
@@ -42,7 +36,12 @@ class VEXManagerUI(QtWidgets.QWidget):
 
         self.geometry = None
 
-        self.preferences_ui = PreferencesUI(self, QtCore.Qt.Dialog)
+        self.preferences = core.get_preferences()
+
+        # Dialogs are created, and their modules imported, the first time they open.
+        self.preferences_ui = None
+        self.batch_apply_ui = None
+        self.scene_harvest_ui = None
 
         self.library_path = ""
         self.current_vex_file_path = ""
@@ -63,6 +62,9 @@ class VEXManagerUI(QtWidgets.QWidget):
         self.menu_bar = QtWidgets.QMenuBar()
 
         edit_menu = self.menu_bar.addMenu("Edit")
+        edit_menu.addAction("Batch Apply", self._open_batch_apply)
+        edit_menu.addAction("Scene Harvest", self._open_scene_harvest)
+        edit_menu.addSeparator()
         edit_menu.addAction("Preferences", self._open_preferences)
 
         help_menu = self.menu_bar.addMenu("Help")
@@ -104,9 +106,7 @@ class VEXManagerUI(QtWidgets.QWidget):
         splitter.setStretchFactor(1, 1)
 
     def _create_connections(self) -> None:
-        self.preferences_ui.on_save_clicked.connect(
-            self._on_save_clicked_preferences_ui
-        )
+        self.preferences.subscribe(self._preferences_changed)
 
         self.file_explorer_widget.current_item_changed.connect(
             self._file_explorer_current_item_changed_widget
@@ -114,7 +114,11 @@ class VEXManagerUI(QtWidgets.QWidget):
         self.file_explorer_widget.current_item_renamed.connect(
             self._file_explorer_current_item_renamed_widget
         )
+        self.file_explorer_widget.library_changed.connect(
+            self._file_explorer_library_changed_widget
+        )
 
+        self.vex_editor_widget.file_saved.connect(self._vex_editor_file_saved_widget)
         self.vex_editor_widget.name_editing_finished.connect(
             self._vex_editor_name_editing_finished_widget
         )
@@ -123,37 +127,71 @@ class VEXManagerUI(QtWidgets.QWidget):
         )
 
     def _load_preferences(self) -> None:
-        preferences = {}
+        library_path = self.preferences.get("library_path")
+        self.library_path = hou.text.expandString(library_path)
+
+    def _open_batch_apply(self) -> None:
+        if self.batch_apply_ui is None:
+            from vex_manager.gui.batch_apply_ui import BatchApplyUI
 
-        if os.path.exists(VEXManagerUI.PREFERENCES_PATH):
-            with open(VEXManagerUI.PREFERENCES_PATH, "r") as file_for_read:
-                preferences = json.load(file_for_read)
+            self.batch_apply_ui = BatchApplyUI(self, QtCore.Qt.Dialog)
 
-        self.library_path = preferences.get("library_path", "")
-        self.library_path = hou.text.expandString(self.library_path)
+        self.batch_apply_ui.set_vex_code(
+            self.vex_editor_widget.vex_plain_text_editor.toPlainText(),
+            self.vex_editor_widget.get_current_file_path(),
+        )
+        self.batch_apply_ui.show()
+
+    def _open_scene_harvest(self) -> None:
+        if self.scene_harvest_ui is None:
+            from vex_manager.gui.scene_harvest_ui import SceneHarvestUI
+
+            self.scene_harvest_ui = SceneHarvestUI(self, QtCore.Qt.Dialog)
+
+        self.scene_harvest_ui.set_library_path(self.library_path)
+        self.scene_harvest_ui.show()
+        self.scene_harvest_ui.harvest()
 
     def _open_preferences(self) -> None:
+        if self.preferences_ui is None:
+            from vex_manager.gui.preferences_ui import PreferencesUI
+
+            self.preferences_ui = PreferencesUI(self, QtCore.Qt.Dialog)
+
         self.preferences_ui.show()
 
     @staticmethod
     def _open_help() -> None:
-        webbrowser.open("https://github.com/mauriciogonzalezsoto/vex-manager")
+        import webbrowser
 
-    def _on_save_clicked_preferences_ui(self) -> None:
-        self._load_preferences()
-        self._update()
+        webbrowser.open("https://github.com/mauriciogonzalezsoto/vex-manager")
 
-        self.vex_editor_widget.vex_plain_text_editor.set_font_and_colors()
+    def _preferences_changed(self, change: core.PreferencesChange) -> None:
+        if "library_path" in change:
+            self.library_path = hou.text.expandString(change["library_path"])
+            self._update()
 
     def _file_explorer_current_item_changed_widget(self, file_path: str) -> None:
         self.current_vex_file_path = file_path
         self.vex_editor_widget.set_file_path(self.current_vex_file_path)
         self.vex_editor_widget.display_code()
+        self.vex_editor_widget.prefetch_code(
+            self.file_explorer_widget.get_neighbor_paths()
+        )
 
     def _file_explorer_current_item_renamed_widget(self, file_path: str) -> None:
+        if self.current_vex_file_path:
+            core.rename_snippet_links(self.current_vex_file_path, file_path)
+
         self.current_vex_file_path = file_path
         self.vex_editor_widget.set_file_path(self.current_vex_file_path)
 
+    def _file_explorer_library_changed_widget(self, change_set: core.ChangeSet) -> None:
+        self.vex_editor_widget.apply_change_set(change_set)
+
+    def _vex_editor_file_saved_widget(self, file_path: str) -> None:
+        self.file_explorer_widget.register_saved_file(file_path)
+
     def _vex_editor_name_editing_finished_widget(self, new_name: str) -> None:
         self.file_explorer_widget.rename_current_item(new_name)
 
@@ -175,12 +213,18 @@ class VEXManagerUI(QtWidgets.QWidget):
 
             self.geometry = self.saveGeometry()
 
+        self.vex_editor_widget.flush_saves(wait=True)
+        self.vex_editor_widget.flush_journal(wait=True)
         self.file_explorer_widget.clear_file_system_watcher()
 
-        self.preferences_ui.close()
+        for dialog in (self.preferences_ui, self.batch_apply_ui, self.scene_harvest_ui):
+            if dialog is not None:
+                dialog.close()
 
     def showEvent(self, event: QtGui.QShowEvent) -> None:
         super().showEvent(event)
 
+        self.preferences.revalidate()
+
         if self.geometry:
             self.restoreGeometry(self.geometry)
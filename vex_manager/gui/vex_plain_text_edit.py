@@ -4,21 +4,43 @@ from PySide2 import QtGui
 
 import hou
 
+from functools import partial
 import logging
-import json
-import os
+import html
+import re
 
 from vex_manager.gui.vex_syntax_highlighter import VEXSyntaxHighlighter
-from vex_manager.config import ColorScheme
-from vex_manager.config import VEXSyntaxis
-import vex_manager.utils as utils
+from vex_manager.core.vex_lexer import TokenType
+from vex_manager.gui.workers import Worker
+import vex_manager.gui.vex_token_cache as vex_token_cache
+import vex_manager.core.vex_signatures as vex_signatures
+import vex_manager.core.vex_symbols as vex_symbols
+import vex_manager.core as core
 
 
 logger = logging.getLogger(f"vex_manager.{__name__}")
 
 
 class VEXPlainTextEdit(QtWidgets.QPlainTextEdit):
-    PREFERENCES_PATH = utils.get_preferences_path()
+    COMPLETION_PREFIX_PATTERN = re.compile(r"@?[A-Za-z_]\w*$")
+    COMPLETION_TRIGGER_PATTERN = re.compile(r"[\w@]")
+
+    # Edits spanning more blocks than this rescan the symbols in the background.
+    MAX_INCREMENTAL_SYMBOL_BLOCKS = 500
+
+    # Longer code is highlighted viewport first and drops the current line highlight.
+    LARGE_FILE_BLOCK_COUNT = 5_000
+
+    PREFERENCE_ATTRIBUTES = {
+        "auto_indent": "auto_indent",
+        "insert_closing_brackets": "insert_closing_brackets",
+        "insert_closing_quotes": "insert_closing_quotes",
+        "backspace_on_tab_stop": "backspace_on_tab_space",
+        "tab_size": "tab_size",
+        "color_scheme": "color_scheme",
+        "font": "font_family",
+        "font_size": "font_size",
+    }
 
     def __init__(self) -> None:
         super().__init__()
@@ -35,17 +57,117 @@ class VEXPlainTextEdit(QtWidgets.QPlainTextEdit):
         self.font_family = ""
         self.font_size = 8
 
+        self.color_scheme = {}
+
+        self.completion_prefix = ""
+
+        self.signature_hint_active = False
+
+        self.large_file_mode = False
+
+        self.streaming = False
+
+        self.block_count = 1
+        self.document_symbols = vex_symbols.DocumentSymbols()
+        self.symbols_ready = True
+        self.symbols_scanning = False
+        self.symbols_stale = False
+        self.symbols_revision = 0
+        self.symbols_thread_pool = QtCore.QThreadPool()
+        self.symbols_thread_pool.setMaxThreadCount(1)
+
+        self.preferences = core.get_preferences()
+
         self.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAsNeeded)
         self.setWordWrapMode(QtGui.QTextOption.NoWrap)
 
         self.vex_syntax_highlighter = VEXSyntaxHighlighter(self.document())
 
+        self.completer_model = QtCore.QStringListModel(self)
+
+        self.completer = QtWidgets.QCompleter(self)
+        self.completer.setModel(self.completer_model)
+        self.completer.setWidget(self)
+        self.completer.setCompletionMode(QtWidgets.QCompleter.UnfilteredPopupCompletion)
+        self.completer.setCaseSensitivity(QtCore.Qt.CaseSensitive)
+        self.completer.setMaxVisibleItems(10)
+
         self._create_connections()
         self._load_preferences()
         self.set_font_and_colors()
 
     def _create_connections(self) -> None:
         self.cursorPositionChanged.connect(self._highlight_current_line)
+        self.updateRequest.connect(self._update_request_plain_text_edit)
+        self.document().contentsChange.connect(self._contents_change_document)
+
+        self.completer.activated[str].connect(self._activated_completer)
+
+        self.preferences.subscribe(self._preferences_changed)
+
+    def _activated_completer(self, completion: str) -> None:
+        text_cursor = self.textCursor()
+        text_cursor.movePosition(
+            QtGui.QTextCursor.Left,
+            QtGui.QTextCursor.KeepAnchor,
+            len(self.completion_prefix),
+        )
+        text_cursor.insertText(completion)
+        self.setTextCursor(text_cursor)
+
+    def _contents_change_document(
+        self, position: int, chars_removed: int, chars_added: int
+    ) -> None:
+        document = self.document()
+        block_count = document.blockCount()
+        self.symbols_revision += 1
+
+        # Streamed text is scanned once it is complete.
+        if self.streaming:
+            self.block_count = block_count
+
+            return
+
+        first_block = document.findBlock(position)
+        last_block = document.findBlock(position + chars_added)
+
+        if not last_block.isValid():
+            last_block = document.lastBlock()
+
+        first_block_number = first_block.blockNumber()
+        number_of_new_blocks = last_block.blockNumber() - first_block_number + 1
+        number_of_old_blocks = number_of_new_blocks - (block_count - self.block_count)
+        self.block_count = block_count
+
+        if not self.symbols_ready:
+            self._scan_symbols()
+
+            return
+
+        if (
+            number_of_new_blocks > VEXPlainTextEdit.MAX_INCREMENTAL_SYMBOL_BLOCKS
+            or number_of_old_blocks > VEXPlainTextEdit.MAX_INCREMENTAL_SYMBOL_BLOCKS
+        ):
+            self._scan_blocks(first_block, number_of_new_blocks, number_of_old_blocks)
+
+            return
+
+        # The highlighter has already lexed the changed blocks.
+        block_symbols = []
+        block = first_block
+
+        for _ in range(number_of_new_blocks):
+            block_symbols.append(vex_token_cache.get_block_symbols(block))
+            block = block.next()
+
+        self.document_symbols.replace_blocks(
+            first_block_number, number_of_old_blocks, block_symbols
+        )
+
+        if self.document_symbols.get_number_of_blocks() != block_count:
+            logger.debug("Document symbols out of sync, rescanning.")
+
+            self._scan_symbols()
 
     def _decrease_font_size(self) -> None:
         point_size = self.font.pointSize()
@@ -60,7 +182,6 @@ class VEXPlainTextEdit(QtWidgets.QPlainTextEdit):
         text_cursor: QtGui.QTextCursor,
         event: QtGui.QKeyEvent,
     ) -> None:
-
         if current_line_text.strip() == "":
             if current_line_text and text_cursor.atBlockEnd():
                 delete_block = len(current_line_text) % self.tab_size
@@ -80,7 +201,7 @@ class VEXPlainTextEdit(QtWidgets.QPlainTextEdit):
         text_cursor.select(QtGui.QTextCursor.WordUnderCursor)
         word_under_cursor = text_cursor.selectedText()
 
-        if word_under_cursor in VEXSyntaxis.VEX_FUNCTIONS:
+        if vex_symbols.is_vex_function(word_under_cursor):
             desktop = hou.ui.curDesktop()
             desktop.displayHelpPath(f"/vex/functions/{word_under_cursor}")
 
@@ -92,10 +213,11 @@ class VEXPlainTextEdit(QtWidgets.QPlainTextEdit):
             cursor_position = text_cursor.position()
 
             if cursor_position:
-                plain_text = self.toPlainText()
+                block_text = text_cursor.block().text()
+                position_in_block = text_cursor.positionInBlock()
 
-                if cursor_position < len(plain_text):
-                    text_at_cursor = self.toPlainText()[cursor_position]
+                if position_in_block < len(block_text):
+                    text_at_cursor = block_text[position_in_block]
 
                     if text_at_cursor == char:
                         text_cursor = self.textCursor()
@@ -107,6 +229,9 @@ class VEXPlainTextEdit(QtWidgets.QPlainTextEdit):
         return False
 
     def _highlight_current_line(self) -> None:
+        if self.large_file_mode:
+            return
+
         extra_selections = []
 
         selection = QtWidgets.QTextEdit.ExtraSelection()
@@ -132,12 +257,15 @@ class VEXPlainTextEdit(QtWidgets.QPlainTextEdit):
         text_cursor: QtGui.QTextCursor,
         event: QtGui.QKeyEvent,
     ) -> None:
-
         leading_space = len(current_line_text) - len(current_line_text.lstrip())
         cursor_position = text_cursor.position() - 1
+        position_in_block = text_cursor.positionInBlock() - 1
 
         if cursor_position >= 0:
-            text_at_cursor = self.toPlainText()[cursor_position]
+            if position_in_block >= 0:
+                text_at_cursor = current_line_text[position_in_block]
+            else:
+                text_at_cursor = "\n"
 
             if text_at_cursor in ["{", "(", "["]:
                 self.insertPlainText("\n\n")
@@ -176,46 +304,393 @@ class VEXPlainTextEdit(QtWidgets.QPlainTextEdit):
         text_cursor.movePosition(text_cursor.PreviousCharacter)
         self.setTextCursor(text_cursor)
 
+    @staticmethod
+    def _format_signatures(
+        signatures: tuple[vex_signatures.VEXSignature, ...], argument_index: int = -1
+    ) -> str:
+        lines = []
+
+        for signature in signatures:
+            arguments = [
+                html.escape(argument.format()) for argument in signature.arguments
+            ]
+
+            if arguments and argument_index >= 0:
+                # Variadic arguments absorb everything past the last named one.
+                if argument_index < len(arguments):
+                    current_index = argument_index
+                elif signature.arguments[-1].type == "...":
+                    current_index = len(arguments) - 1
+                else:
+                    current_index = -1
+
+                if current_index >= 0:
+                    arguments[current_index] = f"<b>{arguments[current_index]}</b>"
+
+            lines.append(
+                f"{html.escape(signature.return_type)} {signature.name}"
+                f"({', '.join(arguments)})"
+            )
+
+        return f"<nobr>{'<br>'.join(lines)}</nobr>"
+
+    def _get_completion_prefix(self) -> str:
+        text_cursor = self.textCursor()
+        text_before_cursor = text_cursor.block().text()[: text_cursor.positionInBlock()]
+        match = VEXPlainTextEdit.COMPLETION_PREFIX_PATTERN.search(text_before_cursor)
+
+        return match.group() if match else ""
+
+    def _is_cursor_in_comment_or_string(self) -> bool:
+        text_cursor = self.textCursor()
+        position_in_block = text_cursor.positionInBlock()
+
+        if not position_in_block:
+            return False
+
+        token = vex_token_cache.get_token_at(text_cursor.block(), position_in_block - 1)
+
+        return token is not None and token[2] in (
+            TokenType.COMMENTS,
+            TokenType.STRINGS,
+        )
+
+    def _highlight_visible_blocks(self) -> None:
+        first_block = self.firstVisibleBlock()
+        last_block = first_block
+        block = first_block
+
+        content_offset = self.contentOffset()
+        viewport_height = self.viewport().height()
+
+        while (
+            block.isValid()
+            and self.blockBoundingGeometry(block).translated(content_offset).top()
+            <= viewport_height
+        ):
+            last_block = block
+            block = block.next()
+
+        self.vex_syntax_highlighter.highlight_blocks(first_block, last_block)
+
     def _load_preferences(self) -> None:
-        settings = {}
+        self._set_preferences(self.preferences.get_all())
 
-        if os.path.exists(VEXPlainTextEdit.PREFERENCES_PATH):
-            with open(VEXPlainTextEdit.PREFERENCES_PATH, "r") as file_for_read:
-                settings = json.load(file_for_read)
+    def _scan_symbols(self) -> None:
+        self.symbols_ready = False
 
-        self.auto_indent = settings.get("auto_indent", True)
-        self.insert_closing_brackets = settings.get("insert_closing_brackets", True)
-        self.insert_closing_quotes = settings.get("insert_closing_quotes", True)
+        # Edits made during a scan are picked up by one more scan once it finishes.
+        if self.symbols_scanning:
+            self.symbols_stale = True
 
-        self.backspace_on_tab_space = settings.get("backspace_on_tab_stop", True)
-        self.tab_size = settings.get("tab_size", 4)
-        self.color_scheme = settings.get("color_scheme", {})
+            return
 
-        if not self.color_scheme:
-            for color_scheme in ColorScheme:
-                color_scheme = color_scheme.value
+        self.symbols_scanning = True
+        self.symbols_stale = False
 
-                self.color_scheme[color_scheme["name"]] = color_scheme["color"]
+        lines = self.toPlainText().split("\n")
 
-        self.font_family = settings.get("font", "Source Sans Pro")
-        self.font_size = settings.get("font_size", 8)
+        worker = Worker(vex_symbols.DocumentSymbols.from_lines, lines)
+        worker.signals.finished.connect(self._symbols_scanned_worker)
+        self.symbols_thread_pool.start(worker)
 
-    def set_font_and_colors(self) -> None:
-        self._load_preferences()
+    def _scan_blocks(
+        self,
+        first_block: QtGui.QTextBlock,
+        number_of_new_blocks: int,
+        number_of_old_blocks: int,
+    ) -> None:
+        first_block_number = first_block.blockNumber()
+
+        # Empty until scanned, so the block numbers stay in step with later edits.
+        self.document_symbols.replace_blocks(
+            first_block_number,
+            number_of_old_blocks,
+            [frozenset()] * number_of_new_blocks,
+        )
+
+        lines = []
+        block = first_block
+
+        for _ in range(number_of_new_blocks):
+            lines.append(block.text())
+            block = block.next()
+
+        worker = Worker(
+            vex_symbols.extract_lines_symbols,
+            lines,
+            vex_token_cache.get_previous_state(first_block),
+        )
+        worker.signals.finished.connect(
+            partial(
+                self._blocks_scanned_worker,
+                self.document_symbols,
+                self.symbols_revision,
+                first_block_number,
+            )
+        )
+        self.symbols_thread_pool.start(worker)
+
+    def _blocks_scanned_worker(
+        self,
+        document_symbols: vex_symbols.DocumentSymbols,
+        symbols_revision: int,
+        first_block_number: int,
+        block_symbols: list[frozenset[str]] | None,
+    ) -> None:
+        # A full scan under way or done since covers these blocks.
+        if not self.symbols_ready or document_symbols is not self.document_symbols:
+            return
+
+        # Edited again while scanned, the blocks may have moved.
+        if block_symbols is None or symbols_revision != self.symbols_revision:
+            self._scan_symbols()
+
+            return
+
+        self.document_symbols.replace_blocks(
+            first_block_number, len(block_symbols), block_symbols
+        )
+
+    def _symbols_scanned_worker(
+        self, document_symbols: vex_symbols.DocumentSymbols | None
+    ) -> None:
+        self.symbols_scanning = False
+
+        if self.symbols_stale:
+            self._scan_symbols()
+        elif document_symbols is not None:
+            self.document_symbols = document_symbols
+            self.symbols_ready = True
 
+    def _set_preferences(self, preferences: dict) -> None:
+        for key, attribute in VEXPlainTextEdit.PREFERENCE_ATTRIBUTES.items():
+            if key in preferences:
+                setattr(self, attribute, preferences[key])
+
+    def _preferences_changed(self, change: core.PreferencesChange) -> None:
+        self._set_preferences(change.changes)
+
+        if {"font", "font_size"} & change.keys():
+            self._set_font()
+
+        if "color_scheme" in change:
+            self.vex_syntax_highlighter.set_vex_systax_highlighter_colors(
+                self.color_scheme
+            )
+
+    def _set_font(self) -> None:
         self.font.setBold(True)
         self.font.setFamily(self.font_family)
         self.font.setPointSize(self.font_size)
         self.font.setWordSpacing(5)
         self.setFont(self.font)
 
+    def _update_completer(self, force: bool = False) -> None:
+        popup = self.completer.popup()
+        prefix = self._get_completion_prefix()
+
+        if not force and (
+            len(prefix.lstrip("@")) < vex_symbols.MINIMUM_SYMBOL_LENGTH
+            or self._is_cursor_in_comment_or_string()
+        ):
+            popup.hide()
+
+            return
+
+        completions = vex_symbols.get_completions(
+            prefix, self.document_symbols if self.symbols_ready else None
+        )
+
+        if not completions:
+            popup.hide()
+
+            return
+
+        self.completion_prefix = prefix
+        self.completer_model.setStringList(completions)
+        popup.setCurrentIndex(self.completer_model.index(0, 0))
+
+        rect = self.cursorRect()
+        rect.setWidth(
+            popup.sizeHintForColumn(0) + popup.verticalScrollBar().sizeHint().width()
+        )
+        self.completer.complete(rect)
+
+    def _show_tool_tip(self, event: QtGui.QHelpEvent) -> None:
+        text_cursor = self.cursorForPosition(event.pos())
+        block = text_cursor.block()
+        token = vex_token_cache.get_token_at(block, text_cursor.positionInBlock())
+
+        # Anything but a VEX function token never loads the signatures.
+        if token is not None and token[2] == TokenType.FUNCTIONS:
+            start, length, token_type = token
+            signatures = vex_signatures.get_signatures(
+                block.text()[start : start + length]
+            )
+        else:
+            signatures = ()
+
+        if signatures:
+            QtWidgets.QToolTip.showText(
+                event.globalPos(), self._format_signatures(signatures), self.viewport()
+            )
+        elif not self.signature_hint_active:
+            QtWidgets.QToolTip.hideText()
+
+    def _update_signature_hint(self) -> None:
+        text_cursor = self.textCursor()
+        block = text_cursor.block()
+        call = vex_signatures.find_call(
+            block.text()[: text_cursor.positionInBlock()],
+            vex_token_cache.get_block_tokens(block),
+        )
+
+        if call is not None and vex_symbols.is_vex_function(call[0]):
+            signatures = vex_signatures.get_signatures(call[0])
+        else:
+            signatures = ()
+
+        if not signatures:
+            if self.signature_hint_active:
+                QtWidgets.QToolTip.hideText()
+                self.signature_hint_active = False
+
+            return
+
+        self.signature_hint_active = True
+
+        cursor_rect = self.cursorRect()
+        position = self.viewport().mapToGlobal(cursor_rect.bottomLeft())
+        QtWidgets.QToolTip.showText(
+            position, self._format_signatures(signatures, call[1]), self.viewport()
+        )
+
+    def _update_request_plain_text_edit(self, rect: QtCore.QRect, dy: int) -> None:
+        if self.vex_syntax_highlighter.is_deferred():
+            self._highlight_visible_blocks()
+
+    def set_large_file_mode(self, large_file_mode: bool) -> None:
+        if large_file_mode == self.large_file_mode:
+            return
+
+        self.large_file_mode = large_file_mode
+
+        if large_file_mode:
+            self.setExtraSelections([])
+        else:
+            self._highlight_current_line()
+
+        logger.debug(f"Large file mode {'on' if large_file_mode else 'off'}.")
+
+    def create_document(self) -> QtGui.QTextDocument:
+        document = QtGui.QTextDocument()
+        document.setDocumentLayout(QtWidgets.QPlainTextDocumentLayout(document))
+
+        VEXSyntaxHighlighter(document)
+
+        return document
+
+    def setDocument(self, document: QtGui.QTextDocument) -> None:
+        if document is self.document():
+            return
+
+        if self.streaming:
+            self.streaming = False
+            self.document().setUndoRedoEnabled(True)
+
+        self.document().contentsChange.disconnect(self._contents_change_document)
+
+        self.completer.popup().hide()
+        QtWidgets.QToolTip.hideText()
+        self.signature_hint_active = False
+
+        document.setDefaultFont(self.font)
+        super().setDocument(document)
+
+        document.contentsChange.connect(self._contents_change_document)
+
+        # Each document keeps its own highlighter and with it the cached tokens, the
+        # colors only need catching up with the preferences.
+        self.vex_syntax_highlighter = document.findChild(VEXSyntaxHighlighter)
+
+        if self.vex_syntax_highlighter is None:
+            self.vex_syntax_highlighter = VEXSyntaxHighlighter(document)
+
         self.vex_syntax_highlighter.set_vex_systax_highlighter_colors(self.color_scheme)
 
-    def keyPressEvent(self, event: QtGui.QKeyEvent) -> None:
+        self.block_count = document.blockCount()
+        self.set_large_file_mode(
+            self.block_count > VEXPlainTextEdit.LARGE_FILE_BLOCK_COUNT
+        )
+        self._highlight_current_line()
+
+        if self.vex_syntax_highlighter.is_deferred():
+            self._highlight_visible_blocks()
+
+        self._scan_symbols()
+
+    def begin_streaming(self) -> None:
+        self.setPlainText("")
+        self.set_large_file_mode(True)
+
+        self.streaming = True
+        self.document().setUndoRedoEnabled(False)
+        self.vex_syntax_highlighter.start_deferred_highlighting(hold=True)
+
+    def append_text(self, text: str) -> None:
+        text_cursor = QtGui.QTextCursor(self.document())
+        text_cursor.movePosition(QtGui.QTextCursor.End)
+        text_cursor.beginEditBlock()
+        text_cursor.insertText(text)
+        text_cursor.endEditBlock()
+
+        self.vex_syntax_highlighter.resume_deferred_highlighting(hold=True)
+
+    def end_streaming(self) -> None:
+        if not self.streaming:
+            return
+
+        self.streaming = False
+        self.document().setUndoRedoEnabled(True)
+        self.document().setModified(False)
+
+        self.set_large_file_mode(
+            self.block_count > VEXPlainTextEdit.LARGE_FILE_BLOCK_COUNT
+        )
+        self.vex_syntax_highlighter.resume_deferred_highlighting()
+        self._scan_symbols()
+
+    def setPlainText(self, text: str) -> None:
+        # Qt keeps undo off after setting the text if it was off before.
+        if self.streaming:
+            self.streaming = False
+            self.document().setUndoRedoEnabled(True)
+
+        large_file_mode = text.count("\n") >= VEXPlainTextEdit.LARGE_FILE_BLOCK_COUNT
+        self.set_large_file_mode(large_file_mode)
+
+        # Qt would otherwise highlight the whole document before returning.
+        if large_file_mode:
+            self.vex_syntax_highlighter.start_deferred_highlighting()
+        else:
+            self.vex_syntax_highlighter.stop_deferred_highlighting()
+
+        super().setPlainText(text)
+
+        if large_file_mode:
+            self._highlight_visible_blocks()
+
+    def set_font_and_colors(self) -> None:
+        self._set_font()
+
+        self.vex_syntax_highlighter.set_vex_systax_highlighter_colors(self.color_scheme)
+
+    def _handle_key_press(self, event: QtGui.QKeyEvent) -> None:
         key = event.key()
         modifiers = event.modifiers()
 
-        ctrl = modifiers & QtCore.Qt.ControlModifier != 0
+        ctrl = bool(modifiers & QtCore.Qt.ControlModifier)
 
         text_cursor = self.textCursor()
         block = text_cursor.block()
@@ -238,6 +713,10 @@ class VEXPlainTextEdit(QtWidgets.QPlainTextEdit):
 
                 return
 
+        elif key == QtCore.Qt.Key_Space:
+            if ctrl:
+                return
+
         elif key == QtCore.Qt.Key_Tab:
             self.insertPlainText("".ljust(self.tab_size))
 
@@ -271,9 +750,7 @@ class VEXPlainTextEdit(QtWidgets.QPlainTextEdit):
 
         elif key == QtCore.Qt.Key_BraceRight:
             if self.insert_closing_brackets:
-
                 if self._handle_cursor_behavior("}"):
-
                     return
 
         elif key == QtCore.Qt.Key_ParenLeft:
@@ -285,7 +762,6 @@ class VEXPlainTextEdit(QtWidgets.QPlainTextEdit):
         elif key == QtCore.Qt.Key_ParenRight:
             if self.insert_closing_brackets:
                 if self._handle_cursor_behavior(")"):
-
                     return
 
         elif key == QtCore.Qt.Key_BracketLeft:
@@ -297,13 +773,11 @@ class VEXPlainTextEdit(QtWidgets.QPlainTextEdit):
         elif key == QtCore.Qt.Key_BracketRight:
             if self.insert_closing_brackets:
                 if self._handle_cursor_behavior("]"):
-
                     return
 
         elif key == QtCore.Qt.Key_QuoteDbl:
             if self.insert_closing_quotes:
                 if self._handle_cursor_behavior('"'):
-
                     return
                 else:
                     self._insert_matching_delimiter('"')
@@ -313,7 +787,6 @@ class VEXPlainTextEdit(QtWidgets.QPlainTextEdit):
         elif key == QtCore.Qt.Key_Apostrophe:
             if self.insert_closing_quotes:
                 if self._handle_cursor_behavior("'"):
-
                     return
                 else:
                     self._insert_matching_delimiter("'")
@@ -321,3 +794,44 @@ class VEXPlainTextEdit(QtWidgets.QPlainTextEdit):
                     return
 
         super().keyPressEvent(event)
+
+    def keyPressEvent(self, event: QtGui.QKeyEvent) -> None:
+        key = event.key()
+        ctrl = bool(event.modifiers() & QtCore.Qt.ControlModifier)
+
+        popup = self.completer.popup()
+
+        # The completer handles these keys itself while its popup is open.
+        if popup.isVisible() and key in (
+            QtCore.Qt.Key_Return,
+            QtCore.Qt.Key_Enter,
+            QtCore.Qt.Key_Escape,
+            QtCore.Qt.Key_Tab,
+            QtCore.Qt.Key_Backtab,
+        ):
+            event.ignore()
+
+            return
+
+        self._handle_key_press(event)
+
+        if ctrl and key == QtCore.Qt.Key_Space:
+            self._update_completer(force=True)
+        elif popup.isVisible() or (
+            VEXPlainTextEdit.COMPLETION_TRIGGER_PATTERN.match(event.text())
+        ):
+            self._update_completer()
+
+        if key == QtCore.Qt.Key_Escape:
+            QtWidgets.QToolTip.hideText()
+            self.signature_hint_active = False
+        elif self.signature_hint_active or event.text() in ("(", ","):
+            self._update_signature_hint()
+
+    def viewportEvent(self, event: QtCore.QEvent) -> bool:
+        if event.type() == QtCore.QEvent.ToolTip:
+            self._show_tool_tip(event)
+
+            return True
+
+        return super().viewportEvent(event)
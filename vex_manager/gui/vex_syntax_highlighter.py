@@ -2,120 +2,259 @@ from PySide2 import QtCore
 from PySide2 import QtGui
 
 import logging
+import time
 
-from vex_manager.config import VEXSyntaxis
+from vex_manager.core.vex_lexer import LexerState
+from vex_manager.core.vex_lexer import TokenType
+from vex_manager.gui.vex_token_cache import VEXBlockData
+import vex_manager.gui.vex_token_cache as vex_token_cache
+from vex_manager.config import ColorScheme
+import vex_manager.core.vex_lexer as vex_lexer
 
 
 logger = logging.getLogger(f"vex_manager.{__name__}")
 
 
 class VEXSyntaxHighlighter(QtGui.QSyntaxHighlighter):
+    # Seconds of highlighting per idle slice while highlighting is deferred.
+    DEFERRED_SLICE_DURATION = 0.008
 
     def __init__(self, parent: QtCore.QObject) -> None:
         super().__init__(parent)
 
-        keywords = "|".join(VEXSyntaxis.KEYWORDS)
-        data_types = "|".join(VEXSyntaxis.DATA_TYPES)
-        vex_functions = "|".join(VEXSyntaxis.VEX_FUNCTIONS)
-
-        self.strings_reg_exp = QtCore.QRegExp(r'(["\'])((?:\\.|[^"\\])*)\1')
-        self.numbers_reg_exp = QtCore.QRegExp(r"\b\d+(\.\d+)?\b")
-        self.comments_reg_exp = QtCore.QRegExp(r"//.*")
-        self.functions_reg_exp = QtCore.QRegExp(rf"\b({vex_functions})\b")
-        self.keywords_reg_exp = QtCore.QRegExp(rf"\b({keywords})\b")
-        self.types_reg_exp = QtCore.QRegExp(rf"\b({data_types})\b")
-        self.references_reg_exp = QtCore.QRegExp(r"[\w]*@[\w-]+")
-
-        self.plain_text_char_format = QtGui.QTextCharFormat()
-        self.strings_text_char_format = QtGui.QTextCharFormat()
-        self.numbers_text_char_format = QtGui.QTextCharFormat()
-        self.comments_text_char_format = QtGui.QTextCharFormat()
-        self.functions_text_char_format = QtGui.QTextCharFormat()
-        self.keywords_text_char_format = QtGui.QTextCharFormat()
-        self.types_text_char_format = QtGui.QTextCharFormat()
-        self.references_text_char_format = QtGui.QTextCharFormat()
+        self.text_char_formats = {
+            token_type: QtGui.QTextCharFormat() for token_type in TokenType
+        }
+
+        # Blocks from here on are left to the idle slices while highlighting is
+        # deferred, a cursor so that the position follows edits.
+        self.deferred_cursor: QtGui.QTextCursor | None = None
+
+        # Held while text is still being appended, the slices then wait at the last
+        # block instead of finishing.
+        self.deferred_hold = False
+
+        self.deferred_timer = QtCore.QTimer(self)
+        self.deferred_timer.setInterval(0)
+        self.deferred_timer.timeout.connect(self._deferred_timeout_timer)
+
+    def _apply_block(
+        self, block: QtGui.QTextBlock, previous_state: int | None = None
+    ) -> VEXBlockData:
+        block_data = vex_token_cache.get_block_data(
+            block, previous_state
+        ) or vex_token_cache.update_block_data(block, previous_state)
+
+        block.setUserState(block_data.state)
+        self._set_block_formats(block, block_data)
+
+        return block_data
+
+    def _deferred_timeout_timer(self) -> None:
+        document = self.document()
+
+        if self.deferred_cursor is None or document is None:
+            self.stop_deferred_highlighting()
+
+            return
+
+        block = document.findBlock(self.deferred_cursor.position())
+        first_position = block.position()
+        end_time = time.perf_counter() + VEXSyntaxHighlighter.DEFERRED_SLICE_DURATION
+
+        state = None
+
+        while block.isValid() and time.perf_counter() < end_time:
+            state = self._apply_block(block, state).state
+            block = block.next()
+
+        if block.isValid():
+            end_position = block.position()
+            self.deferred_cursor.setPosition(end_position)
+        elif self.deferred_hold:
+            end_position = document.characterCount()
+            self.deferred_cursor.setPosition(document.lastBlock().position())
+            self.deferred_timer.stop()
+        else:
+            end_position = document.characterCount()
+            self.stop_deferred_highlighting()
+
+            logger.debug("Deferred highlighting finished.")
+
+        document.markContentsDirty(first_position, end_position - first_position)
+
+    def _set_block_formats(
+        self, block: QtGui.QTextBlock, block_data: VEXBlockData
+    ) -> None:
+        # Qt 5.13's setFormat only collects ranges inside highlightBlock, which then
+        # replaces the layout formats with them like this, keeping those of text an
+        # input method is composing. Nothing is cached in between, the next
+        # highlightBlock compares against the layout, and the callers' markContentsDirty
+        # lays the blocks out again.
+        layout = block.layout()
+        format_ranges = []
+
+        if layout.preeditAreaText():
+            preedit_start = layout.preeditAreaPosition()
+            preedit_end = preedit_start + len(layout.preeditAreaText())
+
+            format_ranges = [
+                format_range
+                for format_range in layout.formats()
+                if format_range.start >= preedit_start
+                and format_range.start + format_range.length <= preedit_end
+            ]
+
+        for start, length, token_type in self._get_spans(
+            block_data, block.length() - 1
+        ):
+            format_range = QtGui.QTextLayout.FormatRange()
+            format_range.start = start
+            format_range.length = length
+            format_range.format = self.text_char_formats[token_type]
+            format_ranges.append(format_range)
+
+        layout.setFormats(format_ranges)
+
+    def is_deferred(self) -> bool:
+        return self.deferred_cursor is not None
+
+    def start_deferred_highlighting(self, hold: bool = False) -> None:
+        self.deferred_cursor = QtGui.QTextCursor(self.document())
+        self.deferred_cursor.setKeepPositionOnInsert(True)
+        self.deferred_hold = hold
+        self.deferred_timer.start()
+
+    def resume_deferred_highlighting(self, hold: bool = False) -> None:
+        self.deferred_hold = hold
+
+        if self.deferred_cursor is not None:
+            self.deferred_timer.start()
+
+    def stop_deferred_highlighting(self) -> None:
+        self.deferred_cursor = None
+        self.deferred_hold = False
+        self.deferred_timer.stop()
+
+    def highlight_blocks(
+        self, first_block: QtGui.QTextBlock, last_block: QtGui.QTextBlock
+    ) -> None:
+        first_position = -1
+        end_position = -1
+        block = first_block
+
+        # Blocks ahead of the idle slices guess their incoming state, the slices
+        # lex them again if the guess was wrong.
+        while block.isValid():
+            if vex_token_cache.get_block_data(block) is None:
+                self._apply_block(block)
+
+                if first_position < 0:
+                    first_position = block.position()
+
+                end_position = block.position() + block.length()
+
+            if block == last_block:
+                break
+
+            block = block.next()
+
+        if first_position >= 0:
+            self.document().markContentsDirty(
+                first_position, end_position - first_position
+            )
 
     def set_vex_systax_highlighter_colors(
         self, color_scheme: dict[str, tuple[float, float, float]]
     ) -> None:
-        self.plain_text_char_format.setForeground(QtGui.QColor(*color_scheme["plain"]))
-        self.strings_text_char_format.setForeground(
-            QtGui.QColor(*color_scheme["strings"])
-        )
-        self.numbers_text_char_format.setForeground(
-            QtGui.QColor(*color_scheme["numbers"])
-        )
-        self.comments_text_char_format.setForeground(
-            QtGui.QColor(*color_scheme["comments"])
-        )
-        self.functions_text_char_format.setForeground(
-            QtGui.QColor(*color_scheme["functions"])
-        )
-        self.keywords_text_char_format.setForeground(
-            QtGui.QColor(*color_scheme["keywords"])
-        )
-        self.types_text_char_format.setForeground(QtGui.QColor(*color_scheme["types"]))
-        self.references_text_char_format.setForeground(
-            QtGui.QColor(*color_scheme["references"])
-        )
-
-        self.rehighlight()
-
-    def _set_vex_syntax_highlighter(
-        self,
-        reg_exp: QtCore.QRegExp,
-        text: str,
-        text_char_format: QtGui.QTextCharFormat,
-    ) -> None:
+        changed_token_types = 0
+
+        for token_type, text_char_format in self.text_char_formats.items():
+            color_scheme_name = ColorScheme[token_type.name].value["name"]
+            color = QtGui.QColor(*color_scheme[color_scheme_name])
+
+            if (
+                text_char_format.hasProperty(QtGui.QTextFormat.ForegroundBrush)
+                and text_char_format.foreground().color() == color
+            ):
+                continue
+
+            text_char_format.setForeground(color)
+            changed_token_types |= 1 << token_type
+
+        if not changed_token_types:
+            return
+
+        self._recolor_blocks(changed_token_types)
+
+    def _recolor_blocks(self, token_types: int) -> None:
+        document = self.document()
+        block = document.firstBlock()
+        plain_text_changed = token_types & 1 << TokenType.PLAIN
 
-        index = reg_exp.indexIn(text)
+        # Cached spans go straight into the block layouts, without highlightBlock.
+        while block.isValid():
+            block_data = block.userData()
 
-        while index >= 0:
-            length = reg_exp.matchedLength()
-            self.setFormat(index, length, text_char_format)
-            index = reg_exp.indexIn(text, index + length)
+            # Blocks without tokens yet pick up the new formats when highlighted.
+            if isinstance(block_data, VEXBlockData) and (
+                plain_text_changed or block_data.token_types & token_types
+            ):
+                self._set_block_formats(block, block_data)
+
+            block = block.next()
+
+        document.markContentsDirty(0, document.characterCount())
+
+    @staticmethod
+    def _get_spans(
+        block_data: VEXBlockData, text_length: int
+    ) -> list[tuple[int, int, int]]:
+        spans = []
+        position = 0
+
+        # Plain text fills the gaps between tokens.
+        for start, length, token_type in block_data.get_tokens():
+            if token_type == TokenType.PLAIN:
+                continue
+
+            if start > position:
+                spans.append((position, start - position, TokenType.PLAIN))
+
+            spans.append((start, length, token_type))
+            position = start + length
+
+        if position < text_length:
+            spans.append((position, text_length - position, TokenType.PLAIN))
+
+        return spans
 
     def highlightBlock(self, text: str) -> None:
-        self.setFormat(0, len(text), self.plain_text_char_format)
-
-        self._set_vex_syntax_highlighter(
-            reg_exp=self.numbers_reg_exp,
-            text=text,
-            text_char_format=self.numbers_text_char_format,
-        )
-
-        self._set_vex_syntax_highlighter(
-            reg_exp=self.functions_reg_exp,
-            text=text,
-            text_char_format=self.functions_text_char_format,
-        )
-
-        self._set_vex_syntax_highlighter(
-            reg_exp=self.keywords_reg_exp,
-            text=text,
-            text_char_format=self.keywords_text_char_format,
-        )
-
-        self._set_vex_syntax_highlighter(
-            reg_exp=self.types_reg_exp,
-            text=text,
-            text_char_format=self.types_text_char_format,
-        )
-
-        self._set_vex_syntax_highlighter(
-            reg_exp=self.references_reg_exp,
-            text=text,
-            text_char_format=self.references_text_char_format,
-        )
-
-        self._set_vex_syntax_highlighter(
-            reg_exp=self.comments_reg_exp,
-            text=text,
-            text_char_format=self.comments_text_char_format,
-        )
-
-        self._set_vex_syntax_highlighter(
-            reg_exp=self.strings_reg_exp,
-            text=text,
-            text_char_format=self.strings_text_char_format,
-        )
+        block = self.currentBlock()
+        block_data = self.currentBlockUserData()
+
+        # Left untouched, the block keeps its state and Qt stops here.
+        if (
+            self.deferred_cursor is not None
+            and not isinstance(block_data, VEXBlockData)
+            and block.position() >= self.deferred_cursor.position()
+        ):
+            return
+
+        previous_block_state = max(self.previousBlockState(), LexerState.NORMAL)
+
+        # Blocks are only lexed again when their text or incoming state changed.
+        if not isinstance(block_data, VEXBlockData) or not block_data.is_valid(
+            block, previous_block_state
+        ):
+            tokens, block_state = vex_lexer.tokenize_block(text, previous_block_state)
+            block_data = VEXBlockData(
+                block.revision(), text, previous_block_state, block_state, tokens
+            )
+            self.setCurrentBlockUserData(block_data)
+
+        for start, length, token_type in self._get_spans(block_data, len(text)):
+            self.setFormat(start, length, self.text_char_formats[token_type])
+
+        # Qt only moves on to the next block while its state keeps changing.
+        self.setCurrentBlockState(block_data.state)
@@ -0,0 +1,130 @@
+from PySide2 import QtGui
+
+from array import array
+import logging
+
+from vex_manager.core.vex_lexer import LexerState
+from vex_manager.core.vex_lexer import TokenType
+import vex_manager.core.vex_symbols as vex_symbols
+import vex_manager.core.vex_lexer as vex_lexer
+
+
+logger = logging.getLogger(f"vex_manager.{__name__}")
+
+
+class VEXBlockData(QtGui.QTextBlockUserData):
+    def __init__(
+        self,
+        revision: int,
+        text: str,
+        previous_state: int,
+        state: LexerState,
+        tokens: list[tuple[int, int, TokenType]],
+    ) -> None:
+        super().__init__()
+
+        self.revision = revision
+        self.text_hash = hash(text)
+        self.previous_state = previous_state
+        self.state = state
+
+        # Flat (start, length, token type) triples.
+        self.tokens = array("I", [value for token in tokens for value in token])
+
+        # Bit mask of the token types, so recoloring can skip unaffected blocks.
+        self.token_types = 0
+
+        for token in tokens:
+            self.token_types |= 1 << token[2]
+
+        self.symbols: frozenset[str] | None = None
+
+    def get_tokens(self) -> list[tuple[int, int, int]]:
+        tokens = self.tokens
+
+        return list(zip(tokens[0::3], tokens[1::3], tokens[2::3]))
+
+    # Qt leaves block revisions alone while undo is off, as in setPlainText, so the
+    # text hash catches those edits.
+    def is_valid(self, block: QtGui.QTextBlock, previous_state: int) -> bool:
+        return (
+            self.revision == block.revision()
+            and self.previous_state == previous_state
+            and self.text_hash == hash(block.text())
+        )
+
+
+def get_previous_state(block: QtGui.QTextBlock) -> int:
+    previous_block = block.previous()
+    previous_block_data = previous_block.userData()
+
+    # Blocks lexed ahead of the highlighter carry their state before Qt does.
+    if (
+        isinstance(previous_block_data, VEXBlockData)
+        and previous_block_data.revision == previous_block.revision()
+        and previous_block_data.text_hash == hash(previous_block.text())
+    ):
+        return previous_block_data.state
+
+    return max(previous_block.userState(), LexerState.NORMAL)
+
+
+def get_block_data(
+    block: QtGui.QTextBlock, previous_state: int | None = None
+) -> VEXBlockData | None:
+    block_data = block.userData()
+
+    if not isinstance(block_data, VEXBlockData):
+        return
+
+    if previous_state is None:
+        previous_state = get_previous_state(block)
+
+    return block_data if block_data.is_valid(block, previous_state) else None
+
+
+def update_block_data(
+    block: QtGui.QTextBlock, previous_state: int | None = None
+) -> VEXBlockData:
+    if previous_state is None:
+        previous_state = get_previous_state(block)
+
+    text = block.text()
+    tokens, state = vex_lexer.tokenize_block(text, previous_state)
+
+    block_data = VEXBlockData(block.revision(), text, previous_state, state, tokens)
+    block.setUserData(block_data)
+
+    return block_data
+
+
+def get_block_tokens(block: QtGui.QTextBlock) -> list[tuple[int, int, int]]:
+    block_data = get_block_data(block) or update_block_data(block)
+
+    return block_data.get_tokens()
+
+
+def get_block_symbols(block: QtGui.QTextBlock) -> frozenset[str]:
+    block_data = get_block_data(block) or update_block_data(block)
+
+    if block_data.symbols is None:
+        block_data.symbols = vex_symbols.extract_symbols(
+            block.text(), block_data.get_tokens()
+        )
+
+    return block_data.symbols
+
+
+def get_token_at(
+    block: QtGui.QTextBlock, position_in_block: int
+) -> tuple[int, int, int] | None:
+    for token in get_block_tokens(block):
+        start, length, token_type = token
+
+        if start > position_in_block:
+            break
+
+        if position_in_block < start + length:
+            return token
+
+    return
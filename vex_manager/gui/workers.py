@@ -0,0 +1,32 @@
+from PySide2 import QtCore
+
+from typing import Callable
+import logging
+
+
+logger = logging.getLogger(f"vex_manager.{__name__}")
+
+
+class WorkerSignals(QtCore.QObject):
+    finished = QtCore.Signal(object)
+
+
+class Worker(QtCore.QRunnable):
+    def __init__(self, function: Callable, *args, **kwargs) -> None:
+        super().__init__()
+
+        self.function = function
+        self.args = args
+        self.kwargs = kwargs
+
+        self.signals = WorkerSignals()
+
+    def run(self) -> None:
+        try:
+            result = self.function(*self.args, **self.kwargs)
+        except Exception:
+            logger.exception(f"Background task {self.function.__name__!r} failed.")
+
+            result = None
+
+        self.signals.finished.emit(result)
@@ -1,2 +1,4 @@
 from vex_manager.utils.utils import is_valid_file_name
+from vex_manager.utils.utils import get_cache_path
+from vex_manager.utils.utils import get_recovery_path
 from vex_manager.utils.utils import get_preferences_path
@@ -1,5 +1,3 @@
-import hou
-
 import os
 import re
 
@@ -11,7 +9,23 @@ def is_valid_file_name(file_name: str) -> bool:
     return bool(match)
 
 
+def get_cache_path() -> str:
+    home_path = os.path.expanduser("~")
+    cache_path = os.path.join(home_path, ".vex_manager", "cache")
+
+    return cache_path
+
+
+def get_recovery_path() -> str:
+    home_path = os.path.expanduser("~")
+    recovery_path = os.path.join(home_path, ".vex_manager", "recovery")
+
+    return recovery_path
+
+
 def get_preferences_path() -> str:
+    import hou
+
     home_path = os.path.expandvars("$HOME")
     houdini_version = hou.applicationVersionString()
     major, minor, patch = houdini_version.split(".")